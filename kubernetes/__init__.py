@@ -16,8 +16,26 @@ __project__ = 'kubernetes'
 # The version is auto-updated. Please do not edit.
 __version__ = "10.0.0-snapshot"
 
-import kubernetes.client
-import kubernetes.config
-import kubernetes.watch
-import kubernetes.stream
-import kubernetes.utils
+import sys
+
+__all__ = ['client', 'config', 'stream', 'utils', 'watch']
+
+if sys.version_info >= (3, 7):
+    from importlib import import_module
+
+    # PEP 562: subpackages are imported on first access so that short lived
+    # programs only pay for what they use.
+    def __getattr__(name):
+        if name not in __all__:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(__name__, name))
+        return import_module('.' + name, __name__)
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__))
+else:
+    import kubernetes.client
+    import kubernetes.config
+    import kubernetes.watch
+    import kubernetes.stream
+    import kubernetes.utils
@@ -13,673 +13,18 @@
 
 from __future__ import absolute_import
 
-# import models into sdk package
-from .models.admissionregistration_v1beta1_service_reference import AdmissionregistrationV1beta1ServiceReference
-from .models.admissionregistration_v1beta1_webhook_client_config import AdmissionregistrationV1beta1WebhookClientConfig
-from .models.apiextensions_v1beta1_service_reference import ApiextensionsV1beta1ServiceReference
-from .models.apiextensions_v1beta1_webhook_client_config import ApiextensionsV1beta1WebhookClientConfig
-from .models.apiregistration_v1beta1_service_reference import ApiregistrationV1beta1ServiceReference
-from .models.apps_v1beta1_deployment import AppsV1beta1Deployment
-from .models.apps_v1beta1_deployment_condition import AppsV1beta1DeploymentCondition
-from .models.apps_v1beta1_deployment_list import AppsV1beta1DeploymentList
-from .models.apps_v1beta1_deployment_rollback import AppsV1beta1DeploymentRollback
-from .models.apps_v1beta1_deployment_spec import AppsV1beta1DeploymentSpec
-from .models.apps_v1beta1_deployment_status import AppsV1beta1DeploymentStatus
-from .models.apps_v1beta1_deployment_strategy import AppsV1beta1DeploymentStrategy
-from .models.apps_v1beta1_rollback_config import AppsV1beta1RollbackConfig
-from .models.apps_v1beta1_rolling_update_deployment import AppsV1beta1RollingUpdateDeployment
-from .models.apps_v1beta1_scale import AppsV1beta1Scale
-from .models.apps_v1beta1_scale_spec import AppsV1beta1ScaleSpec
-from .models.apps_v1beta1_scale_status import AppsV1beta1ScaleStatus
-from .models.extensions_v1beta1_allowed_csi_driver import ExtensionsV1beta1AllowedCSIDriver
-from .models.extensions_v1beta1_allowed_flex_volume import ExtensionsV1beta1AllowedFlexVolume
-from .models.extensions_v1beta1_allowed_host_path import ExtensionsV1beta1AllowedHostPath
-from .models.extensions_v1beta1_deployment import ExtensionsV1beta1Deployment
-from .models.extensions_v1beta1_deployment_condition import ExtensionsV1beta1DeploymentCondition
-from .models.extensions_v1beta1_deployment_list import ExtensionsV1beta1DeploymentList
-from .models.extensions_v1beta1_deployment_rollback import ExtensionsV1beta1DeploymentRollback
-from .models.extensions_v1beta1_deployment_spec import ExtensionsV1beta1DeploymentSpec
-from .models.extensions_v1beta1_deployment_status import ExtensionsV1beta1DeploymentStatus
-from .models.extensions_v1beta1_deployment_strategy import ExtensionsV1beta1DeploymentStrategy
-from .models.extensions_v1beta1_fs_group_strategy_options import ExtensionsV1beta1FSGroupStrategyOptions
-from .models.extensions_v1beta1_http_ingress_path import ExtensionsV1beta1HTTPIngressPath
-from .models.extensions_v1beta1_http_ingress_rule_value import ExtensionsV1beta1HTTPIngressRuleValue
-from .models.extensions_v1beta1_host_port_range import ExtensionsV1beta1HostPortRange
-from .models.extensions_v1beta1_id_range import ExtensionsV1beta1IDRange
-from .models.extensions_v1beta1_ingress import ExtensionsV1beta1Ingress
-from .models.extensions_v1beta1_ingress_backend import ExtensionsV1beta1IngressBackend
-from .models.extensions_v1beta1_ingress_list import ExtensionsV1beta1IngressList
-from .models.extensions_v1beta1_ingress_rule import ExtensionsV1beta1IngressRule
-from .models.extensions_v1beta1_ingress_spec import ExtensionsV1beta1IngressSpec
-from .models.extensions_v1beta1_ingress_status import ExtensionsV1beta1IngressStatus
-from .models.extensions_v1beta1_ingress_tls import ExtensionsV1beta1IngressTLS
-from .models.extensions_v1beta1_pod_security_policy import ExtensionsV1beta1PodSecurityPolicy
-from .models.extensions_v1beta1_pod_security_policy_list import ExtensionsV1beta1PodSecurityPolicyList
-from .models.extensions_v1beta1_pod_security_policy_spec import ExtensionsV1beta1PodSecurityPolicySpec
-from .models.extensions_v1beta1_rollback_config import ExtensionsV1beta1RollbackConfig
-from .models.extensions_v1beta1_rolling_update_deployment import ExtensionsV1beta1RollingUpdateDeployment
-from .models.extensions_v1beta1_run_as_group_strategy_options import ExtensionsV1beta1RunAsGroupStrategyOptions
-from .models.extensions_v1beta1_run_as_user_strategy_options import ExtensionsV1beta1RunAsUserStrategyOptions
-from .models.extensions_v1beta1_se_linux_strategy_options import ExtensionsV1beta1SELinuxStrategyOptions
-from .models.extensions_v1beta1_scale import ExtensionsV1beta1Scale
-from .models.extensions_v1beta1_scale_spec import ExtensionsV1beta1ScaleSpec
-from .models.extensions_v1beta1_scale_status import ExtensionsV1beta1ScaleStatus
-from .models.extensions_v1beta1_supplemental_groups_strategy_options import ExtensionsV1beta1SupplementalGroupsStrategyOptions
-from .models.networking_v1beta1_http_ingress_path import NetworkingV1beta1HTTPIngressPath
-from .models.networking_v1beta1_http_ingress_rule_value import NetworkingV1beta1HTTPIngressRuleValue
-from .models.networking_v1beta1_ingress import NetworkingV1beta1Ingress
-from .models.networking_v1beta1_ingress_backend import NetworkingV1beta1IngressBackend
-from .models.networking_v1beta1_ingress_list import NetworkingV1beta1IngressList
-from .models.networking_v1beta1_ingress_rule import NetworkingV1beta1IngressRule
-from .models.networking_v1beta1_ingress_spec import NetworkingV1beta1IngressSpec
-from .models.networking_v1beta1_ingress_status import NetworkingV1beta1IngressStatus
-from .models.networking_v1beta1_ingress_tls import NetworkingV1beta1IngressTLS
-from .models.policy_v1beta1_allowed_csi_driver import PolicyV1beta1AllowedCSIDriver
-from .models.policy_v1beta1_allowed_flex_volume import PolicyV1beta1AllowedFlexVolume
-from .models.policy_v1beta1_allowed_host_path import PolicyV1beta1AllowedHostPath
-from .models.policy_v1beta1_fs_group_strategy_options import PolicyV1beta1FSGroupStrategyOptions
-from .models.policy_v1beta1_host_port_range import PolicyV1beta1HostPortRange
-from .models.policy_v1beta1_id_range import PolicyV1beta1IDRange
-from .models.policy_v1beta1_pod_security_policy import PolicyV1beta1PodSecurityPolicy
-from .models.policy_v1beta1_pod_security_policy_list import PolicyV1beta1PodSecurityPolicyList
-from .models.policy_v1beta1_pod_security_policy_spec import PolicyV1beta1PodSecurityPolicySpec
-from .models.policy_v1beta1_run_as_group_strategy_options import PolicyV1beta1RunAsGroupStrategyOptions
-from .models.policy_v1beta1_run_as_user_strategy_options import PolicyV1beta1RunAsUserStrategyOptions
-from .models.policy_v1beta1_se_linux_strategy_options import PolicyV1beta1SELinuxStrategyOptions
-from .models.policy_v1beta1_supplemental_groups_strategy_options import PolicyV1beta1SupplementalGroupsStrategyOptions
-from .models.runtime_raw_extension import RuntimeRawExtension
-from .models.v1_api_group import V1APIGroup
-from .models.v1_api_group_list import V1APIGroupList
-from .models.v1_api_resource import V1APIResource
-from .models.v1_api_resource_list import V1APIResourceList
-from .models.v1_api_service import V1APIService
-from .models.v1_api_service_condition import V1APIServiceCondition
-from .models.v1_api_service_list import V1APIServiceList
-from .models.v1_api_service_spec import V1APIServiceSpec
-from .models.v1_api_service_status import V1APIServiceStatus
-from .models.v1_api_versions import V1APIVersions
-from .models.v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from .models.v1_affinity import V1Affinity
-from .models.v1_aggregation_rule import V1AggregationRule
-from .models.v1_attached_volume import V1AttachedVolume
-from .models.v1_azure_disk_volume_source import V1AzureDiskVolumeSource
-from .models.v1_azure_file_persistent_volume_source import V1AzureFilePersistentVolumeSource
-from .models.v1_azure_file_volume_source import V1AzureFileVolumeSource
-from .models.v1_binding import V1Binding
-from .models.v1_csi_persistent_volume_source import V1CSIPersistentVolumeSource
-from .models.v1_csi_volume_source import V1CSIVolumeSource
-from .models.v1_capabilities import V1Capabilities
-from .models.v1_ceph_fs_persistent_volume_source import V1CephFSPersistentVolumeSource
-from .models.v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from .models.v1_cinder_persistent_volume_source import V1CinderPersistentVolumeSource
-from .models.v1_cinder_volume_source import V1CinderVolumeSource
-from .models.v1_client_ip_config import V1ClientIPConfig
-from .models.v1_cluster_role import V1ClusterRole
-from .models.v1_cluster_role_binding import V1ClusterRoleBinding
-from .models.v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from .models.v1_cluster_role_list import V1ClusterRoleList
-from .models.v1_component_condition import V1ComponentCondition
-from .models.v1_component_status import V1ComponentStatus
-from .models.v1_component_status_list import V1ComponentStatusList
-from .models.v1_config_map import V1ConfigMap
-from .models.v1_config_map_env_source import V1ConfigMapEnvSource
-from .models.v1_config_map_key_selector import V1ConfigMapKeySelector
-from .models.v1_config_map_list import V1ConfigMapList
-from .models.v1_config_map_node_config_source import V1ConfigMapNodeConfigSource
-from .models.v1_config_map_projection import V1ConfigMapProjection
-from .models.v1_config_map_volume_source import V1ConfigMapVolumeSource
-from .models.v1_container import V1Container
-from .models.v1_container_image import V1ContainerImage
-from .models.v1_container_port import V1ContainerPort
-from .models.v1_container_state import V1ContainerState
-from .models.v1_container_state_running import V1ContainerStateRunning
-from .models.v1_container_state_terminated import V1ContainerStateTerminated
-from .models.v1_container_state_waiting import V1ContainerStateWaiting
-from .models.v1_container_status import V1ContainerStatus
-from .models.v1_controller_revision import V1ControllerRevision
-from .models.v1_controller_revision_list import V1ControllerRevisionList
-from .models.v1_cross_version_object_reference import V1CrossVersionObjectReference
-from .models.v1_daemon_endpoint import V1DaemonEndpoint
-from .models.v1_daemon_set import V1DaemonSet
-from .models.v1_daemon_set_condition import V1DaemonSetCondition
-from .models.v1_daemon_set_list import V1DaemonSetList
-from .models.v1_daemon_set_spec import V1DaemonSetSpec
-from .models.v1_daemon_set_status import V1DaemonSetStatus
-from .models.v1_daemon_set_update_strategy import V1DaemonSetUpdateStrategy
-from .models.v1_delete_options import V1DeleteOptions
-from .models.v1_deployment import V1Deployment
-from .models.v1_deployment_condition import V1DeploymentCondition
-from .models.v1_deployment_list import V1DeploymentList
-from .models.v1_deployment_spec import V1DeploymentSpec
-from .models.v1_deployment_status import V1DeploymentStatus
-from .models.v1_deployment_strategy import V1DeploymentStrategy
-from .models.v1_downward_api_projection import V1DownwardAPIProjection
-from .models.v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from .models.v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from .models.v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from .models.v1_endpoint_address import V1EndpointAddress
-from .models.v1_endpoint_port import V1EndpointPort
-from .models.v1_endpoint_subset import V1EndpointSubset
-from .models.v1_endpoints import V1Endpoints
-from .models.v1_endpoints_list import V1EndpointsList
-from .models.v1_env_from_source import V1EnvFromSource
-from .models.v1_env_var import V1EnvVar
-from .models.v1_env_var_source import V1EnvVarSource
-from .models.v1_event import V1Event
-from .models.v1_event_list import V1EventList
-from .models.v1_event_series import V1EventSeries
-from .models.v1_event_source import V1EventSource
-from .models.v1_exec_action import V1ExecAction
-from .models.v1_fc_volume_source import V1FCVolumeSource
-from .models.v1_flex_persistent_volume_source import V1FlexPersistentVolumeSource
-from .models.v1_flex_volume_source import V1FlexVolumeSource
-from .models.v1_flocker_volume_source import V1FlockerVolumeSource
-from .models.v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from .models.v1_git_repo_volume_source import V1GitRepoVolumeSource
-from .models.v1_glusterfs_persistent_volume_source import V1GlusterfsPersistentVolumeSource
-from .models.v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from .models.v1_group_version_for_discovery import V1GroupVersionForDiscovery
-from .models.v1_http_get_action import V1HTTPGetAction
-from .models.v1_http_header import V1HTTPHeader
-from .models.v1_handler import V1Handler
-from .models.v1_horizontal_pod_autoscaler import V1HorizontalPodAutoscaler
-from .models.v1_horizontal_pod_autoscaler_list import V1HorizontalPodAutoscalerList
-from .models.v1_horizontal_pod_autoscaler_spec import V1HorizontalPodAutoscalerSpec
-from .models.v1_horizontal_pod_autoscaler_status import V1HorizontalPodAutoscalerStatus
-from .models.v1_host_alias import V1HostAlias
-from .models.v1_host_path_volume_source import V1HostPathVolumeSource
-from .models.v1_ip_block import V1IPBlock
-from .models.v1_iscsi_persistent_volume_source import V1ISCSIPersistentVolumeSource
-from .models.v1_iscsi_volume_source import V1ISCSIVolumeSource
-from .models.v1_initializer import V1Initializer
-from .models.v1_initializers import V1Initializers
-from .models.v1_job import V1Job
-from .models.v1_job_condition import V1JobCondition
-from .models.v1_job_list import V1JobList
-from .models.v1_job_spec import V1JobSpec
-from .models.v1_job_status import V1JobStatus
-from .models.v1_key_to_path import V1KeyToPath
-from .models.v1_label_selector import V1LabelSelector
-from .models.v1_label_selector_requirement import V1LabelSelectorRequirement
-from .models.v1_lease import V1Lease
-from .models.v1_lease_list import V1LeaseList
-from .models.v1_lease_spec import V1LeaseSpec
-from .models.v1_lifecycle import V1Lifecycle
-from .models.v1_limit_range import V1LimitRange
-from .models.v1_limit_range_item import V1LimitRangeItem
-from .models.v1_limit_range_list import V1LimitRangeList
-from .models.v1_limit_range_spec import V1LimitRangeSpec
-from .models.v1_list_meta import V1ListMeta
-from .models.v1_load_balancer_ingress import V1LoadBalancerIngress
-from .models.v1_load_balancer_status import V1LoadBalancerStatus
-from .models.v1_local_object_reference import V1LocalObjectReference
-from .models.v1_local_subject_access_review import V1LocalSubjectAccessReview
-from .models.v1_local_volume_source import V1LocalVolumeSource
-from .models.v1_managed_fields_entry import V1ManagedFieldsEntry
-from .models.v1_nfs_volume_source import V1NFSVolumeSource
-from .models.v1_namespace import V1Namespace
-from .models.v1_namespace_list import V1NamespaceList
-from .models.v1_namespace_spec import V1NamespaceSpec
-from .models.v1_namespace_status import V1NamespaceStatus
-from .models.v1_network_policy import V1NetworkPolicy
-from .models.v1_network_policy_egress_rule import V1NetworkPolicyEgressRule
-from .models.v1_network_policy_ingress_rule import V1NetworkPolicyIngressRule
-from .models.v1_network_policy_list import V1NetworkPolicyList
-from .models.v1_network_policy_peer import V1NetworkPolicyPeer
-from .models.v1_network_policy_port import V1NetworkPolicyPort
-from .models.v1_network_policy_spec import V1NetworkPolicySpec
-from .models.v1_node import V1Node
-from .models.v1_node_address import V1NodeAddress
-from .models.v1_node_affinity import V1NodeAffinity
-from .models.v1_node_condition import V1NodeCondition
-from .models.v1_node_config_source import V1NodeConfigSource
-from .models.v1_node_config_status import V1NodeConfigStatus
-from .models.v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from .models.v1_node_list import V1NodeList
-from .models.v1_node_selector import V1NodeSelector
-from .models.v1_node_selector_requirement import V1NodeSelectorRequirement
-from .models.v1_node_selector_term import V1NodeSelectorTerm
-from .models.v1_node_spec import V1NodeSpec
-from .models.v1_node_status import V1NodeStatus
-from .models.v1_node_system_info import V1NodeSystemInfo
-from .models.v1_non_resource_attributes import V1NonResourceAttributes
-from .models.v1_non_resource_rule import V1NonResourceRule
-from .models.v1_object_field_selector import V1ObjectFieldSelector
-from .models.v1_object_meta import V1ObjectMeta
-from .models.v1_object_reference import V1ObjectReference
-from .models.v1_owner_reference import V1OwnerReference
-from .models.v1_persistent_volume import V1PersistentVolume
-from .models.v1_persistent_volume_claim import V1PersistentVolumeClaim
-from .models.v1_persistent_volume_claim_condition import V1PersistentVolumeClaimCondition
-from .models.v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from .models.v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from .models.v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
-from .models.v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from .models.v1_persistent_volume_list import V1PersistentVolumeList
-from .models.v1_persistent_volume_spec import V1PersistentVolumeSpec
-from .models.v1_persistent_volume_status import V1PersistentVolumeStatus
-from .models.v1_photon_persistent_disk_volume_source import V1PhotonPersistentDiskVolumeSource
-from .models.v1_pod import V1Pod
-from .models.v1_pod_affinity import V1PodAffinity
-from .models.v1_pod_affinity_term import V1PodAffinityTerm
-from .models.v1_pod_anti_affinity import V1PodAntiAffinity
-from .models.v1_pod_condition import V1PodCondition
-from .models.v1_pod_dns_config import V1PodDNSConfig
-from .models.v1_pod_dns_config_option import V1PodDNSConfigOption
-from .models.v1_pod_list import V1PodList
-from .models.v1_pod_readiness_gate import V1PodReadinessGate
-from .models.v1_pod_security_context import V1PodSecurityContext
-from .models.v1_pod_spec import V1PodSpec
-from .models.v1_pod_status import V1PodStatus
-from .models.v1_pod_template import V1PodTemplate
-from .models.v1_pod_template_list import V1PodTemplateList
-from .models.v1_pod_template_spec import V1PodTemplateSpec
-from .models.v1_policy_rule import V1PolicyRule
-from .models.v1_portworx_volume_source import V1PortworxVolumeSource
-from .models.v1_preconditions import V1Preconditions
-from .models.v1_preferred_scheduling_term import V1PreferredSchedulingTerm
-from .models.v1_priority_class import V1PriorityClass
-from .models.v1_priority_class_list import V1PriorityClassList
-from .models.v1_probe import V1Probe
-from .models.v1_projected_volume_source import V1ProjectedVolumeSource
-from .models.v1_quobyte_volume_source import V1QuobyteVolumeSource
-from .models.v1_rbd_persistent_volume_source import V1RBDPersistentVolumeSource
-from .models.v1_rbd_volume_source import V1RBDVolumeSource
-from .models.v1_replica_set import V1ReplicaSet
-from .models.v1_replica_set_condition import V1ReplicaSetCondition
-from .models.v1_replica_set_list import V1ReplicaSetList
-from .models.v1_replica_set_spec import V1ReplicaSetSpec
-from .models.v1_replica_set_status import V1ReplicaSetStatus
-from .models.v1_replication_controller import V1ReplicationController
-from .models.v1_replication_controller_condition import V1ReplicationControllerCondition
-from .models.v1_replication_controller_list import V1ReplicationControllerList
-from .models.v1_replication_controller_spec import V1ReplicationControllerSpec
-from .models.v1_replication_controller_status import V1ReplicationControllerStatus
-from .models.v1_resource_attributes import V1ResourceAttributes
-from .models.v1_resource_field_selector import V1ResourceFieldSelector
-from .models.v1_resource_quota import V1ResourceQuota
-from .models.v1_resource_quota_list import V1ResourceQuotaList
-from .models.v1_resource_quota_spec import V1ResourceQuotaSpec
-from .models.v1_resource_quota_status import V1ResourceQuotaStatus
-from .models.v1_resource_requirements import V1ResourceRequirements
-from .models.v1_resource_rule import V1ResourceRule
-from .models.v1_role import V1Role
-from .models.v1_role_binding import V1RoleBinding
-from .models.v1_role_binding_list import V1RoleBindingList
-from .models.v1_role_list import V1RoleList
-from .models.v1_role_ref import V1RoleRef
-from .models.v1_rolling_update_daemon_set import V1RollingUpdateDaemonSet
-from .models.v1_rolling_update_deployment import V1RollingUpdateDeployment
-from .models.v1_rolling_update_stateful_set_strategy import V1RollingUpdateStatefulSetStrategy
-from .models.v1_se_linux_options import V1SELinuxOptions
-from .models.v1_scale import V1Scale
-from .models.v1_scale_io_persistent_volume_source import V1ScaleIOPersistentVolumeSource
-from .models.v1_scale_io_volume_source import V1ScaleIOVolumeSource
-from .models.v1_scale_spec import V1ScaleSpec
-from .models.v1_scale_status import V1ScaleStatus
-from .models.v1_scope_selector import V1ScopeSelector
-from .models.v1_scoped_resource_selector_requirement import V1ScopedResourceSelectorRequirement
-from .models.v1_secret import V1Secret
-from .models.v1_secret_env_source import V1SecretEnvSource
-from .models.v1_secret_key_selector import V1SecretKeySelector
-from .models.v1_secret_list import V1SecretList
-from .models.v1_secret_projection import V1SecretProjection
-from .models.v1_secret_reference import V1SecretReference
-from .models.v1_secret_volume_source import V1SecretVolumeSource
-from .models.v1_security_context import V1SecurityContext
-from .models.v1_self_subject_access_review import V1SelfSubjectAccessReview
-from .models.v1_self_subject_access_review_spec import V1SelfSubjectAccessReviewSpec
-from .models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from .models.v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from .models.v1_server_address_by_client_cidr import V1ServerAddressByClientCIDR
-from .models.v1_service import V1Service
-from .models.v1_service_account import V1ServiceAccount
-from .models.v1_service_account_list import V1ServiceAccountList
-from .models.v1_service_account_token_projection import V1ServiceAccountTokenProjection
-from .models.v1_service_list import V1ServiceList
-from .models.v1_service_port import V1ServicePort
-from .models.v1_service_reference import V1ServiceReference
-from .models.v1_service_spec import V1ServiceSpec
-from .models.v1_service_status import V1ServiceStatus
-from .models.v1_session_affinity_config import V1SessionAffinityConfig
-from .models.v1_stateful_set import V1StatefulSet
-from .models.v1_stateful_set_condition import V1StatefulSetCondition
-from .models.v1_stateful_set_list import V1StatefulSetList
-from .models.v1_stateful_set_spec import V1StatefulSetSpec
-from .models.v1_stateful_set_status import V1StatefulSetStatus
-from .models.v1_stateful_set_update_strategy import V1StatefulSetUpdateStrategy
-from .models.v1_status import V1Status
-from .models.v1_status_cause import V1StatusCause
-from .models.v1_status_details import V1StatusDetails
-from .models.v1_storage_class import V1StorageClass
-from .models.v1_storage_class_list import V1StorageClassList
-from .models.v1_storage_os_persistent_volume_source import V1StorageOSPersistentVolumeSource
-from .models.v1_storage_os_volume_source import V1StorageOSVolumeSource
-from .models.v1_subject import V1Subject
-from .models.v1_subject_access_review import V1SubjectAccessReview
-from .models.v1_subject_access_review_spec import V1SubjectAccessReviewSpec
-from .models.v1_subject_access_review_status import V1SubjectAccessReviewStatus
-from .models.v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from .models.v1_sysctl import V1Sysctl
-from .models.v1_tcp_socket_action import V1TCPSocketAction
-from .models.v1_taint import V1Taint
-from .models.v1_token_review import V1TokenReview
-from .models.v1_token_review_spec import V1TokenReviewSpec
-from .models.v1_token_review_status import V1TokenReviewStatus
-from .models.v1_toleration import V1Toleration
-from .models.v1_topology_selector_label_requirement import V1TopologySelectorLabelRequirement
-from .models.v1_topology_selector_term import V1TopologySelectorTerm
-from .models.v1_typed_local_object_reference import V1TypedLocalObjectReference
-from .models.v1_user_info import V1UserInfo
-from .models.v1_volume import V1Volume
-from .models.v1_volume_attachment import V1VolumeAttachment
-from .models.v1_volume_attachment_list import V1VolumeAttachmentList
-from .models.v1_volume_attachment_source import V1VolumeAttachmentSource
-from .models.v1_volume_attachment_spec import V1VolumeAttachmentSpec
-from .models.v1_volume_attachment_status import V1VolumeAttachmentStatus
-from .models.v1_volume_device import V1VolumeDevice
-from .models.v1_volume_error import V1VolumeError
-from .models.v1_volume_mount import V1VolumeMount
-from .models.v1_volume_node_affinity import V1VolumeNodeAffinity
-from .models.v1_volume_projection import V1VolumeProjection
-from .models.v1_vsphere_virtual_disk_volume_source import V1VsphereVirtualDiskVolumeSource
-from .models.v1_watch_event import V1WatchEvent
-from .models.v1_weighted_pod_affinity_term import V1WeightedPodAffinityTerm
-from .models.v1alpha1_aggregation_rule import V1alpha1AggregationRule
-from .models.v1alpha1_audit_sink import V1alpha1AuditSink
-from .models.v1alpha1_audit_sink_list import V1alpha1AuditSinkList
-from .models.v1alpha1_audit_sink_spec import V1alpha1AuditSinkSpec
-from .models.v1alpha1_cluster_role import V1alpha1ClusterRole
-from .models.v1alpha1_cluster_role_binding import V1alpha1ClusterRoleBinding
-from .models.v1alpha1_cluster_role_binding_list import V1alpha1ClusterRoleBindingList
-from .models.v1alpha1_cluster_role_list import V1alpha1ClusterRoleList
-from .models.v1alpha1_pod_preset import V1alpha1PodPreset
-from .models.v1alpha1_pod_preset_list import V1alpha1PodPresetList
-from .models.v1alpha1_pod_preset_spec import V1alpha1PodPresetSpec
-from .models.v1alpha1_policy import V1alpha1Policy
-from .models.v1alpha1_policy_rule import V1alpha1PolicyRule
-from .models.v1alpha1_priority_class import V1alpha1PriorityClass
-from .models.v1alpha1_priority_class_list import V1alpha1PriorityClassList
-from .models.v1alpha1_role import V1alpha1Role
-from .models.v1alpha1_role_binding import V1alpha1RoleBinding
-from .models.v1alpha1_role_binding_list import V1alpha1RoleBindingList
-from .models.v1alpha1_role_list import V1alpha1RoleList
-from .models.v1alpha1_role_ref import V1alpha1RoleRef
-from .models.v1alpha1_runtime_class import V1alpha1RuntimeClass
-from .models.v1alpha1_runtime_class_list import V1alpha1RuntimeClassList
-from .models.v1alpha1_runtime_class_spec import V1alpha1RuntimeClassSpec
-from .models.v1alpha1_service_reference import V1alpha1ServiceReference
-from .models.v1alpha1_subject import V1alpha1Subject
-from .models.v1alpha1_volume_attachment import V1alpha1VolumeAttachment
-from .models.v1alpha1_volume_attachment_list import V1alpha1VolumeAttachmentList
-from .models.v1alpha1_volume_attachment_source import V1alpha1VolumeAttachmentSource
-from .models.v1alpha1_volume_attachment_spec import V1alpha1VolumeAttachmentSpec
-from .models.v1alpha1_volume_attachment_status import V1alpha1VolumeAttachmentStatus
-from .models.v1alpha1_volume_error import V1alpha1VolumeError
-from .models.v1alpha1_webhook import V1alpha1Webhook
-from .models.v1alpha1_webhook_client_config import V1alpha1WebhookClientConfig
-from .models.v1alpha1_webhook_throttle_config import V1alpha1WebhookThrottleConfig
-from .models.v1beta1_api_service import V1beta1APIService
-from .models.v1beta1_api_service_condition import V1beta1APIServiceCondition
-from .models.v1beta1_api_service_list import V1beta1APIServiceList
-from .models.v1beta1_api_service_spec import V1beta1APIServiceSpec
-from .models.v1beta1_api_service_status import V1beta1APIServiceStatus
-from .models.v1beta1_aggregation_rule import V1beta1AggregationRule
-from .models.v1beta1_csi_driver import V1beta1CSIDriver
-from .models.v1beta1_csi_driver_list import V1beta1CSIDriverList
-from .models.v1beta1_csi_driver_spec import V1beta1CSIDriverSpec
-from .models.v1beta1_csi_node import V1beta1CSINode
-from .models.v1beta1_csi_node_driver import V1beta1CSINodeDriver
-from .models.v1beta1_csi_node_list import V1beta1CSINodeList
-from .models.v1beta1_csi_node_spec import V1beta1CSINodeSpec
-from .models.v1beta1_certificate_signing_request import V1beta1CertificateSigningRequest
-from .models.v1beta1_certificate_signing_request_condition import V1beta1CertificateSigningRequestCondition
-from .models.v1beta1_certificate_signing_request_list import V1beta1CertificateSigningRequestList
-from .models.v1beta1_certificate_signing_request_spec import V1beta1CertificateSigningRequestSpec
-from .models.v1beta1_certificate_signing_request_status import V1beta1CertificateSigningRequestStatus
-from .models.v1beta1_cluster_role import V1beta1ClusterRole
-from .models.v1beta1_cluster_role_binding import V1beta1ClusterRoleBinding
-from .models.v1beta1_cluster_role_binding_list import V1beta1ClusterRoleBindingList
-from .models.v1beta1_cluster_role_list import V1beta1ClusterRoleList
-from .models.v1beta1_controller_revision import V1beta1ControllerRevision
-from .models.v1beta1_controller_revision_list import V1beta1ControllerRevisionList
-from .models.v1beta1_cron_job import V1beta1CronJob
-from .models.v1beta1_cron_job_list import V1beta1CronJobList
-from .models.v1beta1_cron_job_spec import V1beta1CronJobSpec
-from .models.v1beta1_cron_job_status import V1beta1CronJobStatus
-from .models.v1beta1_custom_resource_column_definition import V1beta1CustomResourceColumnDefinition
-from .models.v1beta1_custom_resource_conversion import V1beta1CustomResourceConversion
-from .models.v1beta1_custom_resource_definition import V1beta1CustomResourceDefinition
-from .models.v1beta1_custom_resource_definition_condition import V1beta1CustomResourceDefinitionCondition
-from .models.v1beta1_custom_resource_definition_list import V1beta1CustomResourceDefinitionList
-from .models.v1beta1_custom_resource_definition_names import V1beta1CustomResourceDefinitionNames
-from .models.v1beta1_custom_resource_definition_spec import V1beta1CustomResourceDefinitionSpec
-from .models.v1beta1_custom_resource_definition_status import V1beta1CustomResourceDefinitionStatus
-from .models.v1beta1_custom_resource_definition_version import V1beta1CustomResourceDefinitionVersion
-from .models.v1beta1_custom_resource_subresource_scale import V1beta1CustomResourceSubresourceScale
-from .models.v1beta1_custom_resource_subresources import V1beta1CustomResourceSubresources
-from .models.v1beta1_custom_resource_validation import V1beta1CustomResourceValidation
-from .models.v1beta1_daemon_set import V1beta1DaemonSet
-from .models.v1beta1_daemon_set_condition import V1beta1DaemonSetCondition
-from .models.v1beta1_daemon_set_list import V1beta1DaemonSetList
-from .models.v1beta1_daemon_set_spec import V1beta1DaemonSetSpec
-from .models.v1beta1_daemon_set_status import V1beta1DaemonSetStatus
-from .models.v1beta1_daemon_set_update_strategy import V1beta1DaemonSetUpdateStrategy
-from .models.v1beta1_event import V1beta1Event
-from .models.v1beta1_event_list import V1beta1EventList
-from .models.v1beta1_event_series import V1beta1EventSeries
-from .models.v1beta1_eviction import V1beta1Eviction
-from .models.v1beta1_external_documentation import V1beta1ExternalDocumentation
-from .models.v1beta1_ip_block import V1beta1IPBlock
-from .models.v1beta1_json_schema_props import V1beta1JSONSchemaProps
-from .models.v1beta1_job_template_spec import V1beta1JobTemplateSpec
-from .models.v1beta1_lease import V1beta1Lease
-from .models.v1beta1_lease_list import V1beta1LeaseList
-from .models.v1beta1_lease_spec import V1beta1LeaseSpec
-from .models.v1beta1_local_subject_access_review import V1beta1LocalSubjectAccessReview
-from .models.v1beta1_mutating_webhook_configuration import V1beta1MutatingWebhookConfiguration
-from .models.v1beta1_mutating_webhook_configuration_list import V1beta1MutatingWebhookConfigurationList
-from .models.v1beta1_network_policy import V1beta1NetworkPolicy
-from .models.v1beta1_network_policy_egress_rule import V1beta1NetworkPolicyEgressRule
-from .models.v1beta1_network_policy_ingress_rule import V1beta1NetworkPolicyIngressRule
-from .models.v1beta1_network_policy_list import V1beta1NetworkPolicyList
-from .models.v1beta1_network_policy_peer import V1beta1NetworkPolicyPeer
-from .models.v1beta1_network_policy_port import V1beta1NetworkPolicyPort
-from .models.v1beta1_network_policy_spec import V1beta1NetworkPolicySpec
-from .models.v1beta1_non_resource_attributes import V1beta1NonResourceAttributes
-from .models.v1beta1_non_resource_rule import V1beta1NonResourceRule
-from .models.v1beta1_pod_disruption_budget import V1beta1PodDisruptionBudget
-from .models.v1beta1_pod_disruption_budget_list import V1beta1PodDisruptionBudgetList
-from .models.v1beta1_pod_disruption_budget_spec import V1beta1PodDisruptionBudgetSpec
-from .models.v1beta1_pod_disruption_budget_status import V1beta1PodDisruptionBudgetStatus
-from .models.v1beta1_policy_rule import V1beta1PolicyRule
-from .models.v1beta1_priority_class import V1beta1PriorityClass
-from .models.v1beta1_priority_class_list import V1beta1PriorityClassList
-from .models.v1beta1_replica_set import V1beta1ReplicaSet
-from .models.v1beta1_replica_set_condition import V1beta1ReplicaSetCondition
-from .models.v1beta1_replica_set_list import V1beta1ReplicaSetList
-from .models.v1beta1_replica_set_spec import V1beta1ReplicaSetSpec
-from .models.v1beta1_replica_set_status import V1beta1ReplicaSetStatus
-from .models.v1beta1_resource_attributes import V1beta1ResourceAttributes
-from .models.v1beta1_resource_rule import V1beta1ResourceRule
-from .models.v1beta1_role import V1beta1Role
-from .models.v1beta1_role_binding import V1beta1RoleBinding
-from .models.v1beta1_role_binding_list import V1beta1RoleBindingList
-from .models.v1beta1_role_list import V1beta1RoleList
-from .models.v1beta1_role_ref import V1beta1RoleRef
-from .models.v1beta1_rolling_update_daemon_set import V1beta1RollingUpdateDaemonSet
-from .models.v1beta1_rolling_update_stateful_set_strategy import V1beta1RollingUpdateStatefulSetStrategy
-from .models.v1beta1_rule_with_operations import V1beta1RuleWithOperations
-from .models.v1beta1_runtime_class import V1beta1RuntimeClass
-from .models.v1beta1_runtime_class_list import V1beta1RuntimeClassList
-from .models.v1beta1_self_subject_access_review import V1beta1SelfSubjectAccessReview
-from .models.v1beta1_self_subject_access_review_spec import V1beta1SelfSubjectAccessReviewSpec
-from .models.v1beta1_self_subject_rules_review import V1beta1SelfSubjectRulesReview
-from .models.v1beta1_self_subject_rules_review_spec import V1beta1SelfSubjectRulesReviewSpec
-from .models.v1beta1_stateful_set import V1beta1StatefulSet
-from .models.v1beta1_stateful_set_condition import V1beta1StatefulSetCondition
-from .models.v1beta1_stateful_set_list import V1beta1StatefulSetList
-from .models.v1beta1_stateful_set_spec import V1beta1StatefulSetSpec
-from .models.v1beta1_stateful_set_status import V1beta1StatefulSetStatus
-from .models.v1beta1_stateful_set_update_strategy import V1beta1StatefulSetUpdateStrategy
-from .models.v1beta1_storage_class import V1beta1StorageClass
-from .models.v1beta1_storage_class_list import V1beta1StorageClassList
-from .models.v1beta1_subject import V1beta1Subject
-from .models.v1beta1_subject_access_review import V1beta1SubjectAccessReview
-from .models.v1beta1_subject_access_review_spec import V1beta1SubjectAccessReviewSpec
-from .models.v1beta1_subject_access_review_status import V1beta1SubjectAccessReviewStatus
-from .models.v1beta1_subject_rules_review_status import V1beta1SubjectRulesReviewStatus
-from .models.v1beta1_token_review import V1beta1TokenReview
-from .models.v1beta1_token_review_spec import V1beta1TokenReviewSpec
-from .models.v1beta1_token_review_status import V1beta1TokenReviewStatus
-from .models.v1beta1_user_info import V1beta1UserInfo
-from .models.v1beta1_validating_webhook_configuration import V1beta1ValidatingWebhookConfiguration
-from .models.v1beta1_validating_webhook_configuration_list import V1beta1ValidatingWebhookConfigurationList
-from .models.v1beta1_volume_attachment import V1beta1VolumeAttachment
-from .models.v1beta1_volume_attachment_list import V1beta1VolumeAttachmentList
-from .models.v1beta1_volume_attachment_source import V1beta1VolumeAttachmentSource
-from .models.v1beta1_volume_attachment_spec import V1beta1VolumeAttachmentSpec
-from .models.v1beta1_volume_attachment_status import V1beta1VolumeAttachmentStatus
-from .models.v1beta1_volume_error import V1beta1VolumeError
-from .models.v1beta1_webhook import V1beta1Webhook
-from .models.v1beta2_controller_revision import V1beta2ControllerRevision
-from .models.v1beta2_controller_revision_list import V1beta2ControllerRevisionList
-from .models.v1beta2_daemon_set import V1beta2DaemonSet
-from .models.v1beta2_daemon_set_condition import V1beta2DaemonSetCondition
-from .models.v1beta2_daemon_set_list import V1beta2DaemonSetList
-from .models.v1beta2_daemon_set_spec import V1beta2DaemonSetSpec
-from .models.v1beta2_daemon_set_status import V1beta2DaemonSetStatus
-from .models.v1beta2_daemon_set_update_strategy import V1beta2DaemonSetUpdateStrategy
-from .models.v1beta2_deployment import V1beta2Deployment
-from .models.v1beta2_deployment_condition import V1beta2DeploymentCondition
-from .models.v1beta2_deployment_list import V1beta2DeploymentList
-from .models.v1beta2_deployment_spec import V1beta2DeploymentSpec
-from .models.v1beta2_deployment_status import V1beta2DeploymentStatus
-from .models.v1beta2_deployment_strategy import V1beta2DeploymentStrategy
-from .models.v1beta2_replica_set import V1beta2ReplicaSet
-from .models.v1beta2_replica_set_condition import V1beta2ReplicaSetCondition
-from .models.v1beta2_replica_set_list import V1beta2ReplicaSetList
-from .models.v1beta2_replica_set_spec import V1beta2ReplicaSetSpec
-from .models.v1beta2_replica_set_status import V1beta2ReplicaSetStatus
-from .models.v1beta2_rolling_update_daemon_set import V1beta2RollingUpdateDaemonSet
-from .models.v1beta2_rolling_update_deployment import V1beta2RollingUpdateDeployment
-from .models.v1beta2_rolling_update_stateful_set_strategy import V1beta2RollingUpdateStatefulSetStrategy
-from .models.v1beta2_scale import V1beta2Scale
-from .models.v1beta2_scale_spec import V1beta2ScaleSpec
-from .models.v1beta2_scale_status import V1beta2ScaleStatus
-from .models.v1beta2_stateful_set import V1beta2StatefulSet
-from .models.v1beta2_stateful_set_condition import V1beta2StatefulSetCondition
-from .models.v1beta2_stateful_set_list import V1beta2StatefulSetList
-from .models.v1beta2_stateful_set_spec import V1beta2StatefulSetSpec
-from .models.v1beta2_stateful_set_status import V1beta2StatefulSetStatus
-from .models.v1beta2_stateful_set_update_strategy import V1beta2StatefulSetUpdateStrategy
-from .models.v2alpha1_cron_job import V2alpha1CronJob
-from .models.v2alpha1_cron_job_list import V2alpha1CronJobList
-from .models.v2alpha1_cron_job_spec import V2alpha1CronJobSpec
-from .models.v2alpha1_cron_job_status import V2alpha1CronJobStatus
-from .models.v2alpha1_job_template_spec import V2alpha1JobTemplateSpec
-from .models.v2beta1_cross_version_object_reference import V2beta1CrossVersionObjectReference
-from .models.v2beta1_external_metric_source import V2beta1ExternalMetricSource
-from .models.v2beta1_external_metric_status import V2beta1ExternalMetricStatus
-from .models.v2beta1_horizontal_pod_autoscaler import V2beta1HorizontalPodAutoscaler
-from .models.v2beta1_horizontal_pod_autoscaler_condition import V2beta1HorizontalPodAutoscalerCondition
-from .models.v2beta1_horizontal_pod_autoscaler_list import V2beta1HorizontalPodAutoscalerList
-from .models.v2beta1_horizontal_pod_autoscaler_spec import V2beta1HorizontalPodAutoscalerSpec
-from .models.v2beta1_horizontal_pod_autoscaler_status import V2beta1HorizontalPodAutoscalerStatus
-from .models.v2beta1_metric_spec import V2beta1MetricSpec
-from .models.v2beta1_metric_status import V2beta1MetricStatus
-from .models.v2beta1_object_metric_source import V2beta1ObjectMetricSource
-from .models.v2beta1_object_metric_status import V2beta1ObjectMetricStatus
-from .models.v2beta1_pods_metric_source import V2beta1PodsMetricSource
-from .models.v2beta1_pods_metric_status import V2beta1PodsMetricStatus
-from .models.v2beta1_resource_metric_source import V2beta1ResourceMetricSource
-from .models.v2beta1_resource_metric_status import V2beta1ResourceMetricStatus
-from .models.v2beta2_cross_version_object_reference import V2beta2CrossVersionObjectReference
-from .models.v2beta2_external_metric_source import V2beta2ExternalMetricSource
-from .models.v2beta2_external_metric_status import V2beta2ExternalMetricStatus
-from .models.v2beta2_horizontal_pod_autoscaler import V2beta2HorizontalPodAutoscaler
-from .models.v2beta2_horizontal_pod_autoscaler_condition import V2beta2HorizontalPodAutoscalerCondition
-from .models.v2beta2_horizontal_pod_autoscaler_list import V2beta2HorizontalPodAutoscalerList
-from .models.v2beta2_horizontal_pod_autoscaler_spec import V2beta2HorizontalPodAutoscalerSpec
-from .models.v2beta2_horizontal_pod_autoscaler_status import V2beta2HorizontalPodAutoscalerStatus
-from .models.v2beta2_metric_identifier import V2beta2MetricIdentifier
-from .models.v2beta2_metric_spec import V2beta2MetricSpec
-from .models.v2beta2_metric_status import V2beta2MetricStatus
-from .models.v2beta2_metric_target import V2beta2MetricTarget
-from .models.v2beta2_metric_value_status import V2beta2MetricValueStatus
-from .models.v2beta2_object_metric_source import V2beta2ObjectMetricSource
-from .models.v2beta2_object_metric_status import V2beta2ObjectMetricStatus
-from .models.v2beta2_pods_metric_source import V2beta2PodsMetricSource
-from .models.v2beta2_pods_metric_status import V2beta2PodsMetricStatus
-from .models.v2beta2_resource_metric_source import V2beta2ResourceMetricSource
-from .models.v2beta2_resource_metric_status import V2beta2ResourceMetricStatus
-from .models.version_info import VersionInfo
-
-# import apis into sdk package
-from .apis.admissionregistration_api import AdmissionregistrationApi
-from .apis.admissionregistration_v1beta1_api import AdmissionregistrationV1beta1Api
-from .apis.apiextensions_api import ApiextensionsApi
-from .apis.apiextensions_v1beta1_api import ApiextensionsV1beta1Api
-from .apis.apiregistration_api import ApiregistrationApi
-from .apis.apiregistration_v1_api import ApiregistrationV1Api
-from .apis.apiregistration_v1beta1_api import ApiregistrationV1beta1Api
-from .apis.apis_api import ApisApi
-from .apis.apps_api import AppsApi
-from .apis.apps_v1_api import AppsV1Api
-from .apis.apps_v1beta1_api import AppsV1beta1Api
-from .apis.apps_v1beta2_api import AppsV1beta2Api
-from .apis.auditregistration_api import AuditregistrationApi
-from .apis.auditregistration_v1alpha1_api import AuditregistrationV1alpha1Api
-from .apis.authentication_api import AuthenticationApi
-from .apis.authentication_v1_api import AuthenticationV1Api
-from .apis.authentication_v1beta1_api import AuthenticationV1beta1Api
-from .apis.authorization_api import AuthorizationApi
-from .apis.authorization_v1_api import AuthorizationV1Api
-from .apis.authorization_v1beta1_api import AuthorizationV1beta1Api
-from .apis.autoscaling_api import AutoscalingApi
-from .apis.autoscaling_v1_api import AutoscalingV1Api
-from .apis.autoscaling_v2beta1_api import AutoscalingV2beta1Api
-from .apis.autoscaling_v2beta2_api import AutoscalingV2beta2Api
-from .apis.batch_api import BatchApi
-from .apis.batch_v1_api import BatchV1Api
-from .apis.batch_v1beta1_api import BatchV1beta1Api
-from .apis.batch_v2alpha1_api import BatchV2alpha1Api
-from .apis.certificates_api import CertificatesApi
-from .apis.certificates_v1beta1_api import CertificatesV1beta1Api
-from .apis.coordination_api import CoordinationApi
-from .apis.coordination_v1_api import CoordinationV1Api
-from .apis.coordination_v1beta1_api import CoordinationV1beta1Api
-from .apis.core_api import CoreApi
-from .apis.core_v1_api import CoreV1Api
-from .apis.custom_objects_api import CustomObjectsApi
-from .apis.events_api import EventsApi
-from .apis.events_v1beta1_api import EventsV1beta1Api
-from .apis.extensions_api import ExtensionsApi
-from .apis.extensions_v1beta1_api import ExtensionsV1beta1Api
-from .apis.logs_api import LogsApi
-from .apis.networking_api import NetworkingApi
-from .apis.networking_v1_api import NetworkingV1Api
-from .apis.networking_v1beta1_api import NetworkingV1beta1Api
-from .apis.node_api import NodeApi
-from .apis.node_v1alpha1_api import NodeV1alpha1Api
-from .apis.node_v1beta1_api import NodeV1beta1Api
-from .apis.policy_api import PolicyApi
-from .apis.policy_v1beta1_api import PolicyV1beta1Api
-from .apis.rbac_authorization_api import RbacAuthorizationApi
-from .apis.rbac_authorization_v1_api import RbacAuthorizationV1Api
-from .apis.rbac_authorization_v1alpha1_api import RbacAuthorizationV1alpha1Api
-from .apis.rbac_authorization_v1beta1_api import RbacAuthorizationV1beta1Api
-from .apis.scheduling_api import SchedulingApi
-from .apis.scheduling_v1_api import SchedulingV1Api
-from .apis.scheduling_v1alpha1_api import SchedulingV1alpha1Api
-from .apis.scheduling_v1beta1_api import SchedulingV1beta1Api
-from .apis.settings_api import SettingsApi
-from .apis.settings_v1alpha1_api import SettingsV1alpha1Api
-from .apis.storage_api import StorageApi
-from .apis.storage_v1_api import StorageV1Api
-from .apis.storage_v1alpha1_api import StorageV1alpha1Api
-from .apis.storage_v1beta1_api import StorageV1beta1Api
-from .apis.version_api import VersionApi
+from . import apis, models
+from .lazy_import import install_lazy_imports
+
+# models and apis are re-exported by the sdk package, imported on first
+# access
+install_lazy_imports(
+    __name__, globals(),
+    dict([(name, '.models' + module)
+          for name, module in models._MODELS.items()] +
+         [(name, '.apis' + module)
+          for name, module in apis._APIS.items()]),
+    ['apis', 'models'])
 
 # import ApiClient
 from .api_client import ApiClient
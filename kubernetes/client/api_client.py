@@ -13,9 +13,9 @@ from __future__ import absolute_import
 
 import os
 import re
-import json
 import mimetypes
 import tempfile
+import threading
 from multiprocessing.pool import ThreadPool
 
 from datetime import date, datetime
@@ -25,8 +25,84 @@ from six import PY3, integer_types, iteritems, text_type
 from six.moves.urllib.parse import quote
 
 from . import models
+from .compact import compact_model
 from .configuration import Configuration
+from .interning import intern_json, intern_string
+from .json_codec import json_codec_for, model_encoder
+from .json_stream import ListStream
+from .lazy_model import lazy_model_builder
+from .metrics import (RequestMetrics, now, resource_of, set_current,
+                      verb_of)
 from .rest import ApiException, RESTClientObject
+from .rfc3339 import parse_rfc3339, parse_rfc3339_date
+from .singleflight import SingleFlight, coalescible, request_key
+
+
+def model_builder(klass, fields):
+    """
+    Returns the function building the models of a class out of their json.
+
+    The models are built through the `_from_server` constructor of the
+    generated classes, which skips the validation of the setters: the
+    server is trusted, and a response missing a required attribute, or
+    restricted to a projection, is not an error.
+
+    :param klass: generated model class.
+    :param fields: dict mapping the json keys of the model to the pair of
+        its attribute name and the deserializer of its value. It is filled
+        in after this call. The attributes missing from it are left None.
+    :return: function taking the decoded json of a model.
+    """
+    # models not generated with `_from_server` are built by their constructor
+    construct = getattr(klass, '_from_server', klass)
+
+    def build(data):
+        kwargs = {}
+        if isinstance(data, dict):
+            for key, value in iteritems(data):
+                field = fields.get(key)
+                if field is not None:
+                    kwargs[field[0]] = field[1](value)
+        return construct(**kwargs)
+    return build
+
+
+def compact_model_builder(klass, fields):
+    """
+    `model_builder` of the compact variants of the models.
+    """
+    return model_builder(compact_model(klass), fields)
+
+
+class _Flavor(object):
+    """
+    How a client deserializes responses: the `model_builder` of its models
+    and whether it interns strings. The deserializers compiled for a flavor
+    are shared by all the clients of that flavor.
+    """
+
+    _flavors = {}
+    _lock = threading.Lock()
+
+    def __init__(self, builder, intern=False):
+        self.builder = builder
+        self.intern = intern
+        # the models wrapping their json keep its strings, which are then
+        # interned up front
+        self.intern_json = intern and getattr(builder, 'wraps_json', False)
+        # compiled deserializers, keyed by class literal or type string
+        self.deserializers = {}
+        # deserializers restricted to a projection, keyed by type and
+        # list of fields
+        self.projections = {}
+
+    @classmethod
+    def of(cls, builder, intern=False):
+        key = (builder, intern)
+        with cls._lock:
+            if key not in cls._flavors:
+                cls._flavors[key] = cls(builder, intern)
+            return cls._flavors[key]
 
 
 class ApiClient(object):
@@ -59,6 +135,9 @@ class ApiClient(object):
         'object': object,
     }
     _pool = None
+    # class of the REST client, e.g. that of the asyncio flavour
+    _rest_client_class = RESTClientObject
+    _deserializers_lock = threading.Lock()
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None, pool_threads=None):
@@ -67,7 +146,19 @@ class ApiClient(object):
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = RESTClientObject(configuration)
+        self.rest_client = self._rest_client_class(configuration)
+        self.json_codec = json_codec_for(configuration)
+        builder = model_builder
+        if configuration.lazy_models:
+            builder = lazy_model_builder
+        elif configuration.compact_models:
+            builder = compact_model_builder
+        self._flavor = _Flavor.of(builder, configuration.intern_strings)
+        sink = configuration.metrics_sink
+        self._observe = getattr(sink, 'observe', sink)
+        self._singleflight = None
+        if configuration.singleflight:
+            self._singleflight = SingleFlight()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -112,8 +203,98 @@ class ApiClient(object):
                    body=None, post_params=None, files=None,
                    response_type=None, auth_settings=None,
                    _return_http_data_only=None, collection_formats=None, _preload_content=True,
-                   _request_timeout=None):
+                   _request_timeout=None, _fields=None):
+
+        metrics = self.start_metrics(method, resource_path, query_params)
+        coalesce = self._singleflight is not None and _preload_content and \
+            coalescible(method, resource_path, query_params)
+
+        url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+
+        key = None
+        if coalesce:
+            key = request_key(url, query_params, header_params)
 
+        if metrics is not None:
+            metrics.add('sanitize', now() - metrics.start)
+            # timed by the REST client and its connection pools
+            set_current(metrics)
+        # perform request and return response
+        try:
+            if key is not None:
+                # identical concurrent reads share one response, and
+                # deserialize models of their own out of it
+                timeout = _request_timeout
+                if isinstance(timeout, tuple):
+                    # (connect, read), unbounded if either is
+                    timeout = None if None in timeout else sum(timeout)
+                response_data = self._singleflight.do(
+                    key,
+                    lambda: self.request(method, url,
+                                         query_params=query_params,
+                                         headers=header_params,
+                                         _request_timeout=_request_timeout),
+                    timeout or None)
+            else:
+                response_data = self.request(method, url,
+                                             query_params=query_params,
+                                             headers=header_params,
+                                             post_params=post_params, body=body,
+                                             _preload_content=_preload_content,
+                                             _request_timeout=_request_timeout)
+        except Exception as e:
+            if metrics is not None:
+                self.observe_metrics(metrics, getattr(e, 'status', None))
+            raise
+        finally:
+            if metrics is not None:
+                set_current(None)
+
+        return self.process_response(response_data, response_type,
+                                     _return_http_data_only, _preload_content,
+                                     _fields, metrics)
+
+    def start_metrics(self, method, resource_path, query_params=None):
+        """
+        Starts the RequestMetrics of a call, if the configuration has a
+        `metrics_sink`.
+
+        :param resource_path: path of the endpoint, with the placeholders
+            of its path parameters.
+        :return: RequestMetrics, or None.
+        """
+        if self._observe is None:
+            return None
+        return RequestMetrics(verb_of(method, resource_path, query_params),
+                              resource_of(resource_path), method,
+                              resource_path)
+
+    def observe_metrics(self, metrics, status):
+        """
+        Ends the RequestMetrics of a call and hands them to the
+        `metrics_sink` of the configuration.
+
+        :param status: http status of the response, None if there is none.
+        """
+        metrics.finish(status)
+        self._observe(metrics)
+
+    def prepare_request(self, resource_path, path_params=None,
+                        query_params=None, header_params=None, body=None,
+                        post_params=None, files=None, auth_settings=None,
+                        collection_formats=None):
+        """
+        Sanitizes the parameters of a call and resolves its url.
+
+        This is the transport independent first half of a call, shared by
+        the blocking and the asyncio clients.
+
+        :return: tuple of (url, query_params, header_params, post_params,
+            body) ready to be handed to the REST client.
+        """
         config = self.configuration
 
         # header parameters
@@ -121,7 +302,10 @@ class ApiClient(object):
         header_params.update(self.default_headers)
         if self.cookie:
             header_params['Cookie'] = self.cookie
-        if header_params:
+        # the headers of the endpoints, see Endpoint.headers, and the
+        # default ones are strings already
+        if header_params and not all(isinstance(value, (str, text_type))
+                                     for value in header_params.values()):
             header_params = self.sanitize_for_serialization(header_params)
             header_params = dict(self.parameters_to_tuples(header_params,
                                                            collection_formats))
@@ -152,30 +336,51 @@ class ApiClient(object):
         # auth setting
         self.update_params_for_auth(header_params, query_params, auth_settings)
 
-        # body
-        if body:
+        # body, the json codecs encoding models serialize it directly
+        if body and not getattr(self.json_codec, 'encodes_models', False):
             body = self.sanitize_for_serialization(body)
 
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(method, url,
-                                     query_params=query_params,
-                                     headers=header_params,
-                                     post_params=post_params, body=body,
-                                     _preload_content=_preload_content,
-                                     _request_timeout=_request_timeout)
+        return url, query_params, header_params, post_params, body
+
+    def process_response(self, response_data, response_type,
+                         _return_http_data_only=None, _preload_content=True,
+                         _fields=None, _metrics=None):
+        """
+        Deserializes a response into the value returned by `call_api`.
+
+        This is the transport independent second half of a call, shared by
+        the blocking and the asyncio clients.
 
+        :param _fields: projection of the response, see `deserialize`.
+        :param _metrics: RequestMetrics of the call, observed once the
+            response is deserialized, see `start_metrics`.
+        """
         self.last_response = response_data
 
         return_data = response_data
         if _preload_content:
             # deserialize response data
-            if response_type:
-                return_data = self.deserialize(response_data, response_type)
-            else:
+            if not response_type:
                 return_data = None
+            elif _metrics is not None and response_type != "file":
+                start = now()
+                data = self.__decode(response_data)
+                decoded = now()
+                return_data = self.__deserialize_data(data, response_type,
+                                                      _fields)
+                _metrics.add('decode', decoded - start)
+                _metrics.add('deserialize', now() - decoded)
+            else:
+                return_data = self.deserialize(response_data, response_type,
+                                               _fields)
+
+        if _metrics is not None:
+            if _preload_content:
+                _metrics.response_bytes = len(response_data.data)
+            self.observe_metrics(_metrics, response_data.status)
 
         if _return_http_data_only:
             return (return_data)
@@ -218,20 +423,26 @@ class ApiClient(object):
             # and attributes which value is not None.
             # Convert attribute name to json key in
             # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in iteritems(obj.swagger_types)
-                        if getattr(obj, attr) is not None}
+            obj_dict = model_encoder(type(obj))(obj)
 
         return {key: self.sanitize_for_serialization(val)
                 for key, val in iteritems(obj_dict)}
 
-    def deserialize(self, response, response_type):
+    def deserialize(self, response, response_type, fields=None):
         """
         Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param fields: projection of the response, list of the dotted
+            paths of the attributes to deserialize, e.g.
+            `['metadata.name', 'status.phase']`. Paths go through lists
+            and dicts of models, and name attributes or json keys. The
+            attributes outside of the projection are left None, their json
+            is not deserialized. The paths of a list response, e.g.
+            `V1PodList`, apply to its items, and its other attributes are
+            deserialized in full. None deserializes everything.
 
         :return: deserialized object.
         """
@@ -240,14 +451,58 @@ class ApiClient(object):
         if response_type == "file":
             return self.__deserialize_file(response)
 
-        # fetch data from response object
+        return self.__deserialize_data(self.__decode(response), response_type,
+                                       fields)
+
+    def __decode(self, response):
+        """
+        Decodes the body of a response into json values.
+        """
         try:
-            data = json.loads(response.data)
+            data = self.json_codec.loads(response.data)
         except ValueError:
             data = response.data
+            if PY3 and isinstance(data, bytes):
+                data = data.decode('utf8')
+        return data
 
+    def __deserialize_data(self, data, response_type, fields):
+        """
+        Deserializes the decoded body of a response, see `deserialize`.
+        """
+        if fields is not None:
+            if self._flavor.intern_json:
+                data = intern_json(data)
+            return self.__projected_deserializer(response_type, fields)(data)
         return self.__deserialize(data, response_type)
 
+    def deserialize_stream(self, response, response_type):
+        """
+        Deserializes the items of a list response while it is read.
+
+        Only one item is decoded at a time instead of the whole body, which
+        bounds the memory used by large lists.
+
+        :param response: urllib3.HTTPResponse of a call made with
+            `_preload_content=False`.
+        :param response_type: list class literal, or string of class name,
+            e.g. `V1PodList`. For `object` the items are left as dicts.
+        :return: ListStream, iterable of the deserialized items.
+        """
+        klass = response_type
+        if type(klass) == str and klass != 'object':
+            klass = getattr(models, klass)
+        if klass in ('object', object):
+            item_type = metadata_type = 'object'
+        else:
+            item_type = re.match(r'list\[(.*)\]',
+                                 klass.swagger_types['items']).group(1)
+            metadata_type = klass.swagger_types['metadata']
+
+        return ListStream(response,
+                          lambda item: self.__deserialize(item, item_type),
+                          lambda data: self.__deserialize(data, metadata_type))
+
     def __deserialize(self, data, klass):
         """
         Deserializes dict, list, str into an object.
@@ -257,43 +512,259 @@ class ApiClient(object):
 
         :return: object.
         """
-        if data is None:
-            return None
+        flavor = self._flavor
+        if flavor.intern_json:
+            data = intern_json(data)
+        try:
+            deserializer = flavor.deserializers[klass]
+        except KeyError:
+            deserializer = self.__compile_deserializer(klass, flavor)
+        return deserializer(data)
+
+    @classmethod
+    def __compile_deserializer(cls, klass, flavor):
+        """
+        Compiles the deserializer of a type once and caches it.
 
+        The deserializers of all the types reachable from `klass` are
+        compiled along with it, and only published to the shared cache once
+        complete, so concurrent readers never see a partial plan.
+
+        :param klass: class literal, or string of class name.
+        :param flavor: _Flavor of the deserializer.
+        :return: function taking the decoded json and returning the object.
+        """
+        with cls._deserializers_lock:
+            compiled = {}
+            deserializer = cls.__build_deserializer(klass, compiled, flavor)
+            flavor.deserializers.update(compiled)
+        return deserializer
+
+    def __projected_deserializer(self, klass, fields):
+        """
+        Returns the deserializer of a type restricted to a projection,
+        compiled once per type and projection.
+        """
+        flavor = self._flavor
+        key = (klass, tuple(fields))
+        try:
+            return flavor.projections[key]
+        except KeyError:
+            pass
+        tree = {}
+        for path in fields:
+            node = tree
+            names = path.split('.')
+            for name in names[:-1]:
+                node = node.setdefault(name, {})
+                if node is None:
+                    # a parent is deserialized in full
+                    break
+            else:
+                node[names[-1]] = None
+
+        with self._deserializers_lock:
+            compiled = {}
+            deserializer = self.__build_projected_deserializer(
+                klass, tree, compiled, flavor, True)
+            flavor.deserializers.update(compiled)
+            flavor.projections[key] = deserializer
+        return deserializer
+
+    @classmethod
+    def __build_projected_deserializer(cls, klass, tree, compiled, flavor,
+                                       root=False):
         if type(klass) == str:
             if klass.startswith('list['):
-                sub_kls = re.match('list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
+                deserialize_item = cls.__build_projected_deserializer(
+                    re.match(r'list\[(.*)\]', klass).group(1), tree,
+                    compiled, flavor)
+
+                def deserializer(data):
+                    if data is None:
+                        return None
+                    return [deserialize_item(sub_data) for sub_data in data]
+                return deserializer
             if klass.startswith('dict('):
-                sub_kls = re.match('dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in iteritems(data)}
+                deserialize_value = cls.__build_projected_deserializer(
+                    re.match(r'dict\(([^,]*), (.*)\)', klass).group(2), tree,
+                    compiled, flavor)
+                intern_key = intern_string if flavor.intern else None
+
+                def deserializer(data):
+                    if data is None:
+                        return None
+                    if intern_key is not None:
+                        return {intern_key(k): deserialize_value(v)
+                                for k, v in iteritems(data)}
+                    return {k: deserialize_value(v)
+                            for k, v in iteritems(data)}
+                return deserializer
+            if klass in cls.NATIVE_TYPES_MAPPING:
+                raise ValueError("Cannot project {0} on {1}".format(
+                    sorted(tree), klass))
+            klass = getattr(models, klass)
+        if not getattr(klass, 'swagger_types', None):
+            raise ValueError("Cannot project {0} on {1}".format(
+                sorted(tree), getattr(klass, '__name__', klass)))
+
+        items_type = klass.swagger_types.get('items', '')
+        if root and items_type.startswith('list['):
+            # the projection of a list applies to its items
+            items_tree = tree
+            tree = dict((attr, None) for attr in klass.swagger_types)
+            tree['items'] = items_tree
+
+        attrs = dict((key, attr) for attr, key in
+                     iteritems(klass.attribute_map))
+        fields = {}
+        for name, subtree in iteritems(tree):
+            attr = name if name in klass.swagger_types else attrs.get(name)
+            if attr is None:
+                raise ValueError("{0} has no attribute {1}".format(
+                    klass.__name__, name))
+            attr_type = klass.swagger_types[attr]
+            if subtree is None:
+                deserialize = cls.__build_deserializer(
+                    attr_type, compiled, flavor)
+            else:
+                deserialize = cls.__build_projected_deserializer(
+                    attr_type, subtree, compiled, flavor)
+            fields[klass.attribute_map[attr]] = (attr, deserialize)
+        build = flavor.builder(klass, fields)
+
+        def deserializer(data):
+            if data is None:
+                return None
+            return build(data)
+        return deserializer
+
+    @classmethod
+    def __build_deserializer(cls, klass, compiled, flavor):
+        if klass in flavor.deserializers:
+            return flavor.deserializers[klass]
+        if klass in compiled:
+            return compiled[klass]
 
+        if type(klass) == str:
+            if klass.startswith('list['):
+                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+                deserializer = cls.__build_list_deserializer(
+                    sub_kls, compiled, flavor)
+            elif klass.startswith('dict('):
+                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+                deserializer = cls.__build_dict_deserializer(
+                    sub_kls, compiled, flavor)
             # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+            elif klass in cls.NATIVE_TYPES_MAPPING:
+                deserializer = cls.__build_deserializer(
+                    cls.NATIVE_TYPES_MAPPING[klass], compiled, flavor)
             else:
-                klass = getattr(models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+                deserializer = cls.__build_deserializer(
+                    getattr(models, klass), compiled, flavor)
+        elif klass in (str, text_type) and flavor.intern:
+            def deserializer(data):
+                if data is None:
+                    return None
+                return intern_string(cls.__deserialize_primitive(data, klass))
+        elif klass in cls.PRIMITIVE_TYPES:
+            def deserializer(data):
+                if data is None:
+                    return None
+                return cls.__deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            if flavor.intern:
+                deserializer = intern_json
+            else:
+                deserializer = cls.__deserialize_object
         elif klass == date:
-            return self.__deserialize_date(data)
+            def deserializer(data):
+                if data is None:
+                    return None
+                return cls.__deserialize_date(data)
         elif klass == datetime:
-            return self.__deserialize_datatime(data)
+            def deserializer(data):
+                if data is None:
+                    return None
+                return cls.__deserialize_datatime(data)
         else:
-            return self.__deserialize_model(data, klass)
+            return cls.__build_model_deserializer(klass, compiled, flavor)
+
+        compiled[klass] = deserializer
+        return deserializer
+
+    @classmethod
+    def __build_list_deserializer(cls, sub_kls, compiled, flavor):
+        deserialize_item = cls.__build_deserializer(sub_kls, compiled, flavor)
+
+        def deserializer(data):
+            if data is None:
+                return None
+            return [deserialize_item(sub_data) for sub_data in data]
+        return deserializer
+
+    @classmethod
+    def __build_dict_deserializer(cls, sub_kls, compiled, flavor):
+        deserialize_value = cls.__build_deserializer(sub_kls, compiled, flavor)
+
+        if flavor.intern:
+            def deserializer(data):
+                if data is None:
+                    return None
+                return {intern_string(k): deserialize_value(v)
+                        for k, v in iteritems(data)}
+            return deserializer
+
+        def deserializer(data):
+            if data is None:
+                return None
+            return {k: deserialize_value(v) for k, v in iteritems(data)}
+        return deserializer
+
+    @classmethod
+    def __build_model_deserializer(cls, klass, compiled, flavor):
+        """
+        Compiles the deserializer of a model class.
+
+        The plan maps every json key of the model to its attribute name and
+        to the deserializer of its type, so that decoding an instance only
+        walks the keys actually present in the data.
+        """
+        polymorphic = hasattr(klass, 'get_real_child_model')
+        if not klass.swagger_types and not polymorphic:
+            compiled[klass] = cls.__deserialize_object
+            return cls.__deserialize_object
+
+        # json key -> (attribute name, deserializer), filled in below so
+        # that self referencing models resolve to this very plan.
+        fields = {}
+        build = flavor.builder(klass, fields)
+
+        def deserializer(data):
+            if data is None:
+                return None
+            instance = build(data)
+
+            if polymorphic:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    child = flavor.deserializers.get(klass_name) or \
+                        cls.__compile_deserializer(klass_name, flavor)
+                    instance = child(data)
+            return instance
+
+        compiled[klass] = deserializer
+        for attr, attr_type in iteritems(klass.swagger_types or {}):
+            fields[klass.attribute_map[attr]] = (
+                attr, cls.__build_deserializer(attr_type, compiled, flavor))
+        return deserializer
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None, _preload_content=True,
-                 _request_timeout=None):
+                 _request_timeout=None, _fields=None):
         """
         Makes the HTTP request (synchronous) and return the deserialized data.
         To make an async request, set the async parameter.
@@ -319,6 +790,8 @@ class ApiClient(object):
                                  reading/decoding response data. Default is True.
         :param _request_timeout: timeout setting for this request. If one number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of (connection, read) timeouts.
+        :param _fields: projection of the response, list of the dotted paths
+                        of the attributes to deserialize, see `deserialize`.
         :return:
             If async parameter is True,
             the request will be called asynchronously.
@@ -331,7 +804,8 @@ class ApiClient(object):
                                    path_params, query_params, header_params,
                                    body, post_params, files,
                                    response_type, auth_settings,
-                                   _return_http_data_only, collection_formats, _preload_content, _request_timeout)
+                                   _return_http_data_only, collection_formats, _preload_content, _request_timeout,
+                                   _fields)
         else:
             thread = self.pool.apply_async(self.__call_api, (resource_path, method,
                                            path_params, query_params,
@@ -339,7 +813,8 @@ class ApiClient(object):
                                            post_params, files,
                                            response_type, auth_settings,
                                            _return_http_data_only,
-                                           collection_formats, _preload_content, _request_timeout))
+                                           collection_formats, _preload_content, _request_timeout,
+                                           _fields))
         return thread
 
     def request(self, method, url, query_params=None, headers=None,
@@ -541,12 +1016,13 @@ class ApiClient(object):
                 group(1)
             path = os.path.join(os.path.dirname(path), filename)
 
-        with open(path, "w") as f:
+        with open(path, "wb" if isinstance(response.data, bytes) else "w") as f:
             f.write(response.data)
 
         return path
 
-    def __deserialize_primitive(self, data, klass):
+    @staticmethod
+    def __deserialize_primitive(data, klass):
         """
         Deserializes string to primitive type.
 
@@ -562,7 +1038,8 @@ class ApiClient(object):
         except TypeError:
             return data
 
-    def __deserialize_object(self, value):
+    @staticmethod
+    def __deserialize_object(value):
         """
         Return a original value.
 
@@ -570,13 +1047,17 @@ class ApiClient(object):
         """
         return value
 
-    def __deserialize_date(self, string):
+    @staticmethod
+    def __deserialize_date(string):
         """
         Deserializes string to date.
 
         :param string: str.
         :return: date.
         """
+        parsed = parse_rfc3339_date(string)
+        if parsed is not None:
+            return parsed
         try:
             from dateutil.parser import parse
             return parse(string).date()
@@ -588,15 +1069,20 @@ class ApiClient(object):
                 reason="Failed to parse `{0}` into a date object".format(string)
             )
 
-    def __deserialize_datatime(self, string):
+    @staticmethod
+    def __deserialize_datatime(string):
         """
         Deserializes string to datetime.
 
-        The string should be in iso8601 datetime format.
+        The string should be in iso8601 datetime format, the RFC 3339
+        timestamps sent by the apiserver are parsed without dateutil.
 
         :param string: str.
         :return: datetime.
         """
+        parsed = parse_rfc3339(string)
+        if parsed is not None:
+            return parsed
         try:
             from dateutil.parser import parse
             return parse(string)
@@ -610,32 +1096,3 @@ class ApiClient(object):
                     .format(string)
                 )
             )
-
-    def __deserialize_model(self, data, klass):
-        """
-        Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.swagger_types and not hasattr(klass, 'get_real_child_model'):
-            return data
-
-        kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in iteritems(klass.swagger_types):
-                if data is not None \
-                   and klass.attribute_map[attr] in data \
-                   and isinstance(data, (list, dict)):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
@@ -1,67 +1,76 @@
+# coding: utf-8
+
 from __future__ import absolute_import
 
-# import apis into api package
-from .admissionregistration_api import AdmissionregistrationApi
-from .admissionregistration_v1beta1_api import AdmissionregistrationV1beta1Api
-from .apiextensions_api import ApiextensionsApi
-from .apiextensions_v1beta1_api import ApiextensionsV1beta1Api
-from .apiregistration_api import ApiregistrationApi
-from .apiregistration_v1_api import ApiregistrationV1Api
-from .apiregistration_v1beta1_api import ApiregistrationV1beta1Api
-from .apis_api import ApisApi
-from .apps_api import AppsApi
-from .apps_v1_api import AppsV1Api
-from .apps_v1beta1_api import AppsV1beta1Api
-from .apps_v1beta2_api import AppsV1beta2Api
-from .auditregistration_api import AuditregistrationApi
-from .auditregistration_v1alpha1_api import AuditregistrationV1alpha1Api
-from .authentication_api import AuthenticationApi
-from .authentication_v1_api import AuthenticationV1Api
-from .authentication_v1beta1_api import AuthenticationV1beta1Api
-from .authorization_api import AuthorizationApi
-from .authorization_v1_api import AuthorizationV1Api
-from .authorization_v1beta1_api import AuthorizationV1beta1Api
-from .autoscaling_api import AutoscalingApi
-from .autoscaling_v1_api import AutoscalingV1Api
-from .autoscaling_v2beta1_api import AutoscalingV2beta1Api
-from .autoscaling_v2beta2_api import AutoscalingV2beta2Api
-from .batch_api import BatchApi
-from .batch_v1_api import BatchV1Api
-from .batch_v1beta1_api import BatchV1beta1Api
-from .batch_v2alpha1_api import BatchV2alpha1Api
-from .certificates_api import CertificatesApi
-from .certificates_v1beta1_api import CertificatesV1beta1Api
-from .coordination_api import CoordinationApi
-from .coordination_v1_api import CoordinationV1Api
-from .coordination_v1beta1_api import CoordinationV1beta1Api
-from .core_api import CoreApi
-from .core_v1_api import CoreV1Api
-from .custom_objects_api import CustomObjectsApi
-from .events_api import EventsApi
-from .events_v1beta1_api import EventsV1beta1Api
-from .extensions_api import ExtensionsApi
-from .extensions_v1beta1_api import ExtensionsV1beta1Api
-from .logs_api import LogsApi
-from .networking_api import NetworkingApi
-from .networking_v1_api import NetworkingV1Api
-from .networking_v1beta1_api import NetworkingV1beta1Api
-from .node_api import NodeApi
-from .node_v1alpha1_api import NodeV1alpha1Api
-from .node_v1beta1_api import NodeV1beta1Api
-from .policy_api import PolicyApi
-from .policy_v1beta1_api import PolicyV1beta1Api
-from .rbac_authorization_api import RbacAuthorizationApi
-from .rbac_authorization_v1_api import RbacAuthorizationV1Api
-from .rbac_authorization_v1alpha1_api import RbacAuthorizationV1alpha1Api
-from .rbac_authorization_v1beta1_api import RbacAuthorizationV1beta1Api
-from .scheduling_api import SchedulingApi
-from .scheduling_v1_api import SchedulingV1Api
-from .scheduling_v1alpha1_api import SchedulingV1alpha1Api
-from .scheduling_v1beta1_api import SchedulingV1beta1Api
-from .settings_api import SettingsApi
-from .settings_v1alpha1_api import SettingsV1alpha1Api
-from .storage_api import StorageApi
-from .storage_v1_api import StorageV1Api
-from .storage_v1alpha1_api import StorageV1alpha1Api
-from .storage_v1beta1_api import StorageV1beta1Api
-from .version_api import VersionApi
+from ..lazy_import import install_lazy_imports
+
+# apis of this package, imported on first access
+_APIS = {
+    'AdmissionregistrationApi': '.admissionregistration_api',
+    'AdmissionregistrationV1beta1Api': '.admissionregistration_v1beta1_api',
+    'ApiextensionsApi': '.apiextensions_api',
+    'ApiextensionsV1beta1Api': '.apiextensions_v1beta1_api',
+    'ApiregistrationApi': '.apiregistration_api',
+    'ApiregistrationV1Api': '.apiregistration_v1_api',
+    'ApiregistrationV1beta1Api': '.apiregistration_v1beta1_api',
+    'ApisApi': '.apis_api',
+    'AppsApi': '.apps_api',
+    'AppsV1Api': '.apps_v1_api',
+    'AppsV1beta1Api': '.apps_v1beta1_api',
+    'AppsV1beta2Api': '.apps_v1beta2_api',
+    'AuditregistrationApi': '.auditregistration_api',
+    'AuditregistrationV1alpha1Api': '.auditregistration_v1alpha1_api',
+    'AuthenticationApi': '.authentication_api',
+    'AuthenticationV1Api': '.authentication_v1_api',
+    'AuthenticationV1beta1Api': '.authentication_v1beta1_api',
+    'AuthorizationApi': '.authorization_api',
+    'AuthorizationV1Api': '.authorization_v1_api',
+    'AuthorizationV1beta1Api': '.authorization_v1beta1_api',
+    'AutoscalingApi': '.autoscaling_api',
+    'AutoscalingV1Api': '.autoscaling_v1_api',
+    'AutoscalingV2beta1Api': '.autoscaling_v2beta1_api',
+    'AutoscalingV2beta2Api': '.autoscaling_v2beta2_api',
+    'BatchApi': '.batch_api',
+    'BatchV1Api': '.batch_v1_api',
+    'BatchV1beta1Api': '.batch_v1beta1_api',
+    'BatchV2alpha1Api': '.batch_v2alpha1_api',
+    'CertificatesApi': '.certificates_api',
+    'CertificatesV1beta1Api': '.certificates_v1beta1_api',
+    'CoordinationApi': '.coordination_api',
+    'CoordinationV1Api': '.coordination_v1_api',
+    'CoordinationV1beta1Api': '.coordination_v1beta1_api',
+    'CoreApi': '.core_api',
+    'CoreV1Api': '.core_v1_api',
+    'CustomObjectsApi': '.custom_objects_api',
+    'EventsApi': '.events_api',
+    'EventsV1beta1Api': '.events_v1beta1_api',
+    'ExtensionsApi': '.extensions_api',
+    'ExtensionsV1beta1Api': '.extensions_v1beta1_api',
+    'LogsApi': '.logs_api',
+    'NetworkingApi': '.networking_api',
+    'NetworkingV1Api': '.networking_v1_api',
+    'NetworkingV1beta1Api': '.networking_v1beta1_api',
+    'NodeApi': '.node_api',
+    'NodeV1alpha1Api': '.node_v1alpha1_api',
+    'NodeV1beta1Api': '.node_v1beta1_api',
+    'PolicyApi': '.policy_api',
+    'PolicyV1beta1Api': '.policy_v1beta1_api',
+    'RbacAuthorizationApi': '.rbac_authorization_api',
+    'RbacAuthorizationV1Api': '.rbac_authorization_v1_api',
+    'RbacAuthorizationV1alpha1Api': '.rbac_authorization_v1alpha1_api',
+    'RbacAuthorizationV1beta1Api': '.rbac_authorization_v1beta1_api',
+    'SchedulingApi': '.scheduling_api',
+    'SchedulingV1Api': '.scheduling_v1_api',
+    'SchedulingV1alpha1Api': '.scheduling_v1alpha1_api',
+    'SchedulingV1beta1Api': '.scheduling_v1beta1_api',
+    'SettingsApi': '.settings_api',
+    'SettingsV1alpha1Api': '.settings_v1alpha1_api',
+    'StorageApi': '.storage_api',
+    'StorageV1Api': '.storage_v1_api',
+    'StorageV1alpha1Api': '.storage_v1alpha1_api',
+    'StorageV1beta1Api': '.storage_v1beta1_api',
+    'VersionApi': '.version_api',
+}
+
+install_lazy_imports(__name__, globals(), _APIS,
+                     set(module[1:] for module in _APIS.values()))
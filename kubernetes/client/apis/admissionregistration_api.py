@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class AdmissionregistrationApi(object):
@@ -69,56 +70,22 @@ class AdmissionregistrationApi(object):
                  returns the request thread.
         """
 
-        all_params = []
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_group" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIGroup',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_api_group'].call(self.api_client, (), kwargs)
+
+
+_ENDPOINTS = {
+    'get_api_group': Endpoint(
+        'get_api_group', 'GET',
+        '/apis/admissionregistration.k8s.io/',
+        response_type='V1APIGroup',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ]),
+}
@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class AdmissionregistrationV1beta1Api(object):
@@ -77,71 +78,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_mutating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1MutatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_mutating_webhook_configuration'].call(
+            self.api_client, (body,), kwargs)
 
     def create_validating_webhook_configuration(self, body, **kwargs):
         """
@@ -185,71 +123,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_validating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1ValidatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_validating_webhook_configuration'].call(
+            self.api_client, (body,), kwargs)
 
     def delete_collection_mutating_webhook_configuration(self, **kwargs):
         """
@@ -301,76 +176,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_collection_mutating_webhook_configuration'].call(
+            self.api_client, (), kwargs)
 
     def delete_collection_validating_webhook_configuration(self, **kwargs):
         """
@@ -422,76 +229,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_collection_validating_webhook_configuration'].call(
+            self.api_client, (), kwargs)
 
     def delete_mutating_webhook_configuration(self, name, **kwargs):
         """
@@ -541,77 +280,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'body', 'dry_run', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_mutating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_mutating_webhook_configuration'].call(
+            self.api_client, (name,), kwargs)
 
     def delete_validating_webhook_configuration(self, name, **kwargs):
         """
@@ -661,77 +331,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'body', 'dry_run', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_validating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_validating_webhook_configuration'].call(
+            self.api_client, (name,), kwargs)
 
     def get_api_resources(self, **kwargs):
         """
@@ -767,59 +368,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = []
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIResourceList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_api_resources'].call(
+            self.api_client, (), kwargs)
 
     def list_mutating_webhook_configuration(self, **kwargs):
         """
@@ -871,76 +421,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1MutatingWebhookConfigurationList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_mutating_webhook_configuration'].call(
+            self.api_client, (), kwargs)
 
     def list_validating_webhook_configuration(self, **kwargs):
         """
@@ -992,76 +474,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1ValidatingWebhookConfigurationList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_validating_webhook_configuration'].call(
+            self.api_client, (), kwargs)
 
     def patch_mutating_webhook_configuration(self, name, body, **kwargs):
         """
@@ -1109,78 +523,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_mutating_webhook_configuration`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_mutating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1MutatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_mutating_webhook_configuration'].call(
+            self.api_client, (name, body), kwargs)
 
     def patch_validating_webhook_configuration(self, name, body, **kwargs):
         """
@@ -1228,78 +572,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_validating_webhook_configuration`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_validating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1ValidatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_validating_webhook_configuration'].call(
+            self.api_client, (name, body), kwargs)
 
     def read_mutating_webhook_configuration(self, name, **kwargs):
         """
@@ -1343,71 +617,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'exact', 'export']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_mutating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'exact' in params:
-            query_params.append(('exact', params['exact']))
-        if 'export' in params:
-            query_params.append(('export', params['export']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1MutatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_mutating_webhook_configuration'].call(
+            self.api_client, (name,), kwargs)
 
     def read_validating_webhook_configuration(self, name, **kwargs):
         """
@@ -1451,71 +662,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'exact', 'export']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_validating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'exact' in params:
-            query_params.append(('exact', params['exact']))
-        if 'export' in params:
-            query_params.append(('export', params['export']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1ValidatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_validating_webhook_configuration'].call(
+            self.api_client, (name,), kwargs)
 
     def replace_mutating_webhook_configuration(self, name, body, **kwargs):
         """
@@ -1561,76 +709,8 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_mutating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_mutating_webhook_configuration`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_mutating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1MutatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_mutating_webhook_configuration'].call(
+            self.api_client, (name, body), kwargs)
 
     def replace_validating_webhook_configuration(self, name, body, **kwargs):
         """
@@ -1676,73 +756,297 @@ class AdmissionregistrationV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_validating_webhook_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_validating_webhook_configuration`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_validating_webhook_configuration`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1ValidatingWebhookConfiguration',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_validating_webhook_configuration'].call(
+            self.api_client, (name, body), kwargs)
+
+
+_ENDPOINTS = {
+    'create_mutating_webhook_configuration': Endpoint(
+        'create_mutating_webhook_configuration', 'POST',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations',
+        response_type='V1beta1MutatingWebhookConfiguration',
+        required=['body'],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'create_validating_webhook_configuration': Endpoint(
+        'create_validating_webhook_configuration', 'POST',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations',
+        response_type='V1beta1ValidatingWebhookConfiguration',
+        required=['body'],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_collection_mutating_webhook_configuration': Endpoint(
+        'delete_collection_mutating_webhook_configuration', 'DELETE',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations',
+        response_type='V1Status',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_collection_validating_webhook_configuration': Endpoint(
+        'delete_collection_validating_webhook_configuration', 'DELETE',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations',
+        response_type='V1Status',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_mutating_webhook_configuration': Endpoint(
+        'delete_mutating_webhook_configuration', 'DELETE',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}',
+        response_type='V1Status',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_validating_webhook_configuration': Endpoint(
+        'delete_validating_webhook_configuration', 'DELETE',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}',
+        response_type='V1Status',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_api_resources': Endpoint(
+        'get_api_resources', 'GET',
+        '/apis/admissionregistration.k8s.io/v1beta1/',
+        response_type='V1APIResourceList',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ]),
+    'list_mutating_webhook_configuration': Endpoint(
+        'list_mutating_webhook_configuration', 'GET',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations',
+        response_type='V1beta1MutatingWebhookConfigurationList',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+            'application/json;stream=watch',
+            'application/vnd.kubernetes.protobuf;stream=watch',
+        ],
+        content_types=['*/*']),
+    'list_validating_webhook_configuration': Endpoint(
+        'list_validating_webhook_configuration', 'GET',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations',
+        response_type='V1beta1ValidatingWebhookConfigurationList',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+            'application/json;stream=watch',
+            'application/vnd.kubernetes.protobuf;stream=watch',
+        ],
+        content_types=['*/*']),
+    'patch_mutating_webhook_configuration': Endpoint(
+        'patch_mutating_webhook_configuration', 'PATCH',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}',
+        response_type='V1beta1MutatingWebhookConfiguration',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'patch_validating_webhook_configuration': Endpoint(
+        'patch_validating_webhook_configuration', 'PATCH',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}',
+        response_type='V1beta1ValidatingWebhookConfiguration',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'read_mutating_webhook_configuration': Endpoint(
+        'read_mutating_webhook_configuration', 'GET',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}',
+        response_type='V1beta1MutatingWebhookConfiguration',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('exact', 'exact'),
+            ('export', 'export'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'read_validating_webhook_configuration': Endpoint(
+        'read_validating_webhook_configuration', 'GET',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}',
+        response_type='V1beta1ValidatingWebhookConfiguration',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('exact', 'exact'),
+            ('export', 'export'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_mutating_webhook_configuration': Endpoint(
+        'replace_mutating_webhook_configuration', 'PUT',
+        '/apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}',
+        response_type='V1beta1MutatingWebhookConfiguration',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_validating_webhook_configuration': Endpoint(
+        'replace_validating_webhook_configuration', 'PUT',
+        '/apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}',
+        response_type='V1beta1ValidatingWebhookConfiguration',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+}
@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class ApiextensionsV1beta1Api(object):
@@ -77,71 +78,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_custom_resource_definition`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_custom_resource_definition'].call(
+            self.api_client, (body,), kwargs)
 
     def delete_collection_custom_resource_definition(self, **kwargs):
         """
@@ -193,76 +131,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_collection_custom_resource_definition'].call(
+            self.api_client, (), kwargs)
 
     def delete_custom_resource_definition(self, name, **kwargs):
         """
@@ -312,77 +182,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'body', 'dry_run', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_custom_resource_definition`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_custom_resource_definition'].call(
+            self.api_client, (name,), kwargs)
 
     def get_api_resources(self, **kwargs):
         """
@@ -418,59 +219,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = []
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIResourceList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_api_resources'].call(
+            self.api_client, (), kwargs)
 
     def list_custom_resource_definition(self, **kwargs):
         """
@@ -522,76 +272,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinitionList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_custom_resource_definition'].call(
+            self.api_client, (), kwargs)
 
     def patch_custom_resource_definition(self, name, body, **kwargs):
         """
@@ -639,78 +321,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_custom_resource_definition`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_custom_resource_definition`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_custom_resource_definition'].call(
+            self.api_client, (name, body), kwargs)
 
     def patch_custom_resource_definition_status(self, name, body, **kwargs):
         """
@@ -758,78 +370,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_custom_resource_definition_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_custom_resource_definition_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_custom_resource_definition_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_custom_resource_definition_status'].call(
+            self.api_client, (name, body), kwargs)
 
     def read_custom_resource_definition(self, name, **kwargs):
         """
@@ -873,71 +415,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'exact', 'export']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_custom_resource_definition`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'exact' in params:
-            query_params.append(('exact', params['exact']))
-        if 'export' in params:
-            query_params.append(('export', params['export']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_custom_resource_definition'].call(
+            self.api_client, (name,), kwargs)
 
     def read_custom_resource_definition_status(self, name, **kwargs):
         """
@@ -977,67 +456,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_custom_resource_definition_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_custom_resource_definition_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_custom_resource_definition_status'].call(
+            self.api_client, (name,), kwargs)
 
     def replace_custom_resource_definition(self, name, body, **kwargs):
         """
@@ -1083,76 +503,8 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_custom_resource_definition" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_custom_resource_definition`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_custom_resource_definition`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_custom_resource_definition'].call(
+            self.api_client, (name, body), kwargs)
 
     def replace_custom_resource_definition_status(self, name, body, **kwargs):
         """
@@ -1198,73 +550,214 @@ class ApiextensionsV1beta1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_custom_resource_definition_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_custom_resource_definition_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_custom_resource_definition_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1beta1CustomResourceDefinition',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_custom_resource_definition_status'].call(
+            self.api_client, (name, body), kwargs)
+
+
+_ENDPOINTS = {
+    'create_custom_resource_definition': Endpoint(
+        'create_custom_resource_definition', 'POST',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['body'],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_collection_custom_resource_definition': Endpoint(
+        'delete_collection_custom_resource_definition', 'DELETE',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions',
+        response_type='V1Status',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_custom_resource_definition': Endpoint(
+        'delete_custom_resource_definition', 'DELETE',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}',
+        response_type='V1Status',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_api_resources': Endpoint(
+        'get_api_resources', 'GET',
+        '/apis/apiextensions.k8s.io/v1beta1/',
+        response_type='V1APIResourceList',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ]),
+    'list_custom_resource_definition': Endpoint(
+        'list_custom_resource_definition', 'GET',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions',
+        response_type='V1beta1CustomResourceDefinitionList',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+            'application/json;stream=watch',
+            'application/vnd.kubernetes.protobuf;stream=watch',
+        ],
+        content_types=['*/*']),
+    'patch_custom_resource_definition': Endpoint(
+        'patch_custom_resource_definition', 'PATCH',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'patch_custom_resource_definition_status': Endpoint(
+        'patch_custom_resource_definition_status', 'PATCH',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'read_custom_resource_definition': Endpoint(
+        'read_custom_resource_definition', 'GET',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('exact', 'exact'),
+            ('export', 'export'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'read_custom_resource_definition_status': Endpoint(
+        'read_custom_resource_definition_status', 'GET',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty')],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_custom_resource_definition': Endpoint(
+        'replace_custom_resource_definition', 'PUT',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_custom_resource_definition_status': Endpoint(
+        'replace_custom_resource_definition_status', 'PUT',
+        '/apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status',
+        response_type='V1beta1CustomResourceDefinition',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+}
@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class ApiregistrationV1Api(object):
@@ -77,71 +78,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_api_service`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_api_service'].call(
+            self.api_client, (body,), kwargs)
 
     def delete_api_service(self, name, **kwargs):
         """
@@ -191,77 +129,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'body', 'dry_run', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_api_service`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_api_service'].call(
+            self.api_client, (name,), kwargs)
 
     def delete_collection_api_service(self, **kwargs):
         """
@@ -313,76 +182,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1Status',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_collection_api_service'].call(
+            self.api_client, (), kwargs)
 
     def get_api_resources(self, **kwargs):
         """
@@ -418,59 +219,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = []
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIResourceList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_api_resources'].call(
+            self.api_client, (), kwargs)
 
     def list_api_service(self, **kwargs):
         """
@@ -522,76 +272,7 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['pretty', '_continue', 'field_selector', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIServiceList',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_api_service'].call(self.api_client, (), kwargs)
 
     def patch_api_service(self, name, body, **kwargs):
         """
@@ -639,78 +320,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_api_service`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_api_service`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_api_service'].call(
+            self.api_client, (name, body), kwargs)
 
     def patch_api_service_status(self, name, body, **kwargs):
         """
@@ -758,78 +369,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager', 'force']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_api_service_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_api_service_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_api_service_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-        if 'force' in params:
-            query_params.append(('force', params['force']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}/status', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_api_service_status'].call(
+            self.api_client, (name, body), kwargs)
 
     def read_api_service(self, name, **kwargs):
         """
@@ -873,71 +414,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty', 'exact', 'export']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_api_service`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'exact' in params:
-            query_params.append(('exact', params['exact']))
-        if 'export' in params:
-            query_params.append(('export', params['export']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_api_service'].call(
+            self.api_client, (name,), kwargs)
 
     def read_api_service_status(self, name, **kwargs):
         """
@@ -977,67 +455,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'pretty']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_api_service_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_api_service_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}/status', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['read_api_service_status'].call(
+            self.api_client, (name,), kwargs)
 
     def replace_api_service(self, name, body, **kwargs):
         """
@@ -1083,76 +502,8 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_api_service" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_api_service`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_api_service`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_api_service'].call(
+            self.api_client, (name, body), kwargs)
 
     def replace_api_service_status(self, name, body, **kwargs):
         """
@@ -1198,73 +549,214 @@ class ApiregistrationV1Api(object):
                  returns the request thread.
         """
 
-        all_params = ['name', 'body', 'pretty', 'dry_run', 'field_manager']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_api_service_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_api_service_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_api_service_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'dry_run' in params:
-            query_params.append(('dryRun', params['dry_run']))
-        if 'field_manager' in params:
-            query_params.append(('fieldManager', params['field_manager']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/apiregistration.k8s.io/v1/apiservices/{name}/status', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='V1APIService',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_api_service_status'].call(
+            self.api_client, (name, body), kwargs)
+
+
+_ENDPOINTS = {
+    'create_api_service': Endpoint(
+        'create_api_service', 'POST',
+        '/apis/apiregistration.k8s.io/v1/apiservices',
+        response_type='V1APIService',
+        required=['body'],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_api_service': Endpoint(
+        'delete_api_service', 'DELETE',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}',
+        response_type='V1Status',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'delete_collection_api_service': Endpoint(
+        'delete_collection_api_service', 'DELETE',
+        '/apis/apiregistration.k8s.io/v1/apiservices',
+        response_type='V1Status',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_api_resources': Endpoint(
+        'get_api_resources', 'GET',
+        '/apis/apiregistration.k8s.io/v1/',
+        response_type='V1APIResourceList',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ]),
+    'list_api_service': Endpoint(
+        'list_api_service', 'GET',
+        '/apis/apiregistration.k8s.io/v1/apiservices',
+        response_type='V1APIServiceList',
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+            'application/json;stream=watch',
+            'application/vnd.kubernetes.protobuf;stream=watch',
+        ],
+        content_types=['*/*']),
+    'patch_api_service': Endpoint(
+        'patch_api_service', 'PATCH',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}',
+        response_type='V1APIService',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'patch_api_service_status': Endpoint(
+        'patch_api_service_status', 'PATCH',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}/status',
+        response_type='V1APIService',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+            ('force', 'force'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=[
+            'application/json-patch+json',
+            'application/merge-patch+json',
+            'application/strategic-merge-patch+json',
+        ]),
+    'read_api_service': Endpoint(
+        'read_api_service', 'GET',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}',
+        response_type='V1APIService',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('exact', 'exact'),
+            ('export', 'export'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'read_api_service_status': Endpoint(
+        'read_api_service_status', 'GET',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}/status',
+        response_type='V1APIService',
+        required=['name'],
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty')],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_api_service': Endpoint(
+        'replace_api_service', 'PUT',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}',
+        response_type='V1APIService',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_api_service_status': Endpoint(
+        'replace_api_service_status', 'PUT',
+        '/apis/apiregistration.k8s.io/v1/apiservices/{name}/status',
+        response_type='V1APIService',
+        required=['name', 'body'],
+        path_params=[('name', 'name')],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('dry_run', 'dryRun'),
+            ('field_manager', 'fieldManager'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+}
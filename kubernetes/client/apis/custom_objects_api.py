@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class CustomObjectsApi(object):
@@ -79,78 +80,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'body', 'pretty']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `create_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `create_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `create_cluster_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_cluster_custom_object'].call(
+            self.api_client, (group, version, plural, body), kwargs)
 
     def create_namespaced_custom_object(self, group, version, namespace, plural, body, **kwargs):
         """
@@ -198,83 +129,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'body', 'pretty']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `create_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `create_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `create_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `create_namespaced_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'POST',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['create_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural, body), kwargs)
 
     def delete_cluster_custom_object(self, group, version, plural, name, body, **kwargs):
         """
@@ -326,91 +182,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `delete_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `delete_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `delete_cluster_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_cluster_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `delete_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_cluster_custom_object'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def delete_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -464,96 +237,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `delete_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `delete_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `delete_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `delete_namespaced_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_namespaced_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `delete_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'DELETE',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['delete_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def get_cluster_custom_object(self, group, version, plural, name, **kwargs):
         """
@@ -597,80 +282,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_cluster_custom_object'].call(
+            self.api_client, (group, version, plural, name), kwargs)
 
     def get_cluster_custom_object_scale(self, group, version, plural, name, **kwargs):
         """
@@ -714,80 +327,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_cluster_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_cluster_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_cluster_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/scale', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_cluster_custom_object_scale'].call(
+            self.api_client, (group, version, plural, name), kwargs)
 
     def get_cluster_custom_object_status(self, group, version, plural, name, **kwargs):
         """
@@ -831,80 +372,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_cluster_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_cluster_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_cluster_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/status', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_cluster_custom_object_status'].call(
+            self.api_client, (group, version, plural, name), kwargs)
 
     def get_namespaced_custom_object(self, group, version, namespace, plural, name, **kwargs):
         """
@@ -950,85 +419,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural, name), kwargs)
 
     def get_namespaced_custom_object_scale(self, group, version, namespace, plural, name, **kwargs):
         """
@@ -1074,85 +466,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object_scale`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_namespaced_custom_object_scale'].call(
+            self.api_client, (group, version, namespace, plural, name), kwargs)
 
     def get_namespaced_custom_object_status(self, group, version, namespace, plural, name, **kwargs):
         """
@@ -1198,85 +513,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object_status`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['get_namespaced_custom_object_status'].call(
+            self.api_client, (group, version, namespace, plural, name), kwargs)
 
     def list_cluster_custom_object(self, group, version, plural, **kwargs):
         """
@@ -1291,8 +529,10 @@ class CustomObjectsApi(object):
         :param str version: The custom resource's version (required)
         :param str plural: The custom resource's plural name. For TPRs this would be lowercase plural kind. (required)
         :param str pretty: If 'true', then the output is pretty printed.
+        :param str _continue: The continue option should be set when retrieving more results from the server. Since this value is server defined, clients may only use the continue value from a previous query result with identical query parameters (except for the value of continue) and the server may reject a continue value it does not recognize. If the specified continue value is no longer valid whether due to expiration (generally five to fifteen minutes) or a configuration change on the server, the server will respond with a 410 ResourceExpired error together with a continue token. If the client needs a consistent list, it must restart their list without the continue field. Otherwise, the client may send another list request with the token received with the 410 error, the server will respond with a list starting from the next key, but from the latest snapshot, which is inconsistent from the previous list results - objects that are created, modified, or deleted after the first list request will be included in the response, as long as their keys are after the \"next key\".  This field is not supported when watch is true. Clients may start a watch from the last resourceVersion value returned by the server and not miss any modifications.
         :param str field_selector: A selector to restrict the list of returned objects by their fields. Defaults to everything.
         :param str label_selector: A selector to restrict the list of returned objects by their labels. Defaults to everything.
+        :param int limit: limit is a maximum number of responses to return for a list call. If more items exist, the server will set the `continue` field on the list metadata to a value that can be used with the same initial query to retrieve the next set of results. Setting a limit may return fewer than the requested amount of items (up to zero items) in the event all requested objects are filtered out and clients should only use the presence of the continue field to determine whether more results are available. Servers may choose not to support the limit argument and will return all of the available results. If limit is specified and the continue field is empty, clients may assume that no more results are available. This field is not supported if watch is true.  The server guarantees that the objects returned when using continue will be identical to issuing a single list call without a limit - that is, no objects created, modified, or deleted after the first request is issued will be included in any subsequent continued requests. This is sometimes referred to as a consistent snapshot, and ensures that a client that is using limit to receive smaller chunks of a very large result can ensure they see all possible objects. If objects are updated during a chunked list the version of the object that was present at the time the first list result was calculated is returned.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history. When specified for list: - if unset, then the result is returned from remote storage based on quorum-read flag; - if it's 0, then we simply return what we currently have in cache, no guarantee; - if set to non zero, then the result is at least as fresh as given rv.
         :param int timeout_seconds: Timeout for the list/watch call. This limits the duration of the call, regardless of any activity or inactivity.
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications.
@@ -1320,8 +560,10 @@ class CustomObjectsApi(object):
         :param str version: The custom resource's version (required)
         :param str plural: The custom resource's plural name. For TPRs this would be lowercase plural kind. (required)
         :param str pretty: If 'true', then the output is pretty printed.
+        :param str _continue: The continue option should be set when retrieving more results from the server. Since this value is server defined, clients may only use the continue value from a previous query result with identical query parameters (except for the value of continue) and the server may reject a continue value it does not recognize. If the specified continue value is no longer valid whether due to expiration (generally five to fifteen minutes) or a configuration change on the server, the server will respond with a 410 ResourceExpired error together with a continue token. If the client needs a consistent list, it must restart their list without the continue field. Otherwise, the client may send another list request with the token received with the 410 error, the server will respond with a list starting from the next key, but from the latest snapshot, which is inconsistent from the previous list results - objects that are created, modified, or deleted after the first list request will be included in the response, as long as their keys are after the \"next key\".  This field is not supported when watch is true. Clients may start a watch from the last resourceVersion value returned by the server and not miss any modifications.
         :param str field_selector: A selector to restrict the list of returned objects by their fields. Defaults to everything.
         :param str label_selector: A selector to restrict the list of returned objects by their labels. Defaults to everything.
+        :param int limit: limit is a maximum number of responses to return for a list call. If more items exist, the server will set the `continue` field on the list metadata to a value that can be used with the same initial query to retrieve the next set of results. Setting a limit may return fewer than the requested amount of items (up to zero items) in the event all requested objects are filtered out and clients should only use the presence of the continue field to determine whether more results are available. Servers may choose not to support the limit argument and will return all of the available results. If limit is specified and the continue field is empty, clients may assume that no more results are available. This field is not supported if watch is true.  The server guarantees that the objects returned when using continue will be identical to issuing a single list call without a limit - that is, no objects created, modified, or deleted after the first request is issued will be included in any subsequent continued requests. This is sometimes referred to as a consistent snapshot, and ensures that a client that is using limit to receive smaller chunks of a very large result can ensure they see all possible objects. If objects are updated during a chunked list the version of the object that was present at the time the first list result was calculated is returned.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history. When specified for list: - if unset, then the result is returned from remote storage based on quorum-read flag; - if it's 0, then we simply return what we currently have in cache, no guarantee; - if set to non zero, then the result is at least as fresh as given rv.
         :param int timeout_seconds: Timeout for the list/watch call. This limits the duration of the call, regardless of any activity or inactivity.
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications.
@@ -1330,87 +572,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'pretty', 'field_selector', 'label_selector', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `list_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `list_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `list_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/json;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_cluster_custom_object'].call(
+            self.api_client, (group, version, plural), kwargs)
 
     def list_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):
         """
@@ -1426,8 +589,10 @@ class CustomObjectsApi(object):
         :param str namespace: The custom resource's namespace (required)
         :param str plural: The custom resource's plural name. For TPRs this would be lowercase plural kind. (required)
         :param str pretty: If 'true', then the output is pretty printed.
+        :param str _continue: The continue option should be set when retrieving more results from the server. Since this value is server defined, clients may only use the continue value from a previous query result with identical query parameters (except for the value of continue) and the server may reject a continue value it does not recognize. If the specified continue value is no longer valid whether due to expiration (generally five to fifteen minutes) or a configuration change on the server, the server will respond with a 410 ResourceExpired error together with a continue token. If the client needs a consistent list, it must restart their list without the continue field. Otherwise, the client may send another list request with the token received with the 410 error, the server will respond with a list starting from the next key, but from the latest snapshot, which is inconsistent from the previous list results - objects that are created, modified, or deleted after the first list request will be included in the response, as long as their keys are after the \"next key\".  This field is not supported when watch is true. Clients may start a watch from the last resourceVersion value returned by the server and not miss any modifications.
         :param str field_selector: A selector to restrict the list of returned objects by their fields. Defaults to everything.
         :param str label_selector: A selector to restrict the list of returned objects by their labels. Defaults to everything.
+        :param int limit: limit is a maximum number of responses to return for a list call. If more items exist, the server will set the `continue` field on the list metadata to a value that can be used with the same initial query to retrieve the next set of results. Setting a limit may return fewer than the requested amount of items (up to zero items) in the event all requested objects are filtered out and clients should only use the presence of the continue field to determine whether more results are available. Servers may choose not to support the limit argument and will return all of the available results. If limit is specified and the continue field is empty, clients may assume that no more results are available. This field is not supported if watch is true.  The server guarantees that the objects returned when using continue will be identical to issuing a single list call without a limit - that is, no objects created, modified, or deleted after the first request is issued will be included in any subsequent continued requests. This is sometimes referred to as a consistent snapshot, and ensures that a client that is using limit to receive smaller chunks of a very large result can ensure they see all possible objects. If objects are updated during a chunked list the version of the object that was present at the time the first list result was calculated is returned.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history. When specified for list: - if unset, then the result is returned from remote storage based on quorum-read flag; - if it's 0, then we simply return what we currently have in cache, no guarantee; - if set to non zero, then the result is at least as fresh as given rv.
         :param int timeout_seconds: Timeout for the list/watch call. This limits the duration of the call, regardless of any activity or inactivity.
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications.
@@ -1456,8 +621,10 @@ class CustomObjectsApi(object):
         :param str namespace: The custom resource's namespace (required)
         :param str plural: The custom resource's plural name. For TPRs this would be lowercase plural kind. (required)
         :param str pretty: If 'true', then the output is pretty printed.
+        :param str _continue: The continue option should be set when retrieving more results from the server. Since this value is server defined, clients may only use the continue value from a previous query result with identical query parameters (except for the value of continue) and the server may reject a continue value it does not recognize. If the specified continue value is no longer valid whether due to expiration (generally five to fifteen minutes) or a configuration change on the server, the server will respond with a 410 ResourceExpired error together with a continue token. If the client needs a consistent list, it must restart their list without the continue field. Otherwise, the client may send another list request with the token received with the 410 error, the server will respond with a list starting from the next key, but from the latest snapshot, which is inconsistent from the previous list results - objects that are created, modified, or deleted after the first list request will be included in the response, as long as their keys are after the \"next key\".  This field is not supported when watch is true. Clients may start a watch from the last resourceVersion value returned by the server and not miss any modifications.
         :param str field_selector: A selector to restrict the list of returned objects by their fields. Defaults to everything.
         :param str label_selector: A selector to restrict the list of returned objects by their labels. Defaults to everything.
+        :param int limit: limit is a maximum number of responses to return for a list call. If more items exist, the server will set the `continue` field on the list metadata to a value that can be used with the same initial query to retrieve the next set of results. Setting a limit may return fewer than the requested amount of items (up to zero items) in the event all requested objects are filtered out and clients should only use the presence of the continue field to determine whether more results are available. Servers may choose not to support the limit argument and will return all of the available results. If limit is specified and the continue field is empty, clients may assume that no more results are available. This field is not supported if watch is true.  The server guarantees that the objects returned when using continue will be identical to issuing a single list call without a limit - that is, no objects created, modified, or deleted after the first request is issued will be included in any subsequent continued requests. This is sometimes referred to as a consistent snapshot, and ensures that a client that is using limit to receive smaller chunks of a very large result can ensure they see all possible objects. If objects are updated during a chunked list the version of the object that was present at the time the first list result was calculated is returned.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history. When specified for list: - if unset, then the result is returned from remote storage based on quorum-read flag; - if it's 0, then we simply return what we currently have in cache, no guarantee; - if set to non zero, then the result is at least as fresh as given rv.
         :param int timeout_seconds: Timeout for the list/watch call. This limits the duration of the call, regardless of any activity or inactivity.
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications.
@@ -1466,92 +633,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'pretty', 'field_selector', 'label_selector', 'resource_version', 'timeout_seconds', 'watch']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `list_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `list_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `list_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `list_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/json;stream=watch'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['list_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural), kwargs)
 
     def patch_cluster_custom_object(self, group, version, plural, name, body, **kwargs):
         """
@@ -1597,85 +680,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_cluster_custom_object'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def patch_cluster_custom_object_scale(self, group, version, plural, name, body, **kwargs):
         """
@@ -1721,85 +727,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object_scale`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/scale', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_cluster_custom_object_scale'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def patch_cluster_custom_object_status(self, group, version, plural, name, body, **kwargs):
         """
@@ -1845,85 +774,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/status', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_cluster_custom_object_status'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -1971,90 +823,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def patch_namespaced_custom_object_scale(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -2102,90 +872,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object_scale`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object_scale`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_namespaced_custom_object_scale'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def patch_namespaced_custom_object_status(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -2233,90 +921,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object_status`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['application/merge-patch+json'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'PATCH',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['patch_namespaced_custom_object_status'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def replace_cluster_custom_object(self, group, version, plural, name, body, **kwargs):
         """
@@ -2362,85 +968,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_cluster_custom_object'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def replace_cluster_custom_object_scale(self, group, version, plural, name, body, **kwargs):
         """
@@ -2486,85 +1015,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object_scale`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/scale', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_cluster_custom_object_scale'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def replace_cluster_custom_object_status(self, group, version, plural, name, body, **kwargs):
         """
@@ -2610,85 +1062,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/{plural}/{name}/status', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_cluster_custom_object_status'].call(
+            self.api_client, (group, version, plural, name, body), kwargs)
 
     def replace_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -2736,90 +1111,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_namespaced_custom_object'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def replace_namespaced_custom_object_scale(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -2867,90 +1160,8 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object_scale" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object_scale`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object_scale`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object_scale`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object_scale`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object_scale`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object_scale`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_namespaced_custom_object_scale'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
 
     def replace_namespaced_custom_object_status(self, group, version, namespace, plural, name, body, **kwargs):
         """
@@ -2998,87 +1209,423 @@ class CustomObjectsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object_status" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params) or (params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object_status`")
-        # verify the required parameter 'version' is set
-        if ('version' not in params) or (params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object_status`")
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params) or (params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object_status`")
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params) or (params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object_status`")
-        # verify the required parameter 'name' is set
-        if ('name' not in params) or (params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object_status`")
-        # verify the required parameter 'body' is set
-        if ('body' not in params) or (params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object_status`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']
-        if 'version' in params:
-            path_params['version'] = params['version']
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']
-        if 'plural' in params:
-            path_params['plural'] = params['plural']
-        if 'name' in params:
-            path_params['name'] = params['name']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.\
-            select_header_accept(['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.\
-            select_header_content_type(['*/*'])
-
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'PUT',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type='object',
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['replace_namespaced_custom_object_status'].call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)
+
+
+_ENDPOINTS = {
+    'create_cluster_custom_object': Endpoint(
+        'create_cluster_custom_object', 'POST',
+        '/apis/{group}/{version}/{plural}',
+        response_type='object',
+        required=['group', 'version', 'plural', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+        ],
+        query_params=[('pretty', 'pretty')],
+        body='body',
+        accepts=['application/json']),
+    'create_namespaced_custom_object': Endpoint(
+        'create_namespaced_custom_object', 'POST',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+        ],
+        query_params=[('pretty', 'pretty')],
+        body='body',
+        accepts=['application/json']),
+    'delete_cluster_custom_object': Endpoint(
+        'delete_cluster_custom_object', 'DELETE',
+        '/apis/{group}/{version}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        query_params=[
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'delete_namespaced_custom_object': Endpoint(
+        'delete_namespaced_custom_object', 'DELETE',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        query_params=[
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'get_cluster_custom_object': Endpoint(
+        'get_cluster_custom_object', 'GET',
+        '/apis/{group}/{version}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'get_cluster_custom_object_scale': Endpoint(
+        'get_cluster_custom_object_scale', 'GET',
+        '/apis/{group}/{version}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_cluster_custom_object_status': Endpoint(
+        'get_cluster_custom_object_status', 'GET',
+        '/apis/{group}/{version}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_namespaced_custom_object': Endpoint(
+        'get_namespaced_custom_object', 'GET',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'get_namespaced_custom_object_scale': Endpoint(
+        'get_namespaced_custom_object_scale', 'GET',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'get_namespaced_custom_object_status': Endpoint(
+        'get_namespaced_custom_object_status', 'GET',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'list_cluster_custom_object': Endpoint(
+        'list_cluster_custom_object', 'GET',
+        '/apis/{group}/{version}/{plural}',
+        response_type='object',
+        required=['group', 'version', 'plural'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+        ],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=['application/json', 'application/json;stream=watch'],
+        content_types=['*/*']),
+    'list_namespaced_custom_object': Endpoint(
+        'list_namespaced_custom_object', 'GET',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+        ],
+        query_params=[
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ],
+        accepts=['application/json', 'application/json;stream=watch'],
+        content_types=['*/*']),
+    'patch_cluster_custom_object': Endpoint(
+        'patch_cluster_custom_object', 'PATCH',
+        '/apis/{group}/{version}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['application/merge-patch+json']),
+    'patch_cluster_custom_object_scale': Endpoint(
+        'patch_cluster_custom_object_scale', 'PATCH',
+        '/apis/{group}/{version}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['application/merge-patch+json']),
+    'patch_cluster_custom_object_status': Endpoint(
+        'patch_cluster_custom_object_status', 'PATCH',
+        '/apis/{group}/{version}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['application/merge-patch+json']),
+    'patch_namespaced_custom_object': Endpoint(
+        'patch_namespaced_custom_object', 'PATCH',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['application/merge-patch+json']),
+    'patch_namespaced_custom_object_scale': Endpoint(
+        'patch_namespaced_custom_object_scale', 'PATCH',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['application/merge-patch+json']),
+    'patch_namespaced_custom_object_status': Endpoint(
+        'patch_namespaced_custom_object_status', 'PATCH',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['application/merge-patch+json']),
+    'replace_cluster_custom_object': Endpoint(
+        'replace_cluster_custom_object', 'PUT',
+        '/apis/{group}/{version}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'replace_cluster_custom_object_scale': Endpoint(
+        'replace_cluster_custom_object_scale', 'PUT',
+        '/apis/{group}/{version}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_cluster_custom_object_status': Endpoint(
+        'replace_cluster_custom_object_status', 'PUT',
+        '/apis/{group}/{version}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_namespaced_custom_object': Endpoint(
+        'replace_namespaced_custom_object', 'PUT',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=['application/json'],
+        content_types=['*/*']),
+    'replace_namespaced_custom_object_scale': Endpoint(
+        'replace_namespaced_custom_object_scale', 'PUT',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+    'replace_namespaced_custom_object_status': Endpoint(
+        'replace_namespaced_custom_object_status', 'PUT',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',
+        response_type='object',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        path_params=[
+            ('group', 'group'),
+            ('version', 'version'),
+            ('namespace', 'namespace'),
+            ('plural', 'plural'),
+            ('name', 'name'),
+        ],
+        body='body',
+        accepts=[
+            'application/json',
+            'application/yaml',
+            'application/vnd.kubernetes.protobuf',
+        ],
+        content_types=['*/*']),
+}
@@ -21,6 +21,7 @@ import re
 from six import iteritems
 
 from ..api_client import ApiClient
+from ..endpoint import Endpoint
 
 
 class LogsApi(object):
@@ -69,57 +70,8 @@ class LogsApi(object):
                  returns the request thread.
         """
 
-        all_params = ['logpath']
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method log_file_handler" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'logpath' is set
-        if ('logpath' not in params) or (params['logpath'] is None):
-            raise ValueError("Missing the required parameter `logpath` when calling `log_file_handler`")
-
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'logpath' in params:
-            path_params['logpath'] = params['logpath']
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/logs/{logpath}', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type=None,
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['log_file_handler'].call(
+            self.api_client, (logpath,), kwargs)
 
     def log_file_list_handler(self, **kwargs):
         """
@@ -153,48 +105,17 @@ class LogsApi(object):
                  returns the request thread.
         """
 
-        all_params = []
-        all_params.append('async_req')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in iteritems(params['kwargs']):
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method log_file_list_handler" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerToken']
-
-        return self.api_client.call_api('/logs/', 'GET',
-                                        path_params,
-                                        query_params,
-                                        header_params,
-                                        body=body_params,
-                                        post_params=form_params,
-                                        files=local_var_files,
-                                        response_type=None,
-                                        auth_settings=auth_settings,
-                                        async_req=params.get('async_req'),
-                                        _return_http_data_only=params.get('_return_http_data_only'),
-                                        _preload_content=params.get('_preload_content', True),
-                                        _request_timeout=params.get('_request_timeout'),
-                                        collection_formats=collection_formats)
+        return _ENDPOINTS['log_file_list_handler'].call(
+            self.api_client, (), kwargs)
+
+
+_ENDPOINTS = {
+    'log_file_handler': Endpoint(
+        'log_file_handler', 'GET',
+        '/logs/{logpath}',
+        required=['logpath'],
+        path_params=[('logpath', 'logpath')]),
+    'log_file_list_handler': Endpoint(
+        'log_file_list_handler', 'GET',
+        '/logs/'),
+}
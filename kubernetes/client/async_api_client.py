@@ -0,0 +1,113 @@
+# coding: utf-8
+"""
+    Kubernetes
+
+    asyncio flavour of the swagger generic API client.
+"""
+
+from __future__ import absolute_import
+
+from .api_client import ApiClient
+from .async_rest import AsyncRESTClientObject
+from .metrics import now
+
+
+class AsyncApiClient(ApiClient):
+    """
+    ApiClient whose calls are coroutines driven by the running event loop.
+
+    Every generated `*Api` method returns whatever `call_api` returns, so
+    an `*Api` built on top of this client returns awaitables instead of
+    blocking, without any thread pool involved:
+
+        async with AsyncApiClient(configuration) as api_client:
+            v1 = CoreV1Api(api_client)
+            pods = await v1.list_namespaced_pod('default')
+
+    Parameter sanitization and response deserialization are shared with
+    `ApiClient`, only the transport differs. The metrics of the calls, see
+    `Configuration.metrics_sink`, do not split the time spent in aiohttp
+    into the phases of the transport.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _rest_client_class = AsyncRESTClientObject
+
+    def __init__(self, configuration=None, header_name=None, header_value=None,
+                 cookie=None):
+        super(AsyncApiClient, self).__init__(configuration, header_name,
+                                             header_value, cookie)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying aiohttp session.
+        """
+        await self.rest_client.close()
+
+    async def __call_api(self, resource_path, method,
+                         path_params=None, query_params=None, header_params=None,
+                         body=None, post_params=None, files=None,
+                         response_type=None, auth_settings=None,
+                         _return_http_data_only=None, collection_formats=None, _preload_content=True,
+                         _request_timeout=None, _fields=None):
+
+        metrics = self.start_metrics(method, resource_path, query_params)
+
+        url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+
+        if metrics is not None:
+            metrics.add('sanitize', now() - metrics.start)
+        # perform request and return response
+        try:
+            response_data = await self.request(method, url,
+                                               query_params=query_params,
+                                               headers=header_params,
+                                               post_params=post_params, body=body,
+                                               _preload_content=_preload_content,
+                                               _request_timeout=_request_timeout)
+        except Exception as e:
+            if metrics is not None:
+                self.observe_metrics(metrics, getattr(e, 'status', None))
+            raise
+
+        return self.process_response(response_data, response_type,
+                                     _return_http_data_only, _preload_content,
+                                     _fields, metrics)
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None, _preload_content=True,
+                 _request_timeout=None, _fields=None):
+        """
+        Makes the HTTP request and returns a coroutine resolving to the
+        deserialized data.
+
+        Takes the same arguments as `ApiClient.call_api`. `async_req` is
+        accepted for compatibility with the generated methods and ignored,
+        every call of this client is asynchronous.
+
+        :return: a coroutine. If `_preload_content` is False it resolves to
+            the aiohttp.ClientResponse, which the caller must release.
+        """
+        return self.__call_api(resource_path, method,
+                               path_params, query_params, header_params,
+                               body, post_params, files,
+                               response_type, auth_settings,
+                               _return_http_data_only, collection_formats, _preload_content, _request_timeout,
+                               _fields)
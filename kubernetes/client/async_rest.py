@@ -0,0 +1,302 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    asyncio transport for the swagger generated client, built on aiohttp.
+    It mirrors `rest.RESTClientObject` so that `ApiClient.request` can drive
+    either of them.
+"""
+
+
+from __future__ import absolute_import
+
+import asyncio
+import io
+import logging
+import re
+import ssl
+
+import certifi
+from six.moves.urllib.parse import urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        'The asyncio client requires aiohttp, '
+        'install it with `pip install kubernetes[asyncio]`.')
+
+from .json_codec import json_codec_for
+from .rate_limit import rate_limiter_for
+from .rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+
+    def getheaders(self):
+        """
+        Returns a dictionary of the response headers.
+        """
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """
+        Returns a given response header.
+        """
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+
+    def __init__(self, configuration, pools_size=4, maxsize=None):
+        # aiohttp.TCPConnector keeps one pool for all hosts, `maxsize` is the
+        # number of requests that are allowed in parallel.
+
+        if configuration.verify_ssl:
+            # ca_certs
+            if configuration.ssl_ca_cert:
+                ca_certs = configuration.ssl_ca_cert
+            else:
+                # if not set certificate file, use Mozilla's root certificates.
+                ca_certs = certifi.where()
+
+            ssl_context = ssl.create_default_context(cafile=ca_certs)
+            if configuration.cert_file:
+                ssl_context.load_cert_chain(configuration.cert_file,
+                                            keyfile=configuration.key_file)
+            if configuration.assert_hostname is False:
+                ssl_context.check_hostname = False
+        else:
+            ssl_context = False
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+
+        self.proxy = configuration.proxy
+        self.ssl_context = ssl_context
+        self.maxsize = maxsize
+        # the session binds to the running event loop, so it is only created
+        # once the first request is made from within that loop.
+        self.pool_manager = None
+        # shared by all the coroutines sending requests through this client
+        self.rate_limiter = rate_limiter_for(configuration)
+        self.retry_policy = configuration.retry_policy
+        self.json_codec = json_codec_for(configuration)
+
+    async def close(self):
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object will be returned without
+                                 reading/decoding response data. Default is True.
+        :param _request_timeout: timeout setting for this request. If one number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = aiohttp.ClientTimeout(sock_connect=_request_timeout[0],
+                                                sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        args = {
+            'method': method,
+            'url': url,
+            'headers': headers,
+            'proxy': self.proxy,
+        }
+        if timeout is not None:
+            args['timeout'] = timeout
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if headers['Content-Type'] == 'application/json-patch+json':
+                    if not isinstance(body, list):
+                        headers['Content-Type'] = \
+                            'application/strategic-merge-patch+json'
+                if body is not None:
+                    args['data'] = self.json_codec.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
+                args['data'] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct Content-Type
+                # which generated by aiohttp will be overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple) and len(v) == 3:
+                        data.add_field(k, value=v[1], filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args['data'] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, str):
+                args['data'] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided arguments.
+                         Please check that your arguments match declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.maxsize,
+                                               ssl=self.ssl_context))
+
+        retry = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            try:
+                r = await self.pool_manager.request(**args)
+            except aiohttp.ClientSSLError as e:
+                msg = "{0}\n{1}".format(type(e).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+            except aiohttp.ClientConnectionError as e:
+                # the request was not sent if the connection failed, timeouts
+                # are left to the caller
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+                if isinstance(e, asyncio.TimeoutError) or \
+                        self.retry_policy is None or \
+                        not self.retry_policy.should_retry_error(method, retry, sent):
+                    raise
+                logger.debug("retrying %s %s after %s", method, url, e)
+                await asyncio.sleep(self.retry_policy.backoff(retry))
+                retry += 1
+                continue
+
+            if self.retry_policy is not None and \
+                    self.retry_policy.should_retry_status(method, r.status, retry):
+                logger.debug("retrying %s %s after status %s",
+                             method, url, r.status)
+                retry_after = r.headers.get('Retry-After')
+                r.release()
+                await asyncio.sleep(self.retry_policy.backoff(retry, retry_after))
+                retry += 1
+                continue
+            break
+
+        if _preload_content or not 200 <= r.status <= 299:
+            data = await r.read()
+            r = AsyncRESTResponse(r, data)
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
+
+    def GET(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
+        return self.request("GET", url,
+                            headers=headers,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            query_params=query_params)
+
+    def HEAD(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
+        return self.request("HEAD", url,
+                            headers=headers,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            query_params=query_params)
+
+    def OPTIONS(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True,
+                _request_timeout=None):
+        return self.request("OPTIONS", url,
+                            headers=headers,
+                            query_params=query_params,
+                            post_params=post_params,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            body=body)
+
+    def DELETE(self, url, headers=None, query_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("DELETE", url,
+                            headers=headers,
+                            query_params=query_params,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            body=body)
+
+    def POST(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True,
+             _request_timeout=None):
+        return self.request("POST", url,
+                            headers=headers,
+                            query_params=query_params,
+                            post_params=post_params,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            body=body)
+
+    def PUT(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True,
+            _request_timeout=None):
+        return self.request("PUT", url,
+                            headers=headers,
+                            query_params=query_params,
+                            post_params=post_params,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            body=body)
+
+    def PATCH(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True,
+              _request_timeout=None):
+        return self.request("PATCH", url,
+                            headers=headers,
+                            query_params=query_params,
+                            post_params=post_params,
+                            _preload_content=_preload_content,
+                            _request_timeout=_request_timeout,
+                            body=body)
@@ -0,0 +1,83 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Memory compact variants of the generated models.
+"""
+
+
+from __future__ import absolute_import
+
+import threading
+
+from six import PY3
+
+# members of the generated classes not carried over to their variants
+_SKIPPED = ('__dict__', '__weakref__')
+
+# compact variants, keyed by generated class
+_compact_models = {}
+_lock = threading.Lock()
+
+
+def _slot(klass, attr):
+    name = '_' + attr
+    if name.startswith('__'):
+        # private names of the class body, e.g. `self.__continue`
+        name = '_' + klass.__name__.lstrip('_') + name
+    return name
+
+
+def _fields(self):
+    return dict((slot, getattr(self, slot)) for slot in self.__slots__)
+
+
+def _reduce(self):
+    return _restore, (self.__class__, tuple(
+        getattr(self, slot) for slot in self.__slots__))
+
+
+def _restore(klass, values):
+    compact = compact_model(klass)
+    obj = compact.__new__(compact)
+    for slot, value in zip(compact.__slots__, values):
+        setattr(obj, slot, value)
+    return obj
+
+
+def compact_model(klass):
+    """
+    Returns the compact variant of a generated model class.
+
+    The instances of the generated models keep their fields in a dict of
+    their own. The compact variant stores them in `__slots__` instead,
+    which takes a fraction of the memory, and otherwise behaves like the
+    generated class: same constructor, properties and methods, instances
+    pass `isinstance` checks against the generated class, compare equal to
+    its instances and are pickled as such. Their `__dict__` is a copy of
+    their fields, and attributes outside of the model cannot be set.
+
+    :param klass: generated model class.
+    :return: class.
+    """
+    try:
+        return _compact_models[klass]
+    except KeyError:
+        pass
+    with _lock:
+        if klass not in _compact_models:
+            namespace = dict((key, value) for key, value in vars(klass).items()
+                             if key not in _SKIPPED)
+            namespace['__slots__'] = tuple(
+                _slot(klass, attr) for attr in klass.swagger_types) + \
+                ('discriminator',)
+            # isinstance, and the generated __eq__, see the generated class
+            namespace['__class__'] = property(lambda self: klass)
+            namespace['__dict__'] = property(_fields)
+            namespace['__reduce__'] = _reduce
+            if PY3:
+                namespace['__qualname__'] = klass.__qualname__
+            _compact_models[klass] = type(klass.__name__, (object,),
+                                          namespace)
+    return _compact_models[klass]
@@ -104,6 +104,49 @@ class Configuration(with_metaclass(TypeWithDefault, object)):
         # Safe chars for path_param
         self.safe_chars_for_path_param = ''
 
+        # Client side rate limit: maximum sustained queries per second sent
+        # by one ApiClient, across all its threads. None disables it.
+        self.qps = None
+        # Number of queries that may be sent at once above `qps`, defaults
+        # to one second worth of queries.
+        self.burst = None
+        # kubernetes.client.retry.RetryPolicy deciding which failed requests
+        # are sent again, requests are not retried by default.
+        self.retry_policy = None
+        # Codec encoding request bodies and decoding responses, see
+        # kubernetes.client.json_codec. None picks the fastest installed
+        # json library.
+        self.json_codec = None
+        # Deserialize the responses into the compact variants of the models,
+        # see kubernetes.client.compact.
+        self.compact_models = False
+        # Deserialize the responses into models wrapping their json, which
+        # deserialize their attributes on first access, see
+        # kubernetes.client.lazy_model. Takes precedence over compact_models.
+        self.lazy_models = False
+        # Intern the strings of the responses, so that the strings repeated
+        # across objects are shared, see kubernetes.client.interning.
+        self.intern_strings = False
+        # Ask the apiserver to gzip the responses, which are decompressed
+        # while read, also when streamed with `_preload_content=False`.
+        # Watches are never compressed.
+        self.gzip = False
+        # kubernetes.client.transport.TransportRegistry whose connection
+        # pools the clients share, e.g. transport.default_registry. None
+        # gives every client pools of its own.
+        self.transport_registry = None
+        # Receives the timing and sizes of every call once it returns or
+        # fails, see kubernetes.client.metrics: an object with an
+        # `observe(metrics)` method, e.g. metrics.HistogramSink, or a
+        # callable taking the RequestMetrics. None measures nothing.
+        self.metrics_sink = None
+        # Send the identical concurrent gets and lists of a blocking
+        # ApiClient, same url, query and headers, as one request whose
+        # response every caller deserializes, see
+        # kubernetes.client.singleflight. Watches, followed logs and the
+        # connect calls, e.g. exec, are never coalesced.
+        self.singleflight = False
+
     @property
     def logger_file(self):
         """
@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Constant descriptions of the generated api methods.
+"""
+
+
+from __future__ import absolute_import
+
+import re
+
+from six.moves.urllib.parse import quote
+
+# parameters every generated method accepts on top of its own
+COMMON_PARAMS = ('async_req', '_return_http_data_only', '_preload_content',
+                 '_request_timeout', '_fields')
+
+_PLACEHOLDER_RE = re.compile(r'{(\w+)}')
+
+
+class Endpoint(object):
+    """
+    What a generated `*_with_http_info` method knows before it is called.
+
+    The generated methods used to rebuild their parameter lists, headers
+    and path on every call. The endpoint works them out once: the set of
+    accepted keyword arguments, the path as a format string, the mapping of
+    the parameters to the path placeholders and query string names, and
+    the `Accept` and `Content-Type` headers. `call` then only binds the
+    values of one call and hands the request to `ApiClient.call_api`.
+
+    :param name: name of the generated method, without `_with_http_info`.
+    :param method: http method.
+    :param path: resource path, with `{placeholder}` path parameters.
+    :param response_type: type the response is deserialized to.
+    :param required: names of the positional, required, parameters.
+    :param path_params: list of (parameter, placeholder) pairs.
+    :param query_params: list of (parameter, query string name) pairs.
+    :param body: name of the body parameter, if any.
+    :param accepts: media types the endpoint produces.
+    :param content_types: media types the endpoint consumes, None if it
+        does not declare any.
+    :param auth_settings: names of the authentication settings.
+    """
+
+    def __init__(self, name, method, path, response_type=None, required=(),
+                 path_params=(), query_params=(), body=None, accepts=(),
+                 content_types=None, auth_settings=('BearerToken',)):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.response_type = response_type
+        self.required = tuple(required)
+        self.path_params = tuple(path_params)
+        self.query_params = tuple(query_params)
+        self.body = body
+        self.accepts = list(accepts)
+        self.content_types = content_types
+        self.auth_settings = list(auth_settings)
+
+        params = set(self.required)
+        params.update(param for param, _ in self.path_params)
+        params.update(param for param, _ in self.query_params)
+        if body is not None:
+            params.add(body)
+        params.update(COMMON_PARAMS)
+        self._params = frozenset(params)
+
+        placeholders = _PLACEHOLDER_RE.findall(path)
+        if sorted(placeholders) != sorted(p for _, p in self.path_params):
+            raise ValueError("Path parameters of {0} do not match {1}".format(
+                name, path))
+        # api client class -> headers, see `headers`
+        self._headers = {}
+
+    def headers(self, api_client):
+        """
+        Returns the `Accept` and `Content-Type` headers of the endpoint, as
+        selected by the class of the api client, which may override
+        `select_header_accept` and `select_header_content_type`.
+        """
+        klass = type(api_client)
+        headers = self._headers.get(klass)
+        if headers is None:
+            headers = {}
+            accept = api_client.select_header_accept(self.accepts)
+            if accept is not None:
+                headers['Accept'] = accept
+            if self.content_types is not None:
+                headers['Content-Type'] = \
+                    api_client.select_header_content_type(self.content_types)
+            self._headers[klass] = headers
+        return headers
+
+    def bind(self, args, kwargs):
+        """
+        Returns the dict of the parameters of a call.
+
+        :param args: values of the required parameters, in order.
+        :param kwargs: keyword arguments of the call.
+        :raise TypeError: for an unexpected keyword argument.
+        :raise ValueError: if a required parameter is None.
+        """
+        for key in kwargs:
+            if key not in self._params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method %s" % (key, self.name)
+                )
+        params = dict(zip(self.required, args))
+        params.update(kwargs)
+        for name in self.required:
+            if params.get(name) is None:
+                raise ValueError(
+                    "Missing the required parameter `%s` when calling `%s`"
+                    % (name, self.name))
+        return params
+
+    def resolve_path(self, params, safe_chars=''):
+        """
+        Returns the resource path with the path parameters quoted in.
+        """
+        if not self.path_params:
+            return self.path
+        return self.path.format(**dict(
+            (placeholder, quote(str(params[param]), safe=safe_chars))
+            for param, placeholder in self.path_params if param in params))
+
+    def call(self, api_client, args, kwargs):
+        """
+        Calls the endpoint through `api_client.call_api`.
+
+        :param api_client: ApiClient of the api object.
+        :param args: values of the required parameters, in order.
+        :param kwargs: keyword arguments of the call.
+        :return: whatever `call_api` returns.
+        """
+        params = self.bind(args, kwargs)
+        path = self.resolve_path(
+            params, api_client.configuration.safe_chars_for_path_param)
+        query_params = [(key, params[param])
+                        for param, key in self.query_params
+                        if param in params]
+        body = params.get(self.body) if self.body is not None else None
+        headers = dict(self.headers(api_client))
+        # bodies such as `kubernetes.utils.MergePatch` pick their media type
+        # among those of the endpoint
+        content_type = getattr(body, 'content_type', None)
+        if content_type in (self.content_types or ()):
+            headers['Content-Type'] = content_type
+
+        return api_client.call_api(
+            path, self.method,
+            None,
+            query_params,
+            headers,
+            body=body,
+            post_params=[],
+            files={},
+            response_type=self.response_type,
+            auth_settings=self.auth_settings,
+            async_req=params.get('async_req'),
+            _return_http_data_only=params.get('_return_http_data_only'),
+            _preload_content=params.get('_preload_content', True),
+            _request_timeout=params.get('_request_timeout'),
+            collection_formats={},
+            _fields=params.get('_fields'))
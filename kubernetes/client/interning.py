@@ -0,0 +1,64 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Sharing of the strings repeated across responses.
+"""
+
+
+from __future__ import absolute_import
+
+from six import iteritems
+from six.moves import intern
+
+# longer strings, e.g. annotations or config map data, are seldom repeated
+# and are left alone
+MAX_INTERNED_LENGTH = 128
+
+
+def intern_string(value):
+    """
+    Returns the interned copy of a decoded string, see `intern_json`.
+    """
+    if type(value) is str and len(value) <= MAX_INTERNED_LENGTH:
+        return intern(value)
+    return value
+
+
+def intern_json(data):
+    """
+    Returns decoded json whose strings are interned.
+
+    Large lists repeat the same label keys and values, namespaces, node
+    and image names, owner references... in every item, and every response
+    and watch event decodes new copies of them. Interning makes all the
+    equal strings of the process, up to `MAX_INTERNED_LENGTH` characters,
+    one and the same object, whichever response they come from. Interned
+    strings are released once no longer used.
+
+    Only `str` is interned, the unicode strings of python 2 are returned
+    as they are. Dicts and lists are copied rather than shared, as the
+    models built out of them can be modified.
+
+    :param data: decoded json.
+    :return: the same json, with interned strings.
+    """
+    if type(data) is dict:
+        result = {}
+        for key, value in iteritems(data):
+            if type(key) is str and len(key) <= MAX_INTERNED_LENGTH:
+                key = intern(key)
+            value_type = type(value)
+            if value_type is str:
+                if len(value) <= MAX_INTERNED_LENGTH:
+                    value = intern(value)
+            elif value_type is dict or value_type is list:
+                value = intern_json(value)
+            result[key] = value
+        return result
+    if type(data) is list:
+        return [intern_json(value) for value in data]
+    if type(data) is str and len(data) <= MAX_INTERNED_LENGTH:
+        return intern(data)
+    return data
@@ -0,0 +1,175 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    JSON encoding and decoding of request and response bodies.
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import sys
+from datetime import date, datetime
+from operator import attrgetter
+
+from six import PY3
+
+# json.loads accepts bytes from python 3.6 on
+_LOADS_BYTES = not PY3 or sys.version_info >= (3, 6)
+
+# compiled model encoders, keyed by model class
+_model_encoders = {}
+
+
+def _compile_model_encoder(klass):
+    keys = tuple(klass.attribute_map[attr] for attr in klass.swagger_types)
+    if not keys:
+        return lambda obj: {}
+    getter = attrgetter(*klass.swagger_types)
+    if len(keys) == 1:
+        key = keys[0]
+
+        def encoder(obj):
+            value = getter(obj)
+            return {} if value is None else {key: value}
+        return encoder
+
+    def encoder(obj):
+        return {key: value for key, value in zip(keys, getter(obj))
+                if value is not None}
+    return encoder
+
+
+def model_encoder(klass):
+    """
+    Returns the encoder of a model class.
+
+    The encoder returns the dict of the json keys and values of the non
+    None attributes of a model, without converting the values: nested
+    models, dates and lists are left to the caller. The attributes and
+    their json keys are worked out once per class. Models defining a
+    `_json_fields` method, such as the lazy models, return that dict
+    themselves.
+
+    :param klass: generated model class.
+    :return: function taking a model and returning a dict.
+    """
+    try:
+        return _model_encoders[klass]
+    except KeyError:
+        encoder = getattr(klass, '_json_fields', None) or \
+            _compile_model_encoder(klass)
+        _model_encoders[klass] = encoder
+        return encoder
+
+
+def encode_default(obj):
+    """
+    `default` hook of the json encoders, encoding the values the json
+    module does not know of the way `ApiClient.sanitize_for_serialization`
+    does: models as their dict, dates in iso8601 format.
+
+    :raise TypeError: for any other value.
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    swagger_types = getattr(obj, 'swagger_types', None)
+    if swagger_types is not None and not isinstance(obj, type):
+        return model_encoder(type(obj))(obj)
+    raise TypeError("Object of type %s is not JSON serializable"
+                    % type(obj).__name__)
+
+
+class JSONCodec(object):
+    """
+    Codec built on the standard library `json` module.
+
+    A codec turns the sanitized body of a request into the bytes or str
+    sent, and the raw bytes of a response into python objects. Any object
+    with `dumps` and `loads` methods behaving like these ones can be set as
+    `Configuration.json_codec`.
+
+    A codec whose `encodes_models` is true is handed the request bodies as
+    passed by the caller, models included, and encodes them without first
+    building their dict with `ApiClient.sanitize_for_serialization`. The
+    bodies of the other codecs are sanitized beforehand.
+    """
+
+    name = 'json'
+    encodes_models = True
+
+    def dumps(self, obj):
+        """
+        :param obj: body, either sanitized by
+            `ApiClient.sanitize_for_serialization` or made of models, dates
+            and the types of the json module.
+        :return: str or bytes.
+        """
+        return json.dumps(obj, default=encode_default)
+
+    def loads(self, data):
+        """
+        :param data: bytes or str.
+        :return: decoded object.
+        :raise ValueError: if `data` is not valid json.
+        """
+        if not _LOADS_BYTES and isinstance(data, bytes):
+            data = data.decode('utf8')
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec built on `orjson`, decoding straight from bytes.
+
+    orjson is stricter than the standard library: it only handles 64 bit
+    integers and str dict keys. Documents it refuses are handed over to the
+    standard library, so that both codecs accept the same input.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        # dates are encoded by encode_default, like the standard library
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj):
+        try:
+            return self._orjson.dumps(obj, default=encode_default,
+                                      option=self._options)
+        except TypeError:
+            return super(OrjsonCodec, self).dumps(obj)
+
+    def loads(self, data):
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return super(OrjsonCodec, self).loads(data)
+
+
+_default_codec = None
+
+
+def default_json_codec():
+    """
+    Returns the fastest codec available: orjson if it is installed, the
+    standard library otherwise.
+    """
+    global _default_codec
+    if _default_codec is None:
+        try:
+            _default_codec = OrjsonCodec()
+        except ImportError:
+            _default_codec = JSONCodec()
+    return _default_codec
+
+
+def json_codec_for(configuration):
+    """
+    Returns the codec set as `configuration.json_codec`, or the default one.
+    """
+    return configuration.json_codec or default_json_codec()
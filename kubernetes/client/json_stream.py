@@ -0,0 +1,186 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Incremental decoding of the `items` of json list responses.
+"""
+
+
+from __future__ import absolute_import
+
+import codecs
+import json
+
+from six import text_type
+
+# bytes read from the response at a time
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Reader(object):
+    """
+    Decodes json values one at a time from an iterable of byte chunks.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = u''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size):
+        """
+        Appends at least `size` characters to the buffer, unless the data
+        ends first. Returns False if nothing could be read.
+        """
+        parts = [self._buffer[self._pos:]]
+        read = 0
+        while read < size and not self._eof:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._eof = True
+                chunk = b''
+                text = self._utf8.decode(chunk, final=True)
+            else:
+                if isinstance(chunk, text_type):
+                    text = chunk
+                else:
+                    text = self._utf8.decode(chunk)
+            parts.append(text)
+            read += len(text)
+        self._buffer = u''.join(parts)
+        self._pos = 0
+        return read > 0
+
+    def peek(self):
+        """
+        Returns the next non whitespace character without consuming it, or
+        None at the end of the data.
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(CHUNK_SIZE):
+                return None
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError('Expecting {0!r} at {1!r}'.format(
+                char, self._buffer[self._pos:self._pos + 20]))
+        self._pos += 1
+
+    def value(self):
+        """
+        Decodes the next json value.
+
+        The buffer only holds what was read so far, so a failure to decode
+        may just mean that the value is incomplete: in that case more data
+        is read, at least as much as is pending, and decoding is retried.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                pending = len(self._buffer) - self._pos
+                if not self._fill(max(pending, CHUNK_SIZE)):
+                    raise
+                continue
+            # a number may go on in the next chunk
+            if end == len(self._buffer) and not self._eof:
+                self._fill(CHUNK_SIZE)
+                continue
+            self._pos = end
+            return value
+
+
+def iter_list_items(chunks, fields=None):
+    """
+    Decodes the items of a json list object as they are read.
+
+    :param chunks: iterable of bytes, e.g. `urllib3.HTTPResponse.stream()`.
+    :param fields: optional dict receiving the other members of the list
+        object (kind, apiVersion, metadata) as they are decoded.
+    :return: generator of the decoded items.
+    """
+    if fields is None:
+        fields = {}
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key == 'items' and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.peek() == ',':
+                        reader.expect(',')
+                    else:
+                        reader.expect(']')
+                        break
+        else:
+            fields[key] = reader.value()
+        if reader.peek() == ',':
+            reader.expect(',')
+        else:
+            reader.expect('}')
+            return
+
+
+class ListStream(object):
+    """
+    The items of a list response, deserialized one at a time while the
+    response is read.
+
+    Iterating releases the connection once the response is consumed, call
+    `close` to give it up early. `kind`, `api_version` and `metadata` of the
+    list are available once the iteration got past them, the apiserver
+    sends them before the items.
+    """
+
+    def __init__(self, response, deserialize_item, deserialize_metadata):
+        self.response = response
+        self._deserialize_item = deserialize_item
+        self._deserialize_metadata = deserialize_metadata
+        self._fields = {}
+
+    def __iter__(self):
+        try:
+            for item in iter_list_items(self.response.stream(CHUNK_SIZE),
+                                        self._fields):
+                yield self._deserialize_item(item)
+        finally:
+            self.close()
+
+    @property
+    def kind(self):
+        return self._fields.get('kind')
+
+    @property
+    def api_version(self):
+        return self._fields.get('apiVersion')
+
+    @property
+    def metadata(self):
+        return self._deserialize_metadata(self._fields.get('metadata'))
+
+    def close(self):
+        self.response.close()
+        self.response.release_conn()
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Deferred import of the generated models and apis.
+"""
+
+
+from __future__ import absolute_import
+
+import sys
+from importlib import import_module
+
+
+def install_lazy_imports(module_name, module_globals, names, submodules=()):
+    """
+    Makes the names of a package resolve on first access.
+
+    `import kubernetes.client` would otherwise import every generated
+    model and api module up front. With PEP 562 (python 3.7+) the package
+    gets a module level `__getattr__` importing the defining module of a
+    name the first time it is looked up; older interpreters import
+    everything eagerly as before.
+
+    :param module_name: `__name__` of the package.
+    :param module_globals: `globals()` of the package.
+    :param names: dict of exported name -> module defining it, relative
+        to the package (e.g. {'V1Pod': '.v1_pod'}).
+    :param submodules: names of submodules that may be accessed as
+        attributes of the package before they were imported.
+    """
+    module_globals['__all__'] = sorted(names)
+    submodules = frozenset(submodules)
+
+    if sys.version_info < (3, 7):
+        for name, module in names.items():
+            module_globals[name] = getattr(
+                import_module(module, module_name), name)
+        return
+
+    def __getattr__(name):
+        if name in names:
+            value = getattr(import_module(names[name], module_name), name)
+        elif name in submodules:
+            value = import_module('.' + name, module_name)
+        else:
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(
+                module_name, name))
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(names) | submodules)
+
+    module_globals['__getattr__'] = __getattr__
+    module_globals['__dir__'] = __dir__
@@ -0,0 +1,174 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Models deserialized on first access.
+"""
+
+
+from __future__ import absolute_import
+
+from six import PY3, iteritems
+
+from .compact import _slot
+
+# members of the generated classes not carried over to their variants
+_SKIPPED = ('__dict__', '__weakref__')
+
+
+def _restore(klass, fields):
+    obj = klass.__new__(klass)
+    obj.__dict__.update(fields)
+    return obj
+
+
+def _to_dict(value):
+    # what the generated to_dict does with the value of an attribute
+    if isinstance(value, list):
+        return [x.to_dict() if hasattr(x, 'to_dict') else x for x in value]
+    elif hasattr(value, 'to_dict'):
+        return value.to_dict()
+    elif isinstance(value, dict):
+        return dict((k, v.to_dict() if hasattr(v, 'to_dict') else v)
+                    for k, v in iteritems(value))
+    return value
+
+
+def _deserialize(fields, key, data):
+    field = fields.get(key)
+    if data is None or field is None:
+        # missing, or outside of the projection of the response
+        return None
+    return field[1](data)
+
+
+def _lazy_property(prop, slot, key, fields):
+    def fget(self):
+        values = self._values
+        try:
+            return values[slot]
+        except KeyError:
+            value = _deserialize(fields, key, self._raw.get(key))
+            values[slot] = value
+            return value
+    return property(fget, prop.fset, prop.fdel, prop.__doc__)
+
+
+def lazy_model(klass, fields):
+    """
+    Returns the lazy variant of a generated model class.
+
+    A lazy model wraps the json of a model as received, and only
+    deserializes an attribute when it is first read, so that the parts of
+    a large response never read are never turned into models. It otherwise
+    behaves like the generated class: its instances pass `isinstance`
+    checks against it, compare equal to its instances, and can be updated
+    through the same properties.
+
+    `to_dict` and the json encoding of a lazy model work from its json and
+    the attributes read or set, without deserializing the rest. The json
+    encoding keeps the nested fields unknown to the models. Accessing
+    `__dict__` deserializes every attribute. Pickled and copied lazy
+    models are restored as instances of the generated class.
+
+    :param klass: generated model class.
+    :param fields: dict mapping the json keys of the model to the pair of
+        its attribute name and the deserializer of its value, as compiled
+        by `ApiClient`. It may be filled in after this call. The attributes
+        missing from it are left None.
+    :return: class, whose instances are built by `lazy_model_builder`.
+    """
+    # attribute -> (json key, name of the field set by the setters)
+    attrs = dict((attr, (klass.attribute_map[attr], _slot(klass, attr)))
+                 for attr in klass.swagger_types)
+    slot_keys = dict((slot, key) for key, slot in attrs.values())
+    backing = frozenset(slot_keys) | frozenset(['discriminator'])
+    init = klass.__init__
+
+    def __init__(self, *args, **kwargs):
+        object.__setattr__(self, '_raw', {})
+        object.__setattr__(self, '_values', {})
+        init(self, *args, **kwargs)
+
+    def __setattr__(self, name, value):
+        if name in backing:
+            self._values[name] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def fields_dict(self):
+        result = dict((slot, getattr(self, attr))
+                      for attr, (_, slot) in iteritems(attrs))
+        result['discriminator'] = self._values.get('discriminator')
+        return result
+
+    def to_dict(self):
+        """
+        Returns the model properties as a dict
+        """
+        result = {}
+        values = self._values
+        raw = self._raw
+        for attr, (key, slot) in iteritems(attrs):
+            if slot in values:
+                value = values[slot]
+            else:
+                value = _deserialize(fields, key, raw.get(key))
+            result[attr] = _to_dict(value)
+        return result
+
+    def _json_fields(self):
+        result = dict((key, value) for key, value in iteritems(self._raw)
+                      if key in fields)
+        for slot, value in iteritems(self._values):
+            key = slot_keys.get(slot)
+            if key is None:
+                continue
+            if value is None:
+                result.pop(key, None)
+            else:
+                result[key] = value
+        return result
+
+    def __reduce__(self):
+        return _restore, (klass, self.__dict__)
+
+    namespace = dict((key, value) for key, value in vars(klass).items()
+                     if key not in _SKIPPED)
+    for attr, (key, slot) in iteritems(attrs):
+        namespace[attr] = _lazy_property(vars(klass)[attr], slot, key,
+                                         fields)
+    namespace.update({
+        '__slots__': ('_raw', '_values'),
+        '__init__': __init__,
+        '__setattr__': __setattr__,
+        # isinstance, and the generated __eq__, see the generated class
+        '__class__': property(lambda self: klass),
+        '__dict__': property(fields_dict),
+        '__reduce__': __reduce__,
+        'to_dict': to_dict,
+        '_json_fields': _json_fields,
+    })
+    if PY3:
+        namespace['__qualname__'] = klass.__qualname__
+    return type(klass.__name__, (object,), namespace)
+
+
+def lazy_model_builder(klass, fields):
+    """
+    `model_builder` of the lazy variants of the models, see `lazy_model`.
+    """
+    lazy = lazy_model(klass, fields)
+    set_raw = lazy._raw.__set__
+    set_values = lazy._values.__set__
+
+    def build(data):
+        obj = object.__new__(lazy)
+        set_raw(obj, data if isinstance(data, dict) else {})
+        set_values(obj, {})
+        return obj
+    return build
+
+
+lazy_model_builder.wraps_json = True
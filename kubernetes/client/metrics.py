@@ -0,0 +1,330 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Timing of the phases of the api calls, and their aggregation.
+"""
+
+
+from __future__ import absolute_import
+
+import bisect
+import threading
+import time
+
+from six import iteritems
+
+try:
+    now = time.perf_counter
+except AttributeError:  # python 2
+    now = time.time
+
+# phases of a call, in order
+PHASES = (
+    # sanitization of the parameters and body, see ApiClient.prepare_request
+    'sanitize',
+    # wait for the rate limiter of the client, see Configuration.qps
+    'throttle',
+    # wait for a connection of the pool
+    'acquire',
+    # connection to the apiserver, and TLS handshake
+    'connect',
+    # from sending the request to receiving the headers of the response
+    'server',
+    # read of the body of the response
+    'read',
+    # json decoding of the body
+    'decode',
+    # deserialization of the decoded body into models
+    'deserialize',
+)
+
+# namespace subresources, e.g. /api/v1/namespaces/{name}/finalize
+_NAMESPACE_SUBRESOURCES = frozenset(['status', 'finalize'])
+
+_VERBS = {
+    'POST': 'create',
+    'PUT': 'update',
+    'PATCH': 'patch',
+}
+
+# the metrics of the call in progress in the thread, for the transport
+_local = threading.local()
+
+
+def current():
+    """
+    Returns the RequestMetrics of the call the thread is sending, if any.
+    """
+    return getattr(_local, 'metrics', None)
+
+
+def set_current(metrics):
+    """
+    Sets the RequestMetrics of the call the thread is sending, None once
+    sent.
+    """
+    _local.metrics = metrics
+
+
+def split_path(path):
+    """
+    Returns the (group, resource, name, subresource, watch) of an api
+    path, None for the paths which are not those of resources.
+    """
+    parts = path.split('?', 1)[0].strip('/').split('/')
+    if parts[0] == 'api' and len(parts) > 2:
+        group, rest = '', parts[2:]
+    elif parts[0] == 'apis' and len(parts) > 3:
+        group, rest = parts[1], parts[3:]
+    else:
+        return None
+    watch = rest[0] == 'watch'
+    if watch:
+        rest = rest[1:]
+    if rest and rest[0] == 'namespaces' and len(rest) > 2 and \
+            not (len(rest) == 3 and rest[2] in _NAMESPACE_SUBRESOURCES):
+        rest = rest[2:]
+    if not rest:
+        return None
+    return (group, rest[0], rest[1] if len(rest) > 1 else None,
+            '/'.join(rest[2:]) or None, watch)
+
+
+def resource_of(path):
+    """
+    Returns the resource an api path is that of, as
+    `resource[.group][/subresource]`, e.g. `pods`, `pods/log` or
+    `deployments.apps/scale`. Other paths, e.g. `/version/`, are returned
+    as they are.
+    """
+    split = split_path(path)
+    if split is None:
+        return path
+    group, resource, _, subresource, _ = split
+    if group:
+        resource += '.' + group
+    if subresource:
+        resource += '/' + subresource
+    return resource
+
+
+def verb_of(method, path, query_params=None):
+    """
+    Returns the kubernetes verb of a request, e.g. `list` or `watch` for a
+    GET of a collection, the lowercase http method for the paths which
+    are not those of resources.
+
+    :param query_params: query parameters of the request, list of pairs.
+    """
+    split = split_path(path)
+    if split is None:
+        return method.lower()
+    name, watch = split[2], split[4]
+    if method == 'GET':
+        for key, value in query_params or ():
+            if key == 'watch' and value and value != 'false':
+                watch = True
+        if watch:
+            return 'watch'
+        return 'get' if name is not None else 'list'
+    if method == 'DELETE':
+        return 'delete' if name is not None else 'deletecollection'
+    return _VERBS.get(method, method.lower())
+
+
+class RequestMetrics(object):
+    """
+    Timing and sizes of one api call, handed to the `metrics_sink` of the
+    configuration of the client once the call returns or fails.
+
+    :param verb: kubernetes verb, see `verb_of`.
+    :param resource: resource of the call, see `resource_of`.
+    :param method: http method.
+    :param path: path of the call.
+    """
+
+    def __init__(self, verb, resource, method, path):
+        self.verb = verb
+        self.resource = resource
+        self.method = method
+        self.path = path
+        # http status, None if no response was received
+        self.status = None
+        # phase -> seconds, for the phases the call went through, see
+        # PHASES. Streamed responses, `_preload_content=False`, are not
+        # read, decoded nor deserialized by the client.
+        self.phases = {}
+        # bytes of the encoded body of the request, and of the decompressed
+        # body of the response, None when not known
+        self.request_bytes = None
+        self.response_bytes = None
+        # seconds, from the start of the call to its end
+        self.duration = None
+        self.start = now()
+
+    def add(self, phase, seconds):
+        """
+        Adds time to a phase, the transport may go through some of them
+        more than once, e.g. on retries.
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def transport_time(self):
+        """
+        Returns the seconds spent waiting for and opening connections.
+        """
+        return self.phases.get('acquire', 0.0) + \
+            self.phases.get('connect', 0.0)
+
+    def finish(self, status=None):
+        self.status = status
+        self.duration = now() - self.start
+
+    def __repr__(self):
+        return ('RequestMetrics({verb} {resource}, status={status}, '
+                'duration={duration}, phases={phases})').format(
+                    **self.__dict__)
+
+
+# seconds
+DEFAULT_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                        0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# bytes
+DEFAULT_SIZE_BUCKETS = tuple(256 * 4 ** i for i in range(10))
+
+
+class Histogram(object):
+    """
+    Distribution of observed values, counted in buckets.
+
+    :param bounds: increasing upper bounds of the buckets, values above
+        the last one are counted in an overflow bucket.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket holding the q-quantile of the
+        values, e.g. 0.99, or None if there is none. The overflow bucket
+        is reported as infinite.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def copy(self):
+        other = Histogram(self.bounds)
+        other.counts = list(self.counts)
+        other.count = self.count
+        other.sum = self.sum
+        return other
+
+    def __repr__(self):
+        return 'Histogram(count={0}, mean={1}, p99={2})'.format(
+            self.count, self.mean, self.quantile(0.99))
+
+
+class HistogramSink(object):
+    """
+    Metrics sink aggregating the calls in histograms per verb and resource.
+
+    Every (verb, resource) gets a histogram of the `duration` of its calls,
+    one per phase, see PHASES, and ones of the `request_bytes` and
+    `response_bytes`. The sink is thread safe.
+
+    Example:
+        sink = kubernetes.client.metrics.HistogramSink()
+        configuration.metrics_sink = sink
+        ...
+        for (verb, resource), histograms in sink.snapshot().items():
+            print(verb, resource, histograms['duration'].quantile(0.99),
+                  histograms['server'].quantile(0.99),
+                  histograms['deserialize'].quantile(0.99))
+
+    :param time_buckets: bounds of the buckets of the times, in seconds.
+    :param size_buckets: bounds of the buckets of the sizes, in bytes.
+    """
+
+    def __init__(self, time_buckets=DEFAULT_TIME_BUCKETS,
+                 size_buckets=DEFAULT_SIZE_BUCKETS):
+        self.time_buckets = time_buckets
+        self.size_buckets = size_buckets
+        self._histograms = {}
+        # (verb, resource) -> status -> count
+        self._statuses = {}
+        self._lock = threading.Lock()
+
+    def _new_histograms(self):
+        histograms = dict((name, Histogram(self.time_buckets))
+                          for name in ('duration',) + PHASES)
+        histograms['request_bytes'] = Histogram(self.size_buckets)
+        histograms['response_bytes'] = Histogram(self.size_buckets)
+        return histograms
+
+    def observe(self, metrics):
+        """
+        Adds the RequestMetrics of a call.
+        """
+        key = (metrics.verb, metrics.resource)
+        with self._lock:
+            histograms = self._histograms.get(key)
+            if histograms is None:
+                histograms = self._histograms[key] = self._new_histograms()
+                self._statuses[key] = {}
+            histograms['duration'].observe(metrics.duration)
+            for phase, seconds in iteritems(metrics.phases):
+                histograms[phase].observe(seconds)
+            if metrics.request_bytes is not None:
+                histograms['request_bytes'].observe(metrics.request_bytes)
+            if metrics.response_bytes is not None:
+                histograms['response_bytes'].observe(metrics.response_bytes)
+            statuses = self._statuses[key]
+            statuses[metrics.status] = statuses.get(metrics.status, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns a copy of the histograms.
+
+        :return: dict mapping the (verb, resource) pairs to dicts of their
+            histograms, by name.
+        """
+        with self._lock:
+            return dict((key, dict((name, histogram.copy())
+                                   for name, histogram in
+                                   iteritems(histograms)))
+                        for key, histograms in iteritems(self._histograms))
+
+    def statuses(self):
+        """
+        Returns the number of calls per http status, None for the calls
+        which got no response.
+
+        :return: dict mapping the (verb, resource) pairs to dicts of their
+            counts by status.
+        """
+        with self._lock:
+            return dict((key, dict(statuses))
+                        for key, statuses in iteritems(self._statuses))
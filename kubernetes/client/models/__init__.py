@@ -13,604 +13,611 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from .admissionregistration_v1beta1_service_reference import AdmissionregistrationV1beta1ServiceReference
-from .admissionregistration_v1beta1_webhook_client_config import AdmissionregistrationV1beta1WebhookClientConfig
-from .apiextensions_v1beta1_service_reference import ApiextensionsV1beta1ServiceReference
-from .apiextensions_v1beta1_webhook_client_config import ApiextensionsV1beta1WebhookClientConfig
-from .apiregistration_v1beta1_service_reference import ApiregistrationV1beta1ServiceReference
-from .apps_v1beta1_deployment import AppsV1beta1Deployment
-from .apps_v1beta1_deployment_condition import AppsV1beta1DeploymentCondition
-from .apps_v1beta1_deployment_list import AppsV1beta1DeploymentList
-from .apps_v1beta1_deployment_rollback import AppsV1beta1DeploymentRollback
-from .apps_v1beta1_deployment_spec import AppsV1beta1DeploymentSpec
-from .apps_v1beta1_deployment_status import AppsV1beta1DeploymentStatus
-from .apps_v1beta1_deployment_strategy import AppsV1beta1DeploymentStrategy
-from .apps_v1beta1_rollback_config import AppsV1beta1RollbackConfig
-from .apps_v1beta1_rolling_update_deployment import AppsV1beta1RollingUpdateDeployment
-from .apps_v1beta1_scale import AppsV1beta1Scale
-from .apps_v1beta1_scale_spec import AppsV1beta1ScaleSpec
-from .apps_v1beta1_scale_status import AppsV1beta1ScaleStatus
-from .extensions_v1beta1_allowed_csi_driver import ExtensionsV1beta1AllowedCSIDriver
-from .extensions_v1beta1_allowed_flex_volume import ExtensionsV1beta1AllowedFlexVolume
-from .extensions_v1beta1_allowed_host_path import ExtensionsV1beta1AllowedHostPath
-from .extensions_v1beta1_deployment import ExtensionsV1beta1Deployment
-from .extensions_v1beta1_deployment_condition import ExtensionsV1beta1DeploymentCondition
-from .extensions_v1beta1_deployment_list import ExtensionsV1beta1DeploymentList
-from .extensions_v1beta1_deployment_rollback import ExtensionsV1beta1DeploymentRollback
-from .extensions_v1beta1_deployment_spec import ExtensionsV1beta1DeploymentSpec
-from .extensions_v1beta1_deployment_status import ExtensionsV1beta1DeploymentStatus
-from .extensions_v1beta1_deployment_strategy import ExtensionsV1beta1DeploymentStrategy
-from .extensions_v1beta1_fs_group_strategy_options import ExtensionsV1beta1FSGroupStrategyOptions
-from .extensions_v1beta1_http_ingress_path import ExtensionsV1beta1HTTPIngressPath
-from .extensions_v1beta1_http_ingress_rule_value import ExtensionsV1beta1HTTPIngressRuleValue
-from .extensions_v1beta1_host_port_range import ExtensionsV1beta1HostPortRange
-from .extensions_v1beta1_id_range import ExtensionsV1beta1IDRange
-from .extensions_v1beta1_ingress import ExtensionsV1beta1Ingress
-from .extensions_v1beta1_ingress_backend import ExtensionsV1beta1IngressBackend
-from .extensions_v1beta1_ingress_list import ExtensionsV1beta1IngressList
-from .extensions_v1beta1_ingress_rule import ExtensionsV1beta1IngressRule
-from .extensions_v1beta1_ingress_spec import ExtensionsV1beta1IngressSpec
-from .extensions_v1beta1_ingress_status import ExtensionsV1beta1IngressStatus
-from .extensions_v1beta1_ingress_tls import ExtensionsV1beta1IngressTLS
-from .extensions_v1beta1_pod_security_policy import ExtensionsV1beta1PodSecurityPolicy
-from .extensions_v1beta1_pod_security_policy_list import ExtensionsV1beta1PodSecurityPolicyList
-from .extensions_v1beta1_pod_security_policy_spec import ExtensionsV1beta1PodSecurityPolicySpec
-from .extensions_v1beta1_rollback_config import ExtensionsV1beta1RollbackConfig
-from .extensions_v1beta1_rolling_update_deployment import ExtensionsV1beta1RollingUpdateDeployment
-from .extensions_v1beta1_run_as_group_strategy_options import ExtensionsV1beta1RunAsGroupStrategyOptions
-from .extensions_v1beta1_run_as_user_strategy_options import ExtensionsV1beta1RunAsUserStrategyOptions
-from .extensions_v1beta1_se_linux_strategy_options import ExtensionsV1beta1SELinuxStrategyOptions
-from .extensions_v1beta1_scale import ExtensionsV1beta1Scale
-from .extensions_v1beta1_scale_spec import ExtensionsV1beta1ScaleSpec
-from .extensions_v1beta1_scale_status import ExtensionsV1beta1ScaleStatus
-from .extensions_v1beta1_supplemental_groups_strategy_options import ExtensionsV1beta1SupplementalGroupsStrategyOptions
-from .networking_v1beta1_http_ingress_path import NetworkingV1beta1HTTPIngressPath
-from .networking_v1beta1_http_ingress_rule_value import NetworkingV1beta1HTTPIngressRuleValue
-from .networking_v1beta1_ingress import NetworkingV1beta1Ingress
-from .networking_v1beta1_ingress_backend import NetworkingV1beta1IngressBackend
-from .networking_v1beta1_ingress_list import NetworkingV1beta1IngressList
-from .networking_v1beta1_ingress_rule import NetworkingV1beta1IngressRule
-from .networking_v1beta1_ingress_spec import NetworkingV1beta1IngressSpec
-from .networking_v1beta1_ingress_status import NetworkingV1beta1IngressStatus
-from .networking_v1beta1_ingress_tls import NetworkingV1beta1IngressTLS
-from .policy_v1beta1_allowed_csi_driver import PolicyV1beta1AllowedCSIDriver
-from .policy_v1beta1_allowed_flex_volume import PolicyV1beta1AllowedFlexVolume
-from .policy_v1beta1_allowed_host_path import PolicyV1beta1AllowedHostPath
-from .policy_v1beta1_fs_group_strategy_options import PolicyV1beta1FSGroupStrategyOptions
-from .policy_v1beta1_host_port_range import PolicyV1beta1HostPortRange
-from .policy_v1beta1_id_range import PolicyV1beta1IDRange
-from .policy_v1beta1_pod_security_policy import PolicyV1beta1PodSecurityPolicy
-from .policy_v1beta1_pod_security_policy_list import PolicyV1beta1PodSecurityPolicyList
-from .policy_v1beta1_pod_security_policy_spec import PolicyV1beta1PodSecurityPolicySpec
-from .policy_v1beta1_run_as_group_strategy_options import PolicyV1beta1RunAsGroupStrategyOptions
-from .policy_v1beta1_run_as_user_strategy_options import PolicyV1beta1RunAsUserStrategyOptions
-from .policy_v1beta1_se_linux_strategy_options import PolicyV1beta1SELinuxStrategyOptions
-from .policy_v1beta1_supplemental_groups_strategy_options import PolicyV1beta1SupplementalGroupsStrategyOptions
-from .runtime_raw_extension import RuntimeRawExtension
-from .v1_api_group import V1APIGroup
-from .v1_api_group_list import V1APIGroupList
-from .v1_api_resource import V1APIResource
-from .v1_api_resource_list import V1APIResourceList
-from .v1_api_service import V1APIService
-from .v1_api_service_condition import V1APIServiceCondition
-from .v1_api_service_list import V1APIServiceList
-from .v1_api_service_spec import V1APIServiceSpec
-from .v1_api_service_status import V1APIServiceStatus
-from .v1_api_versions import V1APIVersions
-from .v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from .v1_affinity import V1Affinity
-from .v1_aggregation_rule import V1AggregationRule
-from .v1_attached_volume import V1AttachedVolume
-from .v1_azure_disk_volume_source import V1AzureDiskVolumeSource
-from .v1_azure_file_persistent_volume_source import V1AzureFilePersistentVolumeSource
-from .v1_azure_file_volume_source import V1AzureFileVolumeSource
-from .v1_binding import V1Binding
-from .v1_csi_persistent_volume_source import V1CSIPersistentVolumeSource
-from .v1_csi_volume_source import V1CSIVolumeSource
-from .v1_capabilities import V1Capabilities
-from .v1_ceph_fs_persistent_volume_source import V1CephFSPersistentVolumeSource
-from .v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from .v1_cinder_persistent_volume_source import V1CinderPersistentVolumeSource
-from .v1_cinder_volume_source import V1CinderVolumeSource
-from .v1_client_ip_config import V1ClientIPConfig
-from .v1_cluster_role import V1ClusterRole
-from .v1_cluster_role_binding import V1ClusterRoleBinding
-from .v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from .v1_cluster_role_list import V1ClusterRoleList
-from .v1_component_condition import V1ComponentCondition
-from .v1_component_status import V1ComponentStatus
-from .v1_component_status_list import V1ComponentStatusList
-from .v1_config_map import V1ConfigMap
-from .v1_config_map_env_source import V1ConfigMapEnvSource
-from .v1_config_map_key_selector import V1ConfigMapKeySelector
-from .v1_config_map_list import V1ConfigMapList
-from .v1_config_map_node_config_source import V1ConfigMapNodeConfigSource
-from .v1_config_map_projection import V1ConfigMapProjection
-from .v1_config_map_volume_source import V1ConfigMapVolumeSource
-from .v1_container import V1Container
-from .v1_container_image import V1ContainerImage
-from .v1_container_port import V1ContainerPort
-from .v1_container_state import V1ContainerState
-from .v1_container_state_running import V1ContainerStateRunning
-from .v1_container_state_terminated import V1ContainerStateTerminated
-from .v1_container_state_waiting import V1ContainerStateWaiting
-from .v1_container_status import V1ContainerStatus
-from .v1_controller_revision import V1ControllerRevision
-from .v1_controller_revision_list import V1ControllerRevisionList
-from .v1_cross_version_object_reference import V1CrossVersionObjectReference
-from .v1_daemon_endpoint import V1DaemonEndpoint
-from .v1_daemon_set import V1DaemonSet
-from .v1_daemon_set_condition import V1DaemonSetCondition
-from .v1_daemon_set_list import V1DaemonSetList
-from .v1_daemon_set_spec import V1DaemonSetSpec
-from .v1_daemon_set_status import V1DaemonSetStatus
-from .v1_daemon_set_update_strategy import V1DaemonSetUpdateStrategy
-from .v1_delete_options import V1DeleteOptions
-from .v1_deployment import V1Deployment
-from .v1_deployment_condition import V1DeploymentCondition
-from .v1_deployment_list import V1DeploymentList
-from .v1_deployment_spec import V1DeploymentSpec
-from .v1_deployment_status import V1DeploymentStatus
-from .v1_deployment_strategy import V1DeploymentStrategy
-from .v1_downward_api_projection import V1DownwardAPIProjection
-from .v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from .v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from .v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from .v1_endpoint_address import V1EndpointAddress
-from .v1_endpoint_port import V1EndpointPort
-from .v1_endpoint_subset import V1EndpointSubset
-from .v1_endpoints import V1Endpoints
-from .v1_endpoints_list import V1EndpointsList
-from .v1_env_from_source import V1EnvFromSource
-from .v1_env_var import V1EnvVar
-from .v1_env_var_source import V1EnvVarSource
-from .v1_event import V1Event
-from .v1_event_list import V1EventList
-from .v1_event_series import V1EventSeries
-from .v1_event_source import V1EventSource
-from .v1_exec_action import V1ExecAction
-from .v1_fc_volume_source import V1FCVolumeSource
-from .v1_flex_persistent_volume_source import V1FlexPersistentVolumeSource
-from .v1_flex_volume_source import V1FlexVolumeSource
-from .v1_flocker_volume_source import V1FlockerVolumeSource
-from .v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from .v1_git_repo_volume_source import V1GitRepoVolumeSource
-from .v1_glusterfs_persistent_volume_source import V1GlusterfsPersistentVolumeSource
-from .v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from .v1_group_version_for_discovery import V1GroupVersionForDiscovery
-from .v1_http_get_action import V1HTTPGetAction
-from .v1_http_header import V1HTTPHeader
-from .v1_handler import V1Handler
-from .v1_horizontal_pod_autoscaler import V1HorizontalPodAutoscaler
-from .v1_horizontal_pod_autoscaler_list import V1HorizontalPodAutoscalerList
-from .v1_horizontal_pod_autoscaler_spec import V1HorizontalPodAutoscalerSpec
-from .v1_horizontal_pod_autoscaler_status import V1HorizontalPodAutoscalerStatus
-from .v1_host_alias import V1HostAlias
-from .v1_host_path_volume_source import V1HostPathVolumeSource
-from .v1_ip_block import V1IPBlock
-from .v1_iscsi_persistent_volume_source import V1ISCSIPersistentVolumeSource
-from .v1_iscsi_volume_source import V1ISCSIVolumeSource
-from .v1_initializer import V1Initializer
-from .v1_initializers import V1Initializers
-from .v1_job import V1Job
-from .v1_job_condition import V1JobCondition
-from .v1_job_list import V1JobList
-from .v1_job_spec import V1JobSpec
-from .v1_job_status import V1JobStatus
-from .v1_key_to_path import V1KeyToPath
-from .v1_label_selector import V1LabelSelector
-from .v1_label_selector_requirement import V1LabelSelectorRequirement
-from .v1_lease import V1Lease
-from .v1_lease_list import V1LeaseList
-from .v1_lease_spec import V1LeaseSpec
-from .v1_lifecycle import V1Lifecycle
-from .v1_limit_range import V1LimitRange
-from .v1_limit_range_item import V1LimitRangeItem
-from .v1_limit_range_list import V1LimitRangeList
-from .v1_limit_range_spec import V1LimitRangeSpec
-from .v1_list_meta import V1ListMeta
-from .v1_load_balancer_ingress import V1LoadBalancerIngress
-from .v1_load_balancer_status import V1LoadBalancerStatus
-from .v1_local_object_reference import V1LocalObjectReference
-from .v1_local_subject_access_review import V1LocalSubjectAccessReview
-from .v1_local_volume_source import V1LocalVolumeSource
-from .v1_managed_fields_entry import V1ManagedFieldsEntry
-from .v1_nfs_volume_source import V1NFSVolumeSource
-from .v1_namespace import V1Namespace
-from .v1_namespace_list import V1NamespaceList
-from .v1_namespace_spec import V1NamespaceSpec
-from .v1_namespace_status import V1NamespaceStatus
-from .v1_network_policy import V1NetworkPolicy
-from .v1_network_policy_egress_rule import V1NetworkPolicyEgressRule
-from .v1_network_policy_ingress_rule import V1NetworkPolicyIngressRule
-from .v1_network_policy_list import V1NetworkPolicyList
-from .v1_network_policy_peer import V1NetworkPolicyPeer
-from .v1_network_policy_port import V1NetworkPolicyPort
-from .v1_network_policy_spec import V1NetworkPolicySpec
-from .v1_node import V1Node
-from .v1_node_address import V1NodeAddress
-from .v1_node_affinity import V1NodeAffinity
-from .v1_node_condition import V1NodeCondition
-from .v1_node_config_source import V1NodeConfigSource
-from .v1_node_config_status import V1NodeConfigStatus
-from .v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from .v1_node_list import V1NodeList
-from .v1_node_selector import V1NodeSelector
-from .v1_node_selector_requirement import V1NodeSelectorRequirement
-from .v1_node_selector_term import V1NodeSelectorTerm
-from .v1_node_spec import V1NodeSpec
-from .v1_node_status import V1NodeStatus
-from .v1_node_system_info import V1NodeSystemInfo
-from .v1_non_resource_attributes import V1NonResourceAttributes
-from .v1_non_resource_rule import V1NonResourceRule
-from .v1_object_field_selector import V1ObjectFieldSelector
-from .v1_object_meta import V1ObjectMeta
-from .v1_object_reference import V1ObjectReference
-from .v1_owner_reference import V1OwnerReference
-from .v1_persistent_volume import V1PersistentVolume
-from .v1_persistent_volume_claim import V1PersistentVolumeClaim
-from .v1_persistent_volume_claim_condition import V1PersistentVolumeClaimCondition
-from .v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from .v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from .v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
-from .v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from .v1_persistent_volume_list import V1PersistentVolumeList
-from .v1_persistent_volume_spec import V1PersistentVolumeSpec
-from .v1_persistent_volume_status import V1PersistentVolumeStatus
-from .v1_photon_persistent_disk_volume_source import V1PhotonPersistentDiskVolumeSource
-from .v1_pod import V1Pod
-from .v1_pod_affinity import V1PodAffinity
-from .v1_pod_affinity_term import V1PodAffinityTerm
-from .v1_pod_anti_affinity import V1PodAntiAffinity
-from .v1_pod_condition import V1PodCondition
-from .v1_pod_dns_config import V1PodDNSConfig
-from .v1_pod_dns_config_option import V1PodDNSConfigOption
-from .v1_pod_list import V1PodList
-from .v1_pod_readiness_gate import V1PodReadinessGate
-from .v1_pod_security_context import V1PodSecurityContext
-from .v1_pod_spec import V1PodSpec
-from .v1_pod_status import V1PodStatus
-from .v1_pod_template import V1PodTemplate
-from .v1_pod_template_list import V1PodTemplateList
-from .v1_pod_template_spec import V1PodTemplateSpec
-from .v1_policy_rule import V1PolicyRule
-from .v1_portworx_volume_source import V1PortworxVolumeSource
-from .v1_preconditions import V1Preconditions
-from .v1_preferred_scheduling_term import V1PreferredSchedulingTerm
-from .v1_priority_class import V1PriorityClass
-from .v1_priority_class_list import V1PriorityClassList
-from .v1_probe import V1Probe
-from .v1_projected_volume_source import V1ProjectedVolumeSource
-from .v1_quobyte_volume_source import V1QuobyteVolumeSource
-from .v1_rbd_persistent_volume_source import V1RBDPersistentVolumeSource
-from .v1_rbd_volume_source import V1RBDVolumeSource
-from .v1_replica_set import V1ReplicaSet
-from .v1_replica_set_condition import V1ReplicaSetCondition
-from .v1_replica_set_list import V1ReplicaSetList
-from .v1_replica_set_spec import V1ReplicaSetSpec
-from .v1_replica_set_status import V1ReplicaSetStatus
-from .v1_replication_controller import V1ReplicationController
-from .v1_replication_controller_condition import V1ReplicationControllerCondition
-from .v1_replication_controller_list import V1ReplicationControllerList
-from .v1_replication_controller_spec import V1ReplicationControllerSpec
-from .v1_replication_controller_status import V1ReplicationControllerStatus
-from .v1_resource_attributes import V1ResourceAttributes
-from .v1_resource_field_selector import V1ResourceFieldSelector
-from .v1_resource_quota import V1ResourceQuota
-from .v1_resource_quota_list import V1ResourceQuotaList
-from .v1_resource_quota_spec import V1ResourceQuotaSpec
-from .v1_resource_quota_status import V1ResourceQuotaStatus
-from .v1_resource_requirements import V1ResourceRequirements
-from .v1_resource_rule import V1ResourceRule
-from .v1_role import V1Role
-from .v1_role_binding import V1RoleBinding
-from .v1_role_binding_list import V1RoleBindingList
-from .v1_role_list import V1RoleList
-from .v1_role_ref import V1RoleRef
-from .v1_rolling_update_daemon_set import V1RollingUpdateDaemonSet
-from .v1_rolling_update_deployment import V1RollingUpdateDeployment
-from .v1_rolling_update_stateful_set_strategy import V1RollingUpdateStatefulSetStrategy
-from .v1_se_linux_options import V1SELinuxOptions
-from .v1_scale import V1Scale
-from .v1_scale_io_persistent_volume_source import V1ScaleIOPersistentVolumeSource
-from .v1_scale_io_volume_source import V1ScaleIOVolumeSource
-from .v1_scale_spec import V1ScaleSpec
-from .v1_scale_status import V1ScaleStatus
-from .v1_scope_selector import V1ScopeSelector
-from .v1_scoped_resource_selector_requirement import V1ScopedResourceSelectorRequirement
-from .v1_secret import V1Secret
-from .v1_secret_env_source import V1SecretEnvSource
-from .v1_secret_key_selector import V1SecretKeySelector
-from .v1_secret_list import V1SecretList
-from .v1_secret_projection import V1SecretProjection
-from .v1_secret_reference import V1SecretReference
-from .v1_secret_volume_source import V1SecretVolumeSource
-from .v1_security_context import V1SecurityContext
-from .v1_self_subject_access_review import V1SelfSubjectAccessReview
-from .v1_self_subject_access_review_spec import V1SelfSubjectAccessReviewSpec
-from .v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from .v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from .v1_server_address_by_client_cidr import V1ServerAddressByClientCIDR
-from .v1_service import V1Service
-from .v1_service_account import V1ServiceAccount
-from .v1_service_account_list import V1ServiceAccountList
-from .v1_service_account_token_projection import V1ServiceAccountTokenProjection
-from .v1_service_list import V1ServiceList
-from .v1_service_port import V1ServicePort
-from .v1_service_reference import V1ServiceReference
-from .v1_service_spec import V1ServiceSpec
-from .v1_service_status import V1ServiceStatus
-from .v1_session_affinity_config import V1SessionAffinityConfig
-from .v1_stateful_set import V1StatefulSet
-from .v1_stateful_set_condition import V1StatefulSetCondition
-from .v1_stateful_set_list import V1StatefulSetList
-from .v1_stateful_set_spec import V1StatefulSetSpec
-from .v1_stateful_set_status import V1StatefulSetStatus
-from .v1_stateful_set_update_strategy import V1StatefulSetUpdateStrategy
-from .v1_status import V1Status
-from .v1_status_cause import V1StatusCause
-from .v1_status_details import V1StatusDetails
-from .v1_storage_class import V1StorageClass
-from .v1_storage_class_list import V1StorageClassList
-from .v1_storage_os_persistent_volume_source import V1StorageOSPersistentVolumeSource
-from .v1_storage_os_volume_source import V1StorageOSVolumeSource
-from .v1_subject import V1Subject
-from .v1_subject_access_review import V1SubjectAccessReview
-from .v1_subject_access_review_spec import V1SubjectAccessReviewSpec
-from .v1_subject_access_review_status import V1SubjectAccessReviewStatus
-from .v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from .v1_sysctl import V1Sysctl
-from .v1_tcp_socket_action import V1TCPSocketAction
-from .v1_taint import V1Taint
-from .v1_token_review import V1TokenReview
-from .v1_token_review_spec import V1TokenReviewSpec
-from .v1_token_review_status import V1TokenReviewStatus
-from .v1_toleration import V1Toleration
-from .v1_topology_selector_label_requirement import V1TopologySelectorLabelRequirement
-from .v1_topology_selector_term import V1TopologySelectorTerm
-from .v1_typed_local_object_reference import V1TypedLocalObjectReference
-from .v1_user_info import V1UserInfo
-from .v1_volume import V1Volume
-from .v1_volume_attachment import V1VolumeAttachment
-from .v1_volume_attachment_list import V1VolumeAttachmentList
-from .v1_volume_attachment_source import V1VolumeAttachmentSource
-from .v1_volume_attachment_spec import V1VolumeAttachmentSpec
-from .v1_volume_attachment_status import V1VolumeAttachmentStatus
-from .v1_volume_device import V1VolumeDevice
-from .v1_volume_error import V1VolumeError
-from .v1_volume_mount import V1VolumeMount
-from .v1_volume_node_affinity import V1VolumeNodeAffinity
-from .v1_volume_projection import V1VolumeProjection
-from .v1_vsphere_virtual_disk_volume_source import V1VsphereVirtualDiskVolumeSource
-from .v1_watch_event import V1WatchEvent
-from .v1_weighted_pod_affinity_term import V1WeightedPodAffinityTerm
-from .v1alpha1_aggregation_rule import V1alpha1AggregationRule
-from .v1alpha1_audit_sink import V1alpha1AuditSink
-from .v1alpha1_audit_sink_list import V1alpha1AuditSinkList
-from .v1alpha1_audit_sink_spec import V1alpha1AuditSinkSpec
-from .v1alpha1_cluster_role import V1alpha1ClusterRole
-from .v1alpha1_cluster_role_binding import V1alpha1ClusterRoleBinding
-from .v1alpha1_cluster_role_binding_list import V1alpha1ClusterRoleBindingList
-from .v1alpha1_cluster_role_list import V1alpha1ClusterRoleList
-from .v1alpha1_pod_preset import V1alpha1PodPreset
-from .v1alpha1_pod_preset_list import V1alpha1PodPresetList
-from .v1alpha1_pod_preset_spec import V1alpha1PodPresetSpec
-from .v1alpha1_policy import V1alpha1Policy
-from .v1alpha1_policy_rule import V1alpha1PolicyRule
-from .v1alpha1_priority_class import V1alpha1PriorityClass
-from .v1alpha1_priority_class_list import V1alpha1PriorityClassList
-from .v1alpha1_role import V1alpha1Role
-from .v1alpha1_role_binding import V1alpha1RoleBinding
-from .v1alpha1_role_binding_list import V1alpha1RoleBindingList
-from .v1alpha1_role_list import V1alpha1RoleList
-from .v1alpha1_role_ref import V1alpha1RoleRef
-from .v1alpha1_runtime_class import V1alpha1RuntimeClass
-from .v1alpha1_runtime_class_list import V1alpha1RuntimeClassList
-from .v1alpha1_runtime_class_spec import V1alpha1RuntimeClassSpec
-from .v1alpha1_service_reference import V1alpha1ServiceReference
-from .v1alpha1_subject import V1alpha1Subject
-from .v1alpha1_volume_attachment import V1alpha1VolumeAttachment
-from .v1alpha1_volume_attachment_list import V1alpha1VolumeAttachmentList
-from .v1alpha1_volume_attachment_source import V1alpha1VolumeAttachmentSource
-from .v1alpha1_volume_attachment_spec import V1alpha1VolumeAttachmentSpec
-from .v1alpha1_volume_attachment_status import V1alpha1VolumeAttachmentStatus
-from .v1alpha1_volume_error import V1alpha1VolumeError
-from .v1alpha1_webhook import V1alpha1Webhook
-from .v1alpha1_webhook_client_config import V1alpha1WebhookClientConfig
-from .v1alpha1_webhook_throttle_config import V1alpha1WebhookThrottleConfig
-from .v1beta1_api_service import V1beta1APIService
-from .v1beta1_api_service_condition import V1beta1APIServiceCondition
-from .v1beta1_api_service_list import V1beta1APIServiceList
-from .v1beta1_api_service_spec import V1beta1APIServiceSpec
-from .v1beta1_api_service_status import V1beta1APIServiceStatus
-from .v1beta1_aggregation_rule import V1beta1AggregationRule
-from .v1beta1_csi_driver import V1beta1CSIDriver
-from .v1beta1_csi_driver_list import V1beta1CSIDriverList
-from .v1beta1_csi_driver_spec import V1beta1CSIDriverSpec
-from .v1beta1_csi_node import V1beta1CSINode
-from .v1beta1_csi_node_driver import V1beta1CSINodeDriver
-from .v1beta1_csi_node_list import V1beta1CSINodeList
-from .v1beta1_csi_node_spec import V1beta1CSINodeSpec
-from .v1beta1_certificate_signing_request import V1beta1CertificateSigningRequest
-from .v1beta1_certificate_signing_request_condition import V1beta1CertificateSigningRequestCondition
-from .v1beta1_certificate_signing_request_list import V1beta1CertificateSigningRequestList
-from .v1beta1_certificate_signing_request_spec import V1beta1CertificateSigningRequestSpec
-from .v1beta1_certificate_signing_request_status import V1beta1CertificateSigningRequestStatus
-from .v1beta1_cluster_role import V1beta1ClusterRole
-from .v1beta1_cluster_role_binding import V1beta1ClusterRoleBinding
-from .v1beta1_cluster_role_binding_list import V1beta1ClusterRoleBindingList
-from .v1beta1_cluster_role_list import V1beta1ClusterRoleList
-from .v1beta1_controller_revision import V1beta1ControllerRevision
-from .v1beta1_controller_revision_list import V1beta1ControllerRevisionList
-from .v1beta1_cron_job import V1beta1CronJob
-from .v1beta1_cron_job_list import V1beta1CronJobList
-from .v1beta1_cron_job_spec import V1beta1CronJobSpec
-from .v1beta1_cron_job_status import V1beta1CronJobStatus
-from .v1beta1_custom_resource_column_definition import V1beta1CustomResourceColumnDefinition
-from .v1beta1_custom_resource_conversion import V1beta1CustomResourceConversion
-from .v1beta1_custom_resource_definition import V1beta1CustomResourceDefinition
-from .v1beta1_custom_resource_definition_condition import V1beta1CustomResourceDefinitionCondition
-from .v1beta1_custom_resource_definition_list import V1beta1CustomResourceDefinitionList
-from .v1beta1_custom_resource_definition_names import V1beta1CustomResourceDefinitionNames
-from .v1beta1_custom_resource_definition_spec import V1beta1CustomResourceDefinitionSpec
-from .v1beta1_custom_resource_definition_status import V1beta1CustomResourceDefinitionStatus
-from .v1beta1_custom_resource_definition_version import V1beta1CustomResourceDefinitionVersion
-from .v1beta1_custom_resource_subresource_scale import V1beta1CustomResourceSubresourceScale
-from .v1beta1_custom_resource_subresources import V1beta1CustomResourceSubresources
-from .v1beta1_custom_resource_validation import V1beta1CustomResourceValidation
-from .v1beta1_daemon_set import V1beta1DaemonSet
-from .v1beta1_daemon_set_condition import V1beta1DaemonSetCondition
-from .v1beta1_daemon_set_list import V1beta1DaemonSetList
-from .v1beta1_daemon_set_spec import V1beta1DaemonSetSpec
-from .v1beta1_daemon_set_status import V1beta1DaemonSetStatus
-from .v1beta1_daemon_set_update_strategy import V1beta1DaemonSetUpdateStrategy
-from .v1beta1_event import V1beta1Event
-from .v1beta1_event_list import V1beta1EventList
-from .v1beta1_event_series import V1beta1EventSeries
-from .v1beta1_eviction import V1beta1Eviction
-from .v1beta1_external_documentation import V1beta1ExternalDocumentation
-from .v1beta1_ip_block import V1beta1IPBlock
-from .v1beta1_json_schema_props import V1beta1JSONSchemaProps
-from .v1beta1_job_template_spec import V1beta1JobTemplateSpec
-from .v1beta1_lease import V1beta1Lease
-from .v1beta1_lease_list import V1beta1LeaseList
-from .v1beta1_lease_spec import V1beta1LeaseSpec
-from .v1beta1_local_subject_access_review import V1beta1LocalSubjectAccessReview
-from .v1beta1_mutating_webhook_configuration import V1beta1MutatingWebhookConfiguration
-from .v1beta1_mutating_webhook_configuration_list import V1beta1MutatingWebhookConfigurationList
-from .v1beta1_network_policy import V1beta1NetworkPolicy
-from .v1beta1_network_policy_egress_rule import V1beta1NetworkPolicyEgressRule
-from .v1beta1_network_policy_ingress_rule import V1beta1NetworkPolicyIngressRule
-from .v1beta1_network_policy_list import V1beta1NetworkPolicyList
-from .v1beta1_network_policy_peer import V1beta1NetworkPolicyPeer
-from .v1beta1_network_policy_port import V1beta1NetworkPolicyPort
-from .v1beta1_network_policy_spec import V1beta1NetworkPolicySpec
-from .v1beta1_non_resource_attributes import V1beta1NonResourceAttributes
-from .v1beta1_non_resource_rule import V1beta1NonResourceRule
-from .v1beta1_pod_disruption_budget import V1beta1PodDisruptionBudget
-from .v1beta1_pod_disruption_budget_list import V1beta1PodDisruptionBudgetList
-from .v1beta1_pod_disruption_budget_spec import V1beta1PodDisruptionBudgetSpec
-from .v1beta1_pod_disruption_budget_status import V1beta1PodDisruptionBudgetStatus
-from .v1beta1_policy_rule import V1beta1PolicyRule
-from .v1beta1_priority_class import V1beta1PriorityClass
-from .v1beta1_priority_class_list import V1beta1PriorityClassList
-from .v1beta1_replica_set import V1beta1ReplicaSet
-from .v1beta1_replica_set_condition import V1beta1ReplicaSetCondition
-from .v1beta1_replica_set_list import V1beta1ReplicaSetList
-from .v1beta1_replica_set_spec import V1beta1ReplicaSetSpec
-from .v1beta1_replica_set_status import V1beta1ReplicaSetStatus
-from .v1beta1_resource_attributes import V1beta1ResourceAttributes
-from .v1beta1_resource_rule import V1beta1ResourceRule
-from .v1beta1_role import V1beta1Role
-from .v1beta1_role_binding import V1beta1RoleBinding
-from .v1beta1_role_binding_list import V1beta1RoleBindingList
-from .v1beta1_role_list import V1beta1RoleList
-from .v1beta1_role_ref import V1beta1RoleRef
-from .v1beta1_rolling_update_daemon_set import V1beta1RollingUpdateDaemonSet
-from .v1beta1_rolling_update_stateful_set_strategy import V1beta1RollingUpdateStatefulSetStrategy
-from .v1beta1_rule_with_operations import V1beta1RuleWithOperations
-from .v1beta1_runtime_class import V1beta1RuntimeClass
-from .v1beta1_runtime_class_list import V1beta1RuntimeClassList
-from .v1beta1_self_subject_access_review import V1beta1SelfSubjectAccessReview
-from .v1beta1_self_subject_access_review_spec import V1beta1SelfSubjectAccessReviewSpec
-from .v1beta1_self_subject_rules_review import V1beta1SelfSubjectRulesReview
-from .v1beta1_self_subject_rules_review_spec import V1beta1SelfSubjectRulesReviewSpec
-from .v1beta1_stateful_set import V1beta1StatefulSet
-from .v1beta1_stateful_set_condition import V1beta1StatefulSetCondition
-from .v1beta1_stateful_set_list import V1beta1StatefulSetList
-from .v1beta1_stateful_set_spec import V1beta1StatefulSetSpec
-from .v1beta1_stateful_set_status import V1beta1StatefulSetStatus
-from .v1beta1_stateful_set_update_strategy import V1beta1StatefulSetUpdateStrategy
-from .v1beta1_storage_class import V1beta1StorageClass
-from .v1beta1_storage_class_list import V1beta1StorageClassList
-from .v1beta1_subject import V1beta1Subject
-from .v1beta1_subject_access_review import V1beta1SubjectAccessReview
-from .v1beta1_subject_access_review_spec import V1beta1SubjectAccessReviewSpec
-from .v1beta1_subject_access_review_status import V1beta1SubjectAccessReviewStatus
-from .v1beta1_subject_rules_review_status import V1beta1SubjectRulesReviewStatus
-from .v1beta1_token_review import V1beta1TokenReview
-from .v1beta1_token_review_spec import V1beta1TokenReviewSpec
-from .v1beta1_token_review_status import V1beta1TokenReviewStatus
-from .v1beta1_user_info import V1beta1UserInfo
-from .v1beta1_validating_webhook_configuration import V1beta1ValidatingWebhookConfiguration
-from .v1beta1_validating_webhook_configuration_list import V1beta1ValidatingWebhookConfigurationList
-from .v1beta1_volume_attachment import V1beta1VolumeAttachment
-from .v1beta1_volume_attachment_list import V1beta1VolumeAttachmentList
-from .v1beta1_volume_attachment_source import V1beta1VolumeAttachmentSource
-from .v1beta1_volume_attachment_spec import V1beta1VolumeAttachmentSpec
-from .v1beta1_volume_attachment_status import V1beta1VolumeAttachmentStatus
-from .v1beta1_volume_error import V1beta1VolumeError
-from .v1beta1_webhook import V1beta1Webhook
-from .v1beta2_controller_revision import V1beta2ControllerRevision
-from .v1beta2_controller_revision_list import V1beta2ControllerRevisionList
-from .v1beta2_daemon_set import V1beta2DaemonSet
-from .v1beta2_daemon_set_condition import V1beta2DaemonSetCondition
-from .v1beta2_daemon_set_list import V1beta2DaemonSetList
-from .v1beta2_daemon_set_spec import V1beta2DaemonSetSpec
-from .v1beta2_daemon_set_status import V1beta2DaemonSetStatus
-from .v1beta2_daemon_set_update_strategy import V1beta2DaemonSetUpdateStrategy
-from .v1beta2_deployment import V1beta2Deployment
-from .v1beta2_deployment_condition import V1beta2DeploymentCondition
-from .v1beta2_deployment_list import V1beta2DeploymentList
-from .v1beta2_deployment_spec import V1beta2DeploymentSpec
-from .v1beta2_deployment_status import V1beta2DeploymentStatus
-from .v1beta2_deployment_strategy import V1beta2DeploymentStrategy
-from .v1beta2_replica_set import V1beta2ReplicaSet
-from .v1beta2_replica_set_condition import V1beta2ReplicaSetCondition
-from .v1beta2_replica_set_list import V1beta2ReplicaSetList
-from .v1beta2_replica_set_spec import V1beta2ReplicaSetSpec
-from .v1beta2_replica_set_status import V1beta2ReplicaSetStatus
-from .v1beta2_rolling_update_daemon_set import V1beta2RollingUpdateDaemonSet
-from .v1beta2_rolling_update_deployment import V1beta2RollingUpdateDeployment
-from .v1beta2_rolling_update_stateful_set_strategy import V1beta2RollingUpdateStatefulSetStrategy
-from .v1beta2_scale import V1beta2Scale
-from .v1beta2_scale_spec import V1beta2ScaleSpec
-from .v1beta2_scale_status import V1beta2ScaleStatus
-from .v1beta2_stateful_set import V1beta2StatefulSet
-from .v1beta2_stateful_set_condition import V1beta2StatefulSetCondition
-from .v1beta2_stateful_set_list import V1beta2StatefulSetList
-from .v1beta2_stateful_set_spec import V1beta2StatefulSetSpec
-from .v1beta2_stateful_set_status import V1beta2StatefulSetStatus
-from .v1beta2_stateful_set_update_strategy import V1beta2StatefulSetUpdateStrategy
-from .v2alpha1_cron_job import V2alpha1CronJob
-from .v2alpha1_cron_job_list import V2alpha1CronJobList
-from .v2alpha1_cron_job_spec import V2alpha1CronJobSpec
-from .v2alpha1_cron_job_status import V2alpha1CronJobStatus
-from .v2alpha1_job_template_spec import V2alpha1JobTemplateSpec
-from .v2beta1_cross_version_object_reference import V2beta1CrossVersionObjectReference
-from .v2beta1_external_metric_source import V2beta1ExternalMetricSource
-from .v2beta1_external_metric_status import V2beta1ExternalMetricStatus
-from .v2beta1_horizontal_pod_autoscaler import V2beta1HorizontalPodAutoscaler
-from .v2beta1_horizontal_pod_autoscaler_condition import V2beta1HorizontalPodAutoscalerCondition
-from .v2beta1_horizontal_pod_autoscaler_list import V2beta1HorizontalPodAutoscalerList
-from .v2beta1_horizontal_pod_autoscaler_spec import V2beta1HorizontalPodAutoscalerSpec
-from .v2beta1_horizontal_pod_autoscaler_status import V2beta1HorizontalPodAutoscalerStatus
-from .v2beta1_metric_spec import V2beta1MetricSpec
-from .v2beta1_metric_status import V2beta1MetricStatus
-from .v2beta1_object_metric_source import V2beta1ObjectMetricSource
-from .v2beta1_object_metric_status import V2beta1ObjectMetricStatus
-from .v2beta1_pods_metric_source import V2beta1PodsMetricSource
-from .v2beta1_pods_metric_status import V2beta1PodsMetricStatus
-from .v2beta1_resource_metric_source import V2beta1ResourceMetricSource
-from .v2beta1_resource_metric_status import V2beta1ResourceMetricStatus
-from .v2beta2_cross_version_object_reference import V2beta2CrossVersionObjectReference
-from .v2beta2_external_metric_source import V2beta2ExternalMetricSource
-from .v2beta2_external_metric_status import V2beta2ExternalMetricStatus
-from .v2beta2_horizontal_pod_autoscaler import V2beta2HorizontalPodAutoscaler
-from .v2beta2_horizontal_pod_autoscaler_condition import V2beta2HorizontalPodAutoscalerCondition
-from .v2beta2_horizontal_pod_autoscaler_list import V2beta2HorizontalPodAutoscalerList
-from .v2beta2_horizontal_pod_autoscaler_spec import V2beta2HorizontalPodAutoscalerSpec
-from .v2beta2_horizontal_pod_autoscaler_status import V2beta2HorizontalPodAutoscalerStatus
-from .v2beta2_metric_identifier import V2beta2MetricIdentifier
-from .v2beta2_metric_spec import V2beta2MetricSpec
-from .v2beta2_metric_status import V2beta2MetricStatus
-from .v2beta2_metric_target import V2beta2MetricTarget
-from .v2beta2_metric_value_status import V2beta2MetricValueStatus
-from .v2beta2_object_metric_source import V2beta2ObjectMetricSource
-from .v2beta2_object_metric_status import V2beta2ObjectMetricStatus
-from .v2beta2_pods_metric_source import V2beta2PodsMetricSource
-from .v2beta2_pods_metric_status import V2beta2PodsMetricStatus
-from .v2beta2_resource_metric_source import V2beta2ResourceMetricSource
-from .v2beta2_resource_metric_status import V2beta2ResourceMetricStatus
-from .version_info import VersionInfo
+from ..lazy_import import install_lazy_imports
+
+# models of this package, imported on first access
+_MODELS = {
+    'AdmissionregistrationV1beta1ServiceReference': '.admissionregistration_v1beta1_service_reference',
+    'AdmissionregistrationV1beta1WebhookClientConfig': '.admissionregistration_v1beta1_webhook_client_config',
+    'ApiextensionsV1beta1ServiceReference': '.apiextensions_v1beta1_service_reference',
+    'ApiextensionsV1beta1WebhookClientConfig': '.apiextensions_v1beta1_webhook_client_config',
+    'ApiregistrationV1beta1ServiceReference': '.apiregistration_v1beta1_service_reference',
+    'AppsV1beta1Deployment': '.apps_v1beta1_deployment',
+    'AppsV1beta1DeploymentCondition': '.apps_v1beta1_deployment_condition',
+    'AppsV1beta1DeploymentList': '.apps_v1beta1_deployment_list',
+    'AppsV1beta1DeploymentRollback': '.apps_v1beta1_deployment_rollback',
+    'AppsV1beta1DeploymentSpec': '.apps_v1beta1_deployment_spec',
+    'AppsV1beta1DeploymentStatus': '.apps_v1beta1_deployment_status',
+    'AppsV1beta1DeploymentStrategy': '.apps_v1beta1_deployment_strategy',
+    'AppsV1beta1RollbackConfig': '.apps_v1beta1_rollback_config',
+    'AppsV1beta1RollingUpdateDeployment': '.apps_v1beta1_rolling_update_deployment',
+    'AppsV1beta1Scale': '.apps_v1beta1_scale',
+    'AppsV1beta1ScaleSpec': '.apps_v1beta1_scale_spec',
+    'AppsV1beta1ScaleStatus': '.apps_v1beta1_scale_status',
+    'ExtensionsV1beta1AllowedCSIDriver': '.extensions_v1beta1_allowed_csi_driver',
+    'ExtensionsV1beta1AllowedFlexVolume': '.extensions_v1beta1_allowed_flex_volume',
+    'ExtensionsV1beta1AllowedHostPath': '.extensions_v1beta1_allowed_host_path',
+    'ExtensionsV1beta1Deployment': '.extensions_v1beta1_deployment',
+    'ExtensionsV1beta1DeploymentCondition': '.extensions_v1beta1_deployment_condition',
+    'ExtensionsV1beta1DeploymentList': '.extensions_v1beta1_deployment_list',
+    'ExtensionsV1beta1DeploymentRollback': '.extensions_v1beta1_deployment_rollback',
+    'ExtensionsV1beta1DeploymentSpec': '.extensions_v1beta1_deployment_spec',
+    'ExtensionsV1beta1DeploymentStatus': '.extensions_v1beta1_deployment_status',
+    'ExtensionsV1beta1DeploymentStrategy': '.extensions_v1beta1_deployment_strategy',
+    'ExtensionsV1beta1FSGroupStrategyOptions': '.extensions_v1beta1_fs_group_strategy_options',
+    'ExtensionsV1beta1HTTPIngressPath': '.extensions_v1beta1_http_ingress_path',
+    'ExtensionsV1beta1HTTPIngressRuleValue': '.extensions_v1beta1_http_ingress_rule_value',
+    'ExtensionsV1beta1HostPortRange': '.extensions_v1beta1_host_port_range',
+    'ExtensionsV1beta1IDRange': '.extensions_v1beta1_id_range',
+    'ExtensionsV1beta1Ingress': '.extensions_v1beta1_ingress',
+    'ExtensionsV1beta1IngressBackend': '.extensions_v1beta1_ingress_backend',
+    'ExtensionsV1beta1IngressList': '.extensions_v1beta1_ingress_list',
+    'ExtensionsV1beta1IngressRule': '.extensions_v1beta1_ingress_rule',
+    'ExtensionsV1beta1IngressSpec': '.extensions_v1beta1_ingress_spec',
+    'ExtensionsV1beta1IngressStatus': '.extensions_v1beta1_ingress_status',
+    'ExtensionsV1beta1IngressTLS': '.extensions_v1beta1_ingress_tls',
+    'ExtensionsV1beta1PodSecurityPolicy': '.extensions_v1beta1_pod_security_policy',
+    'ExtensionsV1beta1PodSecurityPolicyList': '.extensions_v1beta1_pod_security_policy_list',
+    'ExtensionsV1beta1PodSecurityPolicySpec': '.extensions_v1beta1_pod_security_policy_spec',
+    'ExtensionsV1beta1RollbackConfig': '.extensions_v1beta1_rollback_config',
+    'ExtensionsV1beta1RollingUpdateDeployment': '.extensions_v1beta1_rolling_update_deployment',
+    'ExtensionsV1beta1RunAsGroupStrategyOptions': '.extensions_v1beta1_run_as_group_strategy_options',
+    'ExtensionsV1beta1RunAsUserStrategyOptions': '.extensions_v1beta1_run_as_user_strategy_options',
+    'ExtensionsV1beta1SELinuxStrategyOptions': '.extensions_v1beta1_se_linux_strategy_options',
+    'ExtensionsV1beta1Scale': '.extensions_v1beta1_scale',
+    'ExtensionsV1beta1ScaleSpec': '.extensions_v1beta1_scale_spec',
+    'ExtensionsV1beta1ScaleStatus': '.extensions_v1beta1_scale_status',
+    'ExtensionsV1beta1SupplementalGroupsStrategyOptions': '.extensions_v1beta1_supplemental_groups_strategy_options',
+    'NetworkingV1beta1HTTPIngressPath': '.networking_v1beta1_http_ingress_path',
+    'NetworkingV1beta1HTTPIngressRuleValue': '.networking_v1beta1_http_ingress_rule_value',
+    'NetworkingV1beta1Ingress': '.networking_v1beta1_ingress',
+    'NetworkingV1beta1IngressBackend': '.networking_v1beta1_ingress_backend',
+    'NetworkingV1beta1IngressList': '.networking_v1beta1_ingress_list',
+    'NetworkingV1beta1IngressRule': '.networking_v1beta1_ingress_rule',
+    'NetworkingV1beta1IngressSpec': '.networking_v1beta1_ingress_spec',
+    'NetworkingV1beta1IngressStatus': '.networking_v1beta1_ingress_status',
+    'NetworkingV1beta1IngressTLS': '.networking_v1beta1_ingress_tls',
+    'PolicyV1beta1AllowedCSIDriver': '.policy_v1beta1_allowed_csi_driver',
+    'PolicyV1beta1AllowedFlexVolume': '.policy_v1beta1_allowed_flex_volume',
+    'PolicyV1beta1AllowedHostPath': '.policy_v1beta1_allowed_host_path',
+    'PolicyV1beta1FSGroupStrategyOptions': '.policy_v1beta1_fs_group_strategy_options',
+    'PolicyV1beta1HostPortRange': '.policy_v1beta1_host_port_range',
+    'PolicyV1beta1IDRange': '.policy_v1beta1_id_range',
+    'PolicyV1beta1PodSecurityPolicy': '.policy_v1beta1_pod_security_policy',
+    'PolicyV1beta1PodSecurityPolicyList': '.policy_v1beta1_pod_security_policy_list',
+    'PolicyV1beta1PodSecurityPolicySpec': '.policy_v1beta1_pod_security_policy_spec',
+    'PolicyV1beta1RunAsGroupStrategyOptions': '.policy_v1beta1_run_as_group_strategy_options',
+    'PolicyV1beta1RunAsUserStrategyOptions': '.policy_v1beta1_run_as_user_strategy_options',
+    'PolicyV1beta1SELinuxStrategyOptions': '.policy_v1beta1_se_linux_strategy_options',
+    'PolicyV1beta1SupplementalGroupsStrategyOptions': '.policy_v1beta1_supplemental_groups_strategy_options',
+    'RuntimeRawExtension': '.runtime_raw_extension',
+    'V1APIGroup': '.v1_api_group',
+    'V1APIGroupList': '.v1_api_group_list',
+    'V1APIResource': '.v1_api_resource',
+    'V1APIResourceList': '.v1_api_resource_list',
+    'V1APIService': '.v1_api_service',
+    'V1APIServiceCondition': '.v1_api_service_condition',
+    'V1APIServiceList': '.v1_api_service_list',
+    'V1APIServiceSpec': '.v1_api_service_spec',
+    'V1APIServiceStatus': '.v1_api_service_status',
+    'V1APIVersions': '.v1_api_versions',
+    'V1AWSElasticBlockStoreVolumeSource': '.v1_aws_elastic_block_store_volume_source',
+    'V1Affinity': '.v1_affinity',
+    'V1AggregationRule': '.v1_aggregation_rule',
+    'V1AttachedVolume': '.v1_attached_volume',
+    'V1AzureDiskVolumeSource': '.v1_azure_disk_volume_source',
+    'V1AzureFilePersistentVolumeSource': '.v1_azure_file_persistent_volume_source',
+    'V1AzureFileVolumeSource': '.v1_azure_file_volume_source',
+    'V1Binding': '.v1_binding',
+    'V1CSIPersistentVolumeSource': '.v1_csi_persistent_volume_source',
+    'V1CSIVolumeSource': '.v1_csi_volume_source',
+    'V1Capabilities': '.v1_capabilities',
+    'V1CephFSPersistentVolumeSource': '.v1_ceph_fs_persistent_volume_source',
+    'V1CephFSVolumeSource': '.v1_ceph_fs_volume_source',
+    'V1CinderPersistentVolumeSource': '.v1_cinder_persistent_volume_source',
+    'V1CinderVolumeSource': '.v1_cinder_volume_source',
+    'V1ClientIPConfig': '.v1_client_ip_config',
+    'V1ClusterRole': '.v1_cluster_role',
+    'V1ClusterRoleBinding': '.v1_cluster_role_binding',
+    'V1ClusterRoleBindingList': '.v1_cluster_role_binding_list',
+    'V1ClusterRoleList': '.v1_cluster_role_list',
+    'V1ComponentCondition': '.v1_component_condition',
+    'V1ComponentStatus': '.v1_component_status',
+    'V1ComponentStatusList': '.v1_component_status_list',
+    'V1ConfigMap': '.v1_config_map',
+    'V1ConfigMapEnvSource': '.v1_config_map_env_source',
+    'V1ConfigMapKeySelector': '.v1_config_map_key_selector',
+    'V1ConfigMapList': '.v1_config_map_list',
+    'V1ConfigMapNodeConfigSource': '.v1_config_map_node_config_source',
+    'V1ConfigMapProjection': '.v1_config_map_projection',
+    'V1ConfigMapVolumeSource': '.v1_config_map_volume_source',
+    'V1Container': '.v1_container',
+    'V1ContainerImage': '.v1_container_image',
+    'V1ContainerPort': '.v1_container_port',
+    'V1ContainerState': '.v1_container_state',
+    'V1ContainerStateRunning': '.v1_container_state_running',
+    'V1ContainerStateTerminated': '.v1_container_state_terminated',
+    'V1ContainerStateWaiting': '.v1_container_state_waiting',
+    'V1ContainerStatus': '.v1_container_status',
+    'V1ControllerRevision': '.v1_controller_revision',
+    'V1ControllerRevisionList': '.v1_controller_revision_list',
+    'V1CrossVersionObjectReference': '.v1_cross_version_object_reference',
+    'V1DaemonEndpoint': '.v1_daemon_endpoint',
+    'V1DaemonSet': '.v1_daemon_set',
+    'V1DaemonSetCondition': '.v1_daemon_set_condition',
+    'V1DaemonSetList': '.v1_daemon_set_list',
+    'V1DaemonSetSpec': '.v1_daemon_set_spec',
+    'V1DaemonSetStatus': '.v1_daemon_set_status',
+    'V1DaemonSetUpdateStrategy': '.v1_daemon_set_update_strategy',
+    'V1DeleteOptions': '.v1_delete_options',
+    'V1Deployment': '.v1_deployment',
+    'V1DeploymentCondition': '.v1_deployment_condition',
+    'V1DeploymentList': '.v1_deployment_list',
+    'V1DeploymentSpec': '.v1_deployment_spec',
+    'V1DeploymentStatus': '.v1_deployment_status',
+    'V1DeploymentStrategy': '.v1_deployment_strategy',
+    'V1DownwardAPIProjection': '.v1_downward_api_projection',
+    'V1DownwardAPIVolumeFile': '.v1_downward_api_volume_file',
+    'V1DownwardAPIVolumeSource': '.v1_downward_api_volume_source',
+    'V1EmptyDirVolumeSource': '.v1_empty_dir_volume_source',
+    'V1EndpointAddress': '.v1_endpoint_address',
+    'V1EndpointPort': '.v1_endpoint_port',
+    'V1EndpointSubset': '.v1_endpoint_subset',
+    'V1Endpoints': '.v1_endpoints',
+    'V1EndpointsList': '.v1_endpoints_list',
+    'V1EnvFromSource': '.v1_env_from_source',
+    'V1EnvVar': '.v1_env_var',
+    'V1EnvVarSource': '.v1_env_var_source',
+    'V1Event': '.v1_event',
+    'V1EventList': '.v1_event_list',
+    'V1EventSeries': '.v1_event_series',
+    'V1EventSource': '.v1_event_source',
+    'V1ExecAction': '.v1_exec_action',
+    'V1FCVolumeSource': '.v1_fc_volume_source',
+    'V1FlexPersistentVolumeSource': '.v1_flex_persistent_volume_source',
+    'V1FlexVolumeSource': '.v1_flex_volume_source',
+    'V1FlockerVolumeSource': '.v1_flocker_volume_source',
+    'V1GCEPersistentDiskVolumeSource': '.v1_gce_persistent_disk_volume_source',
+    'V1GitRepoVolumeSource': '.v1_git_repo_volume_source',
+    'V1GlusterfsPersistentVolumeSource': '.v1_glusterfs_persistent_volume_source',
+    'V1GlusterfsVolumeSource': '.v1_glusterfs_volume_source',
+    'V1GroupVersionForDiscovery': '.v1_group_version_for_discovery',
+    'V1HTTPGetAction': '.v1_http_get_action',
+    'V1HTTPHeader': '.v1_http_header',
+    'V1Handler': '.v1_handler',
+    'V1HorizontalPodAutoscaler': '.v1_horizontal_pod_autoscaler',
+    'V1HorizontalPodAutoscalerList': '.v1_horizontal_pod_autoscaler_list',
+    'V1HorizontalPodAutoscalerSpec': '.v1_horizontal_pod_autoscaler_spec',
+    'V1HorizontalPodAutoscalerStatus': '.v1_horizontal_pod_autoscaler_status',
+    'V1HostAlias': '.v1_host_alias',
+    'V1HostPathVolumeSource': '.v1_host_path_volume_source',
+    'V1IPBlock': '.v1_ip_block',
+    'V1ISCSIPersistentVolumeSource': '.v1_iscsi_persistent_volume_source',
+    'V1ISCSIVolumeSource': '.v1_iscsi_volume_source',
+    'V1Initializer': '.v1_initializer',
+    'V1Initializers': '.v1_initializers',
+    'V1Job': '.v1_job',
+    'V1JobCondition': '.v1_job_condition',
+    'V1JobList': '.v1_job_list',
+    'V1JobSpec': '.v1_job_spec',
+    'V1JobStatus': '.v1_job_status',
+    'V1KeyToPath': '.v1_key_to_path',
+    'V1LabelSelector': '.v1_label_selector',
+    'V1LabelSelectorRequirement': '.v1_label_selector_requirement',
+    'V1Lease': '.v1_lease',
+    'V1LeaseList': '.v1_lease_list',
+    'V1LeaseSpec': '.v1_lease_spec',
+    'V1Lifecycle': '.v1_lifecycle',
+    'V1LimitRange': '.v1_limit_range',
+    'V1LimitRangeItem': '.v1_limit_range_item',
+    'V1LimitRangeList': '.v1_limit_range_list',
+    'V1LimitRangeSpec': '.v1_limit_range_spec',
+    'V1ListMeta': '.v1_list_meta',
+    'V1LoadBalancerIngress': '.v1_load_balancer_ingress',
+    'V1LoadBalancerStatus': '.v1_load_balancer_status',
+    'V1LocalObjectReference': '.v1_local_object_reference',
+    'V1LocalSubjectAccessReview': '.v1_local_subject_access_review',
+    'V1LocalVolumeSource': '.v1_local_volume_source',
+    'V1ManagedFieldsEntry': '.v1_managed_fields_entry',
+    'V1NFSVolumeSource': '.v1_nfs_volume_source',
+    'V1Namespace': '.v1_namespace',
+    'V1NamespaceList': '.v1_namespace_list',
+    'V1NamespaceSpec': '.v1_namespace_spec',
+    'V1NamespaceStatus': '.v1_namespace_status',
+    'V1NetworkPolicy': '.v1_network_policy',
+    'V1NetworkPolicyEgressRule': '.v1_network_policy_egress_rule',
+    'V1NetworkPolicyIngressRule': '.v1_network_policy_ingress_rule',
+    'V1NetworkPolicyList': '.v1_network_policy_list',
+    'V1NetworkPolicyPeer': '.v1_network_policy_peer',
+    'V1NetworkPolicyPort': '.v1_network_policy_port',
+    'V1NetworkPolicySpec': '.v1_network_policy_spec',
+    'V1Node': '.v1_node',
+    'V1NodeAddress': '.v1_node_address',
+    'V1NodeAffinity': '.v1_node_affinity',
+    'V1NodeCondition': '.v1_node_condition',
+    'V1NodeConfigSource': '.v1_node_config_source',
+    'V1NodeConfigStatus': '.v1_node_config_status',
+    'V1NodeDaemonEndpoints': '.v1_node_daemon_endpoints',
+    'V1NodeList': '.v1_node_list',
+    'V1NodeSelector': '.v1_node_selector',
+    'V1NodeSelectorRequirement': '.v1_node_selector_requirement',
+    'V1NodeSelectorTerm': '.v1_node_selector_term',
+    'V1NodeSpec': '.v1_node_spec',
+    'V1NodeStatus': '.v1_node_status',
+    'V1NodeSystemInfo': '.v1_node_system_info',
+    'V1NonResourceAttributes': '.v1_non_resource_attributes',
+    'V1NonResourceRule': '.v1_non_resource_rule',
+    'V1ObjectFieldSelector': '.v1_object_field_selector',
+    'V1ObjectMeta': '.v1_object_meta',
+    'V1ObjectReference': '.v1_object_reference',
+    'V1OwnerReference': '.v1_owner_reference',
+    'V1PersistentVolume': '.v1_persistent_volume',
+    'V1PersistentVolumeClaim': '.v1_persistent_volume_claim',
+    'V1PersistentVolumeClaimCondition': '.v1_persistent_volume_claim_condition',
+    'V1PersistentVolumeClaimList': '.v1_persistent_volume_claim_list',
+    'V1PersistentVolumeClaimSpec': '.v1_persistent_volume_claim_spec',
+    'V1PersistentVolumeClaimStatus': '.v1_persistent_volume_claim_status',
+    'V1PersistentVolumeClaimVolumeSource': '.v1_persistent_volume_claim_volume_source',
+    'V1PersistentVolumeList': '.v1_persistent_volume_list',
+    'V1PersistentVolumeSpec': '.v1_persistent_volume_spec',
+    'V1PersistentVolumeStatus': '.v1_persistent_volume_status',
+    'V1PhotonPersistentDiskVolumeSource': '.v1_photon_persistent_disk_volume_source',
+    'V1Pod': '.v1_pod',
+    'V1PodAffinity': '.v1_pod_affinity',
+    'V1PodAffinityTerm': '.v1_pod_affinity_term',
+    'V1PodAntiAffinity': '.v1_pod_anti_affinity',
+    'V1PodCondition': '.v1_pod_condition',
+    'V1PodDNSConfig': '.v1_pod_dns_config',
+    'V1PodDNSConfigOption': '.v1_pod_dns_config_option',
+    'V1PodList': '.v1_pod_list',
+    'V1PodReadinessGate': '.v1_pod_readiness_gate',
+    'V1PodSecurityContext': '.v1_pod_security_context',
+    'V1PodSpec': '.v1_pod_spec',
+    'V1PodStatus': '.v1_pod_status',
+    'V1PodTemplate': '.v1_pod_template',
+    'V1PodTemplateList': '.v1_pod_template_list',
+    'V1PodTemplateSpec': '.v1_pod_template_spec',
+    'V1PolicyRule': '.v1_policy_rule',
+    'V1PortworxVolumeSource': '.v1_portworx_volume_source',
+    'V1Preconditions': '.v1_preconditions',
+    'V1PreferredSchedulingTerm': '.v1_preferred_scheduling_term',
+    'V1PriorityClass': '.v1_priority_class',
+    'V1PriorityClassList': '.v1_priority_class_list',
+    'V1Probe': '.v1_probe',
+    'V1ProjectedVolumeSource': '.v1_projected_volume_source',
+    'V1QuobyteVolumeSource': '.v1_quobyte_volume_source',
+    'V1RBDPersistentVolumeSource': '.v1_rbd_persistent_volume_source',
+    'V1RBDVolumeSource': '.v1_rbd_volume_source',
+    'V1ReplicaSet': '.v1_replica_set',
+    'V1ReplicaSetCondition': '.v1_replica_set_condition',
+    'V1ReplicaSetList': '.v1_replica_set_list',
+    'V1ReplicaSetSpec': '.v1_replica_set_spec',
+    'V1ReplicaSetStatus': '.v1_replica_set_status',
+    'V1ReplicationController': '.v1_replication_controller',
+    'V1ReplicationControllerCondition': '.v1_replication_controller_condition',
+    'V1ReplicationControllerList': '.v1_replication_controller_list',
+    'V1ReplicationControllerSpec': '.v1_replication_controller_spec',
+    'V1ReplicationControllerStatus': '.v1_replication_controller_status',
+    'V1ResourceAttributes': '.v1_resource_attributes',
+    'V1ResourceFieldSelector': '.v1_resource_field_selector',
+    'V1ResourceQuota': '.v1_resource_quota',
+    'V1ResourceQuotaList': '.v1_resource_quota_list',
+    'V1ResourceQuotaSpec': '.v1_resource_quota_spec',
+    'V1ResourceQuotaStatus': '.v1_resource_quota_status',
+    'V1ResourceRequirements': '.v1_resource_requirements',
+    'V1ResourceRule': '.v1_resource_rule',
+    'V1Role': '.v1_role',
+    'V1RoleBinding': '.v1_role_binding',
+    'V1RoleBindingList': '.v1_role_binding_list',
+    'V1RoleList': '.v1_role_list',
+    'V1RoleRef': '.v1_role_ref',
+    'V1RollingUpdateDaemonSet': '.v1_rolling_update_daemon_set',
+    'V1RollingUpdateDeployment': '.v1_rolling_update_deployment',
+    'V1RollingUpdateStatefulSetStrategy': '.v1_rolling_update_stateful_set_strategy',
+    'V1SELinuxOptions': '.v1_se_linux_options',
+    'V1Scale': '.v1_scale',
+    'V1ScaleIOPersistentVolumeSource': '.v1_scale_io_persistent_volume_source',
+    'V1ScaleIOVolumeSource': '.v1_scale_io_volume_source',
+    'V1ScaleSpec': '.v1_scale_spec',
+    'V1ScaleStatus': '.v1_scale_status',
+    'V1ScopeSelector': '.v1_scope_selector',
+    'V1ScopedResourceSelectorRequirement': '.v1_scoped_resource_selector_requirement',
+    'V1Secret': '.v1_secret',
+    'V1SecretEnvSource': '.v1_secret_env_source',
+    'V1SecretKeySelector': '.v1_secret_key_selector',
+    'V1SecretList': '.v1_secret_list',
+    'V1SecretProjection': '.v1_secret_projection',
+    'V1SecretReference': '.v1_secret_reference',
+    'V1SecretVolumeSource': '.v1_secret_volume_source',
+    'V1SecurityContext': '.v1_security_context',
+    'V1SelfSubjectAccessReview': '.v1_self_subject_access_review',
+    'V1SelfSubjectAccessReviewSpec': '.v1_self_subject_access_review_spec',
+    'V1SelfSubjectRulesReview': '.v1_self_subject_rules_review',
+    'V1SelfSubjectRulesReviewSpec': '.v1_self_subject_rules_review_spec',
+    'V1ServerAddressByClientCIDR': '.v1_server_address_by_client_cidr',
+    'V1Service': '.v1_service',
+    'V1ServiceAccount': '.v1_service_account',
+    'V1ServiceAccountList': '.v1_service_account_list',
+    'V1ServiceAccountTokenProjection': '.v1_service_account_token_projection',
+    'V1ServiceList': '.v1_service_list',
+    'V1ServicePort': '.v1_service_port',
+    'V1ServiceReference': '.v1_service_reference',
+    'V1ServiceSpec': '.v1_service_spec',
+    'V1ServiceStatus': '.v1_service_status',
+    'V1SessionAffinityConfig': '.v1_session_affinity_config',
+    'V1StatefulSet': '.v1_stateful_set',
+    'V1StatefulSetCondition': '.v1_stateful_set_condition',
+    'V1StatefulSetList': '.v1_stateful_set_list',
+    'V1StatefulSetSpec': '.v1_stateful_set_spec',
+    'V1StatefulSetStatus': '.v1_stateful_set_status',
+    'V1StatefulSetUpdateStrategy': '.v1_stateful_set_update_strategy',
+    'V1Status': '.v1_status',
+    'V1StatusCause': '.v1_status_cause',
+    'V1StatusDetails': '.v1_status_details',
+    'V1StorageClass': '.v1_storage_class',
+    'V1StorageClassList': '.v1_storage_class_list',
+    'V1StorageOSPersistentVolumeSource': '.v1_storage_os_persistent_volume_source',
+    'V1StorageOSVolumeSource': '.v1_storage_os_volume_source',
+    'V1Subject': '.v1_subject',
+    'V1SubjectAccessReview': '.v1_subject_access_review',
+    'V1SubjectAccessReviewSpec': '.v1_subject_access_review_spec',
+    'V1SubjectAccessReviewStatus': '.v1_subject_access_review_status',
+    'V1SubjectRulesReviewStatus': '.v1_subject_rules_review_status',
+    'V1Sysctl': '.v1_sysctl',
+    'V1TCPSocketAction': '.v1_tcp_socket_action',
+    'V1Taint': '.v1_taint',
+    'V1TokenReview': '.v1_token_review',
+    'V1TokenReviewSpec': '.v1_token_review_spec',
+    'V1TokenReviewStatus': '.v1_token_review_status',
+    'V1Toleration': '.v1_toleration',
+    'V1TopologySelectorLabelRequirement': '.v1_topology_selector_label_requirement',
+    'V1TopologySelectorTerm': '.v1_topology_selector_term',
+    'V1TypedLocalObjectReference': '.v1_typed_local_object_reference',
+    'V1UserInfo': '.v1_user_info',
+    'V1Volume': '.v1_volume',
+    'V1VolumeAttachment': '.v1_volume_attachment',
+    'V1VolumeAttachmentList': '.v1_volume_attachment_list',
+    'V1VolumeAttachmentSource': '.v1_volume_attachment_source',
+    'V1VolumeAttachmentSpec': '.v1_volume_attachment_spec',
+    'V1VolumeAttachmentStatus': '.v1_volume_attachment_status',
+    'V1VolumeDevice': '.v1_volume_device',
+    'V1VolumeError': '.v1_volume_error',
+    'V1VolumeMount': '.v1_volume_mount',
+    'V1VolumeNodeAffinity': '.v1_volume_node_affinity',
+    'V1VolumeProjection': '.v1_volume_projection',
+    'V1VsphereVirtualDiskVolumeSource': '.v1_vsphere_virtual_disk_volume_source',
+    'V1WatchEvent': '.v1_watch_event',
+    'V1WeightedPodAffinityTerm': '.v1_weighted_pod_affinity_term',
+    'V1alpha1AggregationRule': '.v1alpha1_aggregation_rule',
+    'V1alpha1AuditSink': '.v1alpha1_audit_sink',
+    'V1alpha1AuditSinkList': '.v1alpha1_audit_sink_list',
+    'V1alpha1AuditSinkSpec': '.v1alpha1_audit_sink_spec',
+    'V1alpha1ClusterRole': '.v1alpha1_cluster_role',
+    'V1alpha1ClusterRoleBinding': '.v1alpha1_cluster_role_binding',
+    'V1alpha1ClusterRoleBindingList': '.v1alpha1_cluster_role_binding_list',
+    'V1alpha1ClusterRoleList': '.v1alpha1_cluster_role_list',
+    'V1alpha1PodPreset': '.v1alpha1_pod_preset',
+    'V1alpha1PodPresetList': '.v1alpha1_pod_preset_list',
+    'V1alpha1PodPresetSpec': '.v1alpha1_pod_preset_spec',
+    'V1alpha1Policy': '.v1alpha1_policy',
+    'V1alpha1PolicyRule': '.v1alpha1_policy_rule',
+    'V1alpha1PriorityClass': '.v1alpha1_priority_class',
+    'V1alpha1PriorityClassList': '.v1alpha1_priority_class_list',
+    'V1alpha1Role': '.v1alpha1_role',
+    'V1alpha1RoleBinding': '.v1alpha1_role_binding',
+    'V1alpha1RoleBindingList': '.v1alpha1_role_binding_list',
+    'V1alpha1RoleList': '.v1alpha1_role_list',
+    'V1alpha1RoleRef': '.v1alpha1_role_ref',
+    'V1alpha1RuntimeClass': '.v1alpha1_runtime_class',
+    'V1alpha1RuntimeClassList': '.v1alpha1_runtime_class_list',
+    'V1alpha1RuntimeClassSpec': '.v1alpha1_runtime_class_spec',
+    'V1alpha1ServiceReference': '.v1alpha1_service_reference',
+    'V1alpha1Subject': '.v1alpha1_subject',
+    'V1alpha1VolumeAttachment': '.v1alpha1_volume_attachment',
+    'V1alpha1VolumeAttachmentList': '.v1alpha1_volume_attachment_list',
+    'V1alpha1VolumeAttachmentSource': '.v1alpha1_volume_attachment_source',
+    'V1alpha1VolumeAttachmentSpec': '.v1alpha1_volume_attachment_spec',
+    'V1alpha1VolumeAttachmentStatus': '.v1alpha1_volume_attachment_status',
+    'V1alpha1VolumeError': '.v1alpha1_volume_error',
+    'V1alpha1Webhook': '.v1alpha1_webhook',
+    'V1alpha1WebhookClientConfig': '.v1alpha1_webhook_client_config',
+    'V1alpha1WebhookThrottleConfig': '.v1alpha1_webhook_throttle_config',
+    'V1beta1APIService': '.v1beta1_api_service',
+    'V1beta1APIServiceCondition': '.v1beta1_api_service_condition',
+    'V1beta1APIServiceList': '.v1beta1_api_service_list',
+    'V1beta1APIServiceSpec': '.v1beta1_api_service_spec',
+    'V1beta1APIServiceStatus': '.v1beta1_api_service_status',
+    'V1beta1AggregationRule': '.v1beta1_aggregation_rule',
+    'V1beta1CSIDriver': '.v1beta1_csi_driver',
+    'V1beta1CSIDriverList': '.v1beta1_csi_driver_list',
+    'V1beta1CSIDriverSpec': '.v1beta1_csi_driver_spec',
+    'V1beta1CSINode': '.v1beta1_csi_node',
+    'V1beta1CSINodeDriver': '.v1beta1_csi_node_driver',
+    'V1beta1CSINodeList': '.v1beta1_csi_node_list',
+    'V1beta1CSINodeSpec': '.v1beta1_csi_node_spec',
+    'V1beta1CertificateSigningRequest': '.v1beta1_certificate_signing_request',
+    'V1beta1CertificateSigningRequestCondition': '.v1beta1_certificate_signing_request_condition',
+    'V1beta1CertificateSigningRequestList': '.v1beta1_certificate_signing_request_list',
+    'V1beta1CertificateSigningRequestSpec': '.v1beta1_certificate_signing_request_spec',
+    'V1beta1CertificateSigningRequestStatus': '.v1beta1_certificate_signing_request_status',
+    'V1beta1ClusterRole': '.v1beta1_cluster_role',
+    'V1beta1ClusterRoleBinding': '.v1beta1_cluster_role_binding',
+    'V1beta1ClusterRoleBindingList': '.v1beta1_cluster_role_binding_list',
+    'V1beta1ClusterRoleList': '.v1beta1_cluster_role_list',
+    'V1beta1ControllerRevision': '.v1beta1_controller_revision',
+    'V1beta1ControllerRevisionList': '.v1beta1_controller_revision_list',
+    'V1beta1CronJob': '.v1beta1_cron_job',
+    'V1beta1CronJobList': '.v1beta1_cron_job_list',
+    'V1beta1CronJobSpec': '.v1beta1_cron_job_spec',
+    'V1beta1CronJobStatus': '.v1beta1_cron_job_status',
+    'V1beta1CustomResourceColumnDefinition': '.v1beta1_custom_resource_column_definition',
+    'V1beta1CustomResourceConversion': '.v1beta1_custom_resource_conversion',
+    'V1beta1CustomResourceDefinition': '.v1beta1_custom_resource_definition',
+    'V1beta1CustomResourceDefinitionCondition': '.v1beta1_custom_resource_definition_condition',
+    'V1beta1CustomResourceDefinitionList': '.v1beta1_custom_resource_definition_list',
+    'V1beta1CustomResourceDefinitionNames': '.v1beta1_custom_resource_definition_names',
+    'V1beta1CustomResourceDefinitionSpec': '.v1beta1_custom_resource_definition_spec',
+    'V1beta1CustomResourceDefinitionStatus': '.v1beta1_custom_resource_definition_status',
+    'V1beta1CustomResourceDefinitionVersion': '.v1beta1_custom_resource_definition_version',
+    'V1beta1CustomResourceSubresourceScale': '.v1beta1_custom_resource_subresource_scale',
+    'V1beta1CustomResourceSubresources': '.v1beta1_custom_resource_subresources',
+    'V1beta1CustomResourceValidation': '.v1beta1_custom_resource_validation',
+    'V1beta1DaemonSet': '.v1beta1_daemon_set',
+    'V1beta1DaemonSetCondition': '.v1beta1_daemon_set_condition',
+    'V1beta1DaemonSetList': '.v1beta1_daemon_set_list',
+    'V1beta1DaemonSetSpec': '.v1beta1_daemon_set_spec',
+    'V1beta1DaemonSetStatus': '.v1beta1_daemon_set_status',
+    'V1beta1DaemonSetUpdateStrategy': '.v1beta1_daemon_set_update_strategy',
+    'V1beta1Event': '.v1beta1_event',
+    'V1beta1EventList': '.v1beta1_event_list',
+    'V1beta1EventSeries': '.v1beta1_event_series',
+    'V1beta1Eviction': '.v1beta1_eviction',
+    'V1beta1ExternalDocumentation': '.v1beta1_external_documentation',
+    'V1beta1IPBlock': '.v1beta1_ip_block',
+    'V1beta1JSONSchemaProps': '.v1beta1_json_schema_props',
+    'V1beta1JobTemplateSpec': '.v1beta1_job_template_spec',
+    'V1beta1Lease': '.v1beta1_lease',
+    'V1beta1LeaseList': '.v1beta1_lease_list',
+    'V1beta1LeaseSpec': '.v1beta1_lease_spec',
+    'V1beta1LocalSubjectAccessReview': '.v1beta1_local_subject_access_review',
+    'V1beta1MutatingWebhookConfiguration': '.v1beta1_mutating_webhook_configuration',
+    'V1beta1MutatingWebhookConfigurationList': '.v1beta1_mutating_webhook_configuration_list',
+    'V1beta1NetworkPolicy': '.v1beta1_network_policy',
+    'V1beta1NetworkPolicyEgressRule': '.v1beta1_network_policy_egress_rule',
+    'V1beta1NetworkPolicyIngressRule': '.v1beta1_network_policy_ingress_rule',
+    'V1beta1NetworkPolicyList': '.v1beta1_network_policy_list',
+    'V1beta1NetworkPolicyPeer': '.v1beta1_network_policy_peer',
+    'V1beta1NetworkPolicyPort': '.v1beta1_network_policy_port',
+    'V1beta1NetworkPolicySpec': '.v1beta1_network_policy_spec',
+    'V1beta1NonResourceAttributes': '.v1beta1_non_resource_attributes',
+    'V1beta1NonResourceRule': '.v1beta1_non_resource_rule',
+    'V1beta1PodDisruptionBudget': '.v1beta1_pod_disruption_budget',
+    'V1beta1PodDisruptionBudgetList': '.v1beta1_pod_disruption_budget_list',
+    'V1beta1PodDisruptionBudgetSpec': '.v1beta1_pod_disruption_budget_spec',
+    'V1beta1PodDisruptionBudgetStatus': '.v1beta1_pod_disruption_budget_status',
+    'V1beta1PolicyRule': '.v1beta1_policy_rule',
+    'V1beta1PriorityClass': '.v1beta1_priority_class',
+    'V1beta1PriorityClassList': '.v1beta1_priority_class_list',
+    'V1beta1ReplicaSet': '.v1beta1_replica_set',
+    'V1beta1ReplicaSetCondition': '.v1beta1_replica_set_condition',
+    'V1beta1ReplicaSetList': '.v1beta1_replica_set_list',
+    'V1beta1ReplicaSetSpec': '.v1beta1_replica_set_spec',
+    'V1beta1ReplicaSetStatus': '.v1beta1_replica_set_status',
+    'V1beta1ResourceAttributes': '.v1beta1_resource_attributes',
+    'V1beta1ResourceRule': '.v1beta1_resource_rule',
+    'V1beta1Role': '.v1beta1_role',
+    'V1beta1RoleBinding': '.v1beta1_role_binding',
+    'V1beta1RoleBindingList': '.v1beta1_role_binding_list',
+    'V1beta1RoleList': '.v1beta1_role_list',
+    'V1beta1RoleRef': '.v1beta1_role_ref',
+    'V1beta1RollingUpdateDaemonSet': '.v1beta1_rolling_update_daemon_set',
+    'V1beta1RollingUpdateStatefulSetStrategy': '.v1beta1_rolling_update_stateful_set_strategy',
+    'V1beta1RuleWithOperations': '.v1beta1_rule_with_operations',
+    'V1beta1RuntimeClass': '.v1beta1_runtime_class',
+    'V1beta1RuntimeClassList': '.v1beta1_runtime_class_list',
+    'V1beta1SelfSubjectAccessReview': '.v1beta1_self_subject_access_review',
+    'V1beta1SelfSubjectAccessReviewSpec': '.v1beta1_self_subject_access_review_spec',
+    'V1beta1SelfSubjectRulesReview': '.v1beta1_self_subject_rules_review',
+    'V1beta1SelfSubjectRulesReviewSpec': '.v1beta1_self_subject_rules_review_spec',
+    'V1beta1StatefulSet': '.v1beta1_stateful_set',
+    'V1beta1StatefulSetCondition': '.v1beta1_stateful_set_condition',
+    'V1beta1StatefulSetList': '.v1beta1_stateful_set_list',
+    'V1beta1StatefulSetSpec': '.v1beta1_stateful_set_spec',
+    'V1beta1StatefulSetStatus': '.v1beta1_stateful_set_status',
+    'V1beta1StatefulSetUpdateStrategy': '.v1beta1_stateful_set_update_strategy',
+    'V1beta1StorageClass': '.v1beta1_storage_class',
+    'V1beta1StorageClassList': '.v1beta1_storage_class_list',
+    'V1beta1Subject': '.v1beta1_subject',
+    'V1beta1SubjectAccessReview': '.v1beta1_subject_access_review',
+    'V1beta1SubjectAccessReviewSpec': '.v1beta1_subject_access_review_spec',
+    'V1beta1SubjectAccessReviewStatus': '.v1beta1_subject_access_review_status',
+    'V1beta1SubjectRulesReviewStatus': '.v1beta1_subject_rules_review_status',
+    'V1beta1TokenReview': '.v1beta1_token_review',
+    'V1beta1TokenReviewSpec': '.v1beta1_token_review_spec',
+    'V1beta1TokenReviewStatus': '.v1beta1_token_review_status',
+    'V1beta1UserInfo': '.v1beta1_user_info',
+    'V1beta1ValidatingWebhookConfiguration': '.v1beta1_validating_webhook_configuration',
+    'V1beta1ValidatingWebhookConfigurationList': '.v1beta1_validating_webhook_configuration_list',
+    'V1beta1VolumeAttachment': '.v1beta1_volume_attachment',
+    'V1beta1VolumeAttachmentList': '.v1beta1_volume_attachment_list',
+    'V1beta1VolumeAttachmentSource': '.v1beta1_volume_attachment_source',
+    'V1beta1VolumeAttachmentSpec': '.v1beta1_volume_attachment_spec',
+    'V1beta1VolumeAttachmentStatus': '.v1beta1_volume_attachment_status',
+    'V1beta1VolumeError': '.v1beta1_volume_error',
+    'V1beta1Webhook': '.v1beta1_webhook',
+    'V1beta2ControllerRevision': '.v1beta2_controller_revision',
+    'V1beta2ControllerRevisionList': '.v1beta2_controller_revision_list',
+    'V1beta2DaemonSet': '.v1beta2_daemon_set',
+    'V1beta2DaemonSetCondition': '.v1beta2_daemon_set_condition',
+    'V1beta2DaemonSetList': '.v1beta2_daemon_set_list',
+    'V1beta2DaemonSetSpec': '.v1beta2_daemon_set_spec',
+    'V1beta2DaemonSetStatus': '.v1beta2_daemon_set_status',
+    'V1beta2DaemonSetUpdateStrategy': '.v1beta2_daemon_set_update_strategy',
+    'V1beta2Deployment': '.v1beta2_deployment',
+    'V1beta2DeploymentCondition': '.v1beta2_deployment_condition',
+    'V1beta2DeploymentList': '.v1beta2_deployment_list',
+    'V1beta2DeploymentSpec': '.v1beta2_deployment_spec',
+    'V1beta2DeploymentStatus': '.v1beta2_deployment_status',
+    'V1beta2DeploymentStrategy': '.v1beta2_deployment_strategy',
+    'V1beta2ReplicaSet': '.v1beta2_replica_set',
+    'V1beta2ReplicaSetCondition': '.v1beta2_replica_set_condition',
+    'V1beta2ReplicaSetList': '.v1beta2_replica_set_list',
+    'V1beta2ReplicaSetSpec': '.v1beta2_replica_set_spec',
+    'V1beta2ReplicaSetStatus': '.v1beta2_replica_set_status',
+    'V1beta2RollingUpdateDaemonSet': '.v1beta2_rolling_update_daemon_set',
+    'V1beta2RollingUpdateDeployment': '.v1beta2_rolling_update_deployment',
+    'V1beta2RollingUpdateStatefulSetStrategy': '.v1beta2_rolling_update_stateful_set_strategy',
+    'V1beta2Scale': '.v1beta2_scale',
+    'V1beta2ScaleSpec': '.v1beta2_scale_spec',
+    'V1beta2ScaleStatus': '.v1beta2_scale_status',
+    'V1beta2StatefulSet': '.v1beta2_stateful_set',
+    'V1beta2StatefulSetCondition': '.v1beta2_stateful_set_condition',
+    'V1beta2StatefulSetList': '.v1beta2_stateful_set_list',
+    'V1beta2StatefulSetSpec': '.v1beta2_stateful_set_spec',
+    'V1beta2StatefulSetStatus': '.v1beta2_stateful_set_status',
+    'V1beta2StatefulSetUpdateStrategy': '.v1beta2_stateful_set_update_strategy',
+    'V2alpha1CronJob': '.v2alpha1_cron_job',
+    'V2alpha1CronJobList': '.v2alpha1_cron_job_list',
+    'V2alpha1CronJobSpec': '.v2alpha1_cron_job_spec',
+    'V2alpha1CronJobStatus': '.v2alpha1_cron_job_status',
+    'V2alpha1JobTemplateSpec': '.v2alpha1_job_template_spec',
+    'V2beta1CrossVersionObjectReference': '.v2beta1_cross_version_object_reference',
+    'V2beta1ExternalMetricSource': '.v2beta1_external_metric_source',
+    'V2beta1ExternalMetricStatus': '.v2beta1_external_metric_status',
+    'V2beta1HorizontalPodAutoscaler': '.v2beta1_horizontal_pod_autoscaler',
+    'V2beta1HorizontalPodAutoscalerCondition': '.v2beta1_horizontal_pod_autoscaler_condition',
+    'V2beta1HorizontalPodAutoscalerList': '.v2beta1_horizontal_pod_autoscaler_list',
+    'V2beta1HorizontalPodAutoscalerSpec': '.v2beta1_horizontal_pod_autoscaler_spec',
+    'V2beta1HorizontalPodAutoscalerStatus': '.v2beta1_horizontal_pod_autoscaler_status',
+    'V2beta1MetricSpec': '.v2beta1_metric_spec',
+    'V2beta1MetricStatus': '.v2beta1_metric_status',
+    'V2beta1ObjectMetricSource': '.v2beta1_object_metric_source',
+    'V2beta1ObjectMetricStatus': '.v2beta1_object_metric_status',
+    'V2beta1PodsMetricSource': '.v2beta1_pods_metric_source',
+    'V2beta1PodsMetricStatus': '.v2beta1_pods_metric_status',
+    'V2beta1ResourceMetricSource': '.v2beta1_resource_metric_source',
+    'V2beta1ResourceMetricStatus': '.v2beta1_resource_metric_status',
+    'V2beta2CrossVersionObjectReference': '.v2beta2_cross_version_object_reference',
+    'V2beta2ExternalMetricSource': '.v2beta2_external_metric_source',
+    'V2beta2ExternalMetricStatus': '.v2beta2_external_metric_status',
+    'V2beta2HorizontalPodAutoscaler': '.v2beta2_horizontal_pod_autoscaler',
+    'V2beta2HorizontalPodAutoscalerCondition': '.v2beta2_horizontal_pod_autoscaler_condition',
+    'V2beta2HorizontalPodAutoscalerList': '.v2beta2_horizontal_pod_autoscaler_list',
+    'V2beta2HorizontalPodAutoscalerSpec': '.v2beta2_horizontal_pod_autoscaler_spec',
+    'V2beta2HorizontalPodAutoscalerStatus': '.v2beta2_horizontal_pod_autoscaler_status',
+    'V2beta2MetricIdentifier': '.v2beta2_metric_identifier',
+    'V2beta2MetricSpec': '.v2beta2_metric_spec',
+    'V2beta2MetricStatus': '.v2beta2_metric_status',
+    'V2beta2MetricTarget': '.v2beta2_metric_target',
+    'V2beta2MetricValueStatus': '.v2beta2_metric_value_status',
+    'V2beta2ObjectMetricSource': '.v2beta2_object_metric_source',
+    'V2beta2ObjectMetricStatus': '.v2beta2_object_metric_status',
+    'V2beta2PodsMetricSource': '.v2beta2_pods_metric_source',
+    'V2beta2PodsMetricStatus': '.v2beta2_pods_metric_status',
+    'V2beta2ResourceMetricSource': '.v2beta2_resource_metric_source',
+    'V2beta2ResourceMetricStatus': '.v2beta2_resource_metric_status',
+    'VersionInfo': '.version_info',
+}
+
+install_lazy_imports(__name__, globals(), _MODELS,
+                     set(module[1:] for module in _MODELS.values()))
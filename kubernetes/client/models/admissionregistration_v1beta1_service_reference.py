@@ -57,6 +57,19 @@ class AdmissionregistrationV1beta1ServiceReference(object):
         if path is not None:
           self.path = path
 
+    @classmethod
+    def _from_server(cls, name=None, namespace=None, path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._namespace = namespace
+        self._path = path
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -59,6 +59,19 @@ class ApiextensionsV1beta1WebhookClientConfig(object):
         if url is not None:
           self.url = url
 
+    @classmethod
+    def _from_server(cls, ca_bundle=None, service=None, url=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ca_bundle = ca_bundle
+        self._service = service
+        self._url = url
+        self.discriminator = None
+        return self
+
     @property
     def ca_bundle(self):
         """
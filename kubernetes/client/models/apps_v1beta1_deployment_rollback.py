@@ -67,6 +67,21 @@ class AppsV1beta1DeploymentRollback(object):
         if updated_annotations is not None:
           self.updated_annotations = updated_annotations
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, name=None, rollback_to=None, updated_annotations=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._name = name
+        self._rollback_to = rollback_to
+        self._updated_annotations = updated_annotations
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
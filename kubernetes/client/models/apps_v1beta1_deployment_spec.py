@@ -88,6 +88,25 @@ class AppsV1beta1DeploymentSpec(object):
           self.strategy = strategy
         self.template = template
 
+    @classmethod
+    def _from_server(cls, min_ready_seconds=None, paused=None, progress_deadline_seconds=None, replicas=None, revision_history_limit=None, rollback_to=None, selector=None, strategy=None, template=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._min_ready_seconds = min_ready_seconds
+        self._paused = paused
+        self._progress_deadline_seconds = progress_deadline_seconds
+        self._replicas = replicas
+        self._revision_history_limit = revision_history_limit
+        self._rollback_to = rollback_to
+        self._selector = selector
+        self._strategy = strategy
+        self._template = template
+        self.discriminator = None
+        return self
+
     @property
     def min_ready_seconds(self):
         """
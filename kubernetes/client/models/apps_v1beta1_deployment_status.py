@@ -84,6 +84,24 @@ class AppsV1beta1DeploymentStatus(object):
         if updated_replicas is not None:
           self.updated_replicas = updated_replicas
 
+    @classmethod
+    def _from_server(cls, available_replicas=None, collision_count=None, conditions=None, observed_generation=None, ready_replicas=None, replicas=None, unavailable_replicas=None, updated_replicas=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._available_replicas = available_replicas
+        self._collision_count = collision_count
+        self._conditions = conditions
+        self._observed_generation = observed_generation
+        self._ready_replicas = ready_replicas
+        self._replicas = replicas
+        self._unavailable_replicas = unavailable_replicas
+        self._updated_replicas = updated_replicas
+        self.discriminator = None
+        return self
+
     @property
     def available_replicas(self):
         """
@@ -49,6 +49,17 @@ class AppsV1beta1ScaleSpec(object):
         if replicas is not None:
           self.replicas = replicas
 
+    @classmethod
+    def _from_server(cls, replicas=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._replicas = replicas
+        self.discriminator = None
+        return self
+
     @property
     def replicas(self):
         """
@@ -48,6 +48,17 @@ class ExtensionsV1beta1AllowedCSIDriver(object):
 
         self.name = name
 
+    @classmethod
+    def _from_server(cls, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -48,6 +48,17 @@ class ExtensionsV1beta1AllowedFlexVolume(object):
 
         self.driver = driver
 
+    @classmethod
+    def _from_server(cls, driver=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._driver = driver
+        self.discriminator = None
+        return self
+
     @property
     def driver(self):
         """
@@ -69,6 +69,21 @@ class ExtensionsV1beta1Deployment(object):
         if status is not None:
           self.status = status
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, spec=None, status=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._spec = spec
+        self._status = status
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
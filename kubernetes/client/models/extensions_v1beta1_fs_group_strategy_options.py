@@ -54,6 +54,18 @@ class ExtensionsV1beta1FSGroupStrategyOptions(object):
         if rule is not None:
           self.rule = rule
 
+    @classmethod
+    def _from_server(cls, ranges=None, rule=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ranges = ranges
+        self._rule = rule
+        self.discriminator = None
+        return self
+
     @property
     def ranges(self):
         """
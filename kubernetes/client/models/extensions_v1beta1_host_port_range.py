@@ -52,6 +52,18 @@ class ExtensionsV1beta1HostPortRange(object):
         self.max = max
         self.min = min
 
+    @classmethod
+    def _from_server(cls, max=None, min=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._max = max
+        self._min = min
+        self.discriminator = None
+        return self
+
     @property
     def max(self):
         """
@@ -53,6 +53,18 @@ class ExtensionsV1beta1HTTPIngressPath(object):
         if path is not None:
           self.path = path
 
+    @classmethod
+    def _from_server(cls, backend=None, path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._backend = backend
+        self._path = path
+        self.discriminator = None
+        return self
+
     @property
     def backend(self):
         """
@@ -48,6 +48,17 @@ class ExtensionsV1beta1HTTPIngressRuleValue(object):
 
         self.paths = paths
 
+    @classmethod
+    def _from_server(cls, paths=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._paths = paths
+        self.discriminator = None
+        return self
+
     @property
     def paths(self):
         """
@@ -54,6 +54,18 @@ class ExtensionsV1beta1IngressRule(object):
         if http is not None:
           self.http = http
 
+    @classmethod
+    def _from_server(cls, host=None, http=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._host = host
+        self._http = http
+        self.discriminator = None
+        return self
+
     @property
     def host(self):
         """
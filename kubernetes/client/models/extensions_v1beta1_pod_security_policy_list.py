@@ -63,6 +63,20 @@ class ExtensionsV1beta1PodSecurityPolicyList(object):
         if metadata is not None:
           self.metadata = metadata
 
+    @classmethod
+    def _from_server(cls, api_version=None, items=None, kind=None, metadata=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._items = items
+        self._kind = kind
+        self._metadata = metadata
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -155,6 +155,39 @@ class ExtensionsV1beta1PodSecurityPolicySpec(object):
         if volumes is not None:
           self.volumes = volumes
 
+    @classmethod
+    def _from_server(cls, allow_privilege_escalation=None, allowed_csi_drivers=None, allowed_capabilities=None, allowed_flex_volumes=None, allowed_host_paths=None, allowed_proc_mount_types=None, allowed_unsafe_sysctls=None, default_add_capabilities=None, default_allow_privilege_escalation=None, forbidden_sysctls=None, fs_group=None, host_ipc=None, host_network=None, host_pid=None, host_ports=None, privileged=None, read_only_root_filesystem=None, required_drop_capabilities=None, run_as_group=None, run_as_user=None, se_linux=None, supplemental_groups=None, volumes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._allow_privilege_escalation = allow_privilege_escalation
+        self._allowed_csi_drivers = allowed_csi_drivers
+        self._allowed_capabilities = allowed_capabilities
+        self._allowed_flex_volumes = allowed_flex_volumes
+        self._allowed_host_paths = allowed_host_paths
+        self._allowed_proc_mount_types = allowed_proc_mount_types
+        self._allowed_unsafe_sysctls = allowed_unsafe_sysctls
+        self._default_add_capabilities = default_add_capabilities
+        self._default_allow_privilege_escalation = default_allow_privilege_escalation
+        self._forbidden_sysctls = forbidden_sysctls
+        self._fs_group = fs_group
+        self._host_ipc = host_ipc
+        self._host_network = host_network
+        self._host_pid = host_pid
+        self._host_ports = host_ports
+        self._privileged = privileged
+        self._read_only_root_filesystem = read_only_root_filesystem
+        self._required_drop_capabilities = required_drop_capabilities
+        self._run_as_group = run_as_group
+        self._run_as_user = run_as_user
+        self._se_linux = se_linux
+        self._supplemental_groups = supplemental_groups
+        self._volumes = volumes
+        self.discriminator = None
+        return self
+
     @property
     def allow_privilege_escalation(self):
         """
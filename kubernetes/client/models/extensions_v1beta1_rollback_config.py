@@ -49,6 +49,17 @@ class ExtensionsV1beta1RollbackConfig(object):
         if revision is not None:
           self.revision = revision
 
+    @classmethod
+    def _from_server(cls, revision=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._revision = revision
+        self.discriminator = None
+        return self
+
     @property
     def revision(self):
         """
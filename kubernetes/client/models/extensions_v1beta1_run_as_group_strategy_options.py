@@ -53,6 +53,18 @@ class ExtensionsV1beta1RunAsGroupStrategyOptions(object):
           self.ranges = ranges
         self.rule = rule
 
+    @classmethod
+    def _from_server(cls, ranges=None, rule=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ranges = ranges
+        self._rule = rule
+        self.discriminator = None
+        return self
+
     @property
     def ranges(self):
         """
@@ -58,6 +58,19 @@ class ExtensionsV1beta1ScaleStatus(object):
         if target_selector is not None:
           self.target_selector = target_selector
 
+    @classmethod
+    def _from_server(cls, replicas=None, selector=None, target_selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._replicas = replicas
+        self._selector = selector
+        self._target_selector = target_selector
+        self.discriminator = None
+        return self
+
     @property
     def replicas(self):
         """
@@ -53,6 +53,18 @@ class ExtensionsV1beta1SELinuxStrategyOptions(object):
         if se_linux_options is not None:
           self.se_linux_options = se_linux_options
 
+    @classmethod
+    def _from_server(cls, rule=None, se_linux_options=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._rule = rule
+        self._se_linux_options = se_linux_options
+        self.discriminator = None
+        return self
+
     @property
     def rule(self):
         """
@@ -52,6 +52,18 @@ class NetworkingV1beta1IngressBackend(object):
         self.service_name = service_name
         self.service_port = service_port
 
+    @classmethod
+    def _from_server(cls, service_name=None, service_port=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._service_name = service_name
+        self._service_port = service_port
+        self.discriminator = None
+        return self
+
     @property
     def service_name(self):
         """
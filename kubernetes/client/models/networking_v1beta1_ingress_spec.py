@@ -59,6 +59,19 @@ class NetworkingV1beta1IngressSpec(object):
         if tls is not None:
           self.tls = tls
 
+    @classmethod
+    def _from_server(cls, backend=None, rules=None, tls=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._backend = backend
+        self._rules = rules
+        self._tls = tls
+        self.discriminator = None
+        return self
+
     @property
     def backend(self):
         """
@@ -54,6 +54,18 @@ class NetworkingV1beta1IngressTLS(object):
         if secret_name is not None:
           self.secret_name = secret_name
 
+    @classmethod
+    def _from_server(cls, hosts=None, secret_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hosts = hosts
+        self._secret_name = secret_name
+        self.discriminator = None
+        return self
+
     @property
     def hosts(self):
         """
@@ -54,6 +54,18 @@ class PolicyV1beta1AllowedHostPath(object):
         if read_only is not None:
           self.read_only = read_only
 
+    @classmethod
+    def _from_server(cls, path_prefix=None, read_only=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._path_prefix = path_prefix
+        self._read_only = read_only
+        self.discriminator = None
+        return self
+
     @property
     def path_prefix(self):
         """
@@ -48,6 +48,17 @@ class RuntimeRawExtension(object):
 
         self.raw = raw
 
+    @classmethod
+    def _from_server(cls, raw=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._raw = raw
+        self.discriminator = None
+        return self
+
     @property
     def raw(self):
         """
@@ -59,6 +59,19 @@ class V1Affinity(object):
         if pod_anti_affinity is not None:
           self.pod_anti_affinity = pod_anti_affinity
 
+    @classmethod
+    def _from_server(cls, node_affinity=None, pod_affinity=None, pod_anti_affinity=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._node_affinity = node_affinity
+        self._pod_affinity = pod_affinity
+        self._pod_anti_affinity = pod_anti_affinity
+        self.discriminator = None
+        return self
+
     @property
     def node_affinity(self):
         """
@@ -58,6 +58,19 @@ class V1APIGroupList(object):
         if kind is not None:
           self.kind = kind
 
+    @classmethod
+    def _from_server(cls, api_version=None, groups=None, kind=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._groups = groups
+        self._kind = kind
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
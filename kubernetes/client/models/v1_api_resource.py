@@ -89,6 +89,26 @@ class V1APIResource(object):
         if version is not None:
           self.version = version
 
+    @classmethod
+    def _from_server(cls, categories=None, group=None, kind=None, name=None, namespaced=None, short_names=None, singular_name=None, storage_version_hash=None, verbs=None, version=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._categories = categories
+        self._group = group
+        self._kind = kind
+        self._name = name
+        self._namespaced = namespaced
+        self._short_names = short_names
+        self._singular_name = singular_name
+        self._storage_version_hash = storage_version_hash
+        self._verbs = verbs
+        self._version = version
+        self.discriminator = None
+        return self
+
     @property
     def categories(self):
         """
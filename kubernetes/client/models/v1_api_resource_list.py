@@ -62,6 +62,20 @@ class V1APIResourceList(object):
           self.kind = kind
         self.resources = resources
 
+    @classmethod
+    def _from_server(cls, api_version=None, group_version=None, kind=None, resources=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._group_version = group_version
+        self._kind = kind
+        self._resources = resources
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
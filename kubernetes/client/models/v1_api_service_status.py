@@ -49,6 +49,17 @@ class V1APIServiceStatus(object):
         if conditions is not None:
           self.conditions = conditions
 
+    @classmethod
+    def _from_server(cls, conditions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._conditions = conditions
+        self.discriminator = None
+        return self
+
     @property
     def conditions(self):
         """
@@ -62,6 +62,20 @@ class V1APIVersions(object):
         self.server_address_by_client_cid_rs = server_address_by_client_cid_rs
         self.versions = versions
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, server_address_by_client_cid_rs=None, versions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._server_address_by_client_cid_rs = server_address_by_client_cid_rs
+        self._versions = versions
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -72,6 +72,22 @@ class V1AzureDiskVolumeSource(object):
         if read_only is not None:
           self.read_only = read_only
 
+    @classmethod
+    def _from_server(cls, caching_mode=None, disk_name=None, disk_uri=None, fs_type=None, kind=None, read_only=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._caching_mode = caching_mode
+        self._disk_name = disk_name
+        self._disk_uri = disk_uri
+        self._fs_type = fs_type
+        self._kind = kind
+        self._read_only = read_only
+        self.discriminator = None
+        return self
+
     @property
     def caching_mode(self):
         """
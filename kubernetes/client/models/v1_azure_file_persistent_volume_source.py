@@ -62,6 +62,20 @@ class V1AzureFilePersistentVolumeSource(object):
           self.secret_namespace = secret_namespace
         self.share_name = share_name
 
+    @classmethod
+    def _from_server(cls, read_only=None, secret_name=None, secret_namespace=None, share_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._read_only = read_only
+        self._secret_name = secret_name
+        self._secret_namespace = secret_namespace
+        self._share_name = share_name
+        self.discriminator = None
+        return self
+
     @property
     def read_only(self):
         """
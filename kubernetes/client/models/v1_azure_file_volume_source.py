@@ -57,6 +57,19 @@ class V1AzureFileVolumeSource(object):
         self.secret_name = secret_name
         self.share_name = share_name
 
+    @classmethod
+    def _from_server(cls, read_only=None, secret_name=None, share_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._read_only = read_only
+        self._secret_name = secret_name
+        self._share_name = share_name
+        self.discriminator = None
+        return self
+
     @property
     def read_only(self):
         """
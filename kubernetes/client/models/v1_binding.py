@@ -63,6 +63,20 @@ class V1Binding(object):
           self.metadata = metadata
         self.target = target
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, target=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._target = target
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
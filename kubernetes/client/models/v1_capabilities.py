@@ -54,6 +54,18 @@ class V1Capabilities(object):
         if drop is not None:
           self.drop = drop
 
+    @classmethod
+    def _from_server(cls, add=None, drop=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._add = add
+        self._drop = drop
+        self.discriminator = None
+        return self
+
     @property
     def add(self):
         """
@@ -73,6 +73,22 @@ class V1CephFSVolumeSource(object):
         if user is not None:
           self.user = user
 
+    @classmethod
+    def _from_server(cls, monitors=None, path=None, read_only=None, secret_file=None, secret_ref=None, user=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._monitors = monitors
+        self._path = path
+        self._read_only = read_only
+        self._secret_file = secret_file
+        self._secret_ref = secret_ref
+        self._user = user
+        self.discriminator = None
+        return self
+
     @property
     def monitors(self):
         """
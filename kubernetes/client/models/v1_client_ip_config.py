@@ -49,6 +49,17 @@ class V1ClientIPConfig(object):
         if timeout_seconds is not None:
           self.timeout_seconds = timeout_seconds
 
+    @classmethod
+    def _from_server(cls, timeout_seconds=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._timeout_seconds = timeout_seconds
+        self.discriminator = None
+        return self
+
     @property
     def timeout_seconds(self):
         """
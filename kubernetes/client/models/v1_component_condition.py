@@ -62,6 +62,20 @@ class V1ComponentCondition(object):
         self.status = status
         self.type = type
 
+    @classmethod
+    def _from_server(cls, error=None, message=None, status=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._error = error
+        self._message = message
+        self._status = status
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def error(self):
         """
@@ -54,6 +54,18 @@ class V1ConfigMapEnvSource(object):
         if optional is not None:
           self.optional = optional
 
+    @classmethod
+    def _from_server(cls, name=None, optional=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._optional = optional
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -66,6 +66,21 @@ class V1ConfigMapNodeConfigSource(object):
         if uid is not None:
           self.uid = uid
 
+    @classmethod
+    def _from_server(cls, kubelet_config_key=None, name=None, namespace=None, resource_version=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._kubelet_config_key = kubelet_config_key
+        self._name = name
+        self._namespace = namespace
+        self._resource_version = resource_version
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def kubelet_config_key(self):
         """
@@ -59,6 +59,19 @@ class V1ConfigMapProjection(object):
         if optional is not None:
           self.optional = optional
 
+    @classmethod
+    def _from_server(cls, items=None, name=None, optional=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._items = items
+        self._name = name
+        self._optional = optional
+        self.discriminator = None
+        return self
+
     @property
     def items(self):
         """
@@ -64,6 +64,20 @@ class V1ConfigMapVolumeSource(object):
         if optional is not None:
           self.optional = optional
 
+    @classmethod
+    def _from_server(cls, default_mode=None, items=None, name=None, optional=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._default_mode = default_mode
+        self._items = items
+        self._name = name
+        self._optional = optional
+        self.discriminator = None
+        return self
+
     @property
     def default_mode(self):
         """
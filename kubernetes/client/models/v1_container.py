@@ -148,6 +148,37 @@ class V1Container(object):
         if working_dir is not None:
           self.working_dir = working_dir
 
+    @classmethod
+    def _from_server(cls, args=None, command=None, env=None, env_from=None, image=None, image_pull_policy=None, lifecycle=None, liveness_probe=None, name=None, ports=None, readiness_probe=None, resources=None, security_context=None, stdin=None, stdin_once=None, termination_message_path=None, termination_message_policy=None, tty=None, volume_devices=None, volume_mounts=None, working_dir=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._args = args
+        self._command = command
+        self._env = env
+        self._env_from = env_from
+        self._image = image
+        self._image_pull_policy = image_pull_policy
+        self._lifecycle = lifecycle
+        self._liveness_probe = liveness_probe
+        self._name = name
+        self._ports = ports
+        self._readiness_probe = readiness_probe
+        self._resources = resources
+        self._security_context = security_context
+        self._stdin = stdin
+        self._stdin_once = stdin_once
+        self._termination_message_path = termination_message_path
+        self._termination_message_policy = termination_message_policy
+        self._tty = tty
+        self._volume_devices = volume_devices
+        self._volume_mounts = volume_mounts
+        self._working_dir = working_dir
+        self.discriminator = None
+        return self
+
     @property
     def args(self):
         """
@@ -53,6 +53,18 @@ class V1ContainerImage(object):
         if size_bytes is not None:
           self.size_bytes = size_bytes
 
+    @classmethod
+    def _from_server(cls, names=None, size_bytes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._names = names
+        self._size_bytes = size_bytes
+        self.discriminator = None
+        return self
+
     @property
     def names(self):
         """
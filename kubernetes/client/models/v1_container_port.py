@@ -68,6 +68,21 @@ class V1ContainerPort(object):
         if protocol is not None:
           self.protocol = protocol
 
+    @classmethod
+    def _from_server(cls, container_port=None, host_ip=None, host_port=None, name=None, protocol=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._container_port = container_port
+        self._host_ip = host_ip
+        self._host_port = host_port
+        self._name = name
+        self._protocol = protocol
+        self.discriminator = None
+        return self
+
     @property
     def container_port(self):
         """
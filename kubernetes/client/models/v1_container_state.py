@@ -59,6 +59,19 @@ class V1ContainerState(object):
         if waiting is not None:
           self.waiting = waiting
 
+    @classmethod
+    def _from_server(cls, running=None, terminated=None, waiting=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._running = running
+        self._terminated = terminated
+        self._waiting = waiting
+        self.discriminator = None
+        return self
+
     @property
     def running(self):
         """
@@ -49,6 +49,17 @@ class V1ContainerStateRunning(object):
         if started_at is not None:
           self.started_at = started_at
 
+    @classmethod
+    def _from_server(cls, started_at=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._started_at = started_at
+        self.discriminator = None
+        return self
+
     @property
     def started_at(self):
         """
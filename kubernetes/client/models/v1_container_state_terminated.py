@@ -78,6 +78,23 @@ class V1ContainerStateTerminated(object):
         if started_at is not None:
           self.started_at = started_at
 
+    @classmethod
+    def _from_server(cls, container_id=None, exit_code=None, finished_at=None, message=None, reason=None, signal=None, started_at=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._container_id = container_id
+        self._exit_code = exit_code
+        self._finished_at = finished_at
+        self._message = message
+        self._reason = reason
+        self._signal = signal
+        self._started_at = started_at
+        self.discriminator = None
+        return self
+
     @property
     def container_id(self):
         """
@@ -54,6 +54,18 @@ class V1ContainerStateWaiting(object):
         if reason is not None:
           self.reason = reason
 
+    @classmethod
+    def _from_server(cls, message=None, reason=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._message = message
+        self._reason = reason
+        self.discriminator = None
+        return self
+
     @property
     def message(self):
         """
@@ -79,6 +79,24 @@ class V1ContainerStatus(object):
         if state is not None:
           self.state = state
 
+    @classmethod
+    def _from_server(cls, container_id=None, image=None, image_id=None, last_state=None, name=None, ready=None, restart_count=None, state=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._container_id = container_id
+        self._image = image
+        self._image_id = image_id
+        self._last_state = last_state
+        self._name = name
+        self._ready = ready
+        self._restart_count = restart_count
+        self._state = state
+        self.discriminator = None
+        return self
+
     @property
     def container_id(self):
         """
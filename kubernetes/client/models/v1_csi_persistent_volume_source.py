@@ -82,6 +82,24 @@ class V1CSIPersistentVolumeSource(object):
           self.volume_attributes = volume_attributes
         self.volume_handle = volume_handle
 
+    @classmethod
+    def _from_server(cls, controller_publish_secret_ref=None, driver=None, fs_type=None, node_publish_secret_ref=None, node_stage_secret_ref=None, read_only=None, volume_attributes=None, volume_handle=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._controller_publish_secret_ref = controller_publish_secret_ref
+        self._driver = driver
+        self._fs_type = fs_type
+        self._node_publish_secret_ref = node_publish_secret_ref
+        self._node_stage_secret_ref = node_stage_secret_ref
+        self._read_only = read_only
+        self._volume_attributes = volume_attributes
+        self._volume_handle = volume_handle
+        self.discriminator = None
+        return self
+
     @property
     def controller_publish_secret_ref(self):
         """
@@ -68,6 +68,21 @@ class V1CSIVolumeSource(object):
         if volume_attributes is not None:
           self.volume_attributes = volume_attributes
 
+    @classmethod
+    def _from_server(cls, driver=None, fs_type=None, node_publish_secret_ref=None, read_only=None, volume_attributes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._driver = driver
+        self._fs_type = fs_type
+        self._node_publish_secret_ref = node_publish_secret_ref
+        self._read_only = read_only
+        self._volume_attributes = volume_attributes
+        self.discriminator = None
+        return self
+
     @property
     def driver(self):
         """
@@ -48,6 +48,17 @@ class V1DaemonEndpoint(object):
 
         self.port = port
 
+    @classmethod
+    def _from_server(cls, port=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._port = port
+        self.discriminator = None
+        return self
+
     @property
     def port(self):
         """
@@ -54,6 +54,18 @@ class V1DaemonSetUpdateStrategy(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, rolling_update=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._rolling_update = rolling_update
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def rolling_update(self):
         """
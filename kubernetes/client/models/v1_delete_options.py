@@ -79,6 +79,23 @@ class V1DeleteOptions(object):
         if propagation_policy is not None:
           self.propagation_policy = propagation_policy
 
+    @classmethod
+    def _from_server(cls, api_version=None, dry_run=None, grace_period_seconds=None, kind=None, orphan_dependents=None, preconditions=None, propagation_policy=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._dry_run = dry_run
+        self._grace_period_seconds = grace_period_seconds
+        self._kind = kind
+        self._orphan_dependents = orphan_dependents
+        self._preconditions = preconditions
+        self._propagation_policy = propagation_policy
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -49,6 +49,17 @@ class V1DownwardAPIProjection(object):
         if items is not None:
           self.items = items
 
+    @classmethod
+    def _from_server(cls, items=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._items = items
+        self.discriminator = None
+        return self
+
     @property
     def items(self):
         """
@@ -63,6 +63,20 @@ class V1DownwardAPIVolumeFile(object):
         if resource_field_ref is not None:
           self.resource_field_ref = resource_field_ref
 
+    @classmethod
+    def _from_server(cls, field_ref=None, mode=None, path=None, resource_field_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._field_ref = field_ref
+        self._mode = mode
+        self._path = path
+        self._resource_field_ref = resource_field_ref
+        self.discriminator = None
+        return self
+
     @property
     def field_ref(self):
         """
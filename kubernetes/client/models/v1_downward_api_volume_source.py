@@ -54,6 +54,18 @@ class V1DownwardAPIVolumeSource(object):
         if items is not None:
           self.items = items
 
+    @classmethod
+    def _from_server(cls, default_mode=None, items=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._default_mode = default_mode
+        self._items = items
+        self.discriminator = None
+        return self
+
     @property
     def default_mode(self):
         """
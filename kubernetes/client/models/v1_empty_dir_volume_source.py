@@ -54,6 +54,18 @@ class V1EmptyDirVolumeSource(object):
         if size_limit is not None:
           self.size_limit = size_limit
 
+    @classmethod
+    def _from_server(cls, medium=None, size_limit=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._medium = medium
+        self._size_limit = size_limit
+        self.discriminator = None
+        return self
+
     @property
     def medium(self):
         """
@@ -63,6 +63,20 @@ class V1EndpointAddress(object):
         if target_ref is not None:
           self.target_ref = target_ref
 
+    @classmethod
+    def _from_server(cls, hostname=None, ip=None, node_name=None, target_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hostname = hostname
+        self._ip = ip
+        self._node_name = node_name
+        self._target_ref = target_ref
+        self.discriminator = None
+        return self
+
     @property
     def hostname(self):
         """
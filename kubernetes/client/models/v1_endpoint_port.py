@@ -58,6 +58,19 @@ class V1EndpointPort(object):
         if protocol is not None:
           self.protocol = protocol
 
+    @classmethod
+    def _from_server(cls, name=None, port=None, protocol=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._port = port
+        self._protocol = protocol
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
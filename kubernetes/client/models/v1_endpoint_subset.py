@@ -59,6 +59,19 @@ class V1EndpointSubset(object):
         if ports is not None:
           self.ports = ports
 
+    @classmethod
+    def _from_server(cls, addresses=None, not_ready_addresses=None, ports=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._addresses = addresses
+        self._not_ready_addresses = not_ready_addresses
+        self._ports = ports
+        self.discriminator = None
+        return self
+
     @property
     def addresses(self):
         """
@@ -59,6 +59,19 @@ class V1EnvFromSource(object):
         if secret_ref is not None:
           self.secret_ref = secret_ref
 
+    @classmethod
+    def _from_server(cls, config_map_ref=None, prefix=None, secret_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._config_map_ref = config_map_ref
+        self._prefix = prefix
+        self._secret_ref = secret_ref
+        self.discriminator = None
+        return self
+
     @property
     def config_map_ref(self):
         """
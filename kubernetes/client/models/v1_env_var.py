@@ -58,6 +58,19 @@ class V1EnvVar(object):
         if value_from is not None:
           self.value_from = value_from
 
+    @classmethod
+    def _from_server(cls, name=None, value=None, value_from=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._value = value
+        self._value_from = value_from
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -64,6 +64,20 @@ class V1EnvVarSource(object):
         if secret_key_ref is not None:
           self.secret_key_ref = secret_key_ref
 
+    @classmethod
+    def _from_server(cls, config_map_key_ref=None, field_ref=None, resource_field_ref=None, secret_key_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._config_map_key_ref = config_map_key_ref
+        self._field_ref = field_ref
+        self._resource_field_ref = resource_field_ref
+        self._secret_key_ref = secret_key_ref
+        self.discriminator = None
+        return self
+
     @property
     def config_map_key_ref(self):
         """
@@ -127,6 +127,33 @@ class V1Event(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, action=None, api_version=None, count=None, event_time=None, first_timestamp=None, involved_object=None, kind=None, last_timestamp=None, message=None, metadata=None, reason=None, related=None, reporting_component=None, reporting_instance=None, series=None, source=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._action = action
+        self._api_version = api_version
+        self._count = count
+        self._event_time = event_time
+        self._first_timestamp = first_timestamp
+        self._involved_object = involved_object
+        self._kind = kind
+        self._last_timestamp = last_timestamp
+        self._message = message
+        self._metadata = metadata
+        self._reason = reason
+        self._related = related
+        self._reporting_component = reporting_component
+        self._reporting_instance = reporting_instance
+        self._series = series
+        self._source = source
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def action(self):
         """
@@ -54,6 +54,18 @@ class V1EventSource(object):
         if host is not None:
           self.host = host
 
+    @classmethod
+    def _from_server(cls, component=None, host=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._component = component
+        self._host = host
+        self.discriminator = None
+        return self
+
     @property
     def component(self):
         """
@@ -49,6 +49,17 @@ class V1ExecAction(object):
         if command is not None:
           self.command = command
 
+    @classmethod
+    def _from_server(cls, command=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._command = command
+        self.discriminator = None
+        return self
+
     @property
     def command(self):
         """
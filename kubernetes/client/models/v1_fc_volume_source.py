@@ -69,6 +69,21 @@ class V1FCVolumeSource(object):
         if wwids is not None:
           self.wwids = wwids
 
+    @classmethod
+    def _from_server(cls, fs_type=None, lun=None, read_only=None, target_ww_ns=None, wwids=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._lun = lun
+        self._read_only = read_only
+        self._target_ww_ns = target_ww_ns
+        self._wwids = wwids
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
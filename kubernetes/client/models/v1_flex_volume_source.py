@@ -68,6 +68,21 @@ class V1FlexVolumeSource(object):
         if secret_ref is not None:
           self.secret_ref = secret_ref
 
+    @classmethod
+    def _from_server(cls, driver=None, fs_type=None, options=None, read_only=None, secret_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._driver = driver
+        self._fs_type = fs_type
+        self._options = options
+        self._read_only = read_only
+        self._secret_ref = secret_ref
+        self.discriminator = None
+        return self
+
     @property
     def driver(self):
         """
@@ -54,6 +54,18 @@ class V1FlockerVolumeSource(object):
         if dataset_uuid is not None:
           self.dataset_uuid = dataset_uuid
 
+    @classmethod
+    def _from_server(cls, dataset_name=None, dataset_uuid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._dataset_name = dataset_name
+        self._dataset_uuid = dataset_uuid
+        self.discriminator = None
+        return self
+
     @property
     def dataset_name(self):
         """
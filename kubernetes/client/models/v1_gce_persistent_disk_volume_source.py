@@ -63,6 +63,20 @@ class V1GCEPersistentDiskVolumeSource(object):
         if read_only is not None:
           self.read_only = read_only
 
+    @classmethod
+    def _from_server(cls, fs_type=None, partition=None, pd_name=None, read_only=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._partition = partition
+        self._pd_name = pd_name
+        self._read_only = read_only
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
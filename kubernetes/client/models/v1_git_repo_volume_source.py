@@ -58,6 +58,19 @@ class V1GitRepoVolumeSource(object):
         if revision is not None:
           self.revision = revision
 
+    @classmethod
+    def _from_server(cls, directory=None, repository=None, revision=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._directory = directory
+        self._repository = repository
+        self._revision = revision
+        self.discriminator = None
+        return self
+
     @property
     def directory(self):
         """
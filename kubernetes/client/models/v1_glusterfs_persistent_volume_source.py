@@ -62,6 +62,20 @@ class V1GlusterfsPersistentVolumeSource(object):
         if read_only is not None:
           self.read_only = read_only
 
+    @classmethod
+    def _from_server(cls, endpoints=None, endpoints_namespace=None, path=None, read_only=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._endpoints = endpoints
+        self._endpoints_namespace = endpoints_namespace
+        self._path = path
+        self._read_only = read_only
+        self.discriminator = None
+        return self
+
     @property
     def endpoints(self):
         """
@@ -52,6 +52,18 @@ class V1GroupVersionForDiscovery(object):
         self.group_version = group_version
         self.version = version
 
+    @classmethod
+    def _from_server(cls, group_version=None, version=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._group_version = group_version
+        self._version = version
+        self.discriminator = None
+        return self
+
     @property
     def group_version(self):
         """
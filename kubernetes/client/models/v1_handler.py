@@ -59,6 +59,19 @@ class V1Handler(object):
         if tcp_socket is not None:
           self.tcp_socket = tcp_socket
 
+    @classmethod
+    def _from_server(cls, _exec=None, http_get=None, tcp_socket=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self.__exec = _exec
+        self._http_get = http_get
+        self._tcp_socket = tcp_socket
+        self.discriminator = None
+        return self
+
     @property
     def _exec(self):
         """
@@ -62,6 +62,20 @@ class V1HorizontalPodAutoscalerSpec(object):
         if target_cpu_utilization_percentage is not None:
           self.target_cpu_utilization_percentage = target_cpu_utilization_percentage
 
+    @classmethod
+    def _from_server(cls, max_replicas=None, min_replicas=None, scale_target_ref=None, target_cpu_utilization_percentage=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._max_replicas = max_replicas
+        self._min_replicas = min_replicas
+        self._scale_target_ref = scale_target_ref
+        self._target_cpu_utilization_percentage = target_cpu_utilization_percentage
+        self.discriminator = None
+        return self
+
     @property
     def max_replicas(self):
         """
@@ -67,6 +67,21 @@ class V1HorizontalPodAutoscalerStatus(object):
         if observed_generation is not None:
           self.observed_generation = observed_generation
 
+    @classmethod
+    def _from_server(cls, current_cpu_utilization_percentage=None, current_replicas=None, desired_replicas=None, last_scale_time=None, observed_generation=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current_cpu_utilization_percentage = current_cpu_utilization_percentage
+        self._current_replicas = current_replicas
+        self._desired_replicas = desired_replicas
+        self._last_scale_time = last_scale_time
+        self._observed_generation = observed_generation
+        self.discriminator = None
+        return self
+
     @property
     def current_cpu_utilization_percentage(self):
         """
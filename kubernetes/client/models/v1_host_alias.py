@@ -54,6 +54,18 @@ class V1HostAlias(object):
         if ip is not None:
           self.ip = ip
 
+    @classmethod
+    def _from_server(cls, hostnames=None, ip=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hostnames = hostnames
+        self._ip = ip
+        self.discriminator = None
+        return self
+
     @property
     def hostnames(self):
         """
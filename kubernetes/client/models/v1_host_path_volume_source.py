@@ -53,6 +53,18 @@ class V1HostPathVolumeSource(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, path=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._path = path
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def path(self):
         """
@@ -68,6 +68,21 @@ class V1HTTPGetAction(object):
         if scheme is not None:
           self.scheme = scheme
 
+    @classmethod
+    def _from_server(cls, host=None, http_headers=None, path=None, port=None, scheme=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._host = host
+        self._http_headers = http_headers
+        self._path = path
+        self._port = port
+        self._scheme = scheme
+        self.discriminator = None
+        return self
+
     @property
     def host(self):
         """
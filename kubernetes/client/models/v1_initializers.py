@@ -53,6 +53,18 @@ class V1Initializers(object):
         if result is not None:
           self.result = result
 
+    @classmethod
+    def _from_server(cls, pending=None, result=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._pending = pending
+        self._result = result
+        self.discriminator = None
+        return self
+
     @property
     def pending(self):
         """
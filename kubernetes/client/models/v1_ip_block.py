@@ -53,6 +53,18 @@ class V1IPBlock(object):
         if _except is not None:
           self._except = _except
 
+    @classmethod
+    def _from_server(cls, cidr=None, _except=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._cidr = cidr
+        self.__except = _except
+        self.discriminator = None
+        return self
+
     @property
     def cidr(self):
         """
@@ -96,6 +96,27 @@ class V1ISCSIVolumeSource(object):
           self.secret_ref = secret_ref
         self.target_portal = target_portal
 
+    @classmethod
+    def _from_server(cls, chap_auth_discovery=None, chap_auth_session=None, fs_type=None, initiator_name=None, iqn=None, iscsi_interface=None, lun=None, portals=None, read_only=None, secret_ref=None, target_portal=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._chap_auth_discovery = chap_auth_discovery
+        self._chap_auth_session = chap_auth_session
+        self._fs_type = fs_type
+        self._initiator_name = initiator_name
+        self._iqn = iqn
+        self._iscsi_interface = iscsi_interface
+        self._lun = lun
+        self._portals = portals
+        self._read_only = read_only
+        self._secret_ref = secret_ref
+        self._target_portal = target_portal
+        self.discriminator = None
+        return self
+
     @property
     def chap_auth_discovery(self):
         """
@@ -83,6 +83,24 @@ class V1JobSpec(object):
         if ttl_seconds_after_finished is not None:
           self.ttl_seconds_after_finished = ttl_seconds_after_finished
 
+    @classmethod
+    def _from_server(cls, active_deadline_seconds=None, backoff_limit=None, completions=None, manual_selector=None, parallelism=None, selector=None, template=None, ttl_seconds_after_finished=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._active_deadline_seconds = active_deadline_seconds
+        self._backoff_limit = backoff_limit
+        self._completions = completions
+        self._manual_selector = manual_selector
+        self._parallelism = parallelism
+        self._selector = selector
+        self._template = template
+        self._ttl_seconds_after_finished = ttl_seconds_after_finished
+        self.discriminator = None
+        return self
+
     @property
     def active_deadline_seconds(self):
         """
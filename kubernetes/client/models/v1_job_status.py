@@ -74,6 +74,22 @@ class V1JobStatus(object):
         if succeeded is not None:
           self.succeeded = succeeded
 
+    @classmethod
+    def _from_server(cls, active=None, completion_time=None, conditions=None, failed=None, start_time=None, succeeded=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._active = active
+        self._completion_time = completion_time
+        self._conditions = conditions
+        self._failed = failed
+        self._start_time = start_time
+        self._succeeded = succeeded
+        self.discriminator = None
+        return self
+
     @property
     def active(self):
         """
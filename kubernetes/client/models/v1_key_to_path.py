@@ -57,6 +57,19 @@ class V1KeyToPath(object):
           self.mode = mode
         self.path = path
 
+    @classmethod
+    def _from_server(cls, key=None, mode=None, path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._key = key
+        self._mode = mode
+        self._path = path
+        self.discriminator = None
+        return self
+
     @property
     def key(self):
         """
@@ -54,6 +54,18 @@ class V1LabelSelector(object):
         if match_labels is not None:
           self.match_labels = match_labels
 
+    @classmethod
+    def _from_server(cls, match_expressions=None, match_labels=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._match_expressions = match_expressions
+        self._match_labels = match_labels
+        self.discriminator = None
+        return self
+
     @property
     def match_expressions(self):
         """
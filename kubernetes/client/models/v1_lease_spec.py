@@ -69,6 +69,21 @@ class V1LeaseSpec(object):
         if renew_time is not None:
           self.renew_time = renew_time
 
+    @classmethod
+    def _from_server(cls, acquire_time=None, holder_identity=None, lease_duration_seconds=None, lease_transitions=None, renew_time=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._acquire_time = acquire_time
+        self._holder_identity = holder_identity
+        self._lease_duration_seconds = lease_duration_seconds
+        self._lease_transitions = lease_transitions
+        self._renew_time = renew_time
+        self.discriminator = None
+        return self
+
     @property
     def acquire_time(self):
         """
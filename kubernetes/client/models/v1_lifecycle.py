@@ -54,6 +54,18 @@ class V1Lifecycle(object):
         if pre_stop is not None:
           self.pre_stop = pre_stop
 
+    @classmethod
+    def _from_server(cls, post_start=None, pre_stop=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._post_start = post_start
+        self._pre_stop = pre_stop
+        self.discriminator = None
+        return self
+
     @property
     def post_start(self):
         """
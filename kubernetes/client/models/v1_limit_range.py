@@ -64,6 +64,20 @@ class V1LimitRange(object):
         if spec is not None:
           self.spec = spec
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, spec=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._spec = spec
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -74,6 +74,22 @@ class V1LimitRangeItem(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, default=None, default_request=None, max=None, max_limit_request_ratio=None, min=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._default = default
+        self._default_request = default_request
+        self._max = max
+        self._max_limit_request_ratio = max_limit_request_ratio
+        self._min = min
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def default(self):
         """
@@ -48,6 +48,17 @@ class V1LimitRangeSpec(object):
 
         self.limits = limits
 
+    @classmethod
+    def _from_server(cls, limits=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._limits = limits
+        self.discriminator = None
+        return self
+
     @property
     def limits(self):
         """
@@ -59,6 +59,19 @@ class V1ListMeta(object):
         if self_link is not None:
           self.self_link = self_link
 
+    @classmethod
+    def _from_server(cls, _continue=None, resource_version=None, self_link=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self.__continue = _continue
+        self._resource_version = resource_version
+        self._self_link = self_link
+        self.discriminator = None
+        return self
+
     @property
     def _continue(self):
         """
@@ -54,6 +54,18 @@ class V1LoadBalancerIngress(object):
         if ip is not None:
           self.ip = ip
 
+    @classmethod
+    def _from_server(cls, hostname=None, ip=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hostname = hostname
+        self._ip = ip
+        self.discriminator = None
+        return self
+
     @property
     def hostname(self):
         """
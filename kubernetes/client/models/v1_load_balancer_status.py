@@ -49,6 +49,17 @@ class V1LoadBalancerStatus(object):
         if ingress is not None:
           self.ingress = ingress
 
+    @classmethod
+    def _from_server(cls, ingress=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ingress = ingress
+        self.discriminator = None
+        return self
+
     @property
     def ingress(self):
         """
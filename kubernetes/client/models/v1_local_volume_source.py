@@ -53,6 +53,18 @@ class V1LocalVolumeSource(object):
           self.fs_type = fs_type
         self.path = path
 
+    @classmethod
+    def _from_server(cls, fs_type=None, path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._path = path
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
@@ -69,6 +69,21 @@ class V1ManagedFieldsEntry(object):
         if time is not None:
           self.time = time
 
+    @classmethod
+    def _from_server(cls, api_version=None, fields=None, manager=None, operation=None, time=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._fields = fields
+        self._manager = manager
+        self._operation = operation
+        self._time = time
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -49,6 +49,17 @@ class V1NamespaceSpec(object):
         if finalizers is not None:
           self.finalizers = finalizers
 
+    @classmethod
+    def _from_server(cls, finalizers=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._finalizers = finalizers
+        self.discriminator = None
+        return self
+
     @property
     def finalizers(self):
         """
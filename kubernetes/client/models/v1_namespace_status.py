@@ -49,6 +49,17 @@ class V1NamespaceStatus(object):
         if phase is not None:
           self.phase = phase
 
+    @classmethod
+    def _from_server(cls, phase=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._phase = phase
+        self.discriminator = None
+        return self
+
     @property
     def phase(self):
         """
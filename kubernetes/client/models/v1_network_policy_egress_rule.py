@@ -54,6 +54,18 @@ class V1NetworkPolicyEgressRule(object):
         if to is not None:
           self.to = to
 
+    @classmethod
+    def _from_server(cls, ports=None, to=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ports = ports
+        self._to = to
+        self.discriminator = None
+        return self
+
     @property
     def ports(self):
         """
@@ -54,6 +54,18 @@ class V1NetworkPolicyIngressRule(object):
         if ports is not None:
           self.ports = ports
 
+    @classmethod
+    def _from_server(cls, _from=None, ports=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self.__from = _from
+        self._ports = ports
+        self.discriminator = None
+        return self
+
     @property
     def _from(self):
         """
@@ -59,6 +59,19 @@ class V1NetworkPolicyPeer(object):
         if pod_selector is not None:
           self.pod_selector = pod_selector
 
+    @classmethod
+    def _from_server(cls, ip_block=None, namespace_selector=None, pod_selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ip_block = ip_block
+        self._namespace_selector = namespace_selector
+        self._pod_selector = pod_selector
+        self.discriminator = None
+        return self
+
     @property
     def ip_block(self):
         """
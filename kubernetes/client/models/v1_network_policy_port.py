@@ -54,6 +54,18 @@ class V1NetworkPolicyPort(object):
         if protocol is not None:
           self.protocol = protocol
 
+    @classmethod
+    def _from_server(cls, port=None, protocol=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._port = port
+        self._protocol = protocol
+        self.discriminator = None
+        return self
+
     @property
     def port(self):
         """
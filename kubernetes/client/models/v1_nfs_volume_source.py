@@ -57,6 +57,19 @@ class V1NFSVolumeSource(object):
           self.read_only = read_only
         self.server = server
 
+    @classmethod
+    def _from_server(cls, path=None, read_only=None, server=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._path = path
+        self._read_only = read_only
+        self._server = server
+        self.discriminator = None
+        return self
+
     @property
     def path(self):
         """
@@ -52,6 +52,18 @@ class V1NodeAddress(object):
         self.address = address
         self.type = type
 
+    @classmethod
+    def _from_server(cls, address=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._address = address
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def address(self):
         """
@@ -49,6 +49,17 @@ class V1NodeConfigSource(object):
         if config_map is not None:
           self.config_map = config_map
 
+    @classmethod
+    def _from_server(cls, config_map=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._config_map = config_map
+        self.discriminator = None
+        return self
+
     @property
     def config_map(self):
         """
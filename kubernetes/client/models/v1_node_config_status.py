@@ -64,6 +64,20 @@ class V1NodeConfigStatus(object):
         if last_known_good is not None:
           self.last_known_good = last_known_good
 
+    @classmethod
+    def _from_server(cls, active=None, assigned=None, error=None, last_known_good=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._active = active
+        self._assigned = assigned
+        self._error = error
+        self._last_known_good = last_known_good
+        self.discriminator = None
+        return self
+
     @property
     def active(self):
         """
@@ -49,6 +49,17 @@ class V1NodeDaemonEndpoints(object):
         if kubelet_endpoint is not None:
           self.kubelet_endpoint = kubelet_endpoint
 
+    @classmethod
+    def _from_server(cls, kubelet_endpoint=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._kubelet_endpoint = kubelet_endpoint
+        self.discriminator = None
+        return self
+
     @property
     def kubelet_endpoint(self):
         """
@@ -48,6 +48,17 @@ class V1NodeSelector(object):
 
         self.node_selector_terms = node_selector_terms
 
+    @classmethod
+    def _from_server(cls, node_selector_terms=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._node_selector_terms = node_selector_terms
+        self.discriminator = None
+        return self
+
     @property
     def node_selector_terms(self):
         """
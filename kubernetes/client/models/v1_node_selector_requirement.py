@@ -57,6 +57,19 @@ class V1NodeSelectorRequirement(object):
         if values is not None:
           self.values = values
 
+    @classmethod
+    def _from_server(cls, key=None, operator=None, values=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._key = key
+        self._operator = operator
+        self._values = values
+        self.discriminator = None
+        return self
+
     @property
     def key(self):
         """
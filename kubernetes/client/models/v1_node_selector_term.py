@@ -54,6 +54,18 @@ class V1NodeSelectorTerm(object):
         if match_fields is not None:
           self.match_fields = match_fields
 
+    @classmethod
+    def _from_server(cls, match_expressions=None, match_fields=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._match_expressions = match_expressions
+        self._match_fields = match_fields
+        self.discriminator = None
+        return self
+
     @property
     def match_expressions(self):
         """
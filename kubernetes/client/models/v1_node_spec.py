@@ -74,6 +74,22 @@ class V1NodeSpec(object):
         if unschedulable is not None:
           self.unschedulable = unschedulable
 
+    @classmethod
+    def _from_server(cls, config_source=None, external_id=None, pod_cidr=None, provider_id=None, taints=None, unschedulable=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._config_source = config_source
+        self._external_id = external_id
+        self._pod_cidr = pod_cidr
+        self._provider_id = provider_id
+        self._taints = taints
+        self._unschedulable = unschedulable
+        self.discriminator = None
+        return self
+
     @property
     def config_source(self):
         """
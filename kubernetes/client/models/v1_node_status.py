@@ -99,6 +99,27 @@ class V1NodeStatus(object):
         if volumes_in_use is not None:
           self.volumes_in_use = volumes_in_use
 
+    @classmethod
+    def _from_server(cls, addresses=None, allocatable=None, capacity=None, conditions=None, config=None, daemon_endpoints=None, images=None, node_info=None, phase=None, volumes_attached=None, volumes_in_use=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._addresses = addresses
+        self._allocatable = allocatable
+        self._capacity = capacity
+        self._conditions = conditions
+        self._config = config
+        self._daemon_endpoints = daemon_endpoints
+        self._images = images
+        self._node_info = node_info
+        self._phase = phase
+        self._volumes_attached = volumes_attached
+        self._volumes_in_use = volumes_in_use
+        self.discriminator = None
+        return self
+
     @property
     def addresses(self):
         """
@@ -84,6 +84,26 @@ class V1NodeSystemInfo(object):
         self.os_image = os_image
         self.system_uuid = system_uuid
 
+    @classmethod
+    def _from_server(cls, architecture=None, boot_id=None, container_runtime_version=None, kernel_version=None, kube_proxy_version=None, kubelet_version=None, machine_id=None, operating_system=None, os_image=None, system_uuid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._architecture = architecture
+        self._boot_id = boot_id
+        self._container_runtime_version = container_runtime_version
+        self._kernel_version = kernel_version
+        self._kube_proxy_version = kube_proxy_version
+        self._kubelet_version = kubelet_version
+        self._machine_id = machine_id
+        self._operating_system = operating_system
+        self._os_image = os_image
+        self._system_uuid = system_uuid
+        self.discriminator = None
+        return self
+
     @property
     def architecture(self):
         """
@@ -54,6 +54,18 @@ class V1NonResourceAttributes(object):
         if verb is not None:
           self.verb = verb
 
+    @classmethod
+    def _from_server(cls, path=None, verb=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._path = path
+        self._verb = verb
+        self.discriminator = None
+        return self
+
     @property
     def path(self):
         """
@@ -53,6 +53,18 @@ class V1ObjectFieldSelector(object):
           self.api_version = api_version
         self.field_path = field_path
 
+    @classmethod
+    def _from_server(cls, api_version=None, field_path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._field_path = field_path
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -129,6 +129,33 @@ class V1ObjectMeta(object):
         if uid is not None:
           self.uid = uid
 
+    @classmethod
+    def _from_server(cls, annotations=None, cluster_name=None, creation_timestamp=None, deletion_grace_period_seconds=None, deletion_timestamp=None, finalizers=None, generate_name=None, generation=None, initializers=None, labels=None, managed_fields=None, name=None, namespace=None, owner_references=None, resource_version=None, self_link=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._annotations = annotations
+        self._cluster_name = cluster_name
+        self._creation_timestamp = creation_timestamp
+        self._deletion_grace_period_seconds = deletion_grace_period_seconds
+        self._deletion_timestamp = deletion_timestamp
+        self._finalizers = finalizers
+        self._generate_name = generate_name
+        self._generation = generation
+        self._initializers = initializers
+        self._labels = labels
+        self._managed_fields = managed_fields
+        self._name = name
+        self._namespace = namespace
+        self._owner_references = owner_references
+        self._resource_version = resource_version
+        self._self_link = self_link
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def annotations(self):
         """
@@ -79,6 +79,23 @@ class V1ObjectReference(object):
         if uid is not None:
           self.uid = uid
 
+    @classmethod
+    def _from_server(cls, api_version=None, field_path=None, kind=None, name=None, namespace=None, resource_version=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._field_path = field_path
+        self._kind = kind
+        self._name = name
+        self._namespace = namespace
+        self._resource_version = resource_version
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
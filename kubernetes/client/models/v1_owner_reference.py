@@ -70,6 +70,22 @@ class V1OwnerReference(object):
         self.name = name
         self.uid = uid
 
+    @classmethod
+    def _from_server(cls, api_version=None, block_owner_deletion=None, controller=None, kind=None, name=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._block_owner_deletion = block_owner_deletion
+        self._controller = controller
+        self._kind = kind
+        self._name = name
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -79,6 +79,23 @@ class V1PersistentVolumeClaimSpec(object):
         if volume_name is not None:
           self.volume_name = volume_name
 
+    @classmethod
+    def _from_server(cls, access_modes=None, data_source=None, resources=None, selector=None, storage_class_name=None, volume_mode=None, volume_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._access_modes = access_modes
+        self._data_source = data_source
+        self._resources = resources
+        self._selector = selector
+        self._storage_class_name = storage_class_name
+        self._volume_mode = volume_mode
+        self._volume_name = volume_name
+        self.discriminator = None
+        return self
+
     @property
     def access_modes(self):
         """
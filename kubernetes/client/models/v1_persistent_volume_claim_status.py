@@ -64,6 +64,20 @@ class V1PersistentVolumeClaimStatus(object):
         if phase is not None:
           self.phase = phase
 
+    @classmethod
+    def _from_server(cls, access_modes=None, capacity=None, conditions=None, phase=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._access_modes = access_modes
+        self._capacity = capacity
+        self._conditions = conditions
+        self._phase = phase
+        self.discriminator = None
+        return self
+
     @property
     def access_modes(self):
         """
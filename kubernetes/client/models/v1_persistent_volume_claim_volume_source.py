@@ -53,6 +53,18 @@ class V1PersistentVolumeClaimVolumeSource(object):
         if read_only is not None:
           self.read_only = read_only
 
+    @classmethod
+    def _from_server(cls, claim_name=None, read_only=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._claim_name = claim_name
+        self._read_only = read_only
+        self.discriminator = None
+        return self
+
     @property
     def claim_name(self):
         """
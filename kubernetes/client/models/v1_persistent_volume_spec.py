@@ -194,6 +194,46 @@ class V1PersistentVolumeSpec(object):
         if vsphere_volume is not None:
           self.vsphere_volume = vsphere_volume
 
+    @classmethod
+    def _from_server(cls, access_modes=None, aws_elastic_block_store=None, azure_disk=None, azure_file=None, capacity=None, cephfs=None, cinder=None, claim_ref=None, csi=None, fc=None, flex_volume=None, flocker=None, gce_persistent_disk=None, glusterfs=None, host_path=None, iscsi=None, local=None, mount_options=None, nfs=None, node_affinity=None, persistent_volume_reclaim_policy=None, photon_persistent_disk=None, portworx_volume=None, quobyte=None, rbd=None, scale_io=None, storage_class_name=None, storageos=None, volume_mode=None, vsphere_volume=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._access_modes = access_modes
+        self._aws_elastic_block_store = aws_elastic_block_store
+        self._azure_disk = azure_disk
+        self._azure_file = azure_file
+        self._capacity = capacity
+        self._cephfs = cephfs
+        self._cinder = cinder
+        self._claim_ref = claim_ref
+        self._csi = csi
+        self._fc = fc
+        self._flex_volume = flex_volume
+        self._flocker = flocker
+        self._gce_persistent_disk = gce_persistent_disk
+        self._glusterfs = glusterfs
+        self._host_path = host_path
+        self._iscsi = iscsi
+        self._local = local
+        self._mount_options = mount_options
+        self._nfs = nfs
+        self._node_affinity = node_affinity
+        self._persistent_volume_reclaim_policy = persistent_volume_reclaim_policy
+        self._photon_persistent_disk = photon_persistent_disk
+        self._portworx_volume = portworx_volume
+        self._quobyte = quobyte
+        self._rbd = rbd
+        self._scale_io = scale_io
+        self._storage_class_name = storage_class_name
+        self._storageos = storageos
+        self._volume_mode = volume_mode
+        self._vsphere_volume = vsphere_volume
+        self.discriminator = None
+        return self
+
     @property
     def access_modes(self):
         """
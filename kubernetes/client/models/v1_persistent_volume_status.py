@@ -59,6 +59,19 @@ class V1PersistentVolumeStatus(object):
         if reason is not None:
           self.reason = reason
 
+    @classmethod
+    def _from_server(cls, message=None, phase=None, reason=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._message = message
+        self._phase = phase
+        self._reason = reason
+        self.discriminator = None
+        return self
+
     @property
     def message(self):
         """
@@ -53,6 +53,18 @@ class V1PhotonPersistentDiskVolumeSource(object):
           self.fs_type = fs_type
         self.pd_id = pd_id
 
+    @classmethod
+    def _from_server(cls, fs_type=None, pd_id=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._pd_id = pd_id
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
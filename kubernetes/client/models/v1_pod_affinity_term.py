@@ -58,6 +58,19 @@ class V1PodAffinityTerm(object):
           self.namespaces = namespaces
         self.topology_key = topology_key
 
+    @classmethod
+    def _from_server(cls, label_selector=None, namespaces=None, topology_key=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._label_selector = label_selector
+        self._namespaces = namespaces
+        self._topology_key = topology_key
+        self.discriminator = None
+        return self
+
     @property
     def label_selector(self):
         """
@@ -54,6 +54,18 @@ class V1PodAntiAffinity(object):
         if required_during_scheduling_ignored_during_execution is not None:
           self.required_during_scheduling_ignored_during_execution = required_during_scheduling_ignored_during_execution
 
+    @classmethod
+    def _from_server(cls, preferred_during_scheduling_ignored_during_execution=None, required_during_scheduling_ignored_during_execution=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._preferred_during_scheduling_ignored_during_execution = preferred_during_scheduling_ignored_during_execution
+        self._required_during_scheduling_ignored_during_execution = required_during_scheduling_ignored_during_execution
+        self.discriminator = None
+        return self
+
     @property
     def preferred_during_scheduling_ignored_during_execution(self):
         """
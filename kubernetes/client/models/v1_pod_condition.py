@@ -72,6 +72,22 @@ class V1PodCondition(object):
         self.status = status
         self.type = type
 
+    @classmethod
+    def _from_server(cls, last_probe_time=None, last_transition_time=None, message=None, reason=None, status=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._last_probe_time = last_probe_time
+        self._last_transition_time = last_transition_time
+        self._message = message
+        self._reason = reason
+        self._status = status
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def last_probe_time(self):
         """
@@ -59,6 +59,19 @@ class V1PodDNSConfig(object):
         if searches is not None:
           self.searches = searches
 
+    @classmethod
+    def _from_server(cls, nameservers=None, options=None, searches=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._nameservers = nameservers
+        self._options = options
+        self._searches = searches
+        self.discriminator = None
+        return self
+
     @property
     def nameservers(self):
         """
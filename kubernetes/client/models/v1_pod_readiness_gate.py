@@ -48,6 +48,17 @@ class V1PodReadinessGate(object):
 
         self.condition_type = condition_type
 
+    @classmethod
+    def _from_server(cls, condition_type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._condition_type = condition_type
+        self.discriminator = None
+        return self
+
     @property
     def condition_type(self):
         """
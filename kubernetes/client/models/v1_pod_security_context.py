@@ -79,6 +79,23 @@ class V1PodSecurityContext(object):
         if sysctls is not None:
           self.sysctls = sysctls
 
+    @classmethod
+    def _from_server(cls, fs_group=None, run_as_group=None, run_as_non_root=None, run_as_user=None, se_linux_options=None, supplemental_groups=None, sysctls=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_group = fs_group
+        self._run_as_group = run_as_group
+        self._run_as_non_root = run_as_non_root
+        self._run_as_user = run_as_user
+        self._se_linux_options = se_linux_options
+        self._supplemental_groups = supplemental_groups
+        self._sysctls = sysctls
+        self.discriminator = None
+        return self
+
     @property
     def fs_group(self):
         """
@@ -193,6 +193,46 @@ class V1PodSpec(object):
         if volumes is not None:
           self.volumes = volumes
 
+    @classmethod
+    def _from_server(cls, active_deadline_seconds=None, affinity=None, automount_service_account_token=None, containers=None, dns_config=None, dns_policy=None, enable_service_links=None, host_aliases=None, host_ipc=None, host_network=None, host_pid=None, hostname=None, image_pull_secrets=None, init_containers=None, node_name=None, node_selector=None, priority=None, priority_class_name=None, readiness_gates=None, restart_policy=None, runtime_class_name=None, scheduler_name=None, security_context=None, service_account=None, service_account_name=None, share_process_namespace=None, subdomain=None, termination_grace_period_seconds=None, tolerations=None, volumes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._active_deadline_seconds = active_deadline_seconds
+        self._affinity = affinity
+        self._automount_service_account_token = automount_service_account_token
+        self._containers = containers
+        self._dns_config = dns_config
+        self._dns_policy = dns_policy
+        self._enable_service_links = enable_service_links
+        self._host_aliases = host_aliases
+        self._host_ipc = host_ipc
+        self._host_network = host_network
+        self._host_pid = host_pid
+        self._hostname = hostname
+        self._image_pull_secrets = image_pull_secrets
+        self._init_containers = init_containers
+        self._node_name = node_name
+        self._node_selector = node_selector
+        self._priority = priority
+        self._priority_class_name = priority_class_name
+        self._readiness_gates = readiness_gates
+        self._restart_policy = restart_policy
+        self._runtime_class_name = runtime_class_name
+        self._scheduler_name = scheduler_name
+        self._security_context = security_context
+        self._service_account = service_account
+        self._service_account_name = service_account_name
+        self._share_process_namespace = share_process_namespace
+        self._subdomain = subdomain
+        self._termination_grace_period_seconds = termination_grace_period_seconds
+        self._tolerations = tolerations
+        self._volumes = volumes
+        self.discriminator = None
+        return self
+
     @property
     def active_deadline_seconds(self):
         """
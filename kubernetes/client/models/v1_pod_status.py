@@ -99,6 +99,27 @@ class V1PodStatus(object):
         if start_time is not None:
           self.start_time = start_time
 
+    @classmethod
+    def _from_server(cls, conditions=None, container_statuses=None, host_ip=None, init_container_statuses=None, message=None, nominated_node_name=None, phase=None, pod_ip=None, qos_class=None, reason=None, start_time=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._conditions = conditions
+        self._container_statuses = container_statuses
+        self._host_ip = host_ip
+        self._init_container_statuses = init_container_statuses
+        self._message = message
+        self._nominated_node_name = nominated_node_name
+        self._phase = phase
+        self._pod_ip = pod_ip
+        self._qos_class = qos_class
+        self._reason = reason
+        self._start_time = start_time
+        self.discriminator = None
+        return self
+
     @property
     def conditions(self):
         """
@@ -54,6 +54,18 @@ class V1PodTemplateSpec(object):
         if spec is not None:
           self.spec = spec
 
+    @classmethod
+    def _from_server(cls, metadata=None, spec=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._metadata = metadata
+        self._spec = spec
+        self.discriminator = None
+        return self
+
     @property
     def metadata(self):
         """
@@ -68,6 +68,21 @@ class V1PolicyRule(object):
           self.resources = resources
         self.verbs = verbs
 
+    @classmethod
+    def _from_server(cls, api_groups=None, non_resource_ur_ls=None, resource_names=None, resources=None, verbs=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_groups = api_groups
+        self._non_resource_ur_ls = non_resource_ur_ls
+        self._resource_names = resource_names
+        self._resources = resources
+        self._verbs = verbs
+        self.discriminator = None
+        return self
+
     @property
     def api_groups(self):
         """
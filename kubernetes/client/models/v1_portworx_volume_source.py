@@ -58,6 +58,19 @@ class V1PortworxVolumeSource(object):
           self.read_only = read_only
         self.volume_id = volume_id
 
+    @classmethod
+    def _from_server(cls, fs_type=None, read_only=None, volume_id=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._read_only = read_only
+        self._volume_id = volume_id
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
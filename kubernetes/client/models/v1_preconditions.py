@@ -54,6 +54,18 @@ class V1Preconditions(object):
         if uid is not None:
           self.uid = uid
 
+    @classmethod
+    def _from_server(cls, resource_version=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._resource_version = resource_version
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def resource_version(self):
         """
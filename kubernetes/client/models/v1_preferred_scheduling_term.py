@@ -52,6 +52,18 @@ class V1PreferredSchedulingTerm(object):
         self.preference = preference
         self.weight = weight
 
+    @classmethod
+    def _from_server(cls, preference=None, weight=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._preference = preference
+        self._weight = weight
+        self.discriminator = None
+        return self
+
     @property
     def preference(self):
         """
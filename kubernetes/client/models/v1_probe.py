@@ -84,6 +84,24 @@ class V1Probe(object):
         if timeout_seconds is not None:
           self.timeout_seconds = timeout_seconds
 
+    @classmethod
+    def _from_server(cls, _exec=None, failure_threshold=None, http_get=None, initial_delay_seconds=None, period_seconds=None, success_threshold=None, tcp_socket=None, timeout_seconds=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self.__exec = _exec
+        self._failure_threshold = failure_threshold
+        self._http_get = http_get
+        self._initial_delay_seconds = initial_delay_seconds
+        self._period_seconds = period_seconds
+        self._success_threshold = success_threshold
+        self._tcp_socket = tcp_socket
+        self._timeout_seconds = timeout_seconds
+        self.discriminator = None
+        return self
+
     @property
     def _exec(self):
         """
@@ -53,6 +53,18 @@ class V1ProjectedVolumeSource(object):
           self.default_mode = default_mode
         self.sources = sources
 
+    @classmethod
+    def _from_server(cls, default_mode=None, sources=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._default_mode = default_mode
+        self._sources = sources
+        self.discriminator = None
+        return self
+
     @property
     def default_mode(self):
         """
@@ -72,6 +72,22 @@ class V1QuobyteVolumeSource(object):
           self.user = user
         self.volume = volume
 
+    @classmethod
+    def _from_server(cls, group=None, read_only=None, registry=None, tenant=None, user=None, volume=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._group = group
+        self._read_only = read_only
+        self._registry = registry
+        self._tenant = tenant
+        self._user = user
+        self._volume = volume
+        self.discriminator = None
+        return self
+
     @property
     def group(self):
         """
@@ -82,6 +82,24 @@ class V1RBDPersistentVolumeSource(object):
         if user is not None:
           self.user = user
 
+    @classmethod
+    def _from_server(cls, fs_type=None, image=None, keyring=None, monitors=None, pool=None, read_only=None, secret_ref=None, user=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._image = image
+        self._keyring = keyring
+        self._monitors = monitors
+        self._pool = pool
+        self._read_only = read_only
+        self._secret_ref = secret_ref
+        self._user = user
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
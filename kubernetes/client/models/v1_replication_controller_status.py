@@ -73,6 +73,22 @@ class V1ReplicationControllerStatus(object):
           self.ready_replicas = ready_replicas
         self.replicas = replicas
 
+    @classmethod
+    def _from_server(cls, available_replicas=None, conditions=None, fully_labeled_replicas=None, observed_generation=None, ready_replicas=None, replicas=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._available_replicas = available_replicas
+        self._conditions = conditions
+        self._fully_labeled_replicas = fully_labeled_replicas
+        self._observed_generation = observed_generation
+        self._ready_replicas = ready_replicas
+        self._replicas = replicas
+        self.discriminator = None
+        return self
+
     @property
     def available_replicas(self):
         """
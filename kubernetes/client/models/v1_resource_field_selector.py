@@ -58,6 +58,19 @@ class V1ResourceFieldSelector(object):
           self.divisor = divisor
         self.resource = resource
 
+    @classmethod
+    def _from_server(cls, container_name=None, divisor=None, resource=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._container_name = container_name
+        self._divisor = divisor
+        self._resource = resource
+        self.discriminator = None
+        return self
+
     @property
     def container_name(self):
         """
@@ -59,6 +59,19 @@ class V1ResourceQuotaSpec(object):
         if scopes is not None:
           self.scopes = scopes
 
+    @classmethod
+    def _from_server(cls, hard=None, scope_selector=None, scopes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hard = hard
+        self._scope_selector = scope_selector
+        self._scopes = scopes
+        self.discriminator = None
+        return self
+
     @property
     def hard(self):
         """
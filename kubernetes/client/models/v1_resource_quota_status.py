@@ -54,6 +54,18 @@ class V1ResourceQuotaStatus(object):
         if used is not None:
           self.used = used
 
+    @classmethod
+    def _from_server(cls, hard=None, used=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._hard = hard
+        self._used = used
+        self.discriminator = None
+        return self
+
     @property
     def hard(self):
         """
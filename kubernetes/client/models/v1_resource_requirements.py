@@ -54,6 +54,18 @@ class V1ResourceRequirements(object):
         if requests is not None:
           self.requests = requests
 
+    @classmethod
+    def _from_server(cls, limits=None, requests=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._limits = limits
+        self._requests = requests
+        self.discriminator = None
+        return self
+
     @property
     def limits(self):
         """
@@ -64,6 +64,20 @@ class V1Role(object):
         if rules is not None:
           self.rules = rules
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, rules=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._rules = rules
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -68,6 +68,21 @@ class V1RoleBinding(object):
         if subjects is not None:
           self.subjects = subjects
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, role_ref=None, subjects=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._role_ref = role_ref
+        self._subjects = subjects
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -49,6 +49,17 @@ class V1RollingUpdateDaemonSet(object):
         if max_unavailable is not None:
           self.max_unavailable = max_unavailable
 
+    @classmethod
+    def _from_server(cls, max_unavailable=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._max_unavailable = max_unavailable
+        self.discriminator = None
+        return self
+
     @property
     def max_unavailable(self):
         """
@@ -91,6 +91,26 @@ class V1ScaleIOVolumeSource(object):
         if volume_name is not None:
           self.volume_name = volume_name
 
+    @classmethod
+    def _from_server(cls, fs_type=None, gateway=None, protection_domain=None, read_only=None, secret_ref=None, ssl_enabled=None, storage_mode=None, storage_pool=None, system=None, volume_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._gateway = gateway
+        self._protection_domain = protection_domain
+        self._read_only = read_only
+        self._secret_ref = secret_ref
+        self._ssl_enabled = ssl_enabled
+        self._storage_mode = storage_mode
+        self._storage_pool = storage_pool
+        self._system = system
+        self._volume_name = volume_name
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
@@ -53,6 +53,18 @@ class V1ScaleStatus(object):
         if selector is not None:
           self.selector = selector
 
+    @classmethod
+    def _from_server(cls, replicas=None, selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._replicas = replicas
+        self._selector = selector
+        self.discriminator = None
+        return self
+
     @property
     def replicas(self):
         """
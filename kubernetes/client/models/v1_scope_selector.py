@@ -49,6 +49,17 @@ class V1ScopeSelector(object):
         if match_expressions is not None:
           self.match_expressions = match_expressions
 
+    @classmethod
+    def _from_server(cls, match_expressions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._match_expressions = match_expressions
+        self.discriminator = None
+        return self
+
     @property
     def match_expressions(self):
         """
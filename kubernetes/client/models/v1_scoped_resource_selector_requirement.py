@@ -57,6 +57,19 @@ class V1ScopedResourceSelectorRequirement(object):
         if values is not None:
           self.values = values
 
+    @classmethod
+    def _from_server(cls, operator=None, scope_name=None, values=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._operator = operator
+        self._scope_name = scope_name
+        self._values = values
+        self.discriminator = None
+        return self
+
     @property
     def operator(self):
         """
@@ -64,6 +64,20 @@ class V1SELinuxOptions(object):
         if user is not None:
           self.user = user
 
+    @classmethod
+    def _from_server(cls, level=None, role=None, type=None, user=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._level = level
+        self._role = role
+        self._type = type
+        self._user = user
+        self.discriminator = None
+        return self
+
     @property
     def level(self):
         """
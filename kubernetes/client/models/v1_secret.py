@@ -74,6 +74,22 @@ class V1Secret(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, api_version=None, data=None, kind=None, metadata=None, string_data=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._data = data
+        self._kind = kind
+        self._metadata = metadata
+        self._string_data = string_data
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
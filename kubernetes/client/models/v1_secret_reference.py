@@ -54,6 +54,18 @@ class V1SecretReference(object):
         if namespace is not None:
           self.namespace = namespace
 
+    @classmethod
+    def _from_server(cls, name=None, namespace=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._namespace = namespace
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
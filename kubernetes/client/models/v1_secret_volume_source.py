@@ -64,6 +64,20 @@ class V1SecretVolumeSource(object):
         if secret_name is not None:
           self.secret_name = secret_name
 
+    @classmethod
+    def _from_server(cls, default_mode=None, items=None, optional=None, secret_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._default_mode = default_mode
+        self._items = items
+        self._optional = optional
+        self._secret_name = secret_name
+        self.discriminator = None
+        return self
+
     @property
     def default_mode(self):
         """
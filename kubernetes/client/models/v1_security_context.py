@@ -89,6 +89,25 @@ class V1SecurityContext(object):
         if se_linux_options is not None:
           self.se_linux_options = se_linux_options
 
+    @classmethod
+    def _from_server(cls, allow_privilege_escalation=None, capabilities=None, privileged=None, proc_mount=None, read_only_root_filesystem=None, run_as_group=None, run_as_non_root=None, run_as_user=None, se_linux_options=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._allow_privilege_escalation = allow_privilege_escalation
+        self._capabilities = capabilities
+        self._privileged = privileged
+        self._proc_mount = proc_mount
+        self._read_only_root_filesystem = read_only_root_filesystem
+        self._run_as_group = run_as_group
+        self._run_as_non_root = run_as_non_root
+        self._run_as_user = run_as_user
+        self._se_linux_options = se_linux_options
+        self.discriminator = None
+        return self
+
     @property
     def allow_privilege_escalation(self):
         """
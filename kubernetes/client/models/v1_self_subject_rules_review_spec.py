@@ -49,6 +49,17 @@ class V1SelfSubjectRulesReviewSpec(object):
         if namespace is not None:
           self.namespace = namespace
 
+    @classmethod
+    def _from_server(cls, namespace=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._namespace = namespace
+        self.discriminator = None
+        return self
+
     @property
     def namespace(self):
         """
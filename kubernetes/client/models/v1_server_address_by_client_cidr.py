@@ -52,6 +52,18 @@ class V1ServerAddressByClientCIDR(object):
         self.client_cidr = client_cidr
         self.server_address = server_address
 
+    @classmethod
+    def _from_server(cls, client_cidr=None, server_address=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._client_cidr = client_cidr
+        self._server_address = server_address
+        self.discriminator = None
+        return self
+
     @property
     def client_cidr(self):
         """
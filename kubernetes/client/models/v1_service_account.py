@@ -74,6 +74,22 @@ class V1ServiceAccount(object):
         if secrets is not None:
           self.secrets = secrets
 
+    @classmethod
+    def _from_server(cls, api_version=None, automount_service_account_token=None, image_pull_secrets=None, kind=None, metadata=None, secrets=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._automount_service_account_token = automount_service_account_token
+        self._image_pull_secrets = image_pull_secrets
+        self._kind = kind
+        self._metadata = metadata
+        self._secrets = secrets
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
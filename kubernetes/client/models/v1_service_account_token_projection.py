@@ -58,6 +58,19 @@ class V1ServiceAccountTokenProjection(object):
           self.expiration_seconds = expiration_seconds
         self.path = path
 
+    @classmethod
+    def _from_server(cls, audience=None, expiration_seconds=None, path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._audience = audience
+        self._expiration_seconds = expiration_seconds
+        self._path = path
+        self.discriminator = None
+        return self
+
     @property
     def audience(self):
         """
@@ -68,6 +68,21 @@ class V1ServicePort(object):
         if target_port is not None:
           self.target_port = target_port
 
+    @classmethod
+    def _from_server(cls, name=None, node_port=None, port=None, protocol=None, target_port=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._node_port = node_port
+        self._port = port
+        self._protocol = protocol
+        self._target_port = target_port
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
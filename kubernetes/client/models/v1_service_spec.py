@@ -109,6 +109,29 @@ class V1ServiceSpec(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, cluster_ip=None, external_i_ps=None, external_name=None, external_traffic_policy=None, health_check_node_port=None, load_balancer_ip=None, load_balancer_source_ranges=None, ports=None, publish_not_ready_addresses=None, selector=None, session_affinity=None, session_affinity_config=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._cluster_ip = cluster_ip
+        self._external_i_ps = external_i_ps
+        self._external_name = external_name
+        self._external_traffic_policy = external_traffic_policy
+        self._health_check_node_port = health_check_node_port
+        self._load_balancer_ip = load_balancer_ip
+        self._load_balancer_source_ranges = load_balancer_source_ranges
+        self._ports = ports
+        self._publish_not_ready_addresses = publish_not_ready_addresses
+        self._selector = selector
+        self._session_affinity = session_affinity
+        self._session_affinity_config = session_affinity_config
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def cluster_ip(self):
         """
@@ -49,6 +49,17 @@ class V1ServiceStatus(object):
         if load_balancer is not None:
           self.load_balancer = load_balancer
 
+    @classmethod
+    def _from_server(cls, load_balancer=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._load_balancer = load_balancer
+        self.discriminator = None
+        return self
+
     @property
     def load_balancer(self):
         """
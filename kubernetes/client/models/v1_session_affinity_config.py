@@ -49,6 +49,17 @@ class V1SessionAffinityConfig(object):
         if client_ip is not None:
           self.client_ip = client_ip
 
+    @classmethod
+    def _from_server(cls, client_ip=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._client_ip = client_ip
+        self.discriminator = None
+        return self
+
     @property
     def client_ip(self):
         """
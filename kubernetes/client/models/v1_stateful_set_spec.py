@@ -81,6 +81,24 @@ class V1StatefulSetSpec(object):
         if volume_claim_templates is not None:
           self.volume_claim_templates = volume_claim_templates
 
+    @classmethod
+    def _from_server(cls, pod_management_policy=None, replicas=None, revision_history_limit=None, selector=None, service_name=None, template=None, update_strategy=None, volume_claim_templates=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._pod_management_policy = pod_management_policy
+        self._replicas = replicas
+        self._revision_history_limit = revision_history_limit
+        self._selector = selector
+        self._service_name = service_name
+        self._template = template
+        self._update_strategy = update_strategy
+        self._volume_claim_templates = volume_claim_templates
+        self.discriminator = None
+        return self
+
     @property
     def pod_management_policy(self):
         """
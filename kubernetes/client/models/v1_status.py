@@ -84,6 +84,24 @@ class V1Status(object):
         if status is not None:
           self.status = status
 
+    @classmethod
+    def _from_server(cls, api_version=None, code=None, details=None, kind=None, message=None, metadata=None, reason=None, status=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._code = code
+        self._details = details
+        self._kind = kind
+        self._message = message
+        self._metadata = metadata
+        self._reason = reason
+        self._status = status
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -74,6 +74,22 @@ class V1StatusDetails(object):
         if uid is not None:
           self.uid = uid
 
+    @classmethod
+    def _from_server(cls, causes=None, group=None, kind=None, name=None, retry_after_seconds=None, uid=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._causes = causes
+        self._group = group
+        self._kind = kind
+        self._name = name
+        self._retry_after_seconds = retry_after_seconds
+        self._uid = uid
+        self.discriminator = None
+        return self
+
     @property
     def causes(self):
         """
@@ -69,6 +69,21 @@ class V1StorageOSVolumeSource(object):
         if volume_namespace is not None:
           self.volume_namespace = volume_namespace
 
+    @classmethod
+    def _from_server(cls, fs_type=None, read_only=None, secret_ref=None, volume_name=None, volume_namespace=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._read_only = read_only
+        self._secret_ref = secret_ref
+        self._volume_name = volume_name
+        self._volume_namespace = volume_namespace
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
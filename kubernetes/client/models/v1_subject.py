@@ -62,6 +62,20 @@ class V1Subject(object):
         if namespace is not None:
           self.namespace = namespace
 
+    @classmethod
+    def _from_server(cls, api_group=None, kind=None, name=None, namespace=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_group = api_group
+        self._kind = kind
+        self._name = name
+        self._namespace = namespace
+        self.discriminator = None
+        return self
+
     @property
     def api_group(self):
         """
@@ -61,6 +61,20 @@ class V1SubjectRulesReviewStatus(object):
         self.non_resource_rules = non_resource_rules
         self.resource_rules = resource_rules
 
+    @classmethod
+    def _from_server(cls, evaluation_error=None, incomplete=None, non_resource_rules=None, resource_rules=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._evaluation_error = evaluation_error
+        self._incomplete = incomplete
+        self._non_resource_rules = non_resource_rules
+        self._resource_rules = resource_rules
+        self.discriminator = None
+        return self
+
     @property
     def evaluation_error(self):
         """
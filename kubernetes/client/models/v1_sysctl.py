@@ -52,6 +52,18 @@ class V1Sysctl(object):
         self.name = name
         self.value = value
 
+    @classmethod
+    def _from_server(cls, name=None, value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._value = value
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
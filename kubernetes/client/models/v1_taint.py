@@ -62,6 +62,20 @@ class V1Taint(object):
         if value is not None:
           self.value = value
 
+    @classmethod
+    def _from_server(cls, effect=None, key=None, time_added=None, value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._effect = effect
+        self._key = key
+        self._time_added = time_added
+        self._value = value
+        self.discriminator = None
+        return self
+
     @property
     def effect(self):
         """
@@ -53,6 +53,18 @@ class V1TCPSocketAction(object):
           self.host = host
         self.port = port
 
+    @classmethod
+    def _from_server(cls, host=None, port=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._host = host
+        self._port = port
+        self.discriminator = None
+        return self
+
     @property
     def host(self):
         """
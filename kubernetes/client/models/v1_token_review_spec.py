@@ -54,6 +54,18 @@ class V1TokenReviewSpec(object):
         if token is not None:
           self.token = token
 
+    @classmethod
+    def _from_server(cls, audiences=None, token=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._audiences = audiences
+        self._token = token
+        self.discriminator = None
+        return self
+
     @property
     def audiences(self):
         """
@@ -64,6 +64,20 @@ class V1TokenReviewStatus(object):
         if user is not None:
           self.user = user
 
+    @classmethod
+    def _from_server(cls, audiences=None, authenticated=None, error=None, user=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._audiences = audiences
+        self._authenticated = authenticated
+        self._error = error
+        self._user = user
+        self.discriminator = None
+        return self
+
     @property
     def audiences(self):
         """
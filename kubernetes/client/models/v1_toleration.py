@@ -69,6 +69,21 @@ class V1Toleration(object):
         if value is not None:
           self.value = value
 
+    @classmethod
+    def _from_server(cls, effect=None, key=None, operator=None, toleration_seconds=None, value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._effect = effect
+        self._key = key
+        self._operator = operator
+        self._toleration_seconds = toleration_seconds
+        self._value = value
+        self.discriminator = None
+        return self
+
     @property
     def effect(self):
         """
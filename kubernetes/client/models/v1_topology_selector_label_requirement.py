@@ -52,6 +52,18 @@ class V1TopologySelectorLabelRequirement(object):
         self.key = key
         self.values = values
 
+    @classmethod
+    def _from_server(cls, key=None, values=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._key = key
+        self._values = values
+        self.discriminator = None
+        return self
+
     @property
     def key(self):
         """
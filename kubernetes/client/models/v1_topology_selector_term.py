@@ -49,6 +49,17 @@ class V1TopologySelectorTerm(object):
         if match_label_expressions is not None:
           self.match_label_expressions = match_label_expressions
 
+    @classmethod
+    def _from_server(cls, match_label_expressions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._match_label_expressions = match_label_expressions
+        self.discriminator = None
+        return self
+
     @property
     def match_label_expressions(self):
         """
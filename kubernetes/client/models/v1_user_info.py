@@ -64,6 +64,20 @@ class V1UserInfo(object):
         if username is not None:
           self.username = username
 
+    @classmethod
+    def _from_server(cls, extra=None, groups=None, uid=None, username=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._extra = extra
+        self._groups = groups
+        self._uid = uid
+        self._username = username
+        self.discriminator = None
+        return self
+
     @property
     def extra(self):
         """
@@ -188,6 +188,45 @@ class V1Volume(object):
         if vsphere_volume is not None:
           self.vsphere_volume = vsphere_volume
 
+    @classmethod
+    def _from_server(cls, aws_elastic_block_store=None, azure_disk=None, azure_file=None, cephfs=None, cinder=None, config_map=None, csi=None, downward_api=None, empty_dir=None, fc=None, flex_volume=None, flocker=None, gce_persistent_disk=None, git_repo=None, glusterfs=None, host_path=None, iscsi=None, name=None, nfs=None, persistent_volume_claim=None, photon_persistent_disk=None, portworx_volume=None, projected=None, quobyte=None, rbd=None, scale_io=None, secret=None, storageos=None, vsphere_volume=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._aws_elastic_block_store = aws_elastic_block_store
+        self._azure_disk = azure_disk
+        self._azure_file = azure_file
+        self._cephfs = cephfs
+        self._cinder = cinder
+        self._config_map = config_map
+        self._csi = csi
+        self._downward_api = downward_api
+        self._empty_dir = empty_dir
+        self._fc = fc
+        self._flex_volume = flex_volume
+        self._flocker = flocker
+        self._gce_persistent_disk = gce_persistent_disk
+        self._git_repo = git_repo
+        self._glusterfs = glusterfs
+        self._host_path = host_path
+        self._iscsi = iscsi
+        self._name = name
+        self._nfs = nfs
+        self._persistent_volume_claim = persistent_volume_claim
+        self._photon_persistent_disk = photon_persistent_disk
+        self._portworx_volume = portworx_volume
+        self._projected = projected
+        self._quobyte = quobyte
+        self._rbd = rbd
+        self._scale_io = scale_io
+        self._secret = secret
+        self._storageos = storageos
+        self._vsphere_volume = vsphere_volume
+        self.discriminator = None
+        return self
+
     @property
     def aws_elastic_block_store(self):
         """
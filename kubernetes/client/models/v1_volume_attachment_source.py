@@ -49,6 +49,17 @@ class V1VolumeAttachmentSource(object):
         if persistent_volume_name is not None:
           self.persistent_volume_name = persistent_volume_name
 
+    @classmethod
+    def _from_server(cls, persistent_volume_name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._persistent_volume_name = persistent_volume_name
+        self.discriminator = None
+        return self
+
     @property
     def persistent_volume_name(self):
         """
@@ -63,6 +63,20 @@ class V1VolumeAttachmentStatus(object):
         if detach_error is not None:
           self.detach_error = detach_error
 
+    @classmethod
+    def _from_server(cls, attach_error=None, attached=None, attachment_metadata=None, detach_error=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._attach_error = attach_error
+        self._attached = attached
+        self._attachment_metadata = attachment_metadata
+        self._detach_error = detach_error
+        self.discriminator = None
+        return self
+
     @property
     def attach_error(self):
         """
@@ -52,6 +52,18 @@ class V1VolumeDevice(object):
         self.device_path = device_path
         self.name = name
 
+    @classmethod
+    def _from_server(cls, device_path=None, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._device_path = device_path
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def device_path(self):
         """
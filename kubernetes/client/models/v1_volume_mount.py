@@ -72,6 +72,22 @@ class V1VolumeMount(object):
         if sub_path_expr is not None:
           self.sub_path_expr = sub_path_expr
 
+    @classmethod
+    def _from_server(cls, mount_path=None, mount_propagation=None, name=None, read_only=None, sub_path=None, sub_path_expr=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._mount_path = mount_path
+        self._mount_propagation = mount_propagation
+        self._name = name
+        self._read_only = read_only
+        self._sub_path = sub_path
+        self._sub_path_expr = sub_path_expr
+        self.discriminator = None
+        return self
+
     @property
     def mount_path(self):
         """
@@ -49,6 +49,17 @@ class V1VolumeNodeAffinity(object):
         if required is not None:
           self.required = required
 
+    @classmethod
+    def _from_server(cls, required=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._required = required
+        self.discriminator = None
+        return self
+
     @property
     def required(self):
         """
@@ -64,6 +64,20 @@ class V1VolumeProjection(object):
         if service_account_token is not None:
           self.service_account_token = service_account_token
 
+    @classmethod
+    def _from_server(cls, config_map=None, downward_api=None, secret=None, service_account_token=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._config_map = config_map
+        self._downward_api = downward_api
+        self._secret = secret
+        self._service_account_token = service_account_token
+        self.discriminator = None
+        return self
+
     @property
     def config_map(self):
         """
@@ -63,6 +63,20 @@ class V1VsphereVirtualDiskVolumeSource(object):
           self.storage_policy_name = storage_policy_name
         self.volume_path = volume_path
 
+    @classmethod
+    def _from_server(cls, fs_type=None, storage_policy_id=None, storage_policy_name=None, volume_path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._fs_type = fs_type
+        self._storage_policy_id = storage_policy_id
+        self._storage_policy_name = storage_policy_name
+        self._volume_path = volume_path
+        self.discriminator = None
+        return self
+
     @property
     def fs_type(self):
         """
@@ -52,6 +52,18 @@ class V1WatchEvent(object):
         self.object = object
         self.type = type
 
+    @classmethod
+    def _from_server(cls, object=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._object = object
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def object(self):
         """
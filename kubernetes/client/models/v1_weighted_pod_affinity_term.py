@@ -52,6 +52,18 @@ class V1WeightedPodAffinityTerm(object):
         self.pod_affinity_term = pod_affinity_term
         self.weight = weight
 
+    @classmethod
+    def _from_server(cls, pod_affinity_term=None, weight=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._pod_affinity_term = pod_affinity_term
+        self._weight = weight
+        self.discriminator = None
+        return self
+
     @property
     def pod_affinity_term(self):
         """
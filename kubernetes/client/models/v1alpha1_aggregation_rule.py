@@ -49,6 +49,17 @@ class V1alpha1AggregationRule(object):
         if cluster_role_selectors is not None:
           self.cluster_role_selectors = cluster_role_selectors
 
+    @classmethod
+    def _from_server(cls, cluster_role_selectors=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._cluster_role_selectors = cluster_role_selectors
+        self.discriminator = None
+        return self
+
     @property
     def cluster_role_selectors(self):
         """
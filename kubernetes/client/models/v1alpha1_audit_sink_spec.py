@@ -52,6 +52,18 @@ class V1alpha1AuditSinkSpec(object):
         self.policy = policy
         self.webhook = webhook
 
+    @classmethod
+    def _from_server(cls, policy=None, webhook=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._policy = policy
+        self._webhook = webhook
+        self.discriminator = None
+        return self
+
     @property
     def policy(self):
         """
@@ -69,6 +69,21 @@ class V1alpha1PodPresetSpec(object):
         if volumes is not None:
           self.volumes = volumes
 
+    @classmethod
+    def _from_server(cls, env=None, env_from=None, selector=None, volume_mounts=None, volumes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._env = env
+        self._env_from = env_from
+        self._selector = selector
+        self._volume_mounts = volume_mounts
+        self._volumes = volumes
+        self.discriminator = None
+        return self
+
     @property
     def env(self):
         """
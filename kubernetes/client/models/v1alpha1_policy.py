@@ -53,6 +53,18 @@ class V1alpha1Policy(object):
         if stages is not None:
           self.stages = stages
 
+    @classmethod
+    def _from_server(cls, level=None, stages=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._level = level
+        self._stages = stages
+        self.discriminator = None
+        return self
+
     @property
     def level(self):
         """
@@ -73,6 +73,22 @@ class V1alpha1PriorityClass(object):
           self.metadata = metadata
         self.value = value
 
+    @classmethod
+    def _from_server(cls, api_version=None, description=None, global_default=None, kind=None, metadata=None, value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._description = description
+        self._global_default = global_default
+        self._kind = kind
+        self._metadata = metadata
+        self._value = value
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
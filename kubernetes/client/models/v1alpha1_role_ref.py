@@ -56,6 +56,19 @@ class V1alpha1RoleRef(object):
         self.kind = kind
         self.name = name
 
+    @classmethod
+    def _from_server(cls, api_group=None, kind=None, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_group = api_group
+        self._kind = kind
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def api_group(self):
         """
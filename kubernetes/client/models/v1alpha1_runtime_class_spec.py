@@ -48,6 +48,17 @@ class V1alpha1RuntimeClassSpec(object):
 
         self.runtime_handler = runtime_handler
 
+    @classmethod
+    def _from_server(cls, runtime_handler=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._runtime_handler = runtime_handler
+        self.discriminator = None
+        return self
+
     @property
     def runtime_handler(self):
         """
@@ -54,6 +54,18 @@ class V1alpha1VolumeError(object):
         if time is not None:
           self.time = time
 
+    @classmethod
+    def _from_server(cls, message=None, time=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._message = message
+        self._time = time
+        self.discriminator = None
+        return self
+
     @property
     def message(self):
         """
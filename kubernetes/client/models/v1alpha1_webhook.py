@@ -53,6 +53,18 @@ class V1alpha1Webhook(object):
         if throttle is not None:
           self.throttle = throttle
 
+    @classmethod
+    def _from_server(cls, client_config=None, throttle=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._client_config = client_config
+        self._throttle = throttle
+        self.discriminator = None
+        return self
+
     @property
     def client_config(self):
         """
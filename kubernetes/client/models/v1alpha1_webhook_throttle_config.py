@@ -54,6 +54,18 @@ class V1alpha1WebhookThrottleConfig(object):
         if qps is not None:
           self.qps = qps
 
+    @classmethod
+    def _from_server(cls, burst=None, qps=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._burst = burst
+        self._qps = qps
+        self.discriminator = None
+        return self
+
     @property
     def burst(self):
         """
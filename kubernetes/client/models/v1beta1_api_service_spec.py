@@ -76,6 +76,23 @@ class V1beta1APIServiceSpec(object):
           self.version = version
         self.version_priority = version_priority
 
+    @classmethod
+    def _from_server(cls, ca_bundle=None, group=None, group_priority_minimum=None, insecure_skip_tls_verify=None, service=None, version=None, version_priority=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ca_bundle = ca_bundle
+        self._group = group
+        self._group_priority_minimum = group_priority_minimum
+        self._insecure_skip_tls_verify = insecure_skip_tls_verify
+        self._service = service
+        self._version = version
+        self._version_priority = version_priority
+        self.discriminator = None
+        return self
+
     @property
     def ca_bundle(self):
         """
@@ -63,6 +63,20 @@ class V1beta1CertificateSigningRequestCondition(object):
           self.reason = reason
         self.type = type
 
+    @classmethod
+    def _from_server(cls, last_update_time=None, message=None, reason=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._last_update_time = last_update_time
+        self._message = message
+        self._reason = reason
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def last_update_time(self):
         """
@@ -73,6 +73,22 @@ class V1beta1CertificateSigningRequestSpec(object):
         if username is not None:
           self.username = username
 
+    @classmethod
+    def _from_server(cls, extra=None, groups=None, request=None, uid=None, usages=None, username=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._extra = extra
+        self._groups = groups
+        self._request = request
+        self._uid = uid
+        self._usages = usages
+        self._username = username
+        self.discriminator = None
+        return self
+
     @property
     def extra(self):
         """
@@ -54,6 +54,18 @@ class V1beta1CertificateSigningRequestStatus(object):
         if conditions is not None:
           self.conditions = conditions
 
+    @classmethod
+    def _from_server(cls, certificate=None, conditions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._certificate = certificate
+        self._conditions = conditions
+        self.discriminator = None
+        return self
+
     @property
     def certificate(self):
         """
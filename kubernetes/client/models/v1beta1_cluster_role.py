@@ -69,6 +69,21 @@ class V1beta1ClusterRole(object):
         if rules is not None:
           self.rules = rules
 
+    @classmethod
+    def _from_server(cls, aggregation_rule=None, api_version=None, kind=None, metadata=None, rules=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._aggregation_rule = aggregation_rule
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._rules = rules
+        self.discriminator = None
+        return self
+
     @property
     def aggregation_rule(self):
         """
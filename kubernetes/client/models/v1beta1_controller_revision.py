@@ -68,6 +68,21 @@ class V1beta1ControllerRevision(object):
           self.metadata = metadata
         self.revision = revision
 
+    @classmethod
+    def _from_server(cls, api_version=None, data=None, kind=None, metadata=None, revision=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._data = data
+        self._kind = kind
+        self._metadata = metadata
+        self._revision = revision
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -54,6 +54,18 @@ class V1beta1CSIDriverSpec(object):
         if pod_info_on_mount is not None:
           self.pod_info_on_mount = pod_info_on_mount
 
+    @classmethod
+    def _from_server(cls, attach_required=None, pod_info_on_mount=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._attach_required = attach_required
+        self._pod_info_on_mount = pod_info_on_mount
+        self.discriminator = None
+        return self
+
     @property
     def attach_required(self):
         """
@@ -57,6 +57,19 @@ class V1beta1CSINodeDriver(object):
         if topology_keys is not None:
           self.topology_keys = topology_keys
 
+    @classmethod
+    def _from_server(cls, name=None, node_id=None, topology_keys=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._node_id = node_id
+        self._topology_keys = topology_keys
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -48,6 +48,17 @@ class V1beta1CSINodeSpec(object):
 
         self.drivers = drivers
 
+    @classmethod
+    def _from_server(cls, drivers=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._drivers = drivers
+        self.discriminator = None
+        return self
+
     @property
     def drivers(self):
         """
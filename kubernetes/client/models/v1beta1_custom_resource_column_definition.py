@@ -71,6 +71,22 @@ class V1beta1CustomResourceColumnDefinition(object):
           self.priority = priority
         self.type = type
 
+    @classmethod
+    def _from_server(cls, json_path=None, description=None, format=None, name=None, priority=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._json_path = json_path
+        self._description = description
+        self._format = format
+        self._name = name
+        self._priority = priority
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def json_path(self):
         """
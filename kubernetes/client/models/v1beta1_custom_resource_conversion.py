@@ -58,6 +58,19 @@ class V1beta1CustomResourceConversion(object):
         if webhook_client_config is not None:
           self.webhook_client_config = webhook_client_config
 
+    @classmethod
+    def _from_server(cls, conversion_review_versions=None, strategy=None, webhook_client_config=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._conversion_review_versions = conversion_review_versions
+        self._strategy = strategy
+        self._webhook_client_config = webhook_client_config
+        self.discriminator = None
+        return self
+
     @property
     def conversion_review_versions(self):
         """
@@ -72,6 +72,22 @@ class V1beta1CustomResourceDefinitionNames(object):
         if singular is not None:
           self.singular = singular
 
+    @classmethod
+    def _from_server(cls, categories=None, kind=None, list_kind=None, plural=None, short_names=None, singular=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._categories = categories
+        self._kind = kind
+        self._list_kind = list_kind
+        self._plural = plural
+        self._short_names = short_names
+        self._singular = singular
+        self.discriminator = None
+        return self
+
     @property
     def categories(self):
         """
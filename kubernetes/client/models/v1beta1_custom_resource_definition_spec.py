@@ -86,6 +86,25 @@ class V1beta1CustomResourceDefinitionSpec(object):
         if versions is not None:
           self.versions = versions
 
+    @classmethod
+    def _from_server(cls, additional_printer_columns=None, conversion=None, group=None, names=None, scope=None, subresources=None, validation=None, version=None, versions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._additional_printer_columns = additional_printer_columns
+        self._conversion = conversion
+        self._group = group
+        self._names = names
+        self._scope = scope
+        self._subresources = subresources
+        self._validation = validation
+        self._version = version
+        self._versions = versions
+        self.discriminator = None
+        return self
+
     @property
     def additional_printer_columns(self):
         """
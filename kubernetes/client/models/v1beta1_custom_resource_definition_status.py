@@ -56,6 +56,19 @@ class V1beta1CustomResourceDefinitionStatus(object):
         self.conditions = conditions
         self.stored_versions = stored_versions
 
+    @classmethod
+    def _from_server(cls, accepted_names=None, conditions=None, stored_versions=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._accepted_names = accepted_names
+        self._conditions = conditions
+        self._stored_versions = stored_versions
+        self.discriminator = None
+        return self
+
     @property
     def accepted_names(self):
         """
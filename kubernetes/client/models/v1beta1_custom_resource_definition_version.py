@@ -71,6 +71,22 @@ class V1beta1CustomResourceDefinitionVersion(object):
         if subresources is not None:
           self.subresources = subresources
 
+    @classmethod
+    def _from_server(cls, additional_printer_columns=None, name=None, schema=None, served=None, storage=None, subresources=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._additional_printer_columns = additional_printer_columns
+        self._name = name
+        self._schema = schema
+        self._served = served
+        self._storage = storage
+        self._subresources = subresources
+        self.discriminator = None
+        return self
+
     @property
     def additional_printer_columns(self):
         """
@@ -57,6 +57,19 @@ class V1beta1CustomResourceSubresourceScale(object):
         self.spec_replicas_path = spec_replicas_path
         self.status_replicas_path = status_replicas_path
 
+    @classmethod
+    def _from_server(cls, label_selector_path=None, spec_replicas_path=None, status_replicas_path=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._label_selector_path = label_selector_path
+        self._spec_replicas_path = spec_replicas_path
+        self._status_replicas_path = status_replicas_path
+        self.discriminator = None
+        return self
+
     @property
     def label_selector_path(self):
         """
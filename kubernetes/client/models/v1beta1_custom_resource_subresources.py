@@ -54,6 +54,18 @@ class V1beta1CustomResourceSubresources(object):
         if status is not None:
           self.status = status
 
+    @classmethod
+    def _from_server(cls, scale=None, status=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._scale = scale
+        self._status = status
+        self.discriminator = None
+        return self
+
     @property
     def scale(self):
         """
@@ -49,6 +49,17 @@ class V1beta1CustomResourceValidation(object):
         if open_apiv3_schema is not None:
           self.open_apiv3_schema = open_apiv3_schema
 
+    @classmethod
+    def _from_server(cls, open_apiv3_schema=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._open_apiv3_schema = open_apiv3_schema
+        self.discriminator = None
+        return self
+
     @property
     def open_apiv3_schema(self):
         """
@@ -90,6 +90,26 @@ class V1beta1DaemonSetStatus(object):
         if updated_number_scheduled is not None:
           self.updated_number_scheduled = updated_number_scheduled
 
+    @classmethod
+    def _from_server(cls, collision_count=None, conditions=None, current_number_scheduled=None, desired_number_scheduled=None, number_available=None, number_misscheduled=None, number_ready=None, number_unavailable=None, observed_generation=None, updated_number_scheduled=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._collision_count = collision_count
+        self._conditions = conditions
+        self._current_number_scheduled = current_number_scheduled
+        self._desired_number_scheduled = desired_number_scheduled
+        self._number_available = number_available
+        self._number_misscheduled = number_misscheduled
+        self._number_ready = number_ready
+        self._number_unavailable = number_unavailable
+        self._observed_generation = observed_generation
+        self._updated_number_scheduled = updated_number_scheduled
+        self.discriminator = None
+        return self
+
     @property
     def collision_count(self):
         """
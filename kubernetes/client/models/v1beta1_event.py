@@ -128,6 +128,33 @@ class V1beta1Event(object):
         if type is not None:
           self.type = type
 
+    @classmethod
+    def _from_server(cls, action=None, api_version=None, deprecated_count=None, deprecated_first_timestamp=None, deprecated_last_timestamp=None, deprecated_source=None, event_time=None, kind=None, metadata=None, note=None, reason=None, regarding=None, related=None, reporting_controller=None, reporting_instance=None, series=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._action = action
+        self._api_version = api_version
+        self._deprecated_count = deprecated_count
+        self._deprecated_first_timestamp = deprecated_first_timestamp
+        self._deprecated_last_timestamp = deprecated_last_timestamp
+        self._deprecated_source = deprecated_source
+        self._event_time = event_time
+        self._kind = kind
+        self._metadata = metadata
+        self._note = note
+        self._reason = reason
+        self._regarding = regarding
+        self._related = related
+        self._reporting_controller = reporting_controller
+        self._reporting_instance = reporting_instance
+        self._series = series
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def action(self):
         """
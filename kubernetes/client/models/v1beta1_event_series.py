@@ -56,6 +56,19 @@ class V1beta1EventSeries(object):
         self.last_observed_time = last_observed_time
         self.state = state
 
+    @classmethod
+    def _from_server(cls, count=None, last_observed_time=None, state=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._count = count
+        self._last_observed_time = last_observed_time
+        self._state = state
+        self.discriminator = None
+        return self
+
     @property
     def count(self):
         """
@@ -54,6 +54,18 @@ class V1beta1ExternalDocumentation(object):
         if url is not None:
           self.url = url
 
+    @classmethod
+    def _from_server(cls, description=None, url=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._description = description
+        self._url = url
+        self.discriminator = None
+        return self
+
     @property
     def description(self):
         """
@@ -229,6 +229,53 @@ class V1beta1JSONSchemaProps(object):
         if unique_items is not None:
           self.unique_items = unique_items
 
+    @classmethod
+    def _from_server(cls, ref=None, schema=None, additional_items=None, additional_properties=None, all_of=None, any_of=None, default=None, definitions=None, dependencies=None, description=None, enum=None, example=None, exclusive_maximum=None, exclusive_minimum=None, external_docs=None, format=None, id=None, items=None, max_items=None, max_length=None, max_properties=None, maximum=None, min_items=None, min_length=None, min_properties=None, minimum=None, multiple_of=None, _not=None, nullable=None, one_of=None, pattern=None, pattern_properties=None, properties=None, required=None, title=None, type=None, unique_items=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._ref = ref
+        self._schema = schema
+        self._additional_items = additional_items
+        self._additional_properties = additional_properties
+        self._all_of = all_of
+        self._any_of = any_of
+        self._default = default
+        self._definitions = definitions
+        self._dependencies = dependencies
+        self._description = description
+        self._enum = enum
+        self._example = example
+        self._exclusive_maximum = exclusive_maximum
+        self._exclusive_minimum = exclusive_minimum
+        self._external_docs = external_docs
+        self._format = format
+        self._id = id
+        self._items = items
+        self._max_items = max_items
+        self._max_length = max_length
+        self._max_properties = max_properties
+        self._maximum = maximum
+        self._min_items = min_items
+        self._min_length = min_length
+        self._min_properties = min_properties
+        self._minimum = minimum
+        self._multiple_of = multiple_of
+        self.__not = _not
+        self._nullable = nullable
+        self._one_of = one_of
+        self._pattern = pattern
+        self._pattern_properties = pattern_properties
+        self._properties = properties
+        self._required = required
+        self._title = title
+        self._type = type
+        self._unique_items = unique_items
+        self.discriminator = None
+        return self
+
     @property
     def ref(self):
         """
@@ -63,6 +63,20 @@ class V1beta1NetworkPolicySpec(object):
         if policy_types is not None:
           self.policy_types = policy_types
 
+    @classmethod
+    def _from_server(cls, egress=None, ingress=None, pod_selector=None, policy_types=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._egress = egress
+        self._ingress = ingress
+        self._pod_selector = pod_selector
+        self._policy_types = policy_types
+        self.discriminator = None
+        return self
+
     @property
     def egress(self):
         """
@@ -53,6 +53,18 @@ class V1beta1NonResourceRule(object):
           self.non_resource_ur_ls = non_resource_ur_ls
         self.verbs = verbs
 
+    @classmethod
+    def _from_server(cls, non_resource_ur_ls=None, verbs=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._non_resource_ur_ls = non_resource_ur_ls
+        self._verbs = verbs
+        self.discriminator = None
+        return self
+
     @property
     def non_resource_ur_ls(self):
         """
@@ -59,6 +59,19 @@ class V1beta1PodDisruptionBudgetSpec(object):
         if selector is not None:
           self.selector = selector
 
+    @classmethod
+    def _from_server(cls, max_unavailable=None, min_available=None, selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._max_unavailable = max_unavailable
+        self._min_available = min_available
+        self._selector = selector
+        self.discriminator = None
+        return self
+
     @property
     def max_unavailable(self):
         """
@@ -70,6 +70,22 @@ class V1beta1PodDisruptionBudgetStatus(object):
         if observed_generation is not None:
           self.observed_generation = observed_generation
 
+    @classmethod
+    def _from_server(cls, current_healthy=None, desired_healthy=None, disrupted_pods=None, disruptions_allowed=None, expected_pods=None, observed_generation=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current_healthy = current_healthy
+        self._desired_healthy = desired_healthy
+        self._disrupted_pods = disrupted_pods
+        self._disruptions_allowed = disruptions_allowed
+        self._expected_pods = expected_pods
+        self._observed_generation = observed_generation
+        self.discriminator = None
+        return self
+
     @property
     def current_healthy(self):
         """
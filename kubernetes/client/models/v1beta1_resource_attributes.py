@@ -79,6 +79,23 @@ class V1beta1ResourceAttributes(object):
         if version is not None:
           self.version = version
 
+    @classmethod
+    def _from_server(cls, group=None, name=None, namespace=None, resource=None, subresource=None, verb=None, version=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._group = group
+        self._name = name
+        self._namespace = namespace
+        self._resource = resource
+        self._subresource = subresource
+        self._verb = verb
+        self._version = version
+        self.discriminator = None
+        return self
+
     @property
     def group(self):
         """
@@ -49,6 +49,17 @@ class V1beta1RollingUpdateStatefulSetStrategy(object):
         if partition is not None:
           self.partition = partition
 
+    @classmethod
+    def _from_server(cls, partition=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._partition = partition
+        self.discriminator = None
+        return self
+
     @property
     def partition(self):
         """
@@ -69,6 +69,21 @@ class V1beta1RuleWithOperations(object):
         if scope is not None:
           self.scope = scope
 
+    @classmethod
+    def _from_server(cls, api_groups=None, api_versions=None, operations=None, resources=None, scope=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_groups = api_groups
+        self._api_versions = api_versions
+        self._operations = operations
+        self._resources = resources
+        self._scope = scope
+        self.discriminator = None
+        return self
+
     @property
     def api_groups(self):
         """
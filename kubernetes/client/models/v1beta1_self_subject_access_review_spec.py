@@ -54,6 +54,18 @@ class V1beta1SelfSubjectAccessReviewSpec(object):
         if resource_attributes is not None:
           self.resource_attributes = resource_attributes
 
+    @classmethod
+    def _from_server(cls, non_resource_attributes=None, resource_attributes=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._non_resource_attributes = non_resource_attributes
+        self._resource_attributes = resource_attributes
+        self.discriminator = None
+        return self
+
     @property
     def non_resource_attributes(self):
         """
@@ -88,6 +88,25 @@ class V1beta1StatefulSetStatus(object):
         if updated_replicas is not None:
           self.updated_replicas = updated_replicas
 
+    @classmethod
+    def _from_server(cls, collision_count=None, conditions=None, current_replicas=None, current_revision=None, observed_generation=None, ready_replicas=None, replicas=None, update_revision=None, updated_replicas=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._collision_count = collision_count
+        self._conditions = conditions
+        self._current_replicas = current_replicas
+        self._current_revision = current_revision
+        self._observed_generation = observed_generation
+        self._ready_replicas = ready_replicas
+        self._replicas = replicas
+        self._update_revision = update_revision
+        self._updated_replicas = updated_replicas
+        self.discriminator = None
+        return self
+
     @property
     def collision_count(self):
         """
@@ -93,6 +93,26 @@ class V1beta1StorageClass(object):
         if volume_binding_mode is not None:
           self.volume_binding_mode = volume_binding_mode
 
+    @classmethod
+    def _from_server(cls, allow_volume_expansion=None, allowed_topologies=None, api_version=None, kind=None, metadata=None, mount_options=None, parameters=None, provisioner=None, reclaim_policy=None, volume_binding_mode=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._allow_volume_expansion = allow_volume_expansion
+        self._allowed_topologies = allowed_topologies
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._mount_options = mount_options
+        self._parameters = parameters
+        self._provisioner = provisioner
+        self._reclaim_policy = reclaim_policy
+        self._volume_binding_mode = volume_binding_mode
+        self.discriminator = None
+        return self
+
     @property
     def allow_volume_expansion(self):
         """
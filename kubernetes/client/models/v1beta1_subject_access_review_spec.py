@@ -74,6 +74,22 @@ class V1beta1SubjectAccessReviewSpec(object):
         if user is not None:
           self.user = user
 
+    @classmethod
+    def _from_server(cls, extra=None, group=None, non_resource_attributes=None, resource_attributes=None, uid=None, user=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._extra = extra
+        self._group = group
+        self._non_resource_attributes = non_resource_attributes
+        self._resource_attributes = resource_attributes
+        self._uid = uid
+        self._user = user
+        self.discriminator = None
+        return self
+
     @property
     def extra(self):
         """
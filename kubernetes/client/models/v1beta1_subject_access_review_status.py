@@ -63,6 +63,20 @@ class V1beta1SubjectAccessReviewStatus(object):
         if reason is not None:
           self.reason = reason
 
+    @classmethod
+    def _from_server(cls, allowed=None, denied=None, evaluation_error=None, reason=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._allowed = allowed
+        self._denied = denied
+        self._evaluation_error = evaluation_error
+        self._reason = reason
+        self.discriminator = None
+        return self
+
     @property
     def allowed(self):
         """
@@ -64,6 +64,20 @@ class V1beta1ValidatingWebhookConfiguration(object):
         if webhooks is not None:
           self.webhooks = webhooks
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, metadata=None, webhooks=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._metadata = metadata
+        self._webhooks = webhooks
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
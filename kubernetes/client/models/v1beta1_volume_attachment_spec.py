@@ -56,6 +56,19 @@ class V1beta1VolumeAttachmentSpec(object):
         self.node_name = node_name
         self.source = source
 
+    @classmethod
+    def _from_server(cls, attacher=None, node_name=None, source=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._attacher = attacher
+        self._node_name = node_name
+        self._source = source
+        self.discriminator = None
+        return self
+
     @property
     def attacher(self):
         """
@@ -82,6 +82,24 @@ class V1beta1Webhook(object):
         if timeout_seconds is not None:
           self.timeout_seconds = timeout_seconds
 
+    @classmethod
+    def _from_server(cls, admission_review_versions=None, client_config=None, failure_policy=None, name=None, namespace_selector=None, rules=None, side_effects=None, timeout_seconds=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._admission_review_versions = admission_review_versions
+        self._client_config = client_config
+        self._failure_policy = failure_policy
+        self._name = name
+        self._namespace_selector = namespace_selector
+        self._rules = rules
+        self._side_effects = side_effects
+        self._timeout_seconds = timeout_seconds
+        self.discriminator = None
+        return self
+
     @property
     def admission_review_versions(self):
         """
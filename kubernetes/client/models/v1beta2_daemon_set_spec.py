@@ -67,6 +67,21 @@ class V1beta2DaemonSetSpec(object):
         if update_strategy is not None:
           self.update_strategy = update_strategy
 
+    @classmethod
+    def _from_server(cls, min_ready_seconds=None, revision_history_limit=None, selector=None, template=None, update_strategy=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._min_ready_seconds = min_ready_seconds
+        self._revision_history_limit = revision_history_limit
+        self._selector = selector
+        self._template = template
+        self._update_strategy = update_strategy
+        self.discriminator = None
+        return self
+
     @property
     def min_ready_seconds(self):
         """
@@ -63,6 +63,20 @@ class V1beta2ReplicaSetSpec(object):
         if template is not None:
           self.template = template
 
+    @classmethod
+    def _from_server(cls, min_ready_seconds=None, replicas=None, selector=None, template=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._min_ready_seconds = min_ready_seconds
+        self._replicas = replicas
+        self._selector = selector
+        self._template = template
+        self.discriminator = None
+        return self
+
     @property
     def min_ready_seconds(self):
         """
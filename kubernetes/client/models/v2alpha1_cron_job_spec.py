@@ -77,6 +77,23 @@ class V2alpha1CronJobSpec(object):
         if suspend is not None:
           self.suspend = suspend
 
+    @classmethod
+    def _from_server(cls, concurrency_policy=None, failed_jobs_history_limit=None, job_template=None, schedule=None, starting_deadline_seconds=None, successful_jobs_history_limit=None, suspend=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._concurrency_policy = concurrency_policy
+        self._failed_jobs_history_limit = failed_jobs_history_limit
+        self._job_template = job_template
+        self._schedule = schedule
+        self._starting_deadline_seconds = starting_deadline_seconds
+        self._successful_jobs_history_limit = successful_jobs_history_limit
+        self._suspend = suspend
+        self.discriminator = None
+        return self
+
     @property
     def concurrency_policy(self):
         """
@@ -54,6 +54,18 @@ class V2alpha1CronJobStatus(object):
         if last_schedule_time is not None:
           self.last_schedule_time = last_schedule_time
 
+    @classmethod
+    def _from_server(cls, active=None, last_schedule_time=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._active = active
+        self._last_schedule_time = last_schedule_time
+        self.discriminator = None
+        return self
+
     @property
     def active(self):
         """
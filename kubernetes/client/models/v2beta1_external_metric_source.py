@@ -63,6 +63,20 @@ class V2beta1ExternalMetricSource(object):
         if target_value is not None:
           self.target_value = target_value
 
+    @classmethod
+    def _from_server(cls, metric_name=None, metric_selector=None, target_average_value=None, target_value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._metric_name = metric_name
+        self._metric_selector = metric_selector
+        self._target_average_value = target_average_value
+        self._target_value = target_value
+        self.discriminator = None
+        return self
+
     @property
     def metric_name(self):
         """
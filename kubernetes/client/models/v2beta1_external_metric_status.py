@@ -62,6 +62,20 @@ class V2beta1ExternalMetricStatus(object):
         if metric_selector is not None:
           self.metric_selector = metric_selector
 
+    @classmethod
+    def _from_server(cls, current_average_value=None, current_value=None, metric_name=None, metric_selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current_average_value = current_average_value
+        self._current_value = current_value
+        self._metric_name = metric_name
+        self._metric_selector = metric_selector
+        self.discriminator = None
+        return self
+
     @property
     def current_average_value(self):
         """
@@ -62,6 +62,20 @@ class V2beta1HorizontalPodAutoscalerSpec(object):
           self.min_replicas = min_replicas
         self.scale_target_ref = scale_target_ref
 
+    @classmethod
+    def _from_server(cls, max_replicas=None, metrics=None, min_replicas=None, scale_target_ref=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._max_replicas = max_replicas
+        self._metrics = metrics
+        self._min_replicas = min_replicas
+        self._scale_target_ref = scale_target_ref
+        self.discriminator = None
+        return self
+
     @property
     def max_replicas(self):
         """
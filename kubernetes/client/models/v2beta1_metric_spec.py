@@ -68,6 +68,21 @@ class V2beta1MetricSpec(object):
           self.resource = resource
         self.type = type
 
+    @classmethod
+    def _from_server(cls, external=None, object=None, pods=None, resource=None, type=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._external = external
+        self._object = object
+        self._pods = pods
+        self._resource = resource
+        self._type = type
+        self.discriminator = None
+        return self
+
     @property
     def external(self):
         """
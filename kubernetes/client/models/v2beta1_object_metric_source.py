@@ -66,6 +66,21 @@ class V2beta1ObjectMetricSource(object):
         self.target = target
         self.target_value = target_value
 
+    @classmethod
+    def _from_server(cls, average_value=None, metric_name=None, selector=None, target=None, target_value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._average_value = average_value
+        self._metric_name = metric_name
+        self._selector = selector
+        self._target = target
+        self._target_value = target_value
+        self.discriminator = None
+        return self
+
     @property
     def average_value(self):
         """
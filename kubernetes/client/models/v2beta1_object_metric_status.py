@@ -66,6 +66,21 @@ class V2beta1ObjectMetricStatus(object):
           self.selector = selector
         self.target = target
 
+    @classmethod
+    def _from_server(cls, average_value=None, current_value=None, metric_name=None, selector=None, target=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._average_value = average_value
+        self._current_value = current_value
+        self._metric_name = metric_name
+        self._selector = selector
+        self._target = target
+        self.discriminator = None
+        return self
+
     @property
     def average_value(self):
         """
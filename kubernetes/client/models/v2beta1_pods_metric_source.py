@@ -57,6 +57,19 @@ class V2beta1PodsMetricSource(object):
           self.selector = selector
         self.target_average_value = target_average_value
 
+    @classmethod
+    def _from_server(cls, metric_name=None, selector=None, target_average_value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._metric_name = metric_name
+        self._selector = selector
+        self._target_average_value = target_average_value
+        self.discriminator = None
+        return self
+
     @property
     def metric_name(self):
         """
@@ -57,6 +57,19 @@ class V2beta1PodsMetricStatus(object):
         if selector is not None:
           self.selector = selector
 
+    @classmethod
+    def _from_server(cls, current_average_value=None, metric_name=None, selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current_average_value = current_average_value
+        self._metric_name = metric_name
+        self._selector = selector
+        self.discriminator = None
+        return self
+
     @property
     def current_average_value(self):
         """
@@ -58,6 +58,19 @@ class V2beta1ResourceMetricSource(object):
         if target_average_value is not None:
           self.target_average_value = target_average_value
 
+    @classmethod
+    def _from_server(cls, name=None, target_average_utilization=None, target_average_value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._target_average_utilization = target_average_utilization
+        self._target_average_value = target_average_value
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -57,6 +57,19 @@ class V2beta1ResourceMetricStatus(object):
         self.current_average_value = current_average_value
         self.name = name
 
+    @classmethod
+    def _from_server(cls, current_average_utilization=None, current_average_value=None, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current_average_utilization = current_average_utilization
+        self._current_average_value = current_average_value
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def current_average_utilization(self):
         """
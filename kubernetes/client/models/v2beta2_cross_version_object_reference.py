@@ -57,6 +57,19 @@ class V2beta2CrossVersionObjectReference(object):
         self.kind = kind
         self.name = name
 
+    @classmethod
+    def _from_server(cls, api_version=None, kind=None, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._api_version = api_version
+        self._kind = kind
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def api_version(self):
         """
@@ -52,6 +52,18 @@ class V2beta2ExternalMetricStatus(object):
         self.current = current
         self.metric = metric
 
+    @classmethod
+    def _from_server(cls, current=None, metric=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current = current
+        self._metric = metric
+        self.discriminator = None
+        return self
+
     @property
     def current(self):
         """
@@ -71,6 +71,22 @@ class V2beta2HorizontalPodAutoscalerStatus(object):
         if observed_generation is not None:
           self.observed_generation = observed_generation
 
+    @classmethod
+    def _from_server(cls, conditions=None, current_metrics=None, current_replicas=None, desired_replicas=None, last_scale_time=None, observed_generation=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._conditions = conditions
+        self._current_metrics = current_metrics
+        self._current_replicas = current_replicas
+        self._desired_replicas = desired_replicas
+        self._last_scale_time = last_scale_time
+        self._observed_generation = observed_generation
+        self.discriminator = None
+        return self
+
     @property
     def conditions(self):
         """
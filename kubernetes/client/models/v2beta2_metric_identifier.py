@@ -53,6 +53,18 @@ class V2beta2MetricIdentifier(object):
         if selector is not None:
           self.selector = selector
 
+    @classmethod
+    def _from_server(cls, name=None, selector=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._selector = selector
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
@@ -59,6 +59,19 @@ class V2beta2MetricValueStatus(object):
         if value is not None:
           self.value = value
 
+    @classmethod
+    def _from_server(cls, average_utilization=None, average_value=None, value=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._average_utilization = average_utilization
+        self._average_value = average_value
+        self._value = value
+        self.discriminator = None
+        return self
+
     @property
     def average_utilization(self):
         """
@@ -56,6 +56,19 @@ class V2beta2ObjectMetricSource(object):
         self.metric = metric
         self.target = target
 
+    @classmethod
+    def _from_server(cls, described_object=None, metric=None, target=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._described_object = described_object
+        self._metric = metric
+        self._target = target
+        self.discriminator = None
+        return self
+
     @property
     def described_object(self):
         """
@@ -56,6 +56,19 @@ class V2beta2ObjectMetricStatus(object):
         self.described_object = described_object
         self.metric = metric
 
+    @classmethod
+    def _from_server(cls, current=None, described_object=None, metric=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current = current
+        self._described_object = described_object
+        self._metric = metric
+        self.discriminator = None
+        return self
+
     @property
     def current(self):
         """
@@ -52,6 +52,18 @@ class V2beta2PodsMetricSource(object):
         self.metric = metric
         self.target = target
 
+    @classmethod
+    def _from_server(cls, metric=None, target=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._metric = metric
+        self._target = target
+        self.discriminator = None
+        return self
+
     @property
     def metric(self):
         """
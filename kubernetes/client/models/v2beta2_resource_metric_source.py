@@ -52,6 +52,18 @@ class V2beta2ResourceMetricSource(object):
         self.name = name
         self.target = target
 
+    @classmethod
+    def _from_server(cls, name=None, target=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._name = name
+        self._target = target
+        self.discriminator = None
+        return self
+
     @property
     def name(self):
         """
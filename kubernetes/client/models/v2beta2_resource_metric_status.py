@@ -52,6 +52,18 @@ class V2beta2ResourceMetricStatus(object):
         self.current = current
         self.name = name
 
+    @classmethod
+    def _from_server(cls, current=None, name=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._current = current
+        self._name = name
+        self.discriminator = None
+        return self
+
     @property
     def current(self):
         """
@@ -80,6 +80,25 @@ class VersionInfo(object):
         self.minor = minor
         self.platform = platform
 
+    @classmethod
+    def _from_server(cls, build_date=None, compiler=None, git_commit=None, git_tree_state=None, git_version=None, go_version=None, major=None, minor=None, platform=None):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+        self._build_date = build_date
+        self._compiler = compiler
+        self._git_commit = git_commit
+        self._git_tree_state = git_tree_state
+        self._git_version = git_version
+        self._go_version = go_version
+        self._major = major
+        self._minor = minor
+        self._platform = platform
+        self.discriminator = None
+        return self
+
     @property
     def build_date(self):
         """
@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Client side rate limiting of the requests sent to the apiserver.
+"""
+
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+try:
+    _now = time.monotonic
+except AttributeError:  # python 2
+    _now = time.time
+
+
+class TokenBucketRateLimiter(object):
+    """
+    Token bucket allowing `qps` requests per second on average, and bursts
+    of up to `burst` requests.
+
+    Tokens are handed out in order and may be borrowed from the future: a
+    request that finds the bucket empty reserves the next token and waits
+    until it is due, so concurrent callers are spaced evenly instead of
+    retrying in lock step. The limiter is thread safe.
+
+    :param qps: sustained number of requests per second.
+    :param burst: size of the bucket, defaults to `qps`.
+    """
+
+    def __init__(self, qps, burst=None, clock=_now):
+        if qps <= 0:
+            raise ValueError("qps must be positive, got {0}".format(qps))
+        self.qps = float(qps)
+        self.burst = max(1, int(burst if burst is not None else qps))
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token.
+
+        :return: seconds to wait before the request may be sent.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.qps
+
+    def accept(self):
+        """
+        Blocks until a request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def rate_limiter_for(configuration):
+    """
+    Returns the rate limiter configured by `configuration.qps` and
+    `configuration.burst`, or None if requests are not rate limited.
+    """
+    if not configuration.qps:
+        return None
+    return TokenBucketRateLimiter(configuration.qps, configuration.burst)
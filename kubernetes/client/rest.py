@@ -14,7 +14,6 @@
 from __future__ import absolute_import
 
 import io
-import json
 import ssl
 import certifi
 import logging
@@ -29,6 +28,11 @@ try:
 except ImportError:
     raise ImportError('Swagger python client requires urllib3.')
 
+from . import metrics
+from .json_codec import json_codec_for
+from .rate_limit import rate_limiter_for
+from .transport import _POOL_CLASSES
+
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,17 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+def _is_watch(query_params):
+    """
+    Tells whether the query parameters of a request are those of a watch,
+    or of a followed log.
+    """
+    if isinstance(query_params, dict):
+        query_params = query_params.items()
+    return any(key in ('watch', 'follow') and value and value != 'false'
+               for key, value in query_params or ())
+
+
 class RESTClientObject(object):
 
     def __init__(self, configuration, pools_size=4, maxsize=None):
@@ -80,34 +95,45 @@ class RESTClientObject(object):
         if configuration.assert_hostname is not None:
             addition_pool_args['assert_hostname'] = configuration.assert_hostname
 
+        # failed requests are retried by the policy rather than by urllib3
+        self.retry_policy = configuration.retry_policy
+        if self.retry_policy is not None:
+            addition_pool_args['retries'] = False
+
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
                 maxsize = configuration.connection_pool_maxsize
             else:
                 maxsize = 4
 
+        pool_args = dict(
+            num_pools=pools_size,
+            maxsize=maxsize,
+            cert_reqs=cert_reqs,
+            ca_certs=ca_certs,
+            cert_file=configuration.cert_file,
+            key_file=configuration.key_file,
+            **addition_pool_args
+        )
+
         # https pool manager
-        if configuration.proxy:
+        if configuration.transport_registry is not None:
+            # shared with the other clients of the registry
+            self.pool_manager = configuration.transport_registry.pool_manager(
+                configuration.host, configuration.proxy, pool_args)
+        elif configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
-                **addition_pool_args
-            )
+                proxy_url=configuration.proxy, **pool_args)
         else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
-            )
+            self.pool_manager = urllib3.PoolManager(**pool_args)
+        if configuration.metrics_sink is not None:
+            # times the acquisition of the connections, and their opening
+            self.pool_manager.pool_classes_by_scheme = _POOL_CLASSES
+
+        # shared by all the threads sending requests through this client
+        self.rate_limiter = rate_limiter_for(configuration)
+        self.json_codec = json_codec_for(configuration)
+        self.gzip = configuration.gzip
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True, _request_timeout=None):
@@ -146,6 +172,85 @@ class RESTClientObject(object):
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
+        # urllib3 decompresses the body while it is read, whether preloaded
+        # or streamed. Watches are read with `decode_content=False`, and a
+        # compressed stream could not be read one event at a time.
+        if self.gzip and 'Accept-Encoding' not in headers and \
+                not _is_watch(query_params):
+            headers['Accept-Encoding'] = 'gzip'
+
+        # the body of the response is read apart from its headers to time
+        # the server and the read separately
+        call = metrics.current()
+        preload = _preload_content and call is None
+
+        retry = 0
+        while True:
+            if self.rate_limiter is not None:
+                if call is not None:
+                    start = metrics.now()
+                    self.rate_limiter.accept()
+                    call.add('throttle', metrics.now() - start)
+                else:
+                    self.rate_limiter.accept()
+
+            try:
+                if call is not None:
+                    start = metrics.now()
+                    transport = call.transport_time()
+                r = self._send(method, url, query_params, dict(headers), body,
+                               post_params, preload, timeout)
+            except (urllib3.exceptions.ConnectTimeoutError,
+                    urllib3.exceptions.ProtocolError) as e:
+                # the request was not sent if the connection failed
+                sent = not isinstance(e, urllib3.exceptions.ConnectTimeoutError)
+                if self.retry_policy is None or \
+                        not self.retry_policy.should_retry_error(method, retry, sent):
+                    raise
+                logger.debug("retrying %s %s after %s", method, url, e)
+                self.retry_policy.sleep(retry)
+                retry += 1
+                continue
+            finally:
+                if call is not None:
+                    call.add('server', metrics.now() - start -
+                             (call.transport_time() - transport))
+
+            if self.retry_policy is not None and \
+                    self.retry_policy.should_retry_status(method, r.status, retry):
+                logger.debug("retrying %s %s after status %s",
+                             method, url, r.status)
+                if not preload:
+                    r.read()
+                    r.release_conn()
+                self.retry_policy.sleep(retry, r.getheader('Retry-After'))
+                retry += 1
+                continue
+            break
+
+        if _preload_content and call is not None:
+            start = metrics.now()
+            r.read(cache_content=True)
+            r.release_conn()
+            call.add('read', metrics.now() - start)
+
+        if _preload_content:
+            # the body is kept as bytes, the json codec decodes them as is
+            r = RESTResponse(r)
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
+
+    def _send(self, method, url, query_params, headers, body, post_params,
+              _preload_content, timeout):
+        """
+        Sends the request once, returns the urllib3.HTTPResponse.
+        """
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -158,7 +263,10 @@ class RESTClientObject(object):
                                 'application/strategic-merge-patch+json'
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.json_codec.dumps(body)
+                        call = metrics.current()
+                        if call is not None:
+                            call.request_bytes = len(request_body)
                     r = self.pool_manager.request(method, url,
                                                   body=request_body,
                                                   preload_content=_preload_content,
@@ -207,20 +315,6 @@ class RESTClientObject(object):
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
 
-        if _preload_content:
-            r = RESTResponse(r)
-
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if PY3:
-                r.data = r.data.decode('utf8')
-
-            # log response body
-            logger.debug("response body: %s", r.data)
-
-        if not 200 <= r.status <= 299:
-            raise ApiException(http_resp=r)
-
         return r
 
     def GET(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
@@ -293,6 +387,8 @@ class ApiException(Exception):
             self.status = http_resp.status
             self.reason = http_resp.reason
             self.body = http_resp.data
+            if PY3 and isinstance(self.body, bytes):
+                self.body = self.body.decode('utf8')
             self.headers = http_resp.getheaders()
         else:
             self.status = status
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Retry policy for the requests sent to the apiserver.
+"""
+
+
+from __future__ import absolute_import
+
+import random
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests are sent again, and when.
+
+    A request is retried when the connection could not be established, when
+    the connection broke before a response was received, or when the
+    apiserver answered with one of `statuses`. Requests that may have been
+    processed by the apiserver are only replayed for idempotent methods,
+    unless `retry_non_idempotent` is set. A 429 Too Many Requests was
+    rejected before being processed and is retried for any method.
+
+    The wait before a retry honors the `Retry-After` header of the response
+    if there is one, and is otherwise drawn at random between 0 and
+    `backoff_factor * 2 ** retry`, capped to `backoff_max` (full jitter), so
+    that clients failing together do not retry in lock step.
+
+    :param max_retries: maximum number of retries of one request.
+    :param backoff_factor: base of the exponential backoff, in seconds.
+    :param backoff_max: maximum wait before a retry, in seconds.
+    :param statuses: http statuses retried.
+    :param retry_non_idempotent: also replay POST and PATCH requests.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, backoff_max=30.0,
+                 statuses=(429, 500, 503), retry_non_idempotent=False):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.statuses = frozenset(statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def _replayable(self, method):
+        return self.retry_non_idempotent or \
+            method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry_status(self, method, status, retry):
+        """
+        :param method: http method of the request.
+        :param status: http status of the response.
+        :param retry: number of retries already made.
+        :return: whether the request should be retried.
+        """
+        if retry >= self.max_retries or status not in self.statuses:
+            return False
+        return status == 429 or self._replayable(method)
+
+    def should_retry_error(self, method, retry, sent=True):
+        """
+        :param method: http method of the request.
+        :param retry: number of retries already made.
+        :param sent: False if the connection failed before the request
+            could be sent.
+        :return: whether the request should be retried.
+        """
+        if retry >= self.max_retries:
+            return False
+        return not sent or self._replayable(method)
+
+    def backoff(self, retry, retry_after=None):
+        """
+        :param retry: number of retries already made.
+        :param retry_after: value of the `Retry-After` response header.
+        :return: seconds to wait before the next retry.
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(
+                0, self.backoff_factor * (2 ** retry))
+        return min(delay, self.backoff_max)
+
+    def sleep(self, retry, retry_after=None):
+        time.sleep(self.backoff(retry, retry_after))
+
+
+def parse_retry_after(value):
+    """
+    Parses a `Retry-After` header, either a number of seconds or a date.
+
+    :return: seconds to wait, or None if `value` is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, mktime_tz(date) - time.time())
@@ -0,0 +1,104 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Fast parsing of the RFC 3339 timestamps emitted by the apiserver.
+"""
+
+
+from __future__ import absolute_import
+
+import re
+from datetime import date, datetime, timedelta
+
+try:
+    from datetime import timezone
+    UTC = timezone.utc
+except ImportError:  # python 2
+    from dateutil.tz import tzoffset, tzutc
+    UTC = tzutc()
+
+    def _fixed_offset(minutes):
+        return tzoffset(None, minutes * 60)
+else:
+    def _fixed_offset(minutes):
+        return timezone(timedelta(minutes=minutes))
+
+# ref https://www.ietf.org/rfc/rfc3339.txt, `time-secfrac` is only bounded
+# by RFC3339Nano in practice.
+_re_rfc3339 = re.compile(r'(\d{4})-(\d\d)-(\d\d)'            # full-date
+                         r'[Tt ]'                            # separator
+                         r'(\d\d):(\d\d):(\d\d)(?:[.,](\d+))?'  # partial-time
+                         r'([Zz]|[-+]\d\d:?\d\d)$')          # time-offset
+_re_date = re.compile(r'(\d{4})-(\d\d)-(\d\d)$')
+
+# Objects of one list share most of their timestamps, remember the recent
+# ones. The cache is simply dropped when full.
+_CACHE_SIZE = 4096
+_cache = {}
+
+
+def _timezone(offset):
+    if offset in 'Zz':
+        return UTC
+    minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+    if offset[0] == '-':
+        minutes = -minutes
+    return _fixed_offset(minutes) if minutes else UTC
+
+
+def parse_rfc3339(string):
+    """
+    Parses an RFC 3339 timestamp into a timezone aware datetime.
+
+    Fractional seconds beyond microseconds are truncated.
+
+    :param string: str.
+    :return: datetime, or None if `string` is not an RFC 3339 timestamp.
+    """
+    try:
+        return _cache[string]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+
+    try:
+        match = _re_rfc3339.match(string)
+    except TypeError:
+        return None
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    try:
+        value = datetime(int(year), int(month), int(day),
+                         int(hour), int(minute), int(second),
+                         microsecond, _timezone(offset))
+    except ValueError:
+        return None
+
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.clear()
+    _cache[string] = value
+    return value
+
+
+def parse_rfc3339_date(string):
+    """
+    Parses an RFC 3339 `full-date`.
+
+    :param string: str.
+    :return: date, or None if `string` is not an RFC 3339 date.
+    """
+    try:
+        match = _re_date.match(string)
+    except TypeError:
+        return None
+    if match is None:
+        return None
+    try:
+        return date(*[int(group) for group in match.groups()])
+    except ValueError:
+        return None
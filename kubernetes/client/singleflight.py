@@ -0,0 +1,147 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Coalescing of identical concurrent requests.
+"""
+
+
+from __future__ import absolute_import
+
+import copy
+import threading
+
+from six import iteritems
+from urllib3.exceptions import TimeoutError
+
+from .metrics import split_path, verb_of
+
+# subresources whose GETs open a stream or a connection rather than read
+_CONNECT_SUBRESOURCES = frozenset(['attach', 'exec', 'portforward', 'proxy'])
+
+
+def coalescible(method, resource_path, query_params=None):
+    """
+    Tells whether a call is a read, a get or a list, whose identical
+    concurrent calls may share one response. Watches, followed logs and
+    the connect subresources are not.
+
+    :param resource_path: path of the endpoint, with the placeholders of
+        its path parameters.
+    :param query_params: query parameters of the call, list of pairs.
+    """
+    if verb_of(method, resource_path, query_params) not in ('get', 'list'):
+        return False
+    for key, value in query_params or ():
+        if key == 'follow' and value and value != 'false':
+            return False
+    split = split_path(resource_path)
+    subresource = split[3] if split is not None else None
+    return subresource is None or \
+        subresource.split('/', 1)[0] not in _CONNECT_SUBRESOURCES
+
+
+def hashable(value):
+    """
+    Returns the value with its lists as tuples and its dicts as sorted
+    tuples of pairs, recursively, e.g. to use parameters in keys.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, hashable(item))
+                            for key, item in iteritems(value)))
+    return value
+
+
+def request_key(url, query_params, headers):
+    """
+    Returns the key identifying a request, None if its parameters cannot
+    make one.
+
+    :param query_params: query parameters, list of pairs.
+    :param headers: dict of the headers.
+    """
+    key = (url, hashable(query_params or ()), hashable(headers or {}))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class WaitTimeout(TimeoutError):
+    """
+    Raised to the callers whose timeout expired while they waited for the
+    call they share.
+    """
+
+
+class _Call(object):
+    """
+    A call in flight, and its outcome once done.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        # callers waiting for the outcome of the call
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Runs one call at a time per key, the callers asking for a key while its
+    call is in flight wait for it and share its outcome.
+
+    Once a call is done the next caller of its key runs a new one: nothing
+    is cached, only the concurrent calls are coalesced.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> _Call
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None):
+        """
+        Returns the result of fn, run by the first caller of the key, or
+        raises its exception. The other callers get a copy of the
+        exception.
+
+        :param key: hashable identity of the call.
+        :param fn: callable without arguments making the call.
+        :param timeout: seconds the caller waits for the call of another
+            caller before raising WaitTimeout, None waits until it is done.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            if not call.done.wait(timeout):
+                raise WaitTimeout("Timed out after %s seconds waiting for "
+                                  "the shared call" % timeout)
+            if call.error is not None:
+                try:
+                    error = copy.copy(call.error)
+                except Exception:
+                    error = call.error
+                raise error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,266 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Connection pools shared by the api clients.
+"""
+
+
+from __future__ import absolute_import
+
+import hashlib
+import os
+import threading
+
+import urllib3
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import metrics
+
+# pool arguments naming files, keyed by their content rather than their path
+_FILE_ARGS = ('ca_certs', 'cert_file', 'key_file')
+
+
+class PoolStats(object):
+    """
+    Statistics of the connection pools of a host.
+
+    :param in_use: connections handed out to requests and not returned.
+    :param idle: open connections waiting in the pools.
+    :param waits: requests which found every connection of their pool in
+        use, and waited for one, or opened one above the size of the pool.
+    :param new_connections: connections opened.
+    :param requests: connections handed out.
+    """
+
+    def __init__(self, in_use=0, idle=0, waits=0, new_connections=0,
+                 requests=0):
+        self.in_use = in_use
+        self.idle = idle
+        self.waits = waits
+        self.new_connections = new_connections
+        self.requests = requests
+
+    def __add__(self, other):
+        return PoolStats(self.in_use + other.in_use, self.idle + other.idle,
+                         self.waits + other.waits,
+                         self.new_connections + other.new_connections,
+                         self.requests + other.requests)
+
+    def __eq__(self, other):
+        return isinstance(other, PoolStats) and \
+            self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return ('PoolStats(in_use={in_use}, idle={idle}, waits={waits}, '
+                'new_connections={new_connections}, '
+                'requests={requests})').format(**self.__dict__)
+
+
+class _TimedConnection(object):
+    """
+    Adds the time a urllib3 connection takes to connect, TLS handshake
+    included, to the metrics of the call it is opened for.
+    """
+
+    def connect(self):
+        start = metrics.now()
+        try:
+            return super(_TimedConnection, self).connect()
+        finally:
+            call = metrics.current()
+            if call is not None:
+                call.add('connect', metrics.now() - start)
+
+
+class TimedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _InstrumentedPool(object):
+    """
+    Counts the connections of a urllib3 connection pool, and times their
+    acquisition for the metrics of the calls.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_InstrumentedPool, self).__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._in_use = 0
+        self._waits = 0
+        self._new_connections = 0
+        self._requests = 0
+
+    def _new_conn(self):
+        with self._stats_lock:
+            self._new_connections += 1
+        return super(_InstrumentedPool, self)._new_conn()
+
+    def _get_conn(self, timeout=None):
+        with self._stats_lock:
+            self._requests += 1
+            self._in_use += 1
+            if self.pool is not None and self.pool.empty():
+                self._waits += 1
+        start = metrics.now()
+        try:
+            conn = super(_InstrumentedPool, self)._get_conn(timeout)
+        except Exception:
+            with self._stats_lock:
+                self._in_use -= 1
+            raise
+        call = metrics.current()
+        if call is not None:
+            call.add('acquire', metrics.now() - start)
+        return conn
+
+    def _put_conn(self, conn):
+        with self._stats_lock:
+            self._in_use -= 1
+        return super(_InstrumentedPool, self)._put_conn(conn)
+
+    def stats(self):
+        """
+        Returns the PoolStats of the pool.
+        """
+        queue = self.pool
+        idle = 0
+        if queue is not None:
+            idle = sum(1 for conn in list(queue.queue) if conn is not None)
+        with self._stats_lock:
+            return PoolStats(self._in_use, idle, self._waits,
+                             self._new_connections, self._requests)
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPool, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPool, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+_POOL_CLASSES = {
+    'http': InstrumentedHTTPConnectionPool,
+    'https': InstrumentedHTTPSConnectionPool,
+}
+
+
+def _file_key(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (IOError, OSError):
+        return path
+
+
+class TransportRegistry(object):
+    """
+    Registry of the urllib3 pool managers shared by the api clients.
+
+    Every `RESTClientObject` builds its own pool manager, so every
+    `ApiClient` opens new connections, and goes through a new TLS
+    handshake, even to a host other clients are connected to. The clients
+    whose configuration has a registry as its `transport_registry` share
+    one pool manager per host, TLS material and proxy instead. The TLS
+    material is compared by the content of its files, so that clients
+    loading the same kube config get the same pools although the
+    certificates are written to new temporary files.
+
+    The pools count their connections, see `stats`. The registry is
+    thread safe, and `default_registry` may be shared by all the clients
+    of a process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> (host, pool manager)
+        self._managers = {}
+        # host -> (maxsize, block)
+        self._sizes = {}
+
+    def set_pool_size(self, host, maxsize, block=False):
+        """
+        Sizes the pools of the clients of a host, rather than their
+        `connection_pool_maxsize`. Applies to the pools created after the
+        call.
+
+        :param host: `host` of the configurations of the clients, e.g.
+            `https://10.0.0.1:6443`.
+        :param maxsize: number of connections kept open to the host.
+        :param block: if True, requests wait for a connection when all are
+            in use, rather than opening one which is closed after use.
+        """
+        with self._lock:
+            self._sizes[host] = (maxsize, block)
+            for manager_host, manager in self._managers.values():
+                if manager_host == host:
+                    manager.connection_pool_kw.update(maxsize=maxsize,
+                                                      block=block)
+
+    def pool_manager(self, host, proxy, pool_args):
+        """
+        Returns the pool manager of a client, shared with the clients of
+        the same host, TLS material and proxy.
+
+        :param host: `host` of the configuration of the client.
+        :param proxy: proxy url of the client, or None.
+        :param pool_args: keyword arguments of the pool manager.
+        """
+        key = (host, proxy, tuple(sorted(
+            (name, _file_key(value) if name in _FILE_ARGS and value and
+             os.path.isfile(value) else value)
+            for name, value in pool_args.items()
+            if name not in ('num_pools', 'maxsize', 'block'))))
+        with self._lock:
+            entry = self._managers.get(key)
+            if entry is None:
+                args = dict(pool_args)
+                if host in self._sizes:
+                    args['maxsize'], args['block'] = self._sizes[host]
+                if proxy:
+                    manager = urllib3.ProxyManager(proxy_url=proxy, **args)
+                else:
+                    manager = urllib3.PoolManager(**args)
+                manager.pool_classes_by_scheme = _POOL_CLASSES
+                entry = self._managers[key] = (host, manager)
+        return entry[1]
+
+    def stats(self):
+        """
+        Returns the statistics of the pools of the registry.
+
+        :return: dict mapping the hosts to their PoolStats.
+        """
+        with self._lock:
+            managers = list(self._managers.values())
+        result = {}
+        for host, manager in managers:
+            stats = result.get(host, PoolStats())
+            for pool_key in list(manager.pools.keys()):
+                pool = manager.pools.get(pool_key)
+                if pool is not None:
+                    stats = stats + pool.stats()
+            result[host] = stats
+        return result
+
+    def clear(self):
+        """
+        Closes the connections of the registry. The clients still using
+        it open new ones.
+        """
+        with self._lock:
+            for _, manager in self._managers.values():
+                manager.clear()
+
+
+default_registry = TransportRegistry()
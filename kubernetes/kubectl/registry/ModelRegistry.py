@@ -32,9 +32,11 @@ def get_apis(group_version, action_map, clazz, api_client):
                     actions.add_action(action, method)
 
 def get_supported_kinds(api_client):
-    api_objects = apis.__dict__
     supported_kinds = {}
-    for name, clazz in api_objects.iteritems():
+    # apis are imported lazily, resolve them through the package's exports
+    # rather than its __dict__
+    for name in apis.__all__:
+        clazz = getattr(apis, name)
         if isinstance(clazz, type):
             parts = re.findall('[A-Z][^A-Z]*', name)
             parts = parts[0:-1]
@@ -88,8 +90,8 @@ class ModelRegistry(object):
 
     def build_core_register(self, api_client):
         supported_kinds = get_supported_kinds(api_client)
-        core_models = models.__dict__
-        for name, clazz in core_models.iteritems():
+        for name in models.__all__:
+            clazz = getattr(models, name)
             if isinstance(clazz, type):
                 gvk = resolve_group_version_kind(name)
                 api_versions = supported_kinds.get(gvk.kind, {})
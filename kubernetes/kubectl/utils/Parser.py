@@ -1,4 +1,5 @@
 from kubernetes.client.rest import ApiException
+from kubernetes.client.rfc3339 import parse_rfc3339, parse_rfc3339_date
 from kubectl.registry.GroupVersionKind import create_group_version_kind
 import yaml
 
@@ -81,6 +82,9 @@ class Parser(object):
         """
         if not value:
             return None
+        parsed = parse_rfc3339_date(value)
+        if parsed is not None:
+            return parsed
         try:
             from dateutil.parser import parse
             return parse(value).date()
@@ -103,6 +107,9 @@ class Parser(object):
         """
         if not value:
             return None
+        parsed = parse_rfc3339(value)
+        if parsed is not None:
+            return parsed
         try:
             from dateutil.parser import parse
             return parse(value)
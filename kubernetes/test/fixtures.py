@@ -0,0 +1,52 @@
+# coding: utf-8
+
+"""
+    Kubernetes
+
+    Fixtures shared by the unit tests.
+"""
+
+
+from __future__ import absolute_import
+
+import json
+
+
+class FakeResponse(object):
+    """
+    Response of the REST client, `body` is json encoded unless it is bytes.
+    """
+
+    def __init__(self, body, status=200, headers=None):
+        self.data = body if isinstance(body, bytes) else json.dumps(body)
+        self.status = status
+        self.headers = headers or {}
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+POD_LIST = {
+    'kind': 'PodList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '10'},
+    'items': [{
+        'metadata': {
+            'name': 'pod-a',
+            'labels': {'app': 'web'},
+            'creationTimestamp': '2019-04-01T10:00:00Z',
+            'unknownField': 'ignored',
+        },
+        'spec': {
+            'containers': [{
+                'name': 'nginx',
+                'image': 'nginx',
+                'ports': [{'containerPort': 80}],
+            }],
+        },
+        'status': {'phase': 'Running'},
+    }],
+}
@@ -0,0 +1,163 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import unittest
+
+from mock import Mock, patch
+
+import kubernetes.client
+from kubernetes.client.api_client import ApiClient
+from kubernetes.test.fixtures import POD_LIST, FakeResponse
+
+
+class TestApiClient(unittest.TestCase):
+    """ ApiClient unit tests """
+
+    def setUp(self):
+        self.api_client = ApiClient()
+
+    def test_deserialize_model_tree(self):
+        pods = self.api_client.deserialize(FakeResponse(POD_LIST), 'V1PodList')
+
+        self.assertIsInstance(pods, kubernetes.client.V1PodList)
+        pod = pods.items[0]
+        self.assertIsInstance(pod, kubernetes.client.V1Pod)
+        self.assertEqual('pod-a', pod.metadata.name)
+        self.assertEqual({'app': 'web'}, pod.metadata.labels)
+        self.assertEqual(2019, pod.metadata.creation_timestamp.year)
+        self.assertEqual(80, pod.spec.containers[0].ports[0].container_port)
+        self.assertEqual('Running', pod.status.phase)
+        self.assertIsNone(pod.spec.volumes)
+
+    def test_deserialize_containers(self):
+        data = {'a': [1, 2], 'b': None}
+        result = self.api_client.deserialize(FakeResponse(data),
+                                             'dict(str, list[int])')
+        self.assertEqual({'a': [1, 2], 'b': None}, result)
+
+        result = self.api_client.deserialize(FakeResponse(['x', 'y']),
+                                             'list[str]')
+        self.assertEqual(['x', 'y'], result)
+
+    def test_deserialize_class_literal(self):
+        ns = self.api_client.deserialize(
+            FakeResponse({'metadata': {'name': 'ns'}}),
+            kubernetes.client.V1Namespace)
+        self.assertEqual('ns', ns.metadata.name)
+
+    def test_deserializers_are_shared(self):
+        self.api_client.deserialize(FakeResponse(POD_LIST), 'V1PodList')
+        deserializers = self.api_client._flavor.deserializers
+        deserializer = deserializers['V1PodList']
+
+        other = ApiClient()
+        other.deserialize(FakeResponse(POD_LIST), 'V1PodList')
+        self.assertIs(deserializers, other._flavor.deserializers)
+        self.assertIs(deserializer, deserializers['V1PodList'])
+        self.assertIn(kubernetes.client.V1ObjectMeta, deserializers)
+
+    def test_self_referencing_model(self):
+        schema = {'type': 'object',
+                  'properties': {'spec': {'type': 'object',
+                                          'properties': {'replicas': {
+                                              'type': 'integer'}}}}}
+        result = self.api_client.deserialize(
+            FakeResponse(schema), 'V1beta1JSONSchemaProps')
+
+        replicas = result.properties['spec'].properties['replicas']
+        self.assertIsInstance(replicas,
+                              kubernetes.client.V1beta1JSONSchemaProps)
+        self.assertEqual('integer', replicas.type)
+
+    def test_missing_required_attributes(self):
+        container = self.api_client.deserialize(
+            FakeResponse({'image': 'nginx'}), 'V1Container')
+        self.assertIsNone(container.name)
+        self.assertEqual('nginx', container.image)
+        self.assertRaises(ValueError, kubernetes.client.V1Container)
+
+    def test_from_server_skips_setters(self):
+        with patch.object(kubernetes.client.V1ListMeta, '_continue',
+                          property(lambda self: 'getter')):
+            meta = kubernetes.client.V1ListMeta._from_server(
+                _continue='token', resource_version='1')
+            self.assertEqual('getter', meta._continue)
+        self.assertEqual('token', meta._continue)
+        self.assertEqual({'_continue': 'token', 'resource_version': '1',
+                          'self_link': None}, meta.to_dict())
+        self.assertEqual(kubernetes.client.V1ListMeta(
+            _continue='token', resource_version='1'), meta)
+
+    def test_projection(self):
+        fields = ['metadata.name', 'metadata.labels', 'status.phase',
+                  'spec.containers.image']
+        with patch.object(kubernetes.client.V1ContainerPort,
+                          '__init__') as port_init:
+            pods = self.api_client.deserialize(
+                FakeResponse(POD_LIST), 'V1PodList', fields)
+            self.assertFalse(port_init.called)
+
+        self.assertEqual('10', pods.metadata.resource_version)
+        self.assertEqual('v1', pods.api_version)
+        pod = pods.items[0]
+        self.assertEqual('pod-a', pod.metadata.name)
+        self.assertEqual({'app': 'web'}, pod.metadata.labels)
+        self.assertIsNone(pod.metadata.creation_timestamp)
+        self.assertEqual('Running', pod.status.phase)
+        self.assertEqual('nginx', pod.spec.containers[0].image)
+        self.assertIsNone(pod.spec.containers[0].ports)
+
+        compile_projection = self.api_client._ApiClient__projected_deserializer
+        self.assertIs(compile_projection('V1PodList', fields),
+                      compile_projection('V1PodList', fields))
+
+    def test_projection_by_json_key(self):
+        pod = self.api_client.deserialize(
+            FakeResponse(POD_LIST['items'][0]), 'V1Pod',
+            ['metadata', 'metadata.name',
+             'spec.containers.ports.containerPort'])
+        self.assertEqual(2019, pod.metadata.creation_timestamp.year)
+        self.assertEqual(80, pod.spec.containers[0].ports[0].container_port)
+        self.assertIsNone(pod.spec.containers[0].name)
+        self.assertIsNone(pod.status)
+
+    def test_invalid_projection(self):
+        self.assertRaises(ValueError, self.api_client.deserialize,
+                          FakeResponse({}), 'V1Pod', ['metadata.nme'])
+        self.assertRaises(ValueError, self.api_client.deserialize,
+                          FakeResponse({}), 'V1Pod', ['metadata.name.x'])
+
+    def test_projection_of_lazy_models(self):
+        config = kubernetes.client.Configuration()
+        config.lazy_models = True
+        pod = ApiClient(config).deserialize(
+            FakeResponse(POD_LIST), 'V1PodList', ['metadata.name']).items[0]
+        self.assertEqual('pod-a', pod.metadata.name)
+        self.assertIsNone(pod.metadata.labels)
+        self.assertIsNone(pod.spec)
+        self.assertEqual({'metadata': {'name': 'pod-a'}},
+                         ApiClient().sanitize_for_serialization(pod))
+
+    def test_projection_of_compact_models(self):
+        config = kubernetes.client.Configuration()
+        config.compact_models = True
+        pod = ApiClient(config).deserialize(
+            FakeResponse(POD_LIST), 'V1PodList',
+            ['spec.containers.image']).items[0]
+        self.assertEqual('nginx', pod.spec.containers[0].image)
+        self.assertIsNone(pod.spec.containers[0].name)
+        self.assertIsNone(pod.metadata)
+        self.assertFalse(hasattr(pod.spec.containers[0], '__weakref__'))
+
+    def test_projection_of_calls(self):
+        self.api_client.rest_client = Mock()
+        self.api_client.rest_client.GET.return_value = FakeResponse(POD_LIST)
+        api = kubernetes.client.CoreV1Api(self.api_client)
+        pods = api.list_namespaced_pod('default', _fields=['metadata.name'])
+        self.assertEqual('pod-a', pods.items[0].metadata.name)
+        self.assertIsNone(pods.items[0].status)
+
+
+if __name__ == '__main__':
+    unittest.main()
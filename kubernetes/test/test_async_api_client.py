@@ -0,0 +1,88 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import sys
+import unittest
+
+import mock
+from mock import Mock
+
+import kubernetes.client
+from kubernetes.client.apis.core_v1_api import CoreV1Api
+
+try:
+    import asyncio
+    from kubernetes.client.async_api_client import AsyncApiClient
+    from kubernetes.client.async_rest import AsyncRESTClientObject
+except (ImportError, SyntaxError):
+    AsyncApiClient = None
+
+
+def _resolved(value):
+    future = asyncio.Future()
+    future.set_result(value)
+    return future
+
+
+@unittest.skipIf(AsyncApiClient is None, 'asyncio client requires aiohttp')
+class TestAsyncApiClient(unittest.TestCase):
+    """ AsyncApiClient unit tests """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.api_client = AsyncApiClient()
+        self.api_client.rest_client = Mock()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _response(self, body, status=200):
+        response = Mock()
+        response.status = status
+        response.data = json.dumps(body)
+        response.getheaders = Mock(return_value={})
+        return response
+
+    def test_generated_method_is_awaitable(self):
+        body = {'kind': 'PodList', 'apiVersion': 'v1', 'metadata': {},
+                'items': [{'metadata': {'name': 'pod-a'}},
+                          {'metadata': {'name': 'pod-b'}}]}
+        self.api_client.rest_client.GET = Mock(
+            side_effect=lambda *a, **kw: _resolved(self._response(body)))
+
+        result = CoreV1Api(self.api_client).list_namespaced_pod('default')
+        self.assertTrue(asyncio.iscoroutine(result))
+        pods = self.loop.run_until_complete(result)
+
+        self.assertIsInstance(pods, kubernetes.client.V1PodList)
+        self.assertEqual(['pod-a', 'pod-b'],
+                         [pod.metadata.name for pod in pods.items])
+        url = self.api_client.rest_client.GET.call_args[0][0]
+        self.assertEqual('https://localhost/api/v1/namespaces/default/pods',
+                         url)
+
+    def test_no_blocking_rest_client(self):
+        with mock.patch('kubernetes.client.api_client.RESTClientObject') \
+                as rest_client_class:
+            api_client = AsyncApiClient()
+        rest_client_class.assert_not_called()
+        self.assertIsInstance(api_client.rest_client, AsyncRESTClientObject)
+        self.loop.run_until_complete(api_client.close())
+
+    def test_with_http_info(self):
+        body = {'metadata': {'name': 'ns'}}
+        self.api_client.rest_client.GET = Mock(
+            side_effect=lambda *a, **kw: _resolved(self._response(body)))
+
+        data, status, headers = self.loop.run_until_complete(
+            CoreV1Api(self.api_client).read_namespace_with_http_info('ns'))
+
+        self.assertEqual('ns', data.metadata.name)
+        self.assertEqual(200, status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import copy
+import pickle
+import unittest
+
+from kubernetes.client import (ApiClient, Configuration, V1ObjectMeta, V1Pod,
+                               V1PodList)
+from kubernetes.client.compact import compact_model
+from kubernetes.test.fixtures import POD_LIST, FakeResponse
+
+
+class TestCompactModel(unittest.TestCase):
+    """ compact_model unit tests """
+
+    def test_same_api(self):
+        compact = compact_model(V1ObjectMeta)
+        self.assertIs(compact, compact_model(V1ObjectMeta))
+        meta = compact(name='a', labels={'app': 'web'})
+        self.assertFalse(hasattr(type(meta), '__weakref__'))
+        self.assertIsInstance(meta, V1ObjectMeta)
+        self.assertEqual('a', meta.name)
+        meta.namespace = 'default'
+        self.assertEqual(V1ObjectMeta(name='a', namespace='default',
+                                      labels={'app': 'web'}).to_dict(),
+                         meta.to_dict())
+        self.assertRaises(AttributeError, setattr, meta, 'extra', 1)
+
+    def test_equality(self):
+        compact = compact_model(V1ObjectMeta)(name='a')
+        self.assertEqual(V1ObjectMeta(name='a'), compact)
+        self.assertEqual(compact, V1ObjectMeta(name='a'))
+        self.assertNotEqual(compact, V1ObjectMeta(name='b'))
+        self.assertEqual(repr(V1ObjectMeta(name='a')), repr(compact))
+
+    def test_pickle(self):
+        pod = compact_model(V1Pod)(
+            metadata=compact_model(V1ObjectMeta)(name='a'))
+        for restored in (pickle.loads(pickle.dumps(pod)),
+                         copy.deepcopy(pod)):
+            self.assertIs(compact_model(V1Pod), type(restored))
+            self.assertEqual(pod, restored)
+            self.assertEqual('a', restored.metadata.name)
+
+
+class TestCompactDeserialization(unittest.TestCase):
+    """ compact models are built by clients asking for them """
+
+    def test_deserialize(self):
+        config = Configuration()
+        config.compact_models = True
+        pods = ApiClient(config).deserialize(FakeResponse(POD_LIST),
+                                             'V1PodList')
+        self.assertIs(compact_model(V1PodList), type(pods))
+        self.assertEqual('10', pods.metadata.resource_version)
+        self.assertIsNone(pods.metadata._continue)
+        self.assertIs(compact_model(V1Pod), type(pods.items[0]))
+        self.assertEqual('Running', pods.items[0].status.phase)
+
+        self.assertEqual(pods, ApiClient().deserialize(
+            FakeResponse(POD_LIST), 'V1PodList'))
+        self.assertIs(V1Pod, type(ApiClient().deserialize(
+            FakeResponse(POD_LIST['items'][0]), 'V1Pod')))
+
+
+if __name__ == '__main__':
+    unittest.main()
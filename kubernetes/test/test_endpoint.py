@@ -0,0 +1,130 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import Configuration, CoreV1Api, LogsApi
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.endpoint import Endpoint
+
+
+def pod_endpoint():
+    return Endpoint(
+        'read_namespaced_pod', 'GET',
+        '/api/v1/namespaces/{namespace}/pods/{name}',
+        response_type='V1Pod',
+        required=['name', 'namespace'],
+        path_params=[('name', 'name'), ('namespace', 'namespace')],
+        query_params=[('pretty', 'pretty'), ('exact', 'exact')],
+        accepts=['application/json', 'application/yaml'],
+        content_types=['*/*'])
+
+
+class TestEndpoint(unittest.TestCase):
+    """ Endpoint unit tests """
+
+    def setUp(self):
+        self.api_client = ApiClient(Configuration())
+        self.api_client.call_api = Mock(return_value='result')
+
+    def test_bind(self):
+        endpoint = pod_endpoint()
+        self.assertEqual({'name': 'a', 'namespace': 'b', 'pretty': 'true'},
+                         endpoint.bind(('a', 'b'), {'pretty': 'true'}))
+        with self.assertRaisesRegex(TypeError, "'watch' to method "
+                                    "read_namespaced_pod"):
+            endpoint.bind(('a', 'b'), {'watch': True})
+        with self.assertRaisesRegex(ValueError, "`namespace` when calling "
+                                    "`read_namespaced_pod`"):
+            endpoint.bind(('a', None), {})
+
+    def test_path_mismatch(self):
+        self.assertRaises(ValueError, Endpoint, 'x', 'GET', '/api/{name}')
+
+    def test_resolve_path(self):
+        endpoint = pod_endpoint()
+        params = {'name': 'a/b c', 'namespace': 'ns'}
+        self.assertEqual('/api/v1/namespaces/ns/pods/a%2Fb%20c',
+                         endpoint.resolve_path(params))
+        self.assertEqual('/api/v1/namespaces/ns/pods/a/b%20c',
+                         endpoint.resolve_path(params, '/'))
+
+    def test_call(self):
+        endpoint = pod_endpoint()
+        result = endpoint.call(self.api_client, ('a', 'ns'),
+                               {'exact': True, 'pretty': None,
+                                '_request_timeout': 3})
+        self.assertEqual('result', result)
+        self.api_client.call_api.assert_called_once_with(
+            '/api/v1/namespaces/ns/pods/a', 'GET', None,
+            [('pretty', None), ('exact', True)],
+            {'Accept': 'application/json', 'Content-Type': 'application/json'},
+            body=None, post_params=[], files={}, response_type='V1Pod',
+            auth_settings=['BearerToken'], async_req=None,
+            _return_http_data_only=None, _preload_content=True,
+            _request_timeout=3, collection_formats={}, _fields=None)
+
+    def test_headers_copied(self):
+        endpoint = pod_endpoint()
+        endpoint.call(self.api_client, ('a', 'ns'), {})
+        headers = self.api_client.call_api.call_args[0][4]
+        headers['User-Agent'] = 'test'
+        self.assertNotIn('User-Agent', endpoint.headers(self.api_client))
+
+    def test_headers_without_accepts(self):
+        endpoint = Endpoint('log_file_list_handler', 'GET', '/logs/',
+                            accepts=())
+        self.assertEqual({}, endpoint.headers(self.api_client))
+        LogsApi(self.api_client).log_file_list_handler()
+        self.assertNotIn('Accept', self.api_client.call_api.call_args[0][4])
+
+    def test_headers_per_client_class(self):
+        class YamlApiClient(ApiClient):
+            def select_header_accept(self, accepts):
+                return 'application/yaml'
+
+        endpoint = pod_endpoint()
+        yaml_client = YamlApiClient(Configuration())
+        self.assertEqual('application/yaml',
+                         endpoint.headers(yaml_client)['Accept'])
+        self.assertEqual('application/json',
+                         endpoint.headers(self.api_client)['Accept'])
+        self.assertEqual('application/yaml',
+                         endpoint.headers(yaml_client)['Accept'])
+
+    def test_headers_not_sanitized(self):
+        api_client = ApiClient(Configuration())
+        api_client.request = Mock()
+        api_client.request.return_value.getheaders.return_value = {}
+        api_client.sanitize_for_serialization = Mock(
+            side_effect=api_client.sanitize_for_serialization)
+        CoreV1Api(api_client).read_namespaced_pod(
+            'a', 'ns', _preload_content=False)
+        api_client.sanitize_for_serialization.assert_not_called()
+        headers = api_client.request.call_args[1]['headers']
+        self.assertEqual('application/json', headers['Accept'])
+        self.assertIn('User-Agent', headers)
+
+    def test_generated_method(self):
+        api = CoreV1Api(self.api_client)
+        body = {'metadata': {'name': 'a'}}
+        self.assertEqual('result', api.create_namespaced_pod(
+            'ns', body, pretty='true'))
+        self.api_client.call_api.assert_called_once_with(
+            '/api/v1/namespaces/ns/pods', 'POST', None,
+            [('pretty', 'true')],
+            {'Accept': 'application/json', 'Content-Type': 'application/json'},
+            body=body, post_params=[], files={}, response_type='V1Pod',
+            auth_settings=['BearerToken'], async_req=None,
+            _return_http_data_only=True, _preload_content=True,
+            _request_timeout=None, collection_formats={}, _fields=None)
+        self.assertRaises(TypeError, api.create_namespaced_pod, 'ns', body,
+                          nope=1)
+        self.assertRaises(ValueError, api.create_namespaced_pod, None, body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import gzip
+import io
+import json
+import unittest
+
+import urllib3
+from mock import Mock
+
+from kubernetes.client import Configuration, CoreV1Api
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.rest import RESTClientObject
+
+CONFIG_MAP_LIST = {
+    'kind': 'ConfigMapList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '42'},
+    'items': [{'metadata': {'name': 'cm-%d' % i}, 'data': {'a': 'b' * 100}}
+              for i in range(50)],
+}
+
+
+def gzipped(data):
+    out = io.BytesIO()
+    with gzip.GzipFile(fileobj=out, mode='wb') as f:
+        f.write(data)
+    return out.getvalue()
+
+
+def response(data, preload_content):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(gzipped(data)), status=200,
+        headers={'Content-Encoding': 'gzip',
+                 'Content-Type': 'application/json'},
+        preload_content=preload_content)
+
+
+class TestGzip(unittest.TestCase):
+    """ gzip compression of the responses """
+
+    def setUp(self):
+        self.config = Configuration()
+        self.config.gzip = True
+        self.data = json.dumps(CONFIG_MAP_LIST).encode('utf-8')
+
+    def client(self, preload_content):
+        api_client = ApiClient(self.config)
+        pool_manager = Mock()
+        pool_manager.request.side_effect = \
+            lambda *args, **kwargs: response(self.data, preload_content)
+        api_client.rest_client.pool_manager = pool_manager
+        return api_client, pool_manager
+
+    def accept_encoding(self, pool_manager):
+        return pool_manager.request.call_args[1]['headers'].get(
+            'Accept-Encoding')
+
+    def test_preloaded(self):
+        api_client, pool_manager = self.client(True)
+        result = CoreV1Api(api_client).list_namespaced_config_map('default')
+        self.assertEqual('gzip', self.accept_encoding(pool_manager))
+        self.assertEqual(50, len(result.items))
+        self.assertEqual('b' * 100, result.items[49].data['a'])
+
+    def test_streamed(self):
+        api_client, pool_manager = self.client(False)
+        resp = CoreV1Api(api_client).list_namespaced_config_map(
+            'default', _preload_content=False)
+        self.assertEqual('gzip', self.accept_encoding(pool_manager))
+        chunks = list(resp.stream(256))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(self.data, b''.join(chunks))
+
+        resp = CoreV1Api(api_client).list_namespaced_config_map(
+            'default', _preload_content=False)
+        items = api_client.deserialize_stream(resp, 'V1ConfigMapList')
+        self.assertEqual(['cm-0', 'cm-1'],
+                         [item.metadata.name for item in items][:2])
+
+    def test_watch_not_compressed(self):
+        api_client, pool_manager = self.client(False)
+        api = CoreV1Api(api_client)
+        api.list_namespaced_config_map('default', watch=True,
+                                       _preload_content=False)
+        self.assertIsNone(self.accept_encoding(pool_manager))
+        api.read_namespaced_pod_log('pod', 'default', follow=True,
+                                    _preload_content=False)
+        self.assertIsNone(self.accept_encoding(pool_manager))
+        api.list_namespaced_config_map('default', watch=False,
+                                       _preload_content=False)
+        self.assertEqual('gzip', self.accept_encoding(pool_manager))
+
+    def test_opt_in(self):
+        rest_client = RESTClientObject(Configuration())
+        rest_client.pool_manager = Mock()
+        rest_client.pool_manager.request.return_value = Mock(status=200)
+        rest_client.request('GET', 'https://localhost/api',
+                            _preload_content=False)
+        self.assertIsNone(self.accept_encoding(rest_client.pool_manager))
+
+
+if __name__ == '__main__':
+    unittest.main()
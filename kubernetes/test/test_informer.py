@@ -0,0 +1,278 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from mock import Mock, patch
+
+from kubernetes.client import (Configuration, V1ListMeta, V1ObjectMeta,
+                               V1OwnerReference, V1Pod, V1PodList, V1PodSpec)
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.compact import compact_model
+from kubernetes.utils import (Informer, Store, label_index,
+                              meta_namespace_key, namespace_index,
+                              node_name_index, owner_uid_index)
+from kubernetes.utils.informer import _ClientWatch
+
+
+def pod(name, namespace='default', resource_version='1', node=None,
+        labels=None, owner=None):
+    owners = None
+    if owner:
+        owners = [V1OwnerReference(api_version='v1', kind='ReplicaSet',
+                                   name=owner, uid=owner)]
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels,
+                              owner_references=owners,
+                              resource_version=resource_version),
+        spec=V1PodSpec(containers=[], node_name=node))
+
+
+def event(event_type, name, resource_version, **kwargs):
+    obj = {'metadata': {'name': name, 'namespace': 'default',
+                        'resourceVersion': resource_version}}
+    obj['metadata'].update(kwargs)
+    return {'type': event_type, 'object': obj}
+
+
+class FakeWatchResponse(object):
+
+    def __init__(self, events):
+        self.events = events
+
+    def read_chunked(self, decode_content=True):
+        for e in self.events:
+            yield (json.dumps(e) + '\n').encode('utf8')
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeApi(object):
+
+    def __init__(self, lists, watches, api_client=None):
+        if api_client is not None:
+            self.api_client = api_client
+        self.lists = list(lists)
+        self.watches = list(watches)
+        self.calls = []
+        self.informer = None
+
+    def list_pods(self, **kwargs):
+        """
+        :return: V1PodList
+        """
+        self.calls.append(kwargs)
+        if kwargs.get('watch'):
+            if not self.watches:
+                self.informer.stop()
+                return FakeWatchResponse([])
+            return FakeWatchResponse(self.watches.pop(0))
+        if not self.lists:
+            self.informer.stop()
+            raise AssertionError('unexpected list call')
+        return self.lists.pop(0)
+
+
+class TestStore(unittest.TestCase):
+    """ Store unit tests """
+
+    def setUp(self):
+        self.store = Store(indexers={
+            'namespace': namespace_index,
+            'label': label_index,
+            'node': node_name_index,
+            'owner': owner_uid_index,
+        })
+
+    def test_key(self):
+        self.assertEqual('default/a', meta_namespace_key(pod('a')))
+        self.assertEqual('node-1', meta_namespace_key(
+            {'metadata': {'name': 'node-1'}}))
+
+    def test_indices(self):
+        self.store.add(pod('a', node='n1', labels={'app': 'web'}, owner='rs'))
+        self.store.add(pod('b', node='n2', labels={'app': 'web'}))
+        self.store.add(pod('c', namespace='other', node='n1'))
+
+        def names(index, value):
+            return sorted(p.metadata.name
+                          for p in self.store.by_index(index, value))
+
+        self.assertEqual(['a', 'b'], names('namespace', 'default'))
+        self.assertEqual(['a', 'b'], names('label', 'app=web'))
+        self.assertEqual(['a', 'c'], names('node', 'n1'))
+        self.assertEqual(['a'], names('owner', 'rs'))
+
+        old = self.store.update(pod('a', node='n2', resource_version='2'))
+        self.assertEqual('1', old.metadata.resource_version)
+        self.assertEqual(['c'], names('node', 'n1'))
+        self.assertEqual(['a', 'b'], names('node', 'n2'))
+        self.assertEqual([], names('owner', 'rs'))
+
+        self.store.delete(pod('b'))
+        self.assertEqual(['a'], names('node', 'n2'))
+        self.assertEqual([], names('label', 'app=web'))
+        self.assertEqual(2, len(self.store))
+        self.assertNotIn('rs', self.store.index_values('owner'))
+
+    def test_add_indexer(self):
+        self.store.add(pod('a', node='n1'))
+        self.store.add_indexer('name', lambda p: [p.metadata.name])
+        self.assertEqual(1, len(self.store.by_index('name', 'a')))
+
+    def test_replace(self):
+        self.store.add(pod('a'))
+        self.store.add(pod('b'))
+        added, updated, deleted = self.store.replace(
+            [pod('b', resource_version='2'), pod('c')], '10')
+        self.assertEqual(['c'], [p.metadata.name for p in added])
+        self.assertEqual([('1', '2')],
+                         [(o.metadata.resource_version,
+                           n.metadata.resource_version) for o, n in updated])
+        self.assertEqual(['a'], [p.metadata.name for p in deleted])
+        self.assertEqual(['default/b', 'default/c'], sorted(self.store.keys()))
+        self.assertEqual('10', self.store.resource_version)
+        self.assertEqual([], self.store.by_index('namespace', 'nope'))
+
+
+class TestInformer(unittest.TestCase):
+    """ Informer unit tests """
+
+    def run_informer(self, api, **kwargs):
+        informer = Informer(api.list_pods, indexers={'node': node_name_index},
+                            **kwargs)
+        api.informer = informer
+        self.events = []
+        informer.add_event_handler(
+            on_add=lambda o: self.events.append(
+                ('add', o.metadata.name)),
+            on_update=lambda o, n: self.events.append(
+                ('update', n.metadata.name, n.metadata.resource_version)),
+            on_delete=lambda o: self.events.append(
+                ('delete', o.metadata.name)))
+        informer.run()
+        return informer
+
+    def test_list_then_watch(self):
+        api = FakeApi(
+            [V1PodList(items=[pod('a'), pod('b')],
+                       metadata=V1ListMeta(resource_version='5'))],
+            [[event('ADDED', 'c', '6'),
+              event('MODIFIED', 'a', '7'),
+              event('DELETED', 'b', '8')]])
+        informer = self.run_informer(api, label_selector='app=web')
+
+        self.assertTrue(informer.has_synced())
+        self.assertEqual([('add', 'a'), ('add', 'b'), ('add', 'c'),
+                          ('update', 'a', '7'), ('delete', 'b')],
+                         self.events)
+        self.assertEqual(['default/a', 'default/c'],
+                         sorted(informer.store.keys()))
+        self.assertEqual('8', informer.store.resource_version)
+
+        list_call, watch_call, resumed = api.calls
+        self.assertEqual('app=web', list_call['label_selector'])
+        self.assertNotIn('watch', list_call)
+        self.assertEqual('5', watch_call['resource_version'])
+        self.assertTrue(watch_call['watch'])
+        self.assertEqual('app=web', watch_call['label_selector'])
+        self.assertEqual('8', resumed['resource_version'])
+
+    def test_relist_on_gone(self):
+        gone = {'type': 'ERROR', 'object': {
+            'kind': 'Status', 'code': 410, 'message': 'too old'}}
+        api = FakeApi(
+            [V1PodList(items=[pod('a'), pod('b')],
+                       metadata=V1ListMeta(resource_version='5')),
+             V1PodList(items=[pod('b', resource_version='9')],
+                       metadata=V1ListMeta(resource_version='20'))],
+            [[gone]])
+        informer = self.run_informer(api)
+
+        self.assertEqual([('add', 'a'), ('add', 'b'),
+                          ('update', 'b', '9'), ('delete', 'a')],
+                         self.events)
+        self.assertEqual('20', informer.store.resource_version)
+        self.assertEqual('20', api.calls[-1]['resource_version'])
+
+    def test_watch_decoded_by_api_client(self):
+        config = Configuration()
+        config.compact_models = True
+        api = FakeApi(
+            [V1PodList(items=[], metadata=V1ListMeta(resource_version='5'))],
+            [[event('ADDED', 'c', '6', labels={'app': 'web'})]],
+            api_client=ApiClient(config))
+        informer = self.run_informer(
+            api, _fields=['metadata.name', 'metadata.namespace',
+                          'metadata.resource_version'])
+
+        obj = informer.store.get_by_key('default/c')
+        self.assertIs(compact_model(V1Pod), type(obj))
+        self.assertEqual('6', obj.metadata.resource_version)
+        # outside of the projection
+        self.assertIsNone(obj.metadata.labels)
+
+    def test_client_watch(self):
+        api_client = ApiClient()
+        api_client.deserialize = Mock(wraps=api_client.deserialize)
+        w = _ClientWatch(api_client, ['metadata.name'])
+
+        e = w.unmarshal_event(json.dumps(event('ADDED', 'a', '7')), 'V1Pod')
+        self.assertEqual('a', e['object'].metadata.name)
+        # outside of the projection
+        self.assertIsNone(e['object'].metadata.namespace)
+        self.assertEqual('default', e['raw_object']['metadata']['namespace'])
+        self.assertEqual('7', w.resource_version)
+        self.assertEqual(['metadata.name'],
+                         api_client.deserialize.call_args[0][2])
+        self.assertEqual('not json', w.unmarshal_event('not json', 'V1Pod'))
+
+    def test_watch_events_interned(self):
+        config = Configuration()
+        config.intern_strings = True
+        api = FakeApi(
+            [V1PodList(items=[], metadata=V1ListMeta(resource_version='5'))],
+            [[event('ADDED', 'a', '6', labels={'tier': 'frontend-1'}),
+              event('ADDED', 'b', '7', labels={'tier': 'frontend-1'})]],
+            api_client=ApiClient(config))
+        informer = self.run_informer(api)
+
+        a = informer.store.get_by_key('default/a')
+        b = informer.store.get_by_key('default/b')
+        self.assertIs(a.metadata.labels['tier'], b.metadata.labels['tier'])
+        self.assertIs(a.metadata.namespace, b.metadata.namespace)
+
+    def test_resync(self):
+        now = [0]
+
+        class ClockedApi(FakeApi):
+            def list_pods(self, **kwargs):
+                """
+                :return: V1PodList
+                """
+                if kwargs.get('watch'):
+                    now[0] += kwargs['timeout_seconds']
+                return FakeApi.list_pods(self, **kwargs)
+
+        api = ClockedApi(
+            [V1PodList(items=[pod('a')],
+                       metadata=V1ListMeta(resource_version='5'))],
+            [[], []])
+        with patch('kubernetes.utils.informer._now', lambda: now[0]):
+            self.run_informer(api, resync_period=60)
+
+        # the last watch call stops the informer
+        self.assertEqual([('add', 'a'), ('update', 'a', '1'),
+                          ('update', 'a', '1')], self.events)
+        self.assertEqual([60, 60, 60],
+                         [c['timeout_seconds'] for c in api.calls[1:]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from kubernetes.client import ApiClient, Configuration
+from kubernetes.client.interning import MAX_INTERNED_LENGTH, intern_json
+from kubernetes.test.fixtures import FakeResponse
+
+
+def pod(name):
+    return {'metadata': {'name': name, 'namespace': 'default',
+                         'labels': {'app': 'web'},
+                         'annotations': {'note': 'x' * 200}},
+            'spec': {'containers': [{'name': 'web', 'image': 'nginx'}]}}
+
+
+class TestInterning(unittest.TestCase):
+    """ intern_json unit tests """
+
+    def test_intern_json(self):
+        first = intern_json(json.loads(json.dumps(pod('a'))))
+        second = intern_json(json.loads(json.dumps(pod('b'))))
+        self.assertEqual(pod('a'), first)
+        self.assertIs(first['metadata']['namespace'],
+                      second['metadata']['namespace'])
+        self.assertIs(first['spec']['containers'][0]['image'],
+                      second['spec']['containers'][0]['image'])
+        self.assertIs(intern_json(json.loads('["nginx"]'))[0],
+                      second['spec']['containers'][0]['image'])
+        self.assertIsNot(first['metadata']['labels'],
+                         second['metadata']['labels'])
+        self.assertIsNot(first['metadata']['annotations']['note'],
+                         second['metadata']['annotations']['note'])
+        self.assertEqual(1, intern_json(1))
+
+    def test_max_length(self):
+        self.assertIs(intern_json(json.loads('"%s"' % ('a' * 128))),
+                      intern_json(json.loads('"%s"' % ('a' * 128))))
+        long_string = 'a' * (MAX_INTERNED_LENGTH + 1)
+        self.assertIsNot(intern_json(json.loads('"%s"' % long_string)),
+                         intern_json(json.loads('"%s"' % long_string)))
+
+    def test_api_client(self):
+        config = Configuration()
+        config.intern_strings = True
+        api_client = ApiClient(config)
+        pods = [api_client.deserialize(FakeResponse(pod(name)), 'V1Pod')
+                for name in ('a', 'b')]
+        self.assertIs(pods[0].metadata.labels['app'],
+                      pods[1].metadata.labels['app'])
+        self.assertIs(list(pods[0].metadata.labels)[0],
+                      list(pods[1].metadata.labels)[0])
+
+        projected = api_client.deserialize(
+            FakeResponse(pod('a')), 'V1Pod', ['metadata.namespace'])
+        self.assertIs(pods[0].metadata.namespace, projected.metadata.namespace)
+
+        config.lazy_models = True
+        lazy = ApiClient(config).deserialize(FakeResponse(pod('c')), 'V1Pod')
+        self.assertIs(pods[0].metadata.namespace,
+                      lazy._raw['metadata']['namespace'])
+        self.assertIs(pods[0].spec.containers[0].image,
+                      lazy.spec.containers[0].image)
+
+        pods = [ApiClient().deserialize(FakeResponse(pod(name)), 'V1Pod')
+                for name in ('a', 'b')]
+        self.assertIsNot(pods[0].spec.containers[0].image,
+                         pods[1].spec.containers[0].image)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+from datetime import datetime
+
+from mock import Mock
+
+from kubernetes.client import (ApiClient, Configuration, V1Container,
+                               V1Deployment, V1DeploymentSpec,
+                               V1LabelSelector, V1ObjectMeta,
+                               V1PodTemplateSpec, V1PodSpec)
+from kubernetes.client.json_codec import (JSONCodec, OrjsonCodec,
+                                          default_json_codec, json_codec_for)
+from kubernetes.client.rest import ApiException, RESTClientObject
+from kubernetes.test.fixtures import FakeResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TestJSONCodec(unittest.TestCase):
+    """ JSONCodec unit tests """
+
+    def test_stdlib(self):
+        codec = JSONCodec()
+        self.assertEqual({'a': [1]}, codec.loads(b'{"a": [1]}'))
+        self.assertEqual({'a': [1]}, codec.loads(u'{"a": [1]}'))
+        self.assertEqual({'a': 1}, json.loads(codec.dumps({'a': 1})))
+        self.assertRaises(ValueError, codec.loads, b'not json')
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        codec = OrjsonCodec()
+        self.assertEqual({'a': u'é'},
+                         codec.loads(u'{"a": "é"}'.encode('utf8')))
+        self.assertEqual(b'{"a":1}', codec.dumps({'a': 1}))
+        self.assertRaises(ValueError, codec.loads, b'not json')
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_falls_back(self):
+        codec = OrjsonCodec()
+        self.assertEqual({'n': 2 ** 70}, codec.loads(b'{"n": %d}' % 2 ** 70))
+        self.assertEqual({'1': 2}, json.loads(codec.dumps({1: 2})))
+
+    def test_default(self):
+        codec = default_json_codec()
+        self.assertIs(codec, default_json_codec())
+        self.assertEqual('json' if orjson is None else 'orjson', codec.name)
+
+        config = Configuration()
+        self.assertIs(codec, json_codec_for(config))
+        config.json_codec = JSONCodec()
+        self.assertIs(config.json_codec, json_codec_for(config))
+        self.assertIs(config.json_codec, ApiClient(config).json_codec)
+        self.assertIs(config.json_codec, RESTClientObject(config).json_codec)
+
+
+def deployment():
+    return V1Deployment(
+        api_version='apps/v1', kind='Deployment',
+        metadata=V1ObjectMeta(
+            name='web', labels={'app': 'web'},
+            creation_timestamp=datetime(2019, 5, 1, 12, 30, 15, 20)),
+        spec=V1DeploymentSpec(
+            replicas=2,
+            selector=V1LabelSelector(match_labels={'app': 'web'}),
+            template=V1PodTemplateSpec(spec=V1PodSpec(containers=[
+                V1Container(name='web', image='nginx', args=('-g', 'x')),
+                V1Container(name='log', image='busybox')]))))
+
+
+DEPLOYMENT = {
+    'apiVersion': 'apps/v1', 'kind': 'Deployment',
+    'metadata': {'name': 'web', 'labels': {'app': 'web'},
+                 'creationTimestamp': '2019-05-01T12:30:15.000020'},
+    'spec': {
+        'replicas': 2,
+        'selector': {'matchLabels': {'app': 'web'}},
+        'template': {'spec': {'containers': [
+            {'name': 'web', 'image': 'nginx', 'args': ['-g', 'x']},
+            {'name': 'log', 'image': 'busybox'}]}}}}
+
+
+class TestModelEncoding(unittest.TestCase):
+    """ Models are encoded by the codecs without being sanitized """
+
+    def test_sanitize(self):
+        self.assertEqual(DEPLOYMENT, json.loads(json.dumps(
+            ApiClient().sanitize_for_serialization(deployment()))))
+
+    def test_stdlib(self):
+        self.assertEqual(DEPLOYMENT,
+                         json.loads(JSONCodec().dumps(deployment())))
+        self.assertEqual([DEPLOYMENT, 1], json.loads(
+            JSONCodec().dumps([deployment(), 1])))
+        self.assertRaises(TypeError, JSONCodec().dumps, object())
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson(self):
+        self.assertEqual(DEPLOYMENT,
+                         json.loads(OrjsonCodec().dumps(deployment())))
+        body = {'spec': deployment().spec, 'n': 2 ** 70}
+        self.assertEqual(2 ** 70, json.loads(OrjsonCodec().dumps(body))['n'])
+
+    def test_prepare_request(self):
+        body = deployment()
+        api_client = ApiClient()
+        self.assertIs(body, api_client.prepare_request('/', body=body)[4])
+
+        config = Configuration()
+        config.json_codec = Mock(spec=['dumps', 'loads'])
+        api_client = ApiClient(config)
+        self.assertEqual(api_client.sanitize_for_serialization(body),
+                         api_client.prepare_request('/', body=body)[4])
+
+
+class TestResponseBytes(unittest.TestCase):
+    """ Response bodies are decoded from bytes """
+
+    def setUp(self):
+        self.config = Configuration()
+        self.config.json_codec = Mock(wraps=JSONCodec())
+        self.api_client = ApiClient(self.config)
+
+    def test_deserialize_bytes(self):
+        ns = self.api_client.deserialize(
+            FakeResponse(b'{"metadata": {"name": "ns"}}'), 'V1Namespace')
+        self.assertEqual('ns', ns.metadata.name)
+        self.config.json_codec.loads.assert_called_once_with(
+            b'{"metadata": {"name": "ns"}}')
+
+    def test_deserialize_text(self):
+        log = self.api_client.deserialize(FakeResponse(b'line 1\n'), 'str')
+        self.assertEqual(u'line 1\n', log)
+
+    def test_request_keeps_bytes(self):
+        rest_client = RESTClientObject(self.config)
+        rest_client.pool_manager = Mock()
+        rest_client.pool_manager.request.return_value = Mock(
+            status=200, reason='OK', data=b'{}')
+        r = rest_client.request('POST', 'http://h/', body={'a': 1})
+        self.assertEqual(b'{}', r.data)
+        self.config.json_codec.dumps.assert_called_once_with({'a': 1})
+
+    def test_exception_body_is_text(self):
+        e = ApiException(http_resp=Mock(status=404, reason='Not Found',
+                                        data=b'{"code": 404}'))
+        self.assertEqual(u'{"code": 404}', e.body)
+
+
+if __name__ == '__main__':
+    unittest.main()
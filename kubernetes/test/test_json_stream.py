@@ -0,0 +1,85 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from mock import Mock
+
+import kubernetes.client
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.json_stream import iter_list_items
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+POD_LIST = {
+    'kind': 'PodList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '42'},
+    'items': [
+        {'metadata': {'name': u'pöd-%d' % i},
+         'spec': {'containers': [{'name': 'c', 'image': 'nginx'}],
+                  'priority': 1234567}}
+        for i in range(20)],
+}
+
+
+class TestJsonStream(unittest.TestCase):
+    """ incremental list decoding unit tests """
+
+    def test_chunk_boundaries(self):
+        data = json.dumps(POD_LIST, ensure_ascii=False).encode('utf-8')
+        for size in (1, 3, 7, 64, len(data)):
+            fields = {}
+            items = list(iter_list_items(chunked(data, size), fields))
+            self.assertEqual(POD_LIST['items'], items, size)
+            self.assertEqual(POD_LIST['metadata'], fields['metadata'])
+            self.assertEqual('PodList', fields['kind'])
+
+    def test_scalars_and_trailing_fields(self):
+        data = b'{"items": [1, 22, 333, "x", null] , "metadata": {"a": 1}}'
+        fields = {}
+        items = list(iter_list_items(chunked(data, 2), fields))
+        self.assertEqual([1, 22, 333, 'x', None], items)
+        self.assertEqual({'a': 1}, fields['metadata'])
+
+    def test_empty(self):
+        self.assertEqual([], list(iter_list_items([b'{}'])))
+        self.assertEqual([], list(iter_list_items([b'{"items": []}'])))
+        self.assertEqual([], list(iter_list_items([b'{"items": null}'])))
+
+    def test_truncated(self):
+        data = json.dumps(POD_LIST).encode('utf-8')[:-30]
+        self.assertRaises(ValueError, list,
+                          iter_list_items(chunked(data, 100)))
+
+    def test_deserialize_stream(self):
+        data = json.dumps(POD_LIST).encode('utf-8')
+        response = Mock()
+        response.stream = Mock(return_value=iter(chunked(data, 50)))
+
+        stream = ApiClient().deserialize_stream(response, 'V1PodList')
+        pods = list(stream)
+
+        self.assertEqual(20, len(pods))
+        self.assertIsInstance(pods[0], kubernetes.client.V1Pod)
+        self.assertEqual(u'pöd-3', pods[3].metadata.name)
+        self.assertEqual(1234567, pods[3].spec.priority)
+        self.assertEqual('42', stream.metadata.resource_version)
+        self.assertTrue(response.release_conn.called)
+
+    def test_deserialize_stream_object(self):
+        response = Mock()
+        response.stream = Mock(return_value=iter(
+            [b'{"items": [{"spec": {"a": 1}}]}']))
+
+        items = list(ApiClient().deserialize_stream(response, 'object'))
+        self.assertEqual([{'spec': {'a': 1}}], items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import subprocess
+import sys
+import unittest
+
+import kubernetes.client
+from kubernetes.client import apis, models
+
+
+class TestLazyImport(unittest.TestCase):
+    """ lazy import of the generated packages unit tests """
+
+    def test_exports(self):
+        self.assertIn('V1Pod', models.__all__)
+        self.assertIn('CoreV1Api', apis.__all__)
+        self.assertIs(models.V1Pod, kubernetes.client.V1Pod)
+        self.assertIs(apis.CoreV1Api, kubernetes.client.CoreV1Api)
+        self.assertEqual('V1Pod', getattr(models, 'V1Pod').__name__)
+
+    def test_submodule_attribute(self):
+        self.assertIs(models.V1Pod, models.v1_pod.V1Pod)
+
+    def test_unknown_name(self):
+        self.assertFalse(hasattr(models, 'V1DoesNotExist'))
+        self.assertRaises(AttributeError, getattr, kubernetes.client,
+                          'V1DoesNotExist')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires PEP 562')
+    def test_import_is_deferred(self):
+        code = ('import sys, kubernetes.client\n'
+                'assert "kubernetes.client.models.v1_pod" not in sys.modules\n'
+                'kubernetes.client.V1Pod\n'
+                'assert "kubernetes.client.models.v1_pod" in sys.modules\n'
+                'assert "kubernetes.client.apis.core_v1_api" not in '
+                'sys.modules\n')
+        subprocess.check_call([sys.executable, '-c', code])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import copy
+import json
+import pickle
+import unittest
+from datetime import datetime
+
+from mock import patch
+
+from kubernetes.client import (ApiClient, Configuration, V1Container,
+                               V1ObjectMeta, V1Pod, V1PodList)
+from kubernetes.client.json_codec import JSONCodec
+from kubernetes.test.fixtures import POD_LIST, FakeResponse
+
+
+def lazy_client():
+    config = Configuration()
+    config.lazy_models = True
+    return ApiClient(config)
+
+
+class TestLazyModel(unittest.TestCase):
+    """ lazy models unit tests """
+
+    def setUp(self):
+        self.pods = lazy_client().deserialize(FakeResponse(POD_LIST),
+                                              'V1PodList')
+        self.pod = self.pods.items[0]
+
+    def test_same_api(self):
+        self.assertIsInstance(self.pods, V1PodList)
+        self.assertIsInstance(self.pod, V1Pod)
+        self.assertEqual('pod-a', self.pod.metadata.name)
+        self.assertEqual(datetime, type(self.pod.metadata.creation_timestamp))
+        self.assertEqual('nginx', self.pod.spec.containers[0].image)
+        self.assertIsNone(self.pod.api_version)
+        self.assertRaises(AttributeError, setattr, self.pod, 'extra', 1)
+
+    def test_deserialized_on_access(self):
+        with patch.object(V1Container, '__init__') as init:
+            self.assertEqual('Running', self.pod.status.phase)
+            self.assertEqual({'app': 'web'}, self.pod.metadata.labels)
+            self.assertNotIn('_spec', self.pod._values)
+            self.assertIs(self.pod.metadata, self.pod.metadata)
+            self.assertFalse(init.called)
+
+    def test_equality(self):
+        eager = ApiClient().deserialize(FakeResponse(POD_LIST), 'V1PodList')
+        self.assertEqual(eager.to_dict(), self.pods.to_dict())
+        # to_dict keeps the lazy models unread
+        self.assertEqual({}, self.pod._values)
+        self.assertEqual(eager, self.pods)
+        self.assertEqual(self.pods, eager)
+
+    def test_update(self):
+        self.pod.metadata.name = 'b'
+        self.pod.status = None
+        self.assertRaises(ValueError, setattr, self.pod.spec, 'containers',
+                          None)
+        expected = copy.deepcopy(POD_LIST['items'][0])
+        expected['metadata']['name'] = 'b'
+        # read, the unknown fields of the metadata are dropped
+        del expected['metadata']['unknownField']
+        del expected['status']
+        self.assertEqual(expected, json.loads(JSONCodec().dumps(self.pod)))
+        self.assertEqual('b', ApiClient().sanitize_for_serialization(
+            self.pod)['metadata']['name'])
+
+    def test_constructor(self):
+        meta = self.pod.metadata.__class__
+        lazy_meta = type(self.pod.metadata)
+        self.assertIs(V1ObjectMeta, meta)
+        created = lazy_meta(name='c')
+        self.assertEqual(V1ObjectMeta(name='c'), created)
+        self.assertEqual({'name': 'c'}, created._json_fields())
+
+    def test_pickle(self):
+        for restored in (pickle.loads(pickle.dumps(self.pod)),
+                         copy.deepcopy(self.pod)):
+            self.assertIs(V1Pod, type(restored))
+            self.assertEqual(self.pod, restored)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import io
+import json
+import socket
+import unittest
+
+import urllib3
+from mock import Mock
+
+from kubernetes.client import Configuration, CoreV1Api, V1ConfigMap
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.metrics import (PHASES, Histogram, HistogramSink,
+                                       RequestMetrics, current, resource_of,
+                                       set_current, verb_of)
+from kubernetes.client.rest import ApiException
+from kubernetes.client.transport import (InstrumentedHTTPConnectionPool,
+                                         TimedHTTPConnection)
+
+CONFIG_MAP_LIST = {
+    'kind': 'ConfigMapList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '42'},
+    'items': [{'metadata': {'name': 'cm-%d' % i}} for i in range(3)],
+}
+
+
+class TestPaths(unittest.TestCase):
+    """ verb and resource of the paths """
+
+    def test_resource_of(self):
+        for path, resource in [
+                ('/api/v1/namespaces/{namespace}/pods', 'pods'),
+                ('/api/v1/namespaces/{namespace}/pods/{name}/log',
+                 'pods/log'),
+                ('/api/v1/pods', 'pods'),
+                ('/api/v1/namespaces', 'namespaces'),
+                ('/api/v1/namespaces/{name}', 'namespaces'),
+                ('/api/v1/namespaces/{name}/status', 'namespaces/status'),
+                ('/apis/apps/v1/namespaces/{namespace}/deployments/{name}'
+                 '/scale', 'deployments.apps/scale'),
+                ('/api/v1/watch/namespaces/{namespace}/pods', 'pods'),
+                ('/version/', '/version/'),
+                ('/apis/apps/', '/apis/apps/')]:
+            self.assertEqual(resource, resource_of(path), path)
+
+    def test_verb_of(self):
+        pods = '/api/v1/namespaces/{namespace}/pods'
+        pod = pods + '/{name}'
+        self.assertEqual('list', verb_of('GET', pods, []))
+        self.assertEqual('list', verb_of('GET', pods, [('watch', False)]))
+        self.assertEqual('watch', verb_of('GET', pods, [('watch', True)]))
+        self.assertEqual('watch',
+                         verb_of('GET', '/api/v1/watch/namespaces/a/pods'))
+        self.assertEqual('get', verb_of('GET', pod))
+        self.assertEqual('create', verb_of('POST', pods))
+        self.assertEqual('update', verb_of('PUT', pod))
+        self.assertEqual('patch', verb_of('PATCH', pod))
+        self.assertEqual('delete', verb_of('DELETE', pod))
+        self.assertEqual('deletecollection', verb_of('DELETE', pods))
+        self.assertEqual('get', verb_of('GET', '/version/'))
+
+
+class TestHistogram(unittest.TestCase):
+    """ Histogram and HistogramSink unit tests """
+
+    def test_histogram(self):
+        histogram = Histogram([1, 2, 4])
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in [0.5, 1, 1.5, 3, 10]:
+            histogram.observe(value)
+        self.assertEqual([2, 1, 1, 1], histogram.counts)
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(3.2, histogram.mean)
+        self.assertEqual(1, histogram.quantile(0.4))
+        self.assertEqual(4, histogram.quantile(0.8))
+        self.assertEqual(float('inf'), histogram.quantile(0.99))
+
+    def test_sink(self):
+        sink = HistogramSink()
+        for status, seconds in [(200, 0.002), (200, 0.2), (404, 0.003)]:
+            metrics = RequestMetrics('get', 'pods', 'GET', '/api/v1/pods')
+            metrics.add('server', seconds)
+            metrics.response_bytes = 1000
+            metrics.finish(status)
+            sink.observe(metrics)
+
+        histograms = sink.snapshot()[('get', 'pods')]
+        self.assertEqual(set(('duration', 'request_bytes', 'response_bytes')
+                             + PHASES), set(histograms))
+        self.assertEqual(3, histograms['duration'].count)
+        self.assertEqual(3, histograms['server'].count)
+        self.assertEqual(0.25, histograms['server'].quantile(0.9))
+        self.assertEqual(0, histograms['read'].count)
+        self.assertEqual(0, histograms['request_bytes'].count)
+        self.assertEqual(1024, histograms['response_bytes'].quantile(1))
+        self.assertEqual({('get', 'pods'): {200: 2, 404: 1}},
+                         sink.statuses())
+
+        # a copy
+        histograms['server'].observe(1)
+        self.assertEqual(3, sink.snapshot()[('get', 'pods')]['server'].count)
+
+
+class TestCallMetrics(unittest.TestCase):
+    """ metrics of the calls of ApiClient """
+
+    def setUp(self):
+        self.sink = HistogramSink()
+        self.config = Configuration()
+        self.config.metrics_sink = self.sink
+
+    def client(self, status=200, body=CONFIG_MAP_LIST):
+        api_client = ApiClient(self.config)
+        pool_manager = Mock()
+        data = json.dumps(body).encode('utf-8')
+        pool_manager.request.side_effect = \
+            lambda *args, **kwargs: urllib3.HTTPResponse(
+                body=io.BytesIO(data), status=status,
+                headers={'Content-Type': 'application/json'},
+                preload_content=kwargs['preload_content'])
+        api_client.rest_client.pool_manager = pool_manager
+        return api_client, pool_manager, data
+
+    def test_phases(self):
+        api_client, pool_manager, data = self.client()
+        result = CoreV1Api(api_client).list_namespaced_config_map('default')
+        self.assertEqual(3, len(result.items))
+        # read apart from the headers
+        self.assertFalse(pool_manager.request.call_args[1]['preload_content'])
+        self.assertIsNone(current())
+
+        histograms = self.sink.snapshot()[('list', 'configmaps')]
+        for phase in ('duration', 'sanitize', 'server', 'read', 'decode',
+                      'deserialize'):
+            self.assertEqual(1, histograms[phase].count, phase)
+        for phase in ('throttle', 'acquire', 'connect'):
+            self.assertEqual(0, histograms[phase].count, phase)
+        self.assertEqual(len(data), histograms['response_bytes'].sum)
+        self.assertEqual({('list', 'configmaps'): {200: 1}},
+                         self.sink.statuses())
+
+    def test_callable_sink(self):
+        observed = []
+        self.config.metrics_sink = observed.append
+        api_client, _, _ = self.client(body={'metadata': {'name': 'a'}})
+        CoreV1Api(api_client).create_namespaced_config_map(
+            'default', V1ConfigMap(data={'a': 'b'}))
+        metrics, = observed
+        self.assertEqual(('create', 'configmaps', 'POST', 200),
+                         (metrics.verb, metrics.resource, metrics.method,
+                          metrics.status))
+        self.assertEqual(
+            len(api_client.rest_client.json_codec.dumps({'data': {'a': 'b'}})),
+            metrics.request_bytes)
+        self.assertGreaterEqual(metrics.duration, sum(metrics.phases.values()))
+
+    def test_error(self):
+        api_client, _, _ = self.client(status=404, body={'kind': 'Status'})
+        with self.assertRaises(ApiException):
+            CoreV1Api(api_client).read_namespaced_config_map('a', 'default')
+        self.assertIsNone(current())
+        self.assertEqual({('get', 'configmaps'): {404: 1}},
+                         self.sink.statuses())
+
+    def test_streamed(self):
+        api_client, pool_manager, _ = self.client()
+        resp = CoreV1Api(api_client).list_namespaced_config_map(
+            'default', _preload_content=False)
+        self.assertFalse(pool_manager.request.call_args[1]['preload_content'])
+        self.assertEqual(CONFIG_MAP_LIST, json.loads(resp.read()))
+        histograms = self.sink.snapshot()[('list', 'configmaps')]
+        self.assertEqual(1, histograms['server'].count)
+        self.assertEqual(0, histograms['read'].count)
+        self.assertEqual(0, histograms['response_bytes'].count)
+
+    def test_disabled(self):
+        self.config.metrics_sink = None
+        api_client, pool_manager, _ = self.client()
+        CoreV1Api(api_client).list_namespaced_config_map('default')
+        self.assertTrue(pool_manager.request.call_args[1]['preload_content'])
+
+
+class TestTransportMetrics(unittest.TestCase):
+    """ timing of the connections """
+
+    def setUp(self):
+        self.metrics = RequestMetrics('get', 'pods', 'GET', '/api/v1/pods')
+        set_current(self.metrics)
+
+    def tearDown(self):
+        set_current(None)
+
+    def test_acquire(self):
+        pool = InstrumentedHTTPConnectionPool('localhost')
+        pool._get_conn()
+        self.assertIn('acquire', self.metrics.phases)
+        self.assertNotIn('connect', self.metrics.phases)
+
+    def test_connect(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        try:
+            conn = TimedHTTPConnection('127.0.0.1', server.getsockname()[1])
+            conn.connect()
+            conn.close()
+        finally:
+            server.close()
+        self.assertIn('connect', self.metrics.phases)
+
+    def test_sink_pools(self):
+        config = Configuration()
+        config.metrics_sink = HistogramSink()
+        manager = ApiClient(config).rest_client.pool_manager
+        self.assertIsInstance(manager.connection_from_url('http://a'),
+                              InstrumentedHTTPConnectionPool)
+
+
+if __name__ == '__main__':
+    unittest.main()
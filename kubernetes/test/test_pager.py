@@ -0,0 +1,110 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import V1ListMeta, V1ObjectMeta, V1Pod, V1PodList
+from kubernetes.client.rest import ApiException
+from kubernetes.utils import ListPager
+
+
+def pod_list(names, token=None, resource_version='1'):
+    return V1PodList(
+        items=[V1Pod(metadata=V1ObjectMeta(name=name)) for name in names],
+        metadata=V1ListMeta(_continue=token,
+                            resource_version=resource_version))
+
+
+class FakeThread(object):
+
+    def __init__(self, func, kwargs):
+        self.func = func
+        self.kwargs = kwargs
+
+    def get(self):
+        return self.func(**self.kwargs)
+
+
+class TestListPager(unittest.TestCase):
+    """ ListPager unit tests """
+
+    def setUp(self):
+        self.pages = {
+            None: pod_list(['a', 'b'], token='t1', resource_version='7'),
+            't1': pod_list(['c', 'd'], token='t2', resource_version='8'),
+            't2': pod_list(['e']),
+        }
+        self.calls = []
+        self.requested = []
+
+    def list_pods(self, **kwargs):
+        self.calls.append(kwargs)
+        token = kwargs.get('_continue')
+        if isinstance(self.pages[token], Exception):
+            raise self.pages[token]
+        return self.pages[token]
+
+    def async_list_pods(self, async_req=False, **kwargs):
+        self.assertTrue(async_req)
+        self.requested.append(kwargs.get('_continue'))
+        return FakeThread(self.list_pods, kwargs)
+
+    def test_items(self):
+        pager = ListPager(limit=2, prefetch=False)
+        names = [pod.metadata.name for pod in
+                 pager.items(self.list_pods, label_selector='app=web')]
+
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'], names)
+        self.assertEqual([None, 't1', 't2'],
+                         [c.get('_continue') for c in self.calls])
+        for call in self.calls:
+            self.assertEqual(2, call['limit'])
+            self.assertEqual('app=web', call['label_selector'])
+        self.assertEqual('7', pager.resource_version)
+
+    def test_prefetch(self):
+        pager = ListPager(limit=2)
+        pages = pager.pages(self.async_list_pods)
+
+        next(pages)
+        # the second page is already requested
+        self.assertEqual([None, 't1'], self.requested)
+        self.assertEqual(['c', 'd'],
+                         [pod.metadata.name for pod in next(pages).items])
+        self.assertEqual(1, len(list(pages)))
+
+    def test_expired_continue_token(self):
+        expired = ApiException(status=410, reason='Gone')
+        expired.body = json.dumps({'kind': 'Status', 'code': 410,
+                                   'metadata': {'continue': 't2'}})
+        self.pages['t1'] = expired
+        names = [pod.metadata.name for pod in
+                 ListPager(prefetch=False).items(self.list_pods)]
+
+        self.assertEqual(['a', 'b', 'e'], names)
+
+    def test_expired_without_token(self):
+        self.pages['t1'] = ApiException(status=410, reason='Gone')
+        items = ListPager(prefetch=False).items(self.list_pods)
+        self.assertRaises(ApiException, list, items)
+
+    def test_custom_objects(self):
+        pages = {
+            None: {'items': [{'name': 'x'}], 'metadata': {'continue': 'n'}},
+            'n': {'items': [{'name': 'y'}], 'metadata': {}},
+        }
+        func = Mock(side_effect=lambda *a, **kw: pages[kw.get('_continue')])
+
+        items = list(ListPager(prefetch=False).items(
+            func, 'example.com', 'v1', 'foos'))
+
+        self.assertEqual([{'name': 'x'}, {'name': 'y'}], items)
+        self.assertEqual(('example.com', 'v1', 'foos'), func.call_args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import copy
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import (ApiClient, Configuration, CoreV1Api,
+                               V1ConfigMap, V1Container, V1ObjectMeta,
+                               V1Pod, V1PodSpec)
+from kubernetes.utils import JsonPatch, MergePatch, json_patch, merge_patch
+
+
+def config_map():
+    return V1ConfigMap(
+        metadata=V1ObjectMeta(name='settings', resource_version='7',
+                              annotations={'a/b': 'x'}),
+        data={'level': 'info', 'size': '3'})
+
+
+class TestMergePatch(unittest.TestCase):
+    """ merge_patch unit tests """
+
+    def test_changes_only(self):
+        original = config_map()
+        modified = copy.deepcopy(original)
+        modified.data['level'] = 'debug'
+        del modified.data['size']
+        modified.metadata.labels = {'app': 'web'}
+
+        patch = merge_patch(original, modified)
+        self.assertIsInstance(patch, MergePatch)
+        self.assertEqual({'data': {'level': 'debug', 'size': None},
+                          'metadata': {'labels': {'app': 'web'}}}, patch)
+
+    def test_equal(self):
+        self.assertEqual({}, merge_patch(config_map(), config_map()))
+
+    def test_lists_and_types(self):
+        original = {'spec': {'ports': [1, 2], 'flag': 1, 'gone': {'a': 1}}}
+        modified = {'spec': {'ports': [1, 3], 'flag': True}}
+        self.assertEqual({'spec': {'ports': [1, 3], 'flag': True,
+                                   'gone': None}},
+                         merge_patch(original, modified))
+
+    def test_models_and_dicts(self):
+        original = config_map()
+        modified = ApiClient().sanitize_for_serialization(original)
+        modified['data']['level'] = 'debug'
+        self.assertEqual({'data': {'level': 'debug'}},
+                         merge_patch(original, modified))
+
+    def test_not_objects(self):
+        self.assertRaises(TypeError, merge_patch, [1], [2])
+
+
+class TestJsonPatch(unittest.TestCase):
+    """ json_patch unit tests """
+
+    def test_operations(self):
+        original = config_map()
+        modified = copy.deepcopy(original)
+        modified.data['level'] = 'debug'
+        modified.data['color'] = 'blue'
+        del modified.data['size']
+        modified.metadata.annotations['a/b'] = 'y'
+
+        patch = json_patch(original, modified)
+        self.assertIsInstance(patch, JsonPatch)
+        self.assertEqual([
+            {'op': 'remove', 'path': '/data/size'},
+            {'op': 'add', 'path': '/data/color', 'value': 'blue'},
+            {'op': 'replace', 'path': '/data/level', 'value': 'debug'},
+            {'op': 'replace', 'path': '/metadata/annotations/a~1b',
+             'value': 'y'},
+        ], patch)
+
+    def test_lists(self):
+        original = V1Pod(spec=V1PodSpec(containers=[
+            V1Container(name='a', image='a:1'),
+            V1Container(name='b'), V1Container(name='c')]))
+        modified = copy.deepcopy(original)
+        modified.spec.containers[0].image = 'a:2'
+        del modified.spec.containers[1:]
+        self.assertEqual([
+            {'op': 'replace', 'path': '/spec/containers/0/image',
+             'value': 'a:2'},
+            {'op': 'remove', 'path': '/spec/containers/2'},
+            {'op': 'remove', 'path': '/spec/containers/1'},
+        ], json_patch(original, modified))
+
+        self.assertEqual([
+            {'op': 'add', 'path': '/spec/containers/-',
+             'value': {'name': 'b'}},
+            {'op': 'add', 'path': '/spec/containers/-',
+             'value': {'name': 'c'}},
+        ], json_patch(modified, {'spec': {'containers': [
+            {'name': 'a', 'image': 'a:2'}, {'name': 'b'}, {'name': 'c'}]}}))
+
+    def test_equal(self):
+        self.assertEqual([], json_patch(config_map(), config_map()))
+
+
+class TestPatchCalls(unittest.TestCase):
+    """ patches sent through the generated methods """
+
+    def setUp(self):
+        self.api_client = ApiClient(Configuration())
+        self.api_client.call_api = Mock()
+        self.api = CoreV1Api(self.api_client)
+
+    def content_type(self):
+        return self.api_client.call_api.call_args[0][4]['Content-Type']
+
+    def test_merge_patch(self):
+        patch = merge_patch({'data': {'a': '1'}}, {'data': {'a': '2'}})
+        self.api.patch_namespaced_config_map('settings', 'default', patch)
+        self.assertEqual('application/merge-patch+json', self.content_type())
+
+    def test_json_patch(self):
+        patch = json_patch({'data': {'a': '1'}}, {'data': {'a': '2'}})
+        self.api.patch_namespaced_config_map('settings', 'default', patch)
+        self.assertEqual('application/json-patch+json', self.content_type())
+
+    def test_strategic_merge_patch(self):
+        # rest.py sends the plain dicts as strategic merge patches
+        self.api.patch_namespaced_config_map('settings', 'default',
+                                             {'data': {'a': '2'}})
+        self.assertEqual('application/json-patch+json', self.content_type())
+
+    def test_unsupported_media_type(self):
+        self.api.create_namespaced_config_map('default', MergePatch())
+        self.assertEqual('application/json', self.content_type())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from kubernetes.client import Configuration
+from kubernetes.client.rate_limit import (TokenBucketRateLimiter,
+                                          rate_limiter_for)
+from kubernetes.client.rest import RESTClientObject
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    """ TokenBucketRateLimiter unit tests """
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_burst_then_spaced(self):
+        limiter = TokenBucketRateLimiter(10, burst=3, clock=self.clock)
+        delays = [limiter.reserve() for _ in range(5)]
+        self.assertEqual([0.0, 0.0, 0.0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3])
+        self.assertAlmostEqual(0.2, delays[4])
+
+    def test_refill(self):
+        limiter = TokenBucketRateLimiter(2, burst=2, clock=self.clock)
+        limiter.reserve()
+        limiter.reserve()
+        self.clock.now += 0.5
+        self.assertEqual(0.0, limiter.reserve())
+        self.assertAlmostEqual(0.5, limiter.reserve())
+        # the bucket never holds more than burst tokens
+        self.clock.now += 60
+        self.assertEqual([0.0, 0.0], [limiter.reserve(), limiter.reserve()])
+        self.assertGreater(limiter.reserve(), 0)
+
+    def test_shared_between_threads(self):
+        limiter = TokenBucketRateLimiter(100, burst=1, clock=self.clock)
+        delays = []
+
+        def worker():
+            for _ in range(50):
+                delays.append(limiter.reserve())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertAlmostEqual(1.99, max(delays))
+        self.assertEqual(200, len(set(round(d, 6) for d in delays)))
+
+    def test_configuration(self):
+        config = Configuration()
+        self.assertIsNone(rate_limiter_for(config))
+        self.assertIsNone(RESTClientObject(config).rate_limiter)
+
+        config.qps = 5
+        limiter = RESTClientObject(config).rate_limiter
+        self.assertEqual(5, limiter.qps)
+        self.assertEqual(5, limiter.burst)
+
+        config.burst = 20
+        self.assertEqual(20, rate_limiter_for(config).burst)
+
+    def test_invalid_qps(self):
+        self.assertRaises(ValueError, TokenBucketRateLimiter, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
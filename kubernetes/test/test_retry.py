@@ -0,0 +1,144 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import time
+import unittest
+from email.utils import formatdate
+
+import urllib3
+from mock import Mock, patch
+
+from kubernetes.client import Configuration
+from kubernetes.client.rest import ApiException, RESTClientObject
+from kubernetes.client.retry import RetryPolicy, parse_retry_after
+
+
+def _response(status, headers=None, data=b'{}'):
+    response = Mock()
+    response.status = status
+    response.reason = 'reason'
+    response.data = data
+    response.getheaders = Mock(return_value=headers or {})
+    response.getheader = Mock(
+        side_effect=lambda name, default=None:
+        (headers or {}).get(name, default))
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """ RetryPolicy unit tests """
+
+    def test_statuses(self):
+        policy = RetryPolicy()
+        for status in (429, 500, 503):
+            self.assertTrue(policy.should_retry_status('GET', status, 0))
+        for status in (400, 404, 409, 410, 502):
+            self.assertFalse(policy.should_retry_status('GET', status, 0))
+
+    def test_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry_status('GET', 503, 1))
+        self.assertFalse(policy.should_retry_status('GET', 503, 2))
+        self.assertFalse(policy.should_retry_error('GET', 2, sent=False))
+
+    def test_non_idempotent(self):
+        policy = RetryPolicy()
+        self.assertFalse(policy.should_retry_status('POST', 503, 0))
+        self.assertFalse(policy.should_retry_status('PATCH', 500, 0))
+        self.assertFalse(policy.should_retry_error('POST', 0))
+        # rejected before being processed
+        self.assertTrue(policy.should_retry_status('POST', 429, 0))
+        # never sent
+        self.assertTrue(policy.should_retry_error('POST', 0, sent=False))
+        self.assertTrue(policy.should_retry_error('PUT', 0))
+
+        policy = RetryPolicy(retry_non_idempotent=True)
+        self.assertTrue(policy.should_retry_status('POST', 503, 0))
+        self.assertTrue(policy.should_retry_error('post', 0))
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+        for retry in range(6):
+            delay = policy.backoff(retry)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(2 ** retry, 5))
+        self.assertEqual(3, policy.backoff(0, '3'))
+        self.assertEqual(5, policy.backoff(0, '120'))
+
+    def test_parse_retry_after(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertEqual(2.5, parse_retry_after('2.5'))
+        self.assertEqual(0, parse_retry_after('-1'))
+        delay = parse_retry_after(formatdate(time.time() + 30))
+        self.assertTrue(25 < delay <= 30)
+        self.assertEqual(0, parse_retry_after(formatdate(time.time() - 30)))
+
+
+@patch('kubernetes.client.retry.time.sleep')
+class TestRESTClientRetries(unittest.TestCase):
+    """ Retries of RESTClientObject.request """
+
+    def setUp(self):
+        self.config = Configuration()
+        self.config.retry_policy = RetryPolicy(max_retries=2)
+        self.client = RESTClientObject(self.config)
+        self.client.pool_manager = Mock()
+
+    def test_no_policy(self, sleep):
+        client = RESTClientObject(Configuration())
+        client.pool_manager = Mock()
+        client.pool_manager.request.return_value = _response(503)
+        self.assertRaises(ApiException, client.request, 'GET', 'http://h/')
+        self.assertEqual(1, client.pool_manager.request.call_count)
+
+    def test_retry_status(self, sleep):
+        self.client.pool_manager.request.side_effect = [
+            _response(503), _response(429, {'Retry-After': '1'}),
+            _response(200)]
+        r = self.client.request('GET', 'http://h/')
+        self.assertEqual(200, r.status)
+        self.assertEqual(3, self.client.pool_manager.request.call_count)
+        self.assertEqual(1, sleep.call_args_list[1][0][0])
+
+    def test_retries_exhausted(self, sleep):
+        self.client.pool_manager.request.return_value = _response(500)
+        with self.assertRaises(ApiException) as e:
+            self.client.request('GET', 'http://h/')
+        self.assertEqual(500, e.exception.status)
+        self.assertEqual(3, self.client.pool_manager.request.call_count)
+
+    def test_post_not_replayed(self, sleep):
+        self.client.pool_manager.request.side_effect = [
+            urllib3.exceptions.ProtocolError('Connection aborted.')]
+        self.assertRaises(urllib3.exceptions.ProtocolError,
+                          self.client.request, 'POST', 'http://h/', body={})
+        self.assertEqual(1, self.client.pool_manager.request.call_count)
+
+    def test_connection_refused(self, sleep):
+        self.client.pool_manager.request.side_effect = [
+            urllib3.exceptions.NewConnectionError(None, 'refused'),
+            _response(201)]
+        r = self.client.request('POST', 'http://h/', body={},
+                                query_params=[('dryRun', 'All')])
+        self.assertEqual(201, r.status)
+        urls = [c[0][1] for c in
+                self.client.pool_manager.request.call_args_list]
+        self.assertEqual(['http://h/?dryRun=All'] * 2, urls)
+
+    def test_release_unread_response(self, sleep):
+        failed = _response(503)
+        self.client.pool_manager.request.side_effect = [
+            failed, _response(200)]
+        self.client.request('GET', 'http://h/', _preload_content=False)
+        failed.release_conn.assert_called_once_with()
+
+    def test_urllib3_retries_disabled(self, sleep):
+        client = RESTClientObject(self.config)
+        retries = client.pool_manager.connection_pool_kw['retries']
+        self.assertIs(False, getattr(retries, 'total', retries))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import unittest
+from datetime import date, datetime, timedelta
+
+from dateutil.parser import parse
+
+from kubernetes.client.rfc3339 import UTC, parse_rfc3339, parse_rfc3339_date
+
+
+class TestRfc3339(unittest.TestCase):
+    """ RFC 3339 parser unit tests """
+
+    def test_utc(self):
+        self.assertEqual(datetime(2019, 4, 1, 10, 20, 30, tzinfo=UTC),
+                         parse_rfc3339('2019-04-01T10:20:30Z'))
+
+    def test_matches_dateutil(self):
+        for string in ['2019-04-01T10:20:30Z',
+                       '2019-04-01t10:20:30z',
+                       '2019-04-01T10:20:30.5Z',
+                       '2019-04-01T10:20:30.123456789Z',
+                       '2019-04-01T10:20:30+02:00',
+                       '2019-04-01T10:20:30.25-05:30',
+                       '2019-04-01 10:20:30Z']:
+            parsed = parse_rfc3339(string)
+            self.assertEqual(parse(string), parsed, string)
+            self.assertEqual(parse(string).utcoffset(), parsed.utcoffset())
+
+    def test_offset(self):
+        parsed = parse_rfc3339('2019-04-01T10:20:30-07:00')
+        self.assertEqual(timedelta(hours=-7), parsed.utcoffset())
+
+    def test_cached_instances(self):
+        self.assertIs(parse_rfc3339('2019-04-01T10:20:31Z'),
+                      parse_rfc3339('2019-04-01T10:20:31Z'))
+
+    def test_not_rfc3339(self):
+        for string in ['2019-04-01', '2019-04-01T10:20:30',
+                       '2019-13-01T10:20:30Z', 'April 1st', None, 42]:
+            self.assertIsNone(parse_rfc3339(string), string)
+
+    def test_date(self):
+        self.assertEqual(date(2019, 4, 1), parse_rfc3339_date('2019-04-01'))
+        self.assertIsNone(parse_rfc3339_date('2019-02-30'))
+        self.assertIsNone(parse_rfc3339_date('2019-04-01T10:20:30Z'))
+
+
+if __name__ == '__main__':
+    unittest.main()
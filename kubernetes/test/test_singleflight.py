@@ -0,0 +1,229 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import io
+import json
+import threading
+import time
+import unittest
+
+import urllib3
+from mock import Mock
+
+from kubernetes.client import Configuration, CoreV1Api
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.rest import ApiException
+from kubernetes.client.singleflight import (SingleFlight, WaitTimeout,
+                                            coalescible, request_key)
+
+THREADS = 5
+
+
+def wait_for(condition):
+    deadline = time.time() + 5
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('timed out')
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """ SingleFlight unit tests """
+
+    def setUp(self):
+        self.group = SingleFlight()
+        self.release = threading.Event()
+        self.calls = []
+        self.results = []
+
+    def call(self, result):
+        self.calls.append(result)
+        self.release.wait()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def run_concurrently(self, key, result):
+        def run():
+            try:
+                self.results.append(
+                    self.group.do(key, lambda: self.call(result)))
+            except Exception as e:
+                self.results.append(e)
+        threads = [threading.Thread(target=run) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: key in self.group._calls and
+                 self.group._calls[key].waiters == THREADS - 1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_shared_result(self):
+        result = object()
+        self.run_concurrently('a', result)
+        self.assertEqual([result], self.calls)
+        self.assertEqual([result] * THREADS, self.results)
+        self.assertEqual({}, self.group._calls)
+
+        # nothing is cached
+        self.assertEqual(2, self.group.do('a', lambda: 2))
+
+    def test_shared_error(self):
+        error = ValueError('failed')
+        self.run_concurrently('a', error)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual(THREADS, len(self.results))
+        # the waiters get copies
+        self.assertEqual(1, sum(result is error for result in self.results))
+        for result in self.results:
+            self.assertIsInstance(result, ValueError)
+            self.assertEqual(('failed',), result.args)
+        self.assertEqual({}, self.group._calls)
+
+    def test_wait_timeout(self):
+        thread = threading.Thread(
+            target=lambda: self.group.do('a', lambda: self.call(1)))
+        thread.start()
+        wait_for(lambda: 'a' in self.group._calls)
+        with self.assertRaises(WaitTimeout):
+            self.group.do('a', lambda: self.call(2), timeout=0.01)
+        self.release.set()
+        thread.join()
+        self.assertEqual([1], self.calls)
+
+    def test_keys(self):
+        self.release.set()
+        self.assertEqual(1, self.group.do('a', lambda: self.call(1)))
+        self.assertEqual(2, self.group.do('b', lambda: self.call(2)))
+        self.assertEqual([1, 2], self.calls)
+
+
+class TestCoalescible(unittest.TestCase):
+    """ the calls which may be coalesced """
+
+    def test_reads(self):
+        pods = '/api/v1/namespaces/{namespace}/pods'
+        self.assertTrue(coalescible('GET', pods, [('labelSelector', 'a=b')]))
+        self.assertTrue(coalescible('GET', pods + '/{name}'))
+        self.assertTrue(coalescible('GET', pods + '/{name}/log'))
+        self.assertTrue(coalescible('GET', '/version/'))
+
+    def test_not_reads(self):
+        pods = '/api/v1/namespaces/{namespace}/pods'
+        self.assertFalse(coalescible('POST', pods))
+        self.assertFalse(coalescible('GET', pods, [('watch', True)]))
+        self.assertFalse(coalescible('GET', pods + '/{name}/log',
+                                     [('follow', True)]))
+        for subresource in ('exec', 'attach', 'portforward', 'proxy',
+                            'proxy/{path}'):
+            self.assertFalse(coalescible(
+                'GET', pods + '/{name}/' + subresource), subresource)
+        self.assertFalse(coalescible('GET', '/api/v1/nodes/{name}/proxy'))
+
+    def test_request_key(self):
+        key = request_key('https://a/api/v1/pods',
+                          [('fieldSelector', ['a', 'b'])], {'Accept': 'x'})
+        self.assertEqual(key, request_key('https://a/api/v1/pods',
+                                          [('fieldSelector', ('a', 'b'))],
+                                          {'Accept': 'x'}))
+        hash(key)
+        self.assertIsNone(request_key('https://a', [('a', set())], {}))
+
+
+class TestApiClientSingleFlight(unittest.TestCase):
+    """ coalescing of the calls of ApiClient """
+
+    def setUp(self):
+        self.config = Configuration()
+        self.config.singleflight = True
+        self.release = threading.Event()
+        self.api_client = ApiClient(self.config)
+        self.pool_manager = Mock()
+        self.pool_manager.request.side_effect = self.respond
+        self.api_client.rest_client.pool_manager = self.pool_manager
+        self.status = 200
+
+    def respond(self, *args, **kwargs):
+        self.release.wait()
+        data = json.dumps({'metadata': {'name': 'a'},
+                           'data': {'key': 'value'}}).encode('utf-8')
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(data), status=self.status,
+            headers={'Content-Type': 'application/json'},
+            preload_content=kwargs['preload_content'])
+
+    def read_concurrently(self, *names):
+        results = []
+
+        def read(name):
+            try:
+                results.append(CoreV1Api(self.api_client)
+                               .read_namespaced_config_map(name, 'default'))
+            except Exception as e:
+                results.append(e)
+        threads = [threading.Thread(target=read, args=(name,))
+                   for name in names]
+        for thread in threads:
+            thread.start()
+        calls = self.api_client._singleflight._calls
+        wait_for(lambda: sum(call.waiters + 1 for call in
+                             list(calls.values())) == len(names))
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesced(self):
+        results = self.read_concurrently(*['a'] * THREADS)
+        self.assertEqual(1, self.pool_manager.request.call_count)
+        self.assertEqual(THREADS, len(results))
+        # every caller gets models of its own
+        self.assertEqual(THREADS, len(set(id(result) for result in results)))
+        for result in results:
+            self.assertEqual({'key': 'value'}, result.data)
+
+    def test_distinct_requests(self):
+        self.read_concurrently('a', 'b', 'a')
+        self.assertEqual(2, self.pool_manager.request.call_count)
+
+    def test_shared_error(self):
+        self.status = 404
+        results = self.read_concurrently('a', 'a')
+        self.assertEqual(1, self.pool_manager.request.call_count)
+        for result in results:
+            self.assertIsInstance(result, ApiException)
+            self.assertEqual(404, result.status)
+        self.assertIsNot(results[0], results[1])
+
+    def test_not_coalesced(self):
+        self.release.set()
+        v1 = CoreV1Api(self.api_client)
+        do = Mock(side_effect=self.api_client._singleflight.do)
+        self.api_client._singleflight.do = do
+        v1.read_namespaced_config_map('a', 'default', _preload_content=False)
+        v1.delete_namespaced_config_map('a', 'default')
+        v1.connect_get_namespaced_pod_exec(
+            'p', 'default', command=['/bin/sh', '-c', 'ls'])
+        self.assertFalse(do.called)
+        v1.read_namespaced_config_map('a', 'default')
+        self.assertTrue(do.called)
+        self.assertIsNone(ApiClient(Configuration())._singleflight)
+
+    def test_request_timeout(self):
+        thread = threading.Thread(
+            target=lambda: CoreV1Api(self.api_client)
+            .read_namespaced_config_map('a', 'default'))
+        thread.start()
+        wait_for(lambda: self.api_client._singleflight._calls)
+        with self.assertRaises(WaitTimeout):
+            CoreV1Api(self.api_client).read_namespaced_config_map(
+                'a', 'default', _request_timeout=(0.01, 0.01))
+        self.release.set()
+        thread.join()
+        self.assertEqual(1, self.pool_manager.request.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
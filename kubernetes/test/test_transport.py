@@ -0,0 +1,102 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import urllib3
+
+from kubernetes.client import Configuration
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.transport import (InstrumentedHTTPConnectionPool,
+                                         PoolStats, TransportRegistry)
+
+
+class TestTransportRegistry(unittest.TestCase):
+    """ TransportRegistry unit tests """
+
+    def setUp(self):
+        self.registry = TransportRegistry()
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def config(self, host='https://a:6443', cert=None):
+        config = Configuration()
+        config.host = host
+        config.transport_registry = self.registry
+        if cert is not None:
+            config.cert_file = self.write(cert)
+        return config
+
+    def write(self, content):
+        fd, path = tempfile.mkstemp(dir=self.tmp)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        return path
+
+    def pool_manager(self, config):
+        return ApiClient(config).rest_client.pool_manager
+
+    def test_shared(self):
+        manager = self.pool_manager(self.config())
+        self.assertIs(manager, self.pool_manager(self.config()))
+        self.assertIsNot(manager, self.pool_manager(self.config('https://b')))
+        self.assertIsNot(self.pool_manager(Configuration()),
+                         self.pool_manager(Configuration()))
+
+    def test_tls_material(self):
+        manager = self.pool_manager(self.config(cert='cert a'))
+        self.assertIs(manager, self.pool_manager(self.config(cert='cert a')))
+        self.assertIsNot(manager,
+                         self.pool_manager(self.config(cert='cert b')))
+
+        config = self.config()
+        config.verify_ssl = False
+        self.assertIsNot(self.pool_manager(self.config()),
+                         self.pool_manager(config))
+
+    def test_proxy(self):
+        config = self.config()
+        config.proxy = 'http://proxy:3128'
+        manager = self.pool_manager(config)
+        self.assertIsInstance(manager, urllib3.ProxyManager)
+        self.assertIsNot(manager, self.pool_manager(self.config()))
+
+    def test_pool_size(self):
+        self.registry.set_pool_size('https://a:6443', 2, block=True)
+        manager = self.pool_manager(self.config())
+        pool = manager.connection_from_url('https://a:6443')
+        self.assertEqual(2, pool.pool.maxsize)
+        self.assertTrue(pool.block)
+
+        self.registry.set_pool_size('https://a:6443', 3)
+        self.assertEqual(3, manager.connection_pool_kw['maxsize'])
+        config = self.config('https://b')
+        config.connection_pool_maxsize = 7
+        self.assertEqual(
+            7, self.pool_manager(config).connection_pool_kw['maxsize'])
+
+    def test_stats(self):
+        manager = self.registry.pool_manager('http://a', None,
+                                             {'maxsize': 1})
+        pool = manager.connection_from_url('http://a')
+        self.assertIsInstance(pool, InstrumentedHTTPConnectionPool)
+        first = pool._get_conn()
+        self.assertEqual({'http://a': PoolStats(1, 0, 0, 1, 1)},
+                         self.registry.stats())
+        second = pool._get_conn()
+        self.assertEqual(PoolStats(2, 0, 1, 2, 2),
+                         self.registry.stats()['http://a'])
+        pool._put_conn(first)
+        pool._put_conn(second)
+        self.assertEqual(PoolStats(0, 1, 1, 2, 2),
+                         self.registry.stats()['http://a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+import unittest
+
+from kubernetes.client import Configuration, V1Pod
+from kubernetes.client.api_client import ApiClient
+from kubernetes.client.compact import compact_model
+from kubernetes.client.rest import ApiException
+from kubernetes.utils import SubscriberOverflow, WatchMultiplexer
+
+
+def event(event_type, name, resource_version):
+    return {'type': event_type, 'object': {'metadata': {
+        'name': name, 'namespace': 'default',
+        'resourceVersion': resource_version}}}
+
+
+class FakeWatchResponse(object):
+
+    def __init__(self, events, gate=None):
+        self.events = events
+        self.gate = gate
+
+    def read_chunked(self, decode_content=True):
+        if self.gate is not None:
+            self.gate.wait(5)
+        for e in self.events:
+            yield (json.dumps(e) + '\n').encode('utf8')
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeApi(object):
+
+    def __init__(self, watches, api_client=None):
+        if api_client is not None:
+            self.api_client = api_client
+        self.watches = list(watches)
+        self.calls = []
+        self.gate = threading.Event()
+        self.idle = threading.Event()
+
+    def list_pods(self, **kwargs):
+        """
+        :return: V1PodList
+        """
+        self.calls.append(kwargs)
+        if not self.watches:
+            # nothing more to watch, hold the upstream until it is stopped
+            self.idle.set()
+            return FakeWatchResponse([], threading.Event())
+        watch = self.watches.pop(0)
+        if isinstance(watch, Exception):
+            raise watch
+        return FakeWatchResponse(watch, self.gate)
+
+
+def names(subscription, count):
+    return [next(subscription)['object'].metadata.name
+            for _ in range(count)]
+
+
+class TestWatchMultiplexer(unittest.TestCase):
+    """ WatchMultiplexer unit tests """
+
+    def test_shared_watch(self):
+        api = FakeApi([[event('ADDED', 'a', '5'), event('ADDED', 'b', '6')]])
+        mux = WatchMultiplexer()
+        first = mux.subscribe(api.list_pods, label_selector='app=web')
+        second = mux.subscribe(api.list_pods, label_selector='app=web')
+        other = mux.subscribe(api.list_pods, label_selector='app=db')
+        self.assertEqual(2, len(mux))
+        api.gate.set()
+
+        self.assertEqual(['a', 'b'], names(first, 2))
+        self.assertEqual(['a', 'b'], names(second, 2))
+        api.idle.wait(5)
+        self.assertEqual(
+            ['app=db', 'app=web'],
+            sorted(c['label_selector'] for c in api.calls[:2]))
+
+        for subscription in (first, second, other):
+            subscription.close()
+        self.assertEqual(0, len(mux))
+        self.assertRaises(StopIteration, next, first)
+
+    def test_shared_with_list_parameters(self):
+        api = FakeApi([[event('ADDED', 'a', '5')]])
+        mux = WatchMultiplexer()
+        first = mux.subscribe(api.list_pods, _fields=['metadata.name'])
+        second = mux.subscribe(api.list_pods, _fields=['metadata.name'])
+        self.assertEqual(1, len(mux))
+        api.gate.set()
+        self.assertEqual(['a'], names(first, 1))
+        self.assertEqual(['a'], names(second, 1))
+        self.assertEqual(['metadata.name'], api.calls[0]['_fields'])
+        first.close()
+        second.close()
+
+    def test_same_event_objects(self):
+        api = FakeApi([[event('ADDED', 'a', '5')]])
+        mux = WatchMultiplexer()
+        first = mux.subscribe(api.list_pods)
+        second = mux.subscribe(api.list_pods)
+        api.gate.set()
+        self.assertIs(next(first), next(second))
+        first.close()
+        second.close()
+
+    def test_decoded_by_api_client(self):
+        config = Configuration()
+        config.compact_models = True
+        api = FakeApi([[event('ADDED', 'a', '5')]], ApiClient(config))
+        subscription = WatchMultiplexer().subscribe(api.list_pods)
+        api.gate.set()
+        self.assertIs(compact_model(V1Pod), type(next(subscription)['object']))
+        subscription.close()
+
+    def test_resume(self):
+        gone = {'type': 'ERROR', 'object': {
+            'kind': 'Status', 'metadata': {}, 'code': 410,
+            'reason': 'Expired', 'message': 'too old'}}
+        api = FakeApi([[event('ADDED', 'a', '5')],
+                       [event('MODIFIED', 'a', '6'), gone],
+                       [event('ADDED', 'b', '20')]])
+        api.gate.set()
+        mux = WatchMultiplexer()
+        subscription = mux.subscribe(api.list_pods, resource_version='1')
+        types = [next(subscription)['type'] for _ in range(4)]
+        api.idle.wait(5)
+        subscription.close()
+
+        self.assertEqual(['ADDED', 'MODIFIED', 'ERROR', 'ADDED'], types)
+        self.assertEqual(['1', '5', None, '20'],
+                         [c.get('resource_version') for c in api.calls])
+        for call in api.calls:
+            self.assertTrue(call['watch'])
+            self.assertIn('timeout_seconds', call)
+
+    def test_resume_after_gone_response(self):
+        api = FakeApi([[event('ADDED', 'a', '5')],
+                       ApiException(status=410, reason='Gone'),
+                       [event('ADDED', 'b', '20')]])
+        api.gate.set()
+        subscription = WatchMultiplexer().subscribe(api.list_pods)
+        events = [next(subscription) for _ in range(3)]
+        api.idle.wait(5)
+        subscription.close()
+
+        self.assertEqual(['ADDED', 'ERROR', 'ADDED'],
+                         [e['type'] for e in events])
+        self.assertEqual(410, events[1]['raw_object']['code'])
+        self.assertEqual([None, '5', None, '20'],
+                         [c.get('resource_version') for c in api.calls])
+
+    def test_drop_oldest(self):
+        api = FakeApi([[event('ADDED', str(i), str(i)) for i in range(5)]])
+        mux = WatchMultiplexer(queue_size=2, overflow='drop_oldest')
+        subscription = mux.subscribe(api.list_pods)
+        api.gate.set()
+        api.idle.wait(5)
+        self.assertEqual(['3', '4'], names(subscription, 2))
+        self.assertEqual(3, subscription.dropped)
+        subscription.close()
+
+    def test_close_on_overflow(self):
+        api = FakeApi([[event('ADDED', str(i), str(i)) for i in range(5)]])
+        mux = WatchMultiplexer(queue_size=2, overflow='close')
+        slow = mux.subscribe(api.list_pods)
+        api.gate.set()
+        # the watch stops with its only subscriber
+        for _ in range(500):
+            if not len(mux):
+                break
+            time.sleep(0.01)
+        self.assertEqual(0, len(mux))
+        self.assertRaises(SubscriberOverflow, list, slow)
+
+    def test_invalid_overflow(self):
+        self.assertRaises(ValueError, WatchMultiplexer, overflow='nope')
+
+
+if __name__ == '__main__':
+    unittest.main()
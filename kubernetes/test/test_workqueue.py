@@ -0,0 +1,183 @@
+# coding: utf-8
+
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+from kubernetes.client import V1ObjectMeta, V1Pod
+from kubernetes.client.rate_limit import TokenBucketRateLimiter
+from kubernetes.utils import Controller, ItemExponentialBackoff, WorkQueue
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestItemExponentialBackoff(unittest.TestCase):
+    """ ItemExponentialBackoff unit tests """
+
+    def test_backoff(self):
+        backoff = ItemExponentialBackoff(base_delay=1, max_delay=5)
+        self.assertEqual([1, 2, 4, 5, 5],
+                         [backoff.when('a') for _ in range(5)])
+        self.assertEqual(1, backoff.when('b'))
+        self.assertEqual(5, backoff.num_requeues('a'))
+        backoff.forget('a')
+        self.assertEqual(0, backoff.num_requeues('a'))
+        self.assertEqual(1, backoff.when('a'))
+
+
+class TestWorkQueue(unittest.TestCase):
+    """ WorkQueue unit tests """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.queue = WorkQueue(
+            backoff=ItemExponentialBackoff(base_delay=1, max_delay=60),
+            rate_limiter=TokenBucketRateLimiter(1, 2, clock=self.clock),
+            clock=self.clock)
+
+    def test_deduplicates(self):
+        for key in ['a', 'b', 'a', 'a', 'c', 'b']:
+            self.queue.add(key)
+        self.assertEqual(3, len(self.queue))
+        self.assertEqual(['a', 'b', 'c'],
+                         [self.queue.get(timeout=0) for _ in range(3)])
+        self.assertIsNone(self.queue.get(timeout=0))
+
+    def test_requeued_after_processing(self):
+        self.queue.add('a')
+        self.assertEqual('a', self.queue.get())
+        # changed again while processed: not handed to another worker
+        self.queue.add('a')
+        self.queue.add('a')
+        self.assertIsNone(self.queue.get(timeout=0))
+        self.queue.done('a')
+        self.assertEqual('a', self.queue.get(timeout=0))
+        self.queue.done('a')
+        self.assertEqual(0, len(self.queue))
+
+    def test_add_after(self):
+        self.queue.add_after('a', 10)
+        self.queue.add_after('b', 5)
+        self.queue.add_after('a', 20)
+        self.assertIsNone(self.queue.get(timeout=0))
+        self.clock.now += 5
+        self.assertEqual('b', self.queue.get(timeout=0))
+        self.clock.now += 5
+        self.assertEqual('a', self.queue.get(timeout=0))
+        self.clock.now += 20
+        self.assertIsNone(self.queue.get(timeout=0))
+
+    def test_add_rate_limited(self):
+        for expected in [1, 2, 4]:
+            self.queue.add_rate_limited('a')
+            self.clock.now += expected - 0.5
+            self.assertIsNone(self.queue.get(timeout=0))
+            self.clock.now += 0.5
+            self.assertEqual('a', self.queue.get(timeout=0))
+            self.queue.done('a')
+        self.assertEqual(3, self.queue.num_requeues('a'))
+        self.queue.forget('a')
+        self.assertEqual(0, self.queue.num_requeues('a'))
+
+    def test_overall_rate_limit(self):
+        # the bucket holds 2 tokens and refills at 1 per second, the first
+        # failure of every item is retried after 1 second
+        for key in ['a', 'b', 'c', 'd', 'e']:
+            self.queue.add_rate_limited(key)
+        self.clock.now += 1
+        self.assertEqual(['a', 'b', 'c'],
+                         [self.queue.get(timeout=0) for _ in range(3)])
+        self.assertIsNone(self.queue.get(timeout=0))
+        self.clock.now += 1
+        self.assertEqual('d', self.queue.get(timeout=0))
+        self.assertIsNone(self.queue.get(timeout=0))
+        self.clock.now += 1
+        self.assertEqual('e', self.queue.get(timeout=0))
+
+    def test_shutdown(self):
+        self.queue.add('a')
+        self.queue.shutdown()
+        self.queue.add('b')
+        self.assertEqual('a', self.queue.get())
+        self.assertIsNone(self.queue.get())
+        self.assertTrue(self.queue.shutting_down)
+
+    def test_get_wakes_up(self):
+        queue = WorkQueue()
+        got = []
+        thread = threading.Thread(target=lambda: got.append(queue.get()))
+        thread.start()
+        queue.add_after('a', 0.05)
+        thread.join(5)
+        self.assertEqual(['a'], got)
+
+
+class TestController(unittest.TestCase):
+    """ Controller unit tests """
+
+    def test_workers(self):
+        lock = threading.Lock()
+        running = set()
+        processed = []
+
+        def handler(key):
+            with lock:
+                self.assertNotIn(key, running)
+                running.add(key)
+            time.sleep(0.001)
+            with lock:
+                running.discard(key)
+                processed.append(key)
+
+        controller = Controller(handler, workers=4)
+        controller.start()
+        for _ in range(20):
+            for i in range(10):
+                controller.enqueue(V1Pod(metadata=V1ObjectMeta(
+                    name='pod-%d' % i, namespace='default')))
+        controller.stop(timeout=10)
+        self.assertEqual(set('default/pod-%d' % i for i in range(10)),
+                         set(processed))
+        self.assertLessEqual(len(processed), 200)
+
+    def test_failures_requeued(self):
+        calls = []
+
+        def handler(key):
+            calls.append(key)
+            if len(calls) < 3:
+                raise ValueError(key)
+
+        queue = WorkQueue(backoff=ItemExponentialBackoff(base_delay=0))
+        controller = Controller(handler, queue=queue)
+        queue.add('a')
+        for _ in range(3):
+            controller.process(queue.get(timeout=1))
+        self.assertEqual(['a'] * 3, calls)
+        self.assertEqual(0, queue.num_requeues('a'))
+        self.assertIsNone(queue.get(timeout=0))
+
+    def test_max_retries(self):
+        def handler(key):
+            raise ValueError(key)
+
+        queue = WorkQueue(backoff=ItemExponentialBackoff(base_delay=0))
+        controller = Controller(handler, queue=queue, max_retries=1)
+        queue.add('a')
+        controller.process(queue.get(timeout=1))
+        controller.process(queue.get(timeout=1))
+        self.assertIsNone(queue.get(timeout=0))
+        self.assertEqual(0, queue.num_requeues('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,3 +15,10 @@
 from __future__ import absolute_import
 
 from .create_from_yaml import FailToCreateError, create_from_yaml
+from .pager import ListPager, stream_list
+from .patch import JsonPatch, MergePatch, json_patch, merge_patch
+from .informer import (Informer, Store, label_index, meta_namespace_key,
+                       namespace_index, node_name_index, owner_uid_index)
+from .workqueue import Controller, ItemExponentialBackoff, WorkQueue
+from .watch_multiplexer import (SubscriberOverflow, Subscription,
+                                WatchMultiplexer)
@@ -0,0 +1,443 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import threading
+
+from kubernetes import watch
+from kubernetes.client.rate_limit import _now
+from kubernetes.client.rest import ApiException
+
+from .pager import ListPager, _field
+
+logger = logging.getLogger(__name__)
+
+# server side timeout of the watch calls, the watch is then resumed from
+# the last resourceVersion seen
+WATCH_TIMEOUT_SECONDS = 300
+
+# longest wait before listing again after a failure
+MAX_BACKOFF_SECONDS = 30
+
+
+def _metadata(obj):
+    return _field(obj, 'metadata', 'metadata')
+
+
+def meta_namespace_key(obj):
+    """Returns the `namespace/name` key of an object, or `name` for objects
+    that are not namespaced.
+    """
+    metadata = _metadata(obj)
+    name = _field(metadata, 'name', 'name')
+    namespace = _field(metadata, 'namespace', 'namespace')
+    if namespace:
+        return namespace + '/' + name
+    return name
+
+
+def namespace_index(obj):
+    """Indexes objects by namespace."""
+    namespace = _field(_metadata(obj), 'namespace', 'namespace')
+    return [namespace] if namespace else []
+
+
+def label_index(obj):
+    """Indexes objects by label, as `key=value`."""
+    labels = _field(_metadata(obj), 'labels', 'labels') or {}
+    return ['{0}={1}'.format(k, v) for k, v in labels.items()]
+
+
+def node_name_index(obj):
+    """Indexes pods by the name of the node they are scheduled to."""
+    node_name = _field(_field(obj, 'spec', 'spec'), 'node_name', 'nodeName')
+    return [node_name] if node_name else []
+
+
+def owner_uid_index(obj):
+    """Indexes objects by the uid of their owners."""
+    owners = _field(_metadata(obj), 'owner_references',
+                    'ownerReferences') or []
+    return [_field(owner, 'uid', 'uid') for owner in owners]
+
+
+class Store(object):
+    """Thread safe cache of objects, with secondary indices.
+
+    Objects are stored under the key returned by `key_func`. Every indexer
+    is a function returning the list of values an object is indexed under,
+    e.g. `namespace_index`; `by_index` then returns the objects indexed
+    under a value. The objects are shared with the other readers of the
+    store and must not be modified.
+
+    :param key_func: function returning the key of an object.
+    :param indexers: dict of index name -> index function.
+    """
+
+    def __init__(self, key_func=meta_namespace_key, indexers=None):
+        self._key_func = key_func
+        self._lock = threading.RLock()
+        self._items = {}
+        self._indexers = {}
+        # index name -> indexed value -> set of keys
+        self._indices = {}
+        # resourceVersion the content of the store is current with
+        self.resource_version = None
+        for name, index_func in (indexers or {}).items():
+            self.add_indexer(name, index_func)
+
+    def add_indexer(self, name, index_func):
+        with self._lock:
+            self._indexers[name] = index_func
+            self._indices[name] = {}
+            for key, obj in self._items.items():
+                self._index(name, key, obj, True)
+
+    def _index(self, name, key, obj, add):
+        index = self._indices[name]
+        for value in self._indexers[name](obj):
+            keys = index.get(value)
+            if add:
+                if keys is None:
+                    keys = index[value] = set()
+                keys.add(key)
+            elif keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    def _put(self, key, obj):
+        old = self._items.get(key)
+        for name in self._indexers:
+            if old is not None:
+                self._index(name, key, old, False)
+            self._index(name, key, obj, True)
+        self._items[key] = obj
+        return old
+
+    def _remove(self, key):
+        old = self._items.pop(key, None)
+        if old is not None:
+            for name in self._indexers:
+                self._index(name, key, old, False)
+        return old
+
+    def update(self, obj):
+        """Adds or replaces an object, returns the object it replaced."""
+        with self._lock:
+            return self._put(self._key_func(obj), obj)
+
+    add = update
+
+    def delete(self, obj):
+        """Removes an object, returns the stored one if any."""
+        with self._lock:
+            return self._remove(self._key_func(obj))
+
+    def replace(self, objs, resource_version=None):
+        """Replaces the whole content of the store.
+
+        :return: tuple of the list of added objects, the list of
+                 (old, new) updated objects and the list of deleted objects.
+        """
+        added, updated = [], []
+        with self._lock:
+            keys = set()
+            for obj in objs:
+                key = self._key_func(obj)
+                keys.add(key)
+                old = self._put(key, obj)
+                if old is None:
+                    added.append(obj)
+                else:
+                    updated.append((old, obj))
+            deleted = [self._remove(key)
+                       for key in list(self._items) if key not in keys]
+            self.resource_version = resource_version
+        return added, updated, deleted
+
+    def get(self, obj):
+        return self.get_by_key(self._key_func(obj))
+
+    def get_by_key(self, key):
+        with self._lock:
+            return self._items.get(key)
+
+    def list(self):
+        with self._lock:
+            return list(self._items.values())
+
+    def keys(self):
+        with self._lock:
+            return list(self._items)
+
+    def by_index(self, name, value):
+        """Returns the objects indexed under `value` by indexer `name`."""
+        with self._lock:
+            keys = self._indices[name].get(value, ())
+            return [self._items[key] for key in keys]
+
+    def index_values(self, name):
+        """Returns the values indexer `name` indexes objects under."""
+        with self._lock:
+            return list(self._indices[name])
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+
+class _EventResponse(object):
+    """The object of a watch event, as a response to deserialize."""
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _ClientWatch(watch.Watch):
+    """Watch decoding its events with a given ApiClient, within the
+    `_fields` projection of the call.
+
+    `kubernetes.watch.Watch` decodes the events with an ApiClient of its
+    own; this overrides its public `unmarshal_event` hook rather than
+    relying on that client.
+    """
+
+    def __init__(self, api_client, fields=None, return_type=None):
+        super(_ClientWatch, self).__init__(return_type)
+        self.api_client = api_client
+        self.fields = fields
+
+    def unmarshal_event(self, data, return_type):
+        try:
+            js = json.loads(data)
+        except ValueError:
+            return data
+        js['raw_object'] = js['object']
+        if return_type:
+            js['object'] = self.api_client.deserialize(
+                _EventResponse(json.dumps(js['raw_object'])), return_type,
+                self.fields)
+        # from the raw object, the projection may leave it out
+        resource_version = _field(_metadata(js['raw_object']),
+                                  'resource_version', 'resourceVersion')
+        if resource_version:
+            self.resource_version = resource_version
+        return js
+
+
+def _client_watch(func, kwargs):
+    """Returns a Watch decoding the events of `func` with the ApiClient of
+    its api, so that they are the same models as its list responses: same
+    codec, model flavor, interning and `_fields` projection.
+    """
+    api_client = getattr(getattr(func, '__self__', None), 'api_client', None)
+    if api_client is None:
+        return watch.Watch()
+    return _ClientWatch(api_client, kwargs.get('_fields'))
+
+
+class _Expired(Exception):
+    """The resourceVersion of the store is too old to watch from."""
+
+
+class Informer(object):
+    """Keeps a local cache of the objects of a list call current.
+
+    The informer lists the objects once, then applies the events of a watch
+    started from the resourceVersion of the list. When the apiserver no
+    longer has the history needed to resume the watch (410 Gone) the
+    objects are listed again. Reads are then served by `store` without any
+    request to the apiserver.
+
+    Handlers are called on the thread of the informer, after the store was
+    updated, with the objects returned by the list and watch calls. Every
+    `resync_period` seconds `on_update` is called again for all the objects
+    of the store, which lets controllers retry work that failed earlier.
+
+    Large caches take less memory when the ApiClient of `func` interns
+    strings (`Configuration.intern_strings`): the label keys and values,
+    namespaces, node names... of all the cached objects are then shared,
+    whether they come from a list or a watch event: both are decoded by
+    the ApiClient of `func`.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        informer = kubernetes.utils.Informer(
+            v1.list_pod_for_all_namespaces, label_selector='app=web',
+            indexers={'node': kubernetes.utils.node_name_index})
+        informer.add_event_handler(on_add=print)
+        informer.start()
+        informer.wait_for_sync()
+        pods = informer.store.by_index('node', 'node-1')
+
+    :param func: a `list_*` method of a generated api. Any parameter to the
+                 function can be passed as keyword argument.
+    :param resync_period: seconds between resyncs, 0 disables them.
+    :param indexers: dict of index name -> index function of the store.
+    """
+
+    def __init__(self, func, resync_period=0, indexers=None, **kwargs):
+        self._func = func
+        self._kwargs = kwargs
+        self.resync_period = resync_period
+        self.store = Store(indexers=indexers)
+        self._handlers = []
+        self._stopped = threading.Event()
+        self._synced = threading.Event()
+        self._thread = None
+        self._watch = None
+
+    def add_event_handler(self, on_add=None, on_update=None, on_delete=None):
+        """Registers functions called with the changes of the store.
+
+        :param on_add: called with the object added.
+        :param on_update: called with the old and the new object.
+        :param on_delete: called with the final state of the object deleted.
+        """
+        self._handlers.append((on_add, on_update, on_delete))
+
+    def _notify(self, kind, *args):
+        for handler in self._handlers:
+            func = handler[kind]
+            if func is None:
+                continue
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("informer event handler failed")
+
+    def _on_add(self, obj):
+        self._notify(0, obj)
+
+    def _on_update(self, old, new):
+        self._notify(1, old, new)
+
+    def _on_delete(self, obj):
+        self._notify(2, obj)
+
+    def start(self):
+        """Runs the informer on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run,
+                                            name='informer')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stops the informer.
+
+        The thread exits after the next event, or once the current watch
+        call timed out.
+        """
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def has_synced(self):
+        """Returns whether the initial list has been stored."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        """Blocks until the initial list has been stored.
+
+        :return: False if `timeout` seconds elapsed first.
+        """
+        return self._synced.wait(timeout)
+
+    def run(self):
+        """Lists and watches until `stop` is called."""
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                self._list_and_watch()
+                backoff = 1
+            except Exception:
+                logger.exception("informer failed, listing again in %ss",
+                                 backoff)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def _list_and_watch(self):
+        self._list()
+        next_resync = None
+        if self.resync_period:
+            next_resync = _now() + self.resync_period
+        while not self._stopped.is_set():
+            timeout = WATCH_TIMEOUT_SECONDS
+            if next_resync is not None:
+                timeout = max(1, min(timeout, int(next_resync - _now())))
+            try:
+                self._watch_once(timeout)
+            except _Expired:
+                return
+            except ApiException as e:
+                if e.status == 410:
+                    return
+                raise
+            if self._stopped.is_set():
+                return
+            if next_resync is not None and _now() >= next_resync:
+                self.resync()
+                next_resync = _now() + self.resync_period
+
+    def _list(self):
+        pager = ListPager(prefetch=False)
+        objs = list(pager.items(self._func, **self._kwargs))
+        added, updated, deleted = self.store.replace(
+            objs, pager.resource_version)
+        for obj in added:
+            self._on_add(obj)
+        for old, new in updated:
+            self._on_update(old, new)
+        for obj in deleted:
+            self._on_delete(obj)
+        self._synced.set()
+
+    def _watch_once(self, timeout):
+        kwargs = dict(self._kwargs, timeout_seconds=timeout)
+        if self.store.resource_version:
+            kwargs['resource_version'] = self.store.resource_version
+        self._watch = _client_watch(self._func, kwargs)
+        stream = self._watch.stream(self._func, **kwargs)
+        for event in stream:
+            if self._stopped.is_set():
+                self._watch.stop()
+            event_type = event['type']
+            if event_type == 'ERROR':
+                status = event['raw_object']
+                if status.get('code') == 410:
+                    raise _Expired()
+                raise ApiException(status=status.get('code'),
+                                   reason=status.get('message'))
+            obj = event['object']
+            if event_type in ('ADDED', 'MODIFIED'):
+                old = self.store.update(obj)
+                if old is None:
+                    self._on_add(obj)
+                else:
+                    self._on_update(old, obj)
+            elif event_type == 'DELETED':
+                self.store.delete(obj)
+                self._on_delete(obj)
+            self.store.resource_version = _field(
+                _metadata(obj), 'resource_version', 'resourceVersion')
+
+    def resync(self):
+        """Calls `on_update` for all the objects of the store."""
+        for obj in self.store.list():
+            self._on_update(obj, obj)
@@ -0,0 +1,165 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pydoc
+
+from kubernetes.client.rest import ApiException
+
+DEFAULT_PAGE_SIZE = 500
+
+PYDOC_RETURN_LABEL = ":return:"
+
+
+def _field(obj, attr, key):
+    """Reads a field of a model, or of the dict returned for custom objects.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, attr, None)
+
+
+def _find_return_type(func):
+    for line in pydoc.getdoc(func).splitlines():
+        if line.startswith(PYDOC_RETURN_LABEL):
+            return line[len(PYDOC_RETURN_LABEL):].strip()
+    return ""
+
+
+def stream_list(func, *args, **kwargs):
+    """Calls a list method and deserializes the objects while they are read.
+
+    Rather than decoding the whole response before building any model,
+    objects are decoded and deserialized one at a time, so the memory used
+    is that of one object instead of the whole list.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        for secret in kubernetes.utils.stream_list(
+                v1.list_secret_for_all_namespaces):
+            ...
+
+    :param func: a `list_*` method of a generated api. Any parameter to the
+                 function can be passed after this parameter.
+    :return: kubernetes.client.json_stream.ListStream, an iterable of the
+             objects. Its `metadata` is available once iteration started.
+    """
+    api_client = func.__self__.api_client
+    kwargs.pop('async_req', None)
+    kwargs['_preload_content'] = False
+    response = func(*args, **kwargs)
+    return api_client.deserialize_stream(response, _find_return_type(func))
+
+
+def _expired_continue_token(exc):
+    """Returns the continue token the apiserver sends along with a 410 Gone
+    for an expired continue token, if any.
+    """
+    if exc.status != 410 or not exc.body:
+        return None
+    try:
+        status = json.loads(exc.body)
+    except (TypeError, ValueError):
+        return None
+    return (status.get('metadata') or {}).get('continue')
+
+
+class ListPager(object):
+    """Iterates over the result of a list call one page at a time.
+
+    The next page is requested on the api client's thread pool as soon as
+    the current one arrived, so it is fetched and deserialized while the
+    caller consumes the current page. At most two pages are held in memory.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        pager = kubernetes.utils.ListPager(limit=1000)
+        for pod in pager.items(v1.list_pod_for_all_namespaces,
+                               label_selector='app=web'):
+            ...
+
+    :param limit: number of objects requested per page.
+    :param prefetch: fetch the next page in the background.
+    """
+
+    def __init__(self, limit=DEFAULT_PAGE_SIZE, prefetch=True):
+        self.limit = limit
+        self.prefetch = prefetch
+        # resourceVersion of the list, as returned with the first page
+        self.resource_version = None
+
+    def _request(self, func, args, kwargs):
+        """Starts the request of a page, returns a callable waiting for it.
+        """
+        kwargs = dict(kwargs)
+        if self.prefetch:
+            return func(*args, async_req=True, **kwargs).get
+
+        return lambda: func(*args, **kwargs)
+
+    def pages(self, func, *args, **kwargs):
+        """Lists all the pages of a list call.
+
+        If the continue token expires while listing, the list goes on with
+        the token the apiserver hands out with the 410 Gone error. The
+        objects of the following pages then come from a more recent
+        snapshot than the ones already returned.
+
+        :param func: a `list_*` method of a generated api. Any parameter to
+                     the function can be passed after this parameter.
+        :return: generator of the list objects returned for each page.
+        """
+        kwargs.pop('async_req', None)
+        kwargs.setdefault('limit', self.limit)
+        self.resource_version = None
+
+        pending = self._request(func, args, kwargs)
+        while pending is not None:
+            try:
+                page = pending()
+            except ApiException as e:
+                token = _expired_continue_token(e)
+                if token is None:
+                    raise
+                kwargs['_continue'] = token
+                pending = self._request(func, args, kwargs)
+                continue
+
+            metadata = _field(page, 'metadata', 'metadata')
+            if self.resource_version is None:
+                self.resource_version = _field(
+                    metadata, 'resource_version', 'resourceVersion')
+
+            token = _field(metadata, '_continue', 'continue')
+            if token:
+                kwargs['_continue'] = token
+                pending = self._request(func, args, kwargs)
+            else:
+                pending = None
+
+            yield page
+
+    def items(self, func, *args, **kwargs):
+        """Lists all the objects of a list call.
+
+        Takes the same parameters as `pages`.
+
+        :return: generator of the objects, models or dicts depending on
+                 the return type of `func`.
+        """
+        for page in self.pages(func, *args, **kwargs):
+            for item in _field(page, 'items', 'items') or []:
+                yield item
@@ -0,0 +1,163 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import date, datetime
+
+from six import iteritems
+
+from kubernetes.client.json_codec import model_encoder
+
+
+class MergePatch(dict):
+    """A JSON merge patch (RFC 7386), as returned by `merge_patch`.
+
+    The `patch_*` methods send it as `application/merge-patch+json`, where
+    they would send a plain dict as a strategic merge patch.
+    """
+
+    content_type = 'application/merge-patch+json'
+
+
+class JsonPatch(list):
+    """A JSON patch (RFC 6902), as returned by `json_patch`.
+
+    The `patch_*` methods send it as `application/json-patch+json`.
+    """
+
+    content_type = 'application/json-patch+json'
+
+
+def _to_json(obj):
+    """Returns the json of a model, the way the api client would send it.
+    """
+    if isinstance(obj, dict):
+        return dict((key, _to_json(value)) for key, value in iteritems(obj))
+    if isinstance(obj, (list, tuple)):
+        return [_to_json(value) for value in obj]
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if getattr(obj, 'swagger_types', None) is not None:
+        return _to_json(model_encoder(type(obj))(obj))
+    return obj
+
+
+def _same(a, b):
+    # True == 1 in python, not in json
+    return a == b and isinstance(a, bool) == isinstance(b, bool)
+
+
+def _objects(original, modified):
+    original = _to_json(original)
+    modified = _to_json(modified)
+    if not isinstance(original, dict) or not isinstance(modified, dict):
+        raise TypeError("Patches are computed between two models or dicts, "
+                        "not %s and %s" % (type(original).__name__,
+                                           type(modified).__name__))
+    return original, modified
+
+
+def _merge_diff(original, modified):
+    patch = {}
+    for key in original:
+        if key not in modified:
+            patch[key] = None
+    for key, value in iteritems(modified):
+        if key in original:
+            old = original[key]
+            if isinstance(old, dict) and isinstance(value, dict):
+                nested = _merge_diff(old, value)
+                if nested:
+                    patch[key] = nested
+                continue
+            if _same(old, value):
+                continue
+        patch[key] = value
+    return patch
+
+
+def merge_patch(original, modified):
+    """Computes the JSON merge patch turning one version of an object into
+    another.
+
+    The patch only holds the fields which changed: the removed fields are
+    set to null and the lists which changed are sent whole. It carries no
+    `resourceVersion` unless the versions differ on it, so that the server
+    applies it to the object as it stands rather than rejecting it with a
+    409 conflict the way it does stale `replace_*` bodies.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        config_map = v1.read_namespaced_config_map('settings', 'default')
+        modified = copy.deepcopy(config_map)
+        modified.data['level'] = 'debug'
+        v1.patch_namespaced_config_map(
+            'settings', 'default',
+            kubernetes.utils.merge_patch(config_map, modified))
+
+    :param original: model, or dict of its json such as returned by
+                     `ApiClient.sanitize_for_serialization`.
+    :param modified: the modified version of the model, or its dict.
+    :return: MergePatch, empty if the versions are equal.
+    """
+    original, modified = _objects(original, modified)
+    return MergePatch(_merge_diff(original, modified))
+
+
+def _pointer(path, key):
+    return '%s/%s' % (path, key.replace('~', '~0').replace('/', '~1'))
+
+
+def _json_diff(original, modified, path, ops):
+    if isinstance(original, dict) and isinstance(modified, dict):
+        for key in sorted(original):
+            if key not in modified:
+                ops.append({'op': 'remove', 'path': _pointer(path, key)})
+        for key in sorted(modified):
+            if key in original:
+                _json_diff(original[key], modified[key],
+                           _pointer(path, key), ops)
+            else:
+                ops.append({'op': 'add', 'path': _pointer(path, key),
+                            'value': modified[key]})
+    elif isinstance(original, list) and isinstance(modified, list):
+        common = min(len(original), len(modified))
+        for index in range(common):
+            _json_diff(original[index], modified[index],
+                       '%s/%d' % (path, index), ops)
+        # removed from the end, so that the indices stay valid
+        for index in range(len(original) - 1, common - 1, -1):
+            ops.append({'op': 'remove', 'path': '%s/%d' % (path, index)})
+        for value in modified[common:]:
+            ops.append({'op': 'add', 'path': path + '/-', 'value': value})
+    elif not _same(original, modified):
+        ops.append({'op': 'replace', 'path': path, 'value': modified})
+
+
+def json_patch(original, modified):
+    """Computes the JSON patch turning one version of an object into
+    another.
+
+    Unlike a merge patch, a JSON patch updates the items of lists in
+    place, adding and removing items at their end.
+
+    :param original: model, or dict of its json such as returned by
+                     `ApiClient.sanitize_for_serialization`.
+    :param modified: the modified version of the model, or its dict.
+    :return: JsonPatch, the list of the operations, empty if the versions
+             are equal.
+    """
+    original, modified = _objects(original, modified)
+    ops = JsonPatch()
+    _json_diff(original, modified, '', ops)
+    return ops
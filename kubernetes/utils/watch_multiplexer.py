@@ -0,0 +1,271 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+
+from six.moves import queue
+
+from kubernetes.client.rest import ApiException
+from kubernetes.client.singleflight import hashable
+
+from .informer import (MAX_BACKOFF_SECONDS, WATCH_TIMEOUT_SECONDS,
+                       _client_watch, _field, _metadata)
+
+logger = logging.getLogger(__name__)
+
+# what to do with an event for a subscriber whose queue is full
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+CLOSE = 'close'
+
+_CLOSED = object()
+
+
+class SubscriberOverflow(Exception):
+    """A subscriber fell too far behind and was closed."""
+
+
+class Subscription(object):
+    """Events of a watch shared with other subscribers.
+
+    Iterating returns the events as returned by `kubernetes.watch.Watch`.
+    The same event is handed to every subscriber, so it must not be
+    modified. Iteration ends once `close` is called.
+    """
+
+    def __init__(self, upstream, queue_size, overflow):
+        self._upstream = upstream
+        self._queue = queue.Queue(queue_size)
+        self._overflow = overflow
+        self._closed = False
+        self._overflowed = False
+        # number of events dropped because the queue was full
+        self.dropped = 0
+
+    def _put(self, event):
+        if self._closed:
+            return
+        if self._overflow == BLOCK:
+            self._queue.put(event)
+            return
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                if self._overflow == CLOSE:
+                    self._overflowed = True
+                    self._close()
+                    return
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        event = self._queue.get()
+        if event is _CLOSED:
+            # let the other consumers of this subscription stop as well
+            self._queue.put(_CLOSED)
+            if self._overflowed:
+                raise SubscriberOverflow()
+            raise StopIteration()
+        return event
+
+    next = __next__
+
+    def _close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._upstream.unsubscribe(self)
+        # make room for the end marker, a closed subscription is not read
+        while True:
+            try:
+                self._queue.put_nowait(_CLOSED)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self):
+        """Unsubscribes, the upstream watch stops with its last
+        subscriber.
+        """
+        self._close()
+
+
+class _Upstream(object):
+    """One watch call, fanned out to its subscribers."""
+
+    def __init__(self, multiplexer, key, func, args, kwargs):
+        self._multiplexer = multiplexer
+        self._key = key
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watch = None
+        self.resource_version = kwargs.pop('resource_version', None)
+
+    def subscribe(self, subscription):
+        with self._lock:
+            self._subscribers.append(subscription)
+
+    def unsubscribe(self, subscription):
+        # under the lock of the multiplexer, so that no subscriber joins
+        # a watch that is stopping
+        with self._multiplexer._lock:
+            with self._lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+                if self._subscribers:
+                    return
+                self._stopped.set()
+            if self._multiplexer._upstreams.get(self._key) is self:
+                del self._multiplexer._upstreams[self._key]
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _dispatch(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription._put(event)
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name='watch-multiplexer')
+        thread.daemon = True
+        thread.start()
+
+    def run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            kwargs = dict(self._kwargs)
+            kwargs.setdefault('timeout_seconds', WATCH_TIMEOUT_SECONDS)
+            if self.resource_version:
+                kwargs['resource_version'] = self.resource_version
+            self._watch = _client_watch(self._func, kwargs)
+            try:
+                for event in self._watch.stream(self._func, *self._args,
+                                                **kwargs):
+                    if self._stopped.is_set():
+                        self._watch.stop()
+                        break
+                    self._handle(event)
+                backoff = 1
+            except Exception as e:
+                if isinstance(e, ApiException) and e.status == 410:
+                    # refused by the apiserver rather than ended by an
+                    # ERROR event, the subscribers get one all the same
+                    status = {'kind': 'Status', 'apiVersion': 'v1',
+                              'metadata': {}, 'status': 'Failure',
+                              'code': 410, 'reason': 'Expired',
+                              'message': e.reason}
+                    self._handle({'type': 'ERROR', 'object': status,
+                                  'raw_object': status})
+                    continue
+                logger.exception("watch failed, resuming in %ss", backoff)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def _handle(self, event):
+        if event['type'] == 'ERROR':
+            if event['raw_object'].get('code') == 410:
+                # the subscribers have to list again, the watch goes on
+                # from the current state
+                self.resource_version = None
+                self._watch.stop()
+        else:
+            resource_version = _field(_metadata(event['object']),
+                                      'resource_version', 'resourceVersion')
+            if resource_version:
+                self.resource_version = resource_version
+        self._dispatch(event)
+
+
+class WatchMultiplexer(object):
+    """Shares watch calls between the subscribers of a process.
+
+    All the subscriptions to the same method with the same parameters share
+    a single watch call to the apiserver, whose events are decoded once
+    and handed to every subscriber. The watch is resumed from the last
+    resourceVersion seen when it times out or fails; when that version is
+    too old (410 Gone) the ERROR event is handed to the subscribers, which
+    should list again, and the watch goes on from the current state.
+
+    Every subscriber has a queue of `queue_size` events. When it is full,
+    `overflow` selects what happens to the next event:
+        'block': the event waits until there is room, holding back all the
+                 subscribers of the watch.
+        'drop_oldest': the oldest event of the queue is dropped.
+        'close': the subscriber is closed, its iteration raises
+                 SubscriberOverflow.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        mux = kubernetes.utils.WatchMultiplexer()
+        for event in mux.subscribe(v1.list_pod_for_all_namespaces,
+                                   label_selector='app=web'):
+            ...
+
+    :param queue_size: maximum number of events queued per subscriber.
+    :param overflow: 'block', 'drop_oldest' or 'close'.
+    """
+
+    def __init__(self, queue_size=1000, overflow=BLOCK):
+        if overflow not in (BLOCK, DROP_OLDEST, CLOSE):
+            raise ValueError("Invalid overflow policy {0!r}".format(overflow))
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self._upstreams = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, func, *args, **kwargs):
+        """Subscribes to the events of a watch.
+
+        :param func: a `list_*` method of a generated api. Any parameter to
+                     the function can be passed after this parameter; a
+                     `resource_version` only applies when the watch is not
+                     shared yet.
+        :return: Subscription, iterable of the events.
+        """
+        key = (func, hashable(args), hashable(dict(
+            (k, v) for k, v in kwargs.items() if k != 'resource_version')))
+        with self._lock:
+            upstream = self._upstreams.get(key)
+            created = upstream is None
+            if created:
+                upstream = _Upstream(self, key, func, args, dict(kwargs))
+                self._upstreams[key] = upstream
+            subscription = Subscription(upstream, self.queue_size,
+                                        self.overflow)
+            upstream.subscribe(subscription)
+        if created:
+            upstream.start()
+        return subscription
+
+    def __len__(self):
+        """Number of watch calls."""
+        with self._lock:
+            return len(self._upstreams)
@@ -0,0 +1,285 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import logging
+import threading
+from collections import deque
+
+from kubernetes.client.rate_limit import TokenBucketRateLimiter, _now
+
+from .informer import meta_namespace_key
+
+logger = logging.getLogger(__name__)
+
+
+class ItemExponentialBackoff(object):
+    """Delay doubling with every failure of an item, until it is forgotten.
+
+    :param base_delay: delay after the first failure, in seconds.
+    :param max_delay: maximum delay, in seconds.
+    """
+
+    def __init__(self, base_delay=0.005, max_delay=1000):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def when(self, item):
+        """Records a failure of `item`, returns the delay before a retry."""
+        with self._lock:
+            failures = self._failures.get(item, 0)
+            self._failures[item] = failures + 1
+        return min(self.base_delay * 2 ** failures, self.max_delay)
+
+    def forget(self, item):
+        with self._lock:
+            self._failures.pop(item, None)
+
+    def num_requeues(self, item):
+        with self._lock:
+            return self._failures.get(item, 0)
+
+
+class WorkQueue(object):
+    """Queue of the keys of the objects a controller has to process.
+
+    An item added while it is already queued is only processed once. An
+    item added while it is processed is queued again once `done` is called
+    for it, so no item is ever handed to two workers at once.
+
+    Failed items are requeued with `add_rate_limited`, after the largest of
+    a delay growing exponentially with the failures of the item, and of the
+    delay imposed by a token bucket shared by all the items.
+
+    :param backoff: per item backoff, an ItemExponentialBackoff by default.
+    :param rate_limiter: overall limit of the requeues, a
+        kubernetes.client.rate_limit.TokenBucketRateLimiter allowing 10 per
+        second with bursts of 100 by default.
+    """
+
+    def __init__(self, backoff=None, rate_limiter=None, clock=_now):
+        if backoff is None:
+            backoff = ItemExponentialBackoff()
+        if rate_limiter is None:
+            rate_limiter = TokenBucketRateLimiter(10, 100)
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue = deque()
+        # items to process, queued or waiting for their processing to end
+        self._dirty = set()
+        self._processing = set()
+        # items added with a delay: heap of (time, seq, item), and the time
+        # each item is due, entries of the heap not matching it are stale
+        self._delayed = []
+        self._due = {}
+        self._seq = itertools.count()
+        self._shutting_down = False
+
+    def add(self, item):
+        """Queues `item` unless it is already queued."""
+        with self._cond:
+            self._add(item)
+
+    def _add(self, item):
+        if self._shutting_down or item in self._dirty:
+            return
+        self._dirty.add(item)
+        if item not in self._processing:
+            self._queue.append(item)
+            self._cond.notify()
+
+    def add_after(self, item, delay):
+        """Queues `item` once `delay` seconds elapsed."""
+        if delay <= 0:
+            return self.add(item)
+        with self._cond:
+            if self._shutting_down:
+                return
+            due = self._clock() + delay
+            if item in self._due and self._due[item] <= due:
+                return
+            self._due[item] = due
+            heapq.heappush(self._delayed, (due, next(self._seq), item))
+            # a waiting worker may have to wake up sooner
+            self._cond.notify()
+
+    def add_rate_limited(self, item):
+        """Queues `item` again after a failure."""
+        self.add_after(item, max(self.backoff.when(item),
+                                 self.rate_limiter.reserve()))
+
+    def forget(self, item):
+        """Resets the backoff of `item`, once it was processed."""
+        self.backoff.forget(item)
+
+    def num_requeues(self, item):
+        return self.backoff.num_requeues(item)
+
+    def _promote_due(self):
+        """Queues the delayed items that are due, returns the seconds until
+        the next one is, or None.
+        """
+        now = self._clock()
+        while self._delayed:
+            due, _, item = self._delayed[0]
+            if self._due.get(item) != due:
+                heapq.heappop(self._delayed)
+            elif due <= now:
+                heapq.heappop(self._delayed)
+                del self._due[item]
+                self._add(item)
+            else:
+                return due - now
+        return None
+
+    def get(self, timeout=None):
+        """Takes the next item to process, `done` must be called with it.
+
+        :param timeout: seconds to wait for an item, None waits until there
+                        is one or the queue is shut down.
+        :return: the item, or None on timeout or once the queue is shut
+                 down and empty.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while True:
+                wait = self._promote_due()
+                if self._queue:
+                    item = self._queue.popleft()
+                    self._processing.add(item)
+                    self._dirty.discard(item)
+                    return item
+                if self._shutting_down:
+                    return None
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def done(self, item):
+        """Marks the end of the processing of `item`."""
+        with self._cond:
+            self._processing.discard(item)
+            if item in self._dirty:
+                self._queue.append(item)
+                self._cond.notify()
+
+    def shutdown(self):
+        """Stops accepting items, `get` returns None once the queue is
+        empty.
+        """
+        with self._cond:
+            self._shutting_down = True
+            self._cond.notify_all()
+
+    @property
+    def shutting_down(self):
+        return self._shutting_down
+
+    def __len__(self):
+        with self._cond:
+            return len(self._queue)
+
+
+class Controller(object):
+    """Processes the keys of a work queue on a pool of worker threads.
+
+    `handler` is called with each key taken from the queue. When it raises,
+    the key is requeued with backoff, up to `max_retries` times; when it
+    returns, the backoff of the key is reset.
+
+    Example:
+        def reconcile(key):
+            pod = informer.store.get_by_key(key)
+            ...
+
+        controller = kubernetes.utils.Controller(reconcile, workers=4)
+        controller.watch(informer)
+        informer.start()
+        controller.start()
+
+    :param handler: function called with the keys to process.
+    :param workers: number of worker threads.
+    :param queue: WorkQueue of the keys, a new one by default.
+    :param max_retries: number of requeues of a failing key before it is
+                        dropped, None retries forever.
+    """
+
+    def __init__(self, handler, workers=1, queue=None, max_retries=None):
+        self.handler = handler
+        self.workers = workers
+        self.queue = queue if queue is not None else WorkQueue()
+        self.max_retries = max_retries
+        self._threads = []
+
+    def enqueue(self, obj):
+        """Queues the `namespace/name` key of `obj`."""
+        self.queue.add(meta_namespace_key(obj))
+
+    def watch(self, informer):
+        """Queues the keys of the objects changed in the store of
+        `informer`.
+        """
+        informer.add_event_handler(
+            on_add=self.enqueue,
+            on_update=lambda old, new: self.enqueue(new),
+            on_delete=self.enqueue)
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work,
+                                      name='controller-worker-%d' % i)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        """Shuts the queue down and waits for the workers to finish the
+        keys already queued.
+        """
+        self.queue.shutdown()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self):
+        while True:
+            key = self.queue.get()
+            if key is None:
+                return
+            self.process(key)
+
+    def process(self, key):
+        """Runs the handler for `key`, requeues it if the handler fails."""
+        try:
+            self.handler(key)
+        except Exception:
+            if self.max_retries is None or \
+                    self.queue.num_requeues(key) < self.max_retries:
+                logger.exception("processing %s failed, requeuing", key)
+                self.queue.add_rate_limited(key)
+            else:
+                logger.exception("processing %s failed, dropping it", key)
+                self.queue.forget(key)
+        else:
+            self.queue.forget(key)
+        finally:
+            self.queue.done(key)
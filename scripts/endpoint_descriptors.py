@@ -0,0 +1,209 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewrites the generated api methods to call precomputed endpoints.
+
+The generator emits `*_with_http_info` methods rebuilding their parameter
+lists, headers and path parameters on every call. This extracts what those
+methods compute into a table of `kubernetes.client.endpoint.Endpoint` at
+the end of each api module, and replaces their bodies with a call to the
+endpoint. Docstrings and signatures are left untouched.
+
+Usage: python endpoint_descriptors.py <path to kubernetes/client>
+"""
+
+import ast
+import os
+import re
+import sys
+
+SUFFIX = '_with_http_info'
+
+COMMON_PARAMS = ['async_req', '_return_http_data_only', '_preload_content',
+                 '_request_timeout']
+
+REQUIRED_RE = re.compile(r"# verify the required parameter '(\w+)' is set")
+
+API_CLIENT_IMPORT = 'from ..api_client import ApiClient\n'
+
+ENDPOINT_IMPORT = 'from ..endpoint import Endpoint\n'
+
+TABLE_START = '_ENDPOINTS = {'
+
+WIDTH = 79
+
+
+def _const(node):
+    return ast.literal_eval(node)
+
+
+def _param_name(node):
+    """Returns 'x' for the expression `params['x']`."""
+    assert isinstance(node, ast.Subscript) and node.value.id == 'params'
+    return _const(node.slice)
+
+
+def _subscript_target(node, name):
+    return (isinstance(node, ast.Subscript) and
+            isinstance(node.value, ast.Name) and node.value.id == name)
+
+
+def extract(func, source):
+    """Returns the Endpoint arguments of a `*_with_http_info` method."""
+    desc = {
+        'name': func.name[:-len(SUFFIX)],
+        'path_params': [],
+        'query_params': [],
+        'body': None,
+        'accepts': [],
+        'content_types': None,
+    }
+    all_params = None
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign):
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id == 'all_params':
+                all_params = _const(node.value)
+            elif isinstance(target, ast.Name) and target.id == 'body_params':
+                if not isinstance(node.value, ast.Constant):
+                    desc['body'] = _param_name(node.value)
+            elif isinstance(target, ast.Name) and \
+                    target.id == 'auth_settings':
+                desc['auth_settings'] = _const(node.value)
+            elif _subscript_target(target, 'path_params'):
+                desc['path_params'].append(
+                    (_param_name(node.value), _const(target.slice)))
+            elif _subscript_target(target, 'header_params'):
+                header = _const(target.slice)
+                values = _const(node.value.args[0])
+                if header == 'Accept':
+                    desc['accepts'] = values
+                elif header == 'Content-Type':
+                    desc['content_types'] = values
+                else:
+                    raise ValueError('Unexpected header ' + header)
+        elif isinstance(node, ast.Call) and \
+                isinstance(node.func, ast.Attribute):
+            if node.func.attr == 'append' and \
+                    isinstance(node.func.value, ast.Name):
+                if node.func.value.id == 'query_params':
+                    key, value = node.args[0].elts
+                    desc['query_params'].append(
+                        (_param_name(value), _const(key)))
+                elif node.func.value.id != 'all_params':
+                    raise ValueError('Unexpected ' + node.func.value.id)
+            elif node.func.attr == 'call_api':
+                desc['path'] = _const(node.args[0])
+                desc['method'] = _const(node.args[1])
+                for keyword in node.keywords:
+                    if keyword.arg == 'response_type':
+                        desc['response_type'] = _const(keyword.value)
+
+    required = REQUIRED_RE.findall(ast.get_source_segment(source, func))
+    positional = [arg.arg for arg in func.args.args[1:]]
+    if required != positional:
+        raise ValueError('{0}: required parameters {1} are not {2}'.format(
+            func.name, required, positional))
+    desc['required'] = required
+
+    known = set(required) | set(p for p, _ in desc['path_params']) | \
+        set(p for p, _ in desc['query_params']) | set([desc['body']])
+    known.discard(None)
+    if set(all_params) != known:
+        raise ValueError('{0}: unhandled parameters {1}'.format(
+            func.name, set(all_params) - known))
+    return desc
+
+
+def _format_arg(name, value, indent):
+    line = '{0}{1}={2!r},'.format(indent, name, value)
+    if len(line) <= WIDTH or not isinstance(value, list):
+        return [line]
+    lines = ['{0}{1}=['.format(indent, name)]
+    lines += ['{0}    {1!r},'.format(indent, item) for item in value]
+    lines.append(indent + '],')
+    return lines
+
+
+def format_endpoint(desc):
+    indent = ' ' * 8
+    lines = ['    {0!r}: Endpoint('.format(desc['name'])]
+    lines.append('{0}{1!r}, {2!r},'.format(indent, desc['name'],
+                                           desc['method']))
+    lines.append('{0}{1!r},'.format(indent, desc['path']))
+    for name, default in (('response_type', None), ('required', []),
+                          ('path_params', []), ('query_params', []),
+                          ('body', None), ('accepts', []),
+                          ('content_types', None),
+                          ('auth_settings', ['BearerToken'])):
+        value = desc.get(name, default)
+        if value != default:
+            lines += _format_arg(name, value, indent)
+    lines[-1] = lines[-1][:-1] + '),'
+    return '\n'.join(lines)
+
+
+def call_statement(desc):
+    args = ', '.join(desc['required'])
+    if len(desc['required']) == 1:
+        args += ','
+    call = "        return _ENDPOINTS[{0!r}].call(".format(desc['name'])
+    rest = "self.api_client, ({0}), kwargs)".format(args)
+    if len(call) + len(rest) <= WIDTH:
+        return call + rest + '\n'
+    return call + '\n            ' + rest + '\n'
+
+
+def rewrite_module(path):
+    with open(path) as f:
+        source = f.read()
+    if TABLE_START in source or SUFFIX not in source:
+        return False
+    tree = ast.parse(source)
+    lines = source.splitlines(True)
+    descs = []
+    # replaced line ranges, rewritten from the end of the file
+    replacements = []
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        for func in cls.body:
+            if not isinstance(func, ast.FunctionDef) or \
+                    not func.name.endswith(SUFFIX):
+                continue
+            desc = extract(func, source)
+            descs.append(desc)
+            replacements.append((func.body[1].lineno - 1, func.end_lineno,
+                                 call_statement(desc)))
+    for start, end, statement in reversed(replacements):
+        lines[start:end] = [statement]
+    source = ''.join(lines)
+    source = source.replace(API_CLIENT_IMPORT,
+                            API_CLIENT_IMPORT + ENDPOINT_IMPORT, 1)
+    source = source.rstrip('\n') + '\n\n\n' + TABLE_START + '\n' + \
+        '\n'.join(format_endpoint(desc) for desc in descs) + '\n}\n'
+    with open(path, 'w') as f:
+        f.write(source)
+    return True
+
+
+def main(client_dir):
+    apis_dir = os.path.join(client_dir, 'apis')
+    for filename in sorted(os.listdir(apis_dir)):
+        if filename.endswith('_api.py'):
+            rewrite_module(os.path.join(apis_dir, filename))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -0,0 +1,114 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rewrites the generated client packages to import their members lazily.
+
+The generator emits `__init__.py` files importing all the models and apis
+up front. This replaces those imports with name -> module tables consumed
+by `kubernetes.client.lazy_import`.
+
+Usage: python lazy_imports.py <path to kubernetes/client>
+"""
+
+import os
+import re
+import sys
+
+HEADER_END = '"""\n'
+
+CLASS_RE = re.compile(r'^class (\w+)\(object\):', re.MULTILINE)
+
+PACKAGE_TEMPLATE = '''{header}
+
+from __future__ import absolute_import
+
+from ..lazy_import import install_lazy_imports
+
+# {kind} of this package, imported on first access
+{table} = {{
+{entries}
+}}
+
+install_lazy_imports(__name__, globals(), {table},
+                     set(module[1:] for module in {table}.values()))
+'''
+
+CLIENT_TEMPLATE = '''{header}
+
+from __future__ import absolute_import
+
+from . import apis, models
+from .lazy_import import install_lazy_imports
+
+# models and apis are re-exported by the sdk package, imported on first
+# access
+install_lazy_imports(
+    __name__, globals(),
+    dict([(name, '.models' + module)
+          for name, module in models._MODELS.items()] +
+         [(name, '.apis' + module)
+          for name, module in apis._APIS.items()]),
+    ['apis', 'models'])
+
+# import ApiClient
+from .api_client import ApiClient
+
+from .configuration import Configuration
+'''
+
+
+def read_header(path):
+    """Returns the leading comments and docstring of a generated file."""
+    with open(path) as f:
+        content = f.read()
+    start = content.find('"""')
+    if start == -1 or content.find('import') < start:
+        return '# coding: utf-8'
+    end = content.index(HEADER_END, start + 3) + len(HEADER_END)
+    return content[:end]
+
+
+def collect_classes(package_dir):
+    table = {}
+    for filename in sorted(os.listdir(package_dir)):
+        if not filename.endswith('.py') or filename == '__init__.py':
+            continue
+        with open(os.path.join(package_dir, filename)) as f:
+            for name in CLASS_RE.findall(f.read()):
+                table[name] = '.' + filename[:-3]
+    return table
+
+
+def write_package(package_dir, kind, table_name):
+    init = os.path.join(package_dir, '__init__.py')
+    table = collect_classes(package_dir)
+    entries = '\n'.join("    '{0}': '{1}',".format(name, table[name])
+                        for name in sorted(table))
+    header = read_header(init)
+    with open(init, 'w') as f:
+        f.write(PACKAGE_TEMPLATE.format(header=header, kind=kind,
+                                        table=table_name, entries=entries))
+
+
+def main(client_dir):
+    write_package(os.path.join(client_dir, 'models'), 'models', '_MODELS')
+    write_package(os.path.join(client_dir, 'apis'), 'apis', '_APIS')
+    init = os.path.join(client_dir, '__init__.py')
+    header = read_header(init)
+    with open(init, 'w') as f:
+        f.write(CLIENT_TEMPLATE.format(header=header))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -0,0 +1,84 @@
+# Copyright 2019 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Adds a trusted constructor to the generated models.
+
+The constructors of the generated models assign every attribute through
+its setter, and the setters of the required attributes reject None. This
+adds a `_from_server` classmethod to every model, setting the fields
+behind the properties directly, which `ApiClient` uses to build the models
+of the responses.
+
+Usage: python model_from_server.py <path to kubernetes/client>
+"""
+
+import os
+import re
+import sys
+
+INIT_RE = re.compile(
+    r'^    def __init__\(self(?P<args>(?:, \w+=None)*)\):\n'
+    r'        """\n.*?\n        """\n\n'
+    r'(?P<fields>(?:        self\.\w+ = None\n)*)'
+    r'        self\.discriminator = None\n'
+    r'.*?(?=\n    @|\n    def )',
+    re.MULTILINE | re.DOTALL)
+
+FIELD_RE = re.compile(r'        self\.(\w+) = None\n')
+
+TEMPLATE = '''
+    @classmethod
+    def _from_server(cls{args}):
+        """
+        Returns the model of a response, with its fields set without the
+        validation of the setters.
+        """
+        self = cls.__new__(cls)
+{assignments}        self.discriminator = None
+        return self
+'''
+
+
+def rewrite_model(path):
+    with open(path) as f:
+        source = f.read()
+    if 'def _from_server(' in source:
+        return False
+    match = INIT_RE.search(source)
+    if match is None:
+        raise ValueError('No constructor found in ' + path)
+    args = re.findall(r', (\w+)=None', match.group('args'))
+    fields = FIELD_RE.findall(match.group('fields'))
+    if ['_' + arg for arg in args] != fields:
+        raise ValueError('{0}: arguments {1} do not match {2}'.format(
+            path, args, fields))
+    method = TEMPLATE.format(
+        args=match.group('args'),
+        assignments=''.join('        self.{0} = {1}\n'.format(field, arg)
+                            for field, arg in zip(fields, args)))
+    source = source[:match.end()] + method + source[match.end():]
+    with open(path, 'w') as f:
+        f.write(source)
+    return True
+
+
+def main(client_dir):
+    models_dir = os.path.join(client_dir, 'models')
+    for filename in sorted(os.listdir(models_dir)):
+        if filename.endswith('.py') and filename != '__init__.py':
+            rewrite_model(os.path.join(models_dir, filename))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -71,4 +71,12 @@ sed -i'' "s,^DEVELOPMENT_STATUS = .*,DEVELOPMENT_STATUS = \\\"${DEVELOPMENT_STAT
 # second, this should be ported to swagger-codegen
 echo ">>> patching client..."
 git apply "${SCRIPT_ROOT}/rest_client_patch.diff"
+echo ">>> adding the chunking parameters of the custom object lists..."
+git apply "${SCRIPT_ROOT}/custom_objects_patch.diff"
+echo ">>> making models and apis lazily imported..."
+python "${SCRIPT_ROOT}/lazy_imports.py" "${CLIENT_ROOT}/client"
+echo ">>> precomputing the endpoints of the apis..."
+python "${SCRIPT_ROOT}/endpoint_descriptors.py" "${CLIENT_ROOT}/client"
+echo ">>> adding the trusted constructors of the models..."
+python "${SCRIPT_ROOT}/model_from_server.py" "${CLIENT_ROOT}/client"
 echo ">>> Done."
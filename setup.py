@@ -28,7 +28,8 @@ DEVELOPMENT_STATUS = "4 - Beta"
 # http://pypi.python.org/pypi/setuptools
 
 EXTRAS = {
-    'adal': ['adal>=1.0.2']
+    'adal': ['adal>=1.0.2'],
+    'asyncio': ['aiohttp>=3.5.4;python_version>="3.5"'],
 }
 REQUIRES = []
 with open('requirements.txt') as f: